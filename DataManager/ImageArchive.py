@@ -0,0 +1,398 @@
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from DataManager.ImageEncoding import EncodingProfile, LEGACY_PRESET, encode_image
+
+# 검사 image 보관소
+# 기존: IMAGE_SAVE_PATH/<날짜>/<position>/{Rule,Crop,readed_qrcode}/<YYYYmmdd_HHMMSS>.jpg 로 저장
+#       (초 단위 이름이라 빠른 재시도 시 덮어씀, 차량 (AGV) 별 image 를 찾으려면 폴더 전체를 훑어야 함)
+# 변경:
+#   - 폴더 구조는 그대로, 파일 이름은 <HHMMSS_ffffff>_<AGV>.jpg (같은 이름이 있으면 _1, _2 ..), 배타적 생성으로 덮어쓰지 않음
+#   - 저장할 때 index (SQLite) 에 날짜 / AGV / 차종 / spec / position / 종류와 thumbnail 을 기록
+#   - 지난 날짜 폴더는 compact() 로 날짜별 zip (archive/<날짜>.zip) 하나로 묶음
+#     (JPG / PNG / WebP 는 이미 압축된 형식이라 STORED, 그 외는 DEFLATED)
+#   - apply_retention() 으로 보관 기간이 지난 날짜의 index / 폴더 / zip 삭제
+
+INDEX_FILE_NAME = "index.db"
+ARCHIVE_DIR_NAME = "archive"
+THUMBNAIL_WIDTH = 320
+THUMBNAIL_QUALITY = 80
+ZIP_CACHE_SIZE = 4
+STORED_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS image (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp   REAL NOT NULL,
+    day         TEXT NOT NULL,
+    agv_no      TEXT,
+    body_type   TEXT,
+    spec        TEXT,
+    position    TEXT,
+    kind        TEXT,
+    path        TEXT NOT NULL,
+    container   TEXT,
+    size        INTEGER
+);
+CREATE TABLE IF NOT EXISTS thumbnail (
+    image_id    INTEGER PRIMARY KEY REFERENCES image(id),
+    data        BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_image_agv ON image(agv_no, timestamp);
+CREATE INDEX IF NOT EXISTS idx_image_spec ON image(spec, timestamp);
+CREATE INDEX IF NOT EXISTS idx_image_time ON image(timestamp);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_image_day_path ON image(day, path);
+"""
+
+_COLUMNS = "id, timestamp, day, agv_no, body_type, spec, position, kind, path, container, size"
+
+
+@dataclass
+class ArchiveEntry:
+    id: int
+    timestamp: float
+    day: str                    # YYYYmmdd
+    agv_no: Optional[str]
+    body_type: Optional[str]
+    spec: Optional[str]
+    position: Optional[str]
+    kind: Optional[str]         # "" (원본) | "Rule" | "Crop" | "readed_qrcode"
+    path: str                   # 날짜 폴더 기준 상대 경로 ("/" 구분)
+    container: Optional[str]    # compact 된 경우 zip 파일 이름
+    size: int
+
+
+def make_thumbnail(image: np.ndarray, width=THUMBNAIL_WIDTH) -> Optional[bytes]:
+    height = max(1, round(image.shape[0] * width / image.shape[1]))
+    if image.shape[1] > width:
+        image = cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+    success, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, THUMBNAIL_QUALITY])
+    return encoded.tobytes() if success else None
+
+
+def _remove_empty_directories(path):
+    """path 아래의 빈 폴더 (path 포함) 삭제. 파일이 남아 있는 폴더는 그대로."""
+    for directory, _, _ in os.walk(path, topdown=False):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass
+
+
+class ImageArchive:
+    """
+    Args:
+        root (str): image 저장 폴더 (IMAGE_SAVE_PATH)
+    """
+    def __init__(self, root):
+        self.root = root
+        self.index_path = os.path.join(root, INDEX_FILE_NAME)
+        self.archive_path = os.path.join(root, ARCHIVE_DIR_NAME)
+
+        self._lock = threading.Lock()
+        self._connection = None
+        self._zip_lock = threading.Lock()
+        self._zip_files = OrderedDict()     # container -> zipfile.ZipFile (읽기용)
+
+    # ---------------------------------------------------------------
+    # index
+    # ---------------------------------------------------------------
+    def _connect(self):
+        if self._connection is None:
+            os.makedirs(self.root, exist_ok=True)
+            connection = sqlite3.connect(self.index_path, timeout=5.0, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+        with self._zip_lock:
+            for zip_file in self._zip_files.values():
+                zip_file.close()
+            self._zip_files.clear()
+
+    # ---------------------------------------------------------------
+    # 저장
+    # ---------------------------------------------------------------
+    def save(self, image: np.ndarray, position, kind="", agv_no=None, body_type=None, spec=None,
+             profile: Optional[EncodingProfile] = None, timestamp=None) -> Optional[ArchiveEntry]:
+        """
+        image 를 저장하고 index 에 기록합니다. (작업 thread 에서 호출)
+
+        Args:
+            position (str): 검사 위치 ("1", "2", "3")
+            kind (str): "" (원본) | "Rule" | "Crop" | "readed_qrcode"
+            profile (EncodingProfile): None 이면 종류별 기존 형식 (LEGACY_PRESET)
+        """
+        if image is None:
+            return None
+        timestamp = time.time() if timestamp is None else timestamp
+        moment = datetime.fromtimestamp(timestamp)
+        day = moment.strftime("%Y%m%d")
+
+        profile = LEGACY_PRESET.get(kind, LEGACY_PRESET[""]) if profile is None else profile
+        ext = profile.ext
+        data = encode_image(image, profile)
+        if data is None:
+            print(f"[ImageArchive.py] - encode failed. {ext}")
+            return None
+
+        directory = "/".join(part for part in (str(position), kind) if part)
+        name = moment.strftime("%H%M%S_%f") + (f"_{agv_no}" if agv_no else "")
+        os.makedirs(os.path.join(self.root, day, directory), exist_ok=True)
+        relative_path = self._write_exclusive(day, directory, name, ext, data)
+
+        thumbnail = make_thumbnail(image)
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO image (timestamp, day, agv_no, body_type, spec, position, kind, path, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (timestamp, day, agv_no, body_type, spec, str(position), kind, relative_path, len(data)))
+                image_id = cursor.lastrowid
+                if thumbnail is not None:
+                    connection.execute("INSERT INTO thumbnail (image_id, data) VALUES (?, ?)", (image_id, thumbnail))
+
+        return ArchiveEntry(image_id, timestamp, day, agv_no, body_type, spec, str(position), kind, relative_path,
+                            None, len(data))
+
+    def _write_exclusive(self, day, directory, name, ext, data) -> str:
+        for index in range(1000):
+            file_name = f"{name}_{index}{ext}" if index else f"{name}{ext}"
+            relative_path = f"{directory}/{file_name}"
+            try:
+                with open(os.path.join(self.root, day, relative_path), "xb") as file:
+                    file.write(data)
+                return relative_path
+            except FileExistsError:
+                continue
+        raise FileExistsError(f"{day}/{directory}/{name}{ext}")
+
+    # ---------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------
+    def find(self, agv_no=None, since=None, until=None, position=None, kind=None, body_type=None, spec=None,
+             limit=None) -> list:
+        """
+        Args:
+            since, until (float | datetime): 시간 범위
+        Returns:
+            list[ArchiveEntry]: 시간 순
+        """
+        conditions = []
+        params = []
+        for column, value in (("agv_no", agv_no), ("position", position), ("kind", kind),
+                              ("body_type", body_type), ("spec", spec)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(str(value))
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(since.timestamp() if isinstance(since, datetime) else since)
+        if until is not None:
+            conditions.append("timestamp < ?")
+            params.append(until.timestamp() if isinstance(until, datetime) else until)
+
+        sql = f"SELECT {_COLUMNS} FROM image"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY timestamp"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [ArchiveEntry(*row) for row in self._execute(sql, params)]
+
+    def find_vehicle(self, agv_no, days=7) -> list:
+        """AGV 번호의 최근 days 일 image."""
+        since = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days - 1)
+        return self.find(agv_no=agv_no, since=since)
+
+    def thumbnail(self, entry: ArchiveEntry) -> Optional[np.ndarray]:
+        rows = self._execute("SELECT data FROM thumbnail WHERE image_id = ?", (entry.id,))
+        if not rows:
+            return None
+        return cv2.imdecode(np.frombuffer(rows[0][0], dtype=np.uint8), cv2.IMREAD_COLOR)
+
+    def read_bytes(self, entry: ArchiveEntry) -> Optional[bytes]:
+        try:
+            if entry.container is None:
+                with open(os.path.join(self.root, entry.day, entry.path), "rb") as file:
+                    return file.read()
+            with self._zip_lock:
+                return self._open_zip(entry.container).read(entry.path)
+        except (OSError, KeyError, zipfile.BadZipFile) as e:
+            print(f"[ImageArchive.py] - read failed. {entry.day}/{entry.path} {e}")
+            return None
+
+    def load_image(self, entry: ArchiveEntry, flags=cv2.IMREAD_UNCHANGED) -> Optional[np.ndarray]:
+        data = self.read_bytes(entry)
+        if data is None:
+            return None
+        return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flags)
+
+    def _open_zip(self, container) -> zipfile.ZipFile:
+        zip_file = self._zip_files.get(container)
+        if zip_file is not None:
+            self._zip_files.move_to_end(container)
+            return zip_file
+
+        zip_file = zipfile.ZipFile(os.path.join(self.archive_path, container))
+        self._zip_files[container] = zip_file
+        while len(self._zip_files) > ZIP_CACHE_SIZE:
+            self._zip_files.popitem(last=False)[1].close()
+        return zip_file
+
+    def _close_zip(self, container):
+        with self._zip_lock:
+            zip_file = self._zip_files.pop(container, None)
+            if zip_file is not None:
+                zip_file.close()
+
+    # ---------------------------------------------------------------
+    # compaction / retention
+    # ---------------------------------------------------------------
+    def loose_days(self) -> list:
+        """zip 으로 묶이지 않은 날짜 폴더 (YYYYmmdd)."""
+        if not os.path.isdir(self.root):
+            return []
+        days = []
+        for name in os.listdir(self.root):
+            if len(name) == 8 and name.isdigit() and os.path.isdir(os.path.join(self.root, name)):
+                days.append(name)
+        return sorted(days)
+
+    def compact(self, keep_days=1) -> int:
+        """
+        오늘부터 keep_days 일 이전의 날짜 폴더를 archive/<날짜>.zip 으로 묶습니다.
+        index 에 없는 파일 (이전 방식으로 저장된 image) 은 AGV 정보 없이 index 에 추가.
+
+        Returns:
+            int: 묶은 파일 수
+        """
+        cutoff = (datetime.now() - timedelta(days=keep_days - 1)).strftime("%Y%m%d")
+        packed = 0
+        for day in self.loose_days():
+            if day >= cutoff:
+                continue
+            try:
+                packed += self._compact_day(day)
+            except (OSError, sqlite3.Error, zipfile.BadZipFile) as e:
+                print(f"[ImageArchive.py] - compact failed. {day} {e}")
+        return packed
+
+    def _compact_day(self, day) -> int:
+        day_path = os.path.join(self.root, day)
+        files = []
+        for directory, _, file_names in os.walk(day_path):
+            for file_name in file_names:
+                if file_name.endswith(".tmp"):
+                    continue
+                full_path = os.path.join(directory, file_name)
+                files.append((full_path, os.path.relpath(full_path, day_path).replace(os.sep, "/")))
+        if not files:
+            _remove_empty_directories(day_path)
+            return 0
+
+        os.makedirs(self.archive_path, exist_ok=True)
+        container = f"{day}.zip"
+        zip_path = os.path.join(self.archive_path, container)
+        temp_path = zip_path + ".tmp"
+
+        # 이미 zip 이 있으면 (compact 후 같은 날짜로 저장된 파일) 이어서 추가
+        self._close_zip(container)
+        if os.path.exists(zip_path):
+            shutil.copyfile(zip_path, temp_path)
+        with zipfile.ZipFile(temp_path, "a") as zip_file:
+            existing = set(zip_file.namelist())
+            for full_path, relative_path in files:
+                if relative_path in existing:
+                    continue
+                compress_type = zipfile.ZIP_STORED if relative_path.lower().endswith(STORED_EXTENSIONS) \
+                    else zipfile.ZIP_DEFLATED
+                zip_file.write(full_path, relative_path, compress_type=compress_type)
+        os.replace(temp_path, zip_path)
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                for full_path, relative_path in files:
+                    cursor = connection.execute("UPDATE image SET container = ? WHERE day = ? AND path = ?",
+                                                (container, day, relative_path))
+                    if cursor.rowcount == 0:
+                        parts = relative_path.split("/")
+                        connection.execute(
+                            "INSERT INTO image (timestamp, day, position, kind, path, container, size) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            (os.path.getmtime(full_path), day, parts[0] if len(parts) > 1 else None,
+                             "/".join(parts[1:-1]), relative_path, container, os.path.getsize(full_path)))
+
+        # zip 에 넣은 파일만 삭제 (os.walk 이후 저장된 파일 / 저장 중인 .tmp 는 다음 compact 에서)
+        for full_path, _ in files:
+            try:
+                os.remove(full_path)
+            except OSError as e:
+                print(f"[ImageArchive.py] - remove failed. {full_path} {e}")
+        _remove_empty_directories(day_path)
+        return len(files)
+
+    def apply_retention(self, retention_days) -> int:
+        """
+        보관 기간 (일) 이 지난 날짜의 index / 폴더 / zip 을 삭제합니다.
+
+        Returns:
+            int: 삭제한 날짜 수
+        """
+        cutoff = (datetime.now() - timedelta(days=retention_days)).strftime("%Y%m%d")
+
+        days = set(day for day in self.loose_days() if day < cutoff)
+        if os.path.isdir(self.archive_path):
+            for file_name in os.listdir(self.archive_path):
+                day = file_name.split(".")[0]
+                if file_name.endswith(".zip") and len(day) == 8 and day.isdigit() and day < cutoff:
+                    days.add(day)
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM thumbnail WHERE image_id IN (SELECT id FROM image WHERE day < ?)",
+                                   (cutoff,))
+                connection.execute("DELETE FROM image WHERE day < ?", (cutoff,))
+
+        for day in sorted(days):
+            shutil.rmtree(os.path.join(self.root, day), ignore_errors=True)
+            container = f"{day}.zip"
+            self._close_zip(container)
+            try:
+                os.remove(os.path.join(self.archive_path, container))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"[ImageArchive.py] - remove failed. {container} {e}")
+        return len(days)
+
+    def maintenance(self, retention_days=None, keep_days=1) -> str:
+        """하루 한 번: compact + retention (retention_days 가 None 이면 삭제하지 않음). GUI thread 가 아닌 곳에서 호출."""
+        packed = self.compact(keep_days)
+        removed = self.apply_retention(retention_days) if retention_days is not None else 0
+        return f"Image archive: packed {packed} files, removed {removed} days"
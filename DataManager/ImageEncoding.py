@@ -0,0 +1,216 @@
+from dataclasses import dataclass, field, fields
+from typing import Optional
+
+import cv2
+import numpy as np
+
+# 검사 image 저장 encoding 설정
+# 기존: 원본 / Rule / Crop 은 cv2.imwrite 기본 JPEG (quality 95), QR 은 cv2.imwrite 기본 PNG
+#       (OpenCV 4: compression 1 + RLE strategy. IMWRITE_PNG_COMPRESSION 을 넘기면 strategy 가 default 로 바뀌므로 같이 지정)
+#       4K 원본 3장이 cycle 마다 가장 많은 CPU / disk 를 씀
+# 변경: 저장 종류 (kind) 별 EncodingProfile 을 preset 으로 선택 (설정 화면), 필요하면 종류별로 덮어쓰기.
+#       original_only_on_ng 이면 OK 결과의 원본은 REDUCED_ORIGIN (축소본) 으로 저장하고 NG 일 때만 원본 크기로 저장.
+#       OpenCV 의 encoder 만 사용 (libjpeg-turbo / libwebp / zlib, 특정 HW 가속 없음).
+#       설정 파일의 overrides 는 읽을 때 검사해서 잘못된 항목은 버리고 preset 사용 (저장 thread 에서 실패하지 않도록).
+
+ARTIFACT_KINDS = ("", "Rule", "Crop", "readed_qrcode")      # "" : 원본
+EXTENSIONS = {"jpg": ".jpg", "png": ".png", "webp": ".webp"}
+CHROMA_SUBSAMPLING = {
+    "444": "IMWRITE_JPEG_SAMPLING_FACTOR_444",
+    "422": "IMWRITE_JPEG_SAMPLING_FACTOR_422",
+    "420": "IMWRITE_JPEG_SAMPLING_FACTOR_420",
+}
+PNG_STRATEGIES = {
+    "default": "IMWRITE_PNG_STRATEGY_DEFAULT",
+    "filtered": "IMWRITE_PNG_STRATEGY_FILTERED",
+    "huffman_only": "IMWRITE_PNG_STRATEGY_HUFFMAN_ONLY",
+    "rle": "IMWRITE_PNG_STRATEGY_RLE",
+    "fixed": "IMWRITE_PNG_STRATEGY_FIXED",
+}
+
+
+@dataclass
+class EncodingProfile:
+    """
+    Args:
+        format (str): "jpg" | "png" | "webp"
+        quality (int): JPEG / WebP 품질 (1 ~ 100)
+        chroma (str): JPEG chroma subsampling "444" | "422" | "420". None 이면 OpenCV 기본 (420)
+        scale (float): 저장 전 축소 비율 (1.0 이면 원본 크기)
+        optimize (bool): JPEG huffman table 최적화 (조금 작아지고 조금 느려짐)
+        progressive (bool): progressive JPEG
+        png_compression (int): PNG zlib 압축 단계 (0 ~ 9, 높을수록 작고 느림)
+        png_strategy (str): PNG zlib strategy (PNG_STRATEGIES). 기본값은 cv2.imwrite 기본과 같은 1 + "rle"
+    """
+    format: str = "jpg"
+    quality: int = 95
+    chroma: Optional[str] = None
+    scale: float = 1.0
+    optimize: bool = False
+    progressive: bool = False
+    png_compression: int = 1
+    png_strategy: str = "rle"
+
+    @classmethod
+    def from_dict(cls, settings: Optional[dict]):
+        profile = cls()
+        for key, value in (settings or {}).items():
+            if hasattr(profile, key):
+                setattr(profile, key, value)
+        return profile
+
+    def to_dict(self) -> dict:
+        return {item.name: getattr(self, item.name) for item in fields(self)}
+
+    def validate(self):
+        """값이 잘못되었으면 ValueError. 통과하면 params() / ext 에서 예외가 나지 않음."""
+        if not isinstance(self.format, str) or self.format not in EXTENSIONS:
+            raise ValueError(f"format {self.format}")
+        if self.chroma is not None and (not isinstance(self.chroma, str) or self.chroma not in CHROMA_SUBSAMPLING):
+            raise ValueError(f"chroma {self.chroma}")
+        if not isinstance(self.png_strategy, str) or self.png_strategy not in PNG_STRATEGIES:
+            raise ValueError(f"png_strategy {self.png_strategy}")
+        # bool 은 int 의 subclass 라서 숫자 항목에서는 따로 제외
+        if not _is_number(self.scale, (int, float)) or not 0 < self.scale <= 1:
+            raise ValueError(f"scale {self.scale}")
+        if not _is_number(self.quality, int) or not 1 <= self.quality <= 100:
+            raise ValueError(f"quality {self.quality}")
+        if not _is_number(self.png_compression, int) or not 0 <= self.png_compression <= 9:
+            raise ValueError(f"png_compression {self.png_compression}")
+        if not isinstance(self.optimize, bool):
+            raise ValueError(f"optimize {self.optimize}")
+        if not isinstance(self.progressive, bool):
+            raise ValueError(f"progressive {self.progressive}")
+
+    @property
+    def ext(self) -> str:
+        return EXTENSIONS[self.format]
+
+    def params(self) -> list:
+        if self.format == "png":
+            # strategy 는 compression 뒤에 (OpenCV 는 compression 을 받으면 strategy 를 default 로 되돌림)
+            return [cv2.IMWRITE_PNG_COMPRESSION, int(self.png_compression),
+                    cv2.IMWRITE_PNG_STRATEGY, getattr(cv2, PNG_STRATEGIES[self.png_strategy])]
+        if self.format == "webp":
+            return [cv2.IMWRITE_WEBP_QUALITY, int(self.quality)]
+
+        params = [cv2.IMWRITE_JPEG_QUALITY, int(self.quality),
+                  cv2.IMWRITE_JPEG_OPTIMIZE, int(self.optimize),
+                  cv2.IMWRITE_JPEG_PROGRESSIVE, int(self.progressive)]
+        # IMWRITE_JPEG_SAMPLING_FACTOR 는 OpenCV 4.5.5 이상
+        if self.chroma is not None and hasattr(cv2, "IMWRITE_JPEG_SAMPLING_FACTOR"):
+            params += [cv2.IMWRITE_JPEG_SAMPLING_FACTOR, getattr(cv2, CHROMA_SUBSAMPLING[self.chroma])]
+        return params
+
+
+def _is_number(value, types) -> bool:
+    return isinstance(value, types) and not isinstance(value, bool)
+
+
+def resize_for_profile(image: np.ndarray, profile: EncodingProfile) -> np.ndarray:
+    if profile.scale >= 1.0:
+        return image
+    height, width = image.shape[:2]
+    size = (max(1, round(width * profile.scale)), max(1, round(height * profile.scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def encode_image(image: np.ndarray, profile: EncodingProfile) -> Optional[bytes]:
+    success, encoded = cv2.imencode(profile.ext, resize_for_profile(image, profile), profile.params())
+    return encoded.tobytes() if success else None
+
+
+# 기존 cv2.imwrite (기본 parameter) 와 같은 결과
+LEGACY_PRESET = {
+    "": EncodingProfile(),
+    "Rule": EncodingProfile(),
+    "Crop": EncodingProfile(),
+    "readed_qrcode": EncodingProfile("png"),
+}
+
+ENCODING_PRESETS = {
+    "legacy": LEGACY_PRESET,
+    # 원본은 같은 크기, Rule 결과는 화면 확인용이라 절반 크기, Crop 은 검사 영역이라 색 정보 유지 (444)
+    "balanced": {
+        "": EncodingProfile(quality=90, chroma="420"),
+        "Rule": EncodingProfile(quality=80, chroma="420", scale=0.5),
+        "Crop": EncodingProfile(quality=95, chroma="444"),
+        "readed_qrcode": EncodingProfile("png"),
+    },
+    # disk 우선: 원본도 절반 크기
+    "compact": {
+        "": EncodingProfile(quality=85, chroma="420", scale=0.5, optimize=True),
+        "Rule": EncodingProfile("webp", quality=75, scale=0.5),
+        "Crop": EncodingProfile(quality=90, chroma="444", optimize=True),
+        "readed_qrcode": EncodingProfile("png", png_compression=9, png_strategy="default"),
+    },
+}
+
+# original_only_on_ng 일 때 OK 결과의 원본
+REDUCED_ORIGIN = EncodingProfile(quality=85, chroma="420", scale=0.5)
+
+
+@dataclass
+class ImageEncodingSettings:
+    """
+    Args:
+        preset (str): ENCODING_PRESETS 이름
+        original_only_on_ng (bool): True 이면 NG 결과만 원본 크기로 저장, OK 결과는 REDUCED_ORIGIN
+        overrides (dict): 종류별로 preset 을 덮어쓰는 profile {kind: EncodingProfile dict}. 잘못된 항목은 읽을 때 버림
+    """
+    preset: str = "legacy"
+    original_only_on_ng: bool = False
+    overrides: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, settings: Optional[dict]):
+        encoding = cls()
+        for key, value in (settings or {}).items():
+            if hasattr(encoding, key):
+                setattr(encoding, key, value)
+        if encoding.preset not in ENCODING_PRESETS:
+            print(f"[ImageEncoding.py] - unknown preset {encoding.preset}. use legacy")
+            encoding.preset = "legacy"
+        encoding.overrides = cls._valid_overrides(encoding.overrides)
+        return encoding
+
+    @staticmethod
+    def _valid_overrides(overrides) -> dict:
+        """검사를 통과한 override 만 {kind: EncodingProfile dict} 로. 나머지는 preset 사용."""
+        if not isinstance(overrides, dict):
+            print(f"[ImageEncoding.py] - invalid overrides {overrides}. use preset")
+            return {}
+        valid = {}
+        for kind, settings in overrides.items():
+            try:
+                if kind not in ARTIFACT_KINDS:
+                    raise ValueError(f"kind {kind}")
+                if not isinstance(settings, dict):
+                    raise ValueError(f"profile {settings}")
+                profile = EncodingProfile.from_dict(settings)
+                profile.validate()
+            except ValueError as e:
+                print(f"[ImageEncoding.py] - invalid override {kind!r}: {e}. use preset")
+                continue
+            valid[kind] = profile.to_dict()
+        return valid
+
+    def to_dict(self) -> dict:
+        return {
+            "preset": self.preset,
+            "original_only_on_ng": self.original_only_on_ng,
+            "overrides": self.overrides,
+        }
+
+    def profile(self, kind="", ng=None) -> EncodingProfile:
+        """
+        Args:
+            kind (str): ARTIFACT_KINDS
+            ng (bool): 검사 결과. None 이면 알 수 없음 (원본 크기로 저장)
+        """
+        if kind == "" and self.original_only_on_ng and ng is False:
+            return REDUCED_ORIGIN
+        if kind in self.overrides:
+            return EncodingProfile.from_dict(self.overrides[kind])
+        preset = ENCODING_PRESETS[self.preset]
+        return preset.get(kind, preset[""])
@@ -1,60 +1,399 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from enum import Enum
+from typing import Optional
 
+import cv2
 import numpy as np
 
-class InspectionDataManager:
-    def __init__(self):
-        self.timestamp = None
+from DataManager.ImageEncoding import EncodingProfile, encode_image
 
-        self.position1_image = None
-        self.position2_image = None
-        self.position3_image = None
+# 검사 기록 저장소 (cycle 단위)
+# 기존: position1~3 의 원본 image (4K, ~25MB) 를 속성으로 들고 있다가 ProcessThread 가 HOMING 에서 clear() 해야 해제.
+#       같은 image 가 signal / 화면 / 저장 thread 로 동시에 전달되어 누가 언제 놓는지 알 수 없음.
+# 변경:
+#   - cycle 마다 InspectionRecord (__slots__, QR / Hole 결과 / 시간 필드) 하나. begin_cycle 에서 이전 cycle 을 완료 처리.
+#   - image 는 ImageBuffer (읽기 전용, 참조 count). 기록을 읽는 곳 (main_window position 버튼, 검사 이력 화면) 은
+#     borrow 로 빌려 쓰고 끝나면 반납. 검사 image 저장 (ImageArchive) / 화면 (DisplayBridge) 은 작업 thread 의 원본을 직접 받음.
+#   - 완료된 cycle 의 image 는 spill thread 가 디스크에 JPEG (SPILL_PROFILE) 로 기록 (.npy 는 4K 1장 ~25MB).
+#     메모리 사용량이 memory_budget 을 넘으면 오래된 cycle 부터 메모리에서 내리고 (빌려간 곳이 있으면 반납 후) 필요할 때 디스크에서 읽음.
+#   - 기록은 max_records 개까지만 유지 (오래된 기록은 spill 파일과 함께 삭제).
+#     기록은 메모리에만 있으므로 시작할 때 이전 실행의 spill 파일은 모두 삭제.
 
-        self.position1_data = None
-        self.position2_data = None
-        self.position3_data = None
+DEFAULT_MEMORY_BUDGET = 512 * 1024 * 1024     # 4K BGR 1장 ~25MB -> 약 20장
+DEFAULT_MAX_RECORDS = 500
+POSITIONS = (1, 2, 3)
+SPILL_PROFILE = EncodingProfile()           # 검사 image 원본 저장과 같은 JPEG (quality 95)
+SPILL_PREFIX = "cycle_"
 
-    def clear(self):
-        self.timestamp = None
-        self.position1_image = None
-        self.position2_image = None
-        self.position3_image = None
 
-        self.position1_data = None
-        self.position2_data = None
-        self.position3_data = None
+class ImageBuffer:
+    """
+    여러 곳에서 공유하는 읽기 전용 image. 저장소가 참조 하나를 가지고, borrow 한 곳마다 참조가 늘어남.
 
-    def set_position1_data(self, image: np.ndarray, data):
-        self.position1_image = image
-        self.position1_data = data
+    메모리에서 내릴 때 (evict) 빌려간 곳이 있으면 마지막 반납 시점에 내림.
+    """
+    __slots__ = ("_array", "_path", "_refs", "_evict_pending", "_lock", "shape", "nbytes")
 
-    def set_position2_data(self, image: np.ndarray, data):
-        self.position2_image = image
-        self.position2_data = data
+    def __init__(self, array: np.ndarray):
+        array = array.view()
+        array.flags.writeable = False   # 공유 중 수정 방지 (수정이 필요하면 copy). 넘겨준 쪽의 array 는 그대로
+        self._array = array
+        self._path = None
+        self._refs = 0
+        self._evict_pending = False
+        self._lock = threading.Lock()
+        self.shape = array.shape
+        self.nbytes = array.nbytes
 
-    def set_position3_data(self, image: np.ndarray, data):
-        self.position3_image = image
-        self.position3_data = data
+    @property
+    def in_memory(self) -> bool:
+        return self._array is not None
 
-    def get_inspection_image(self, position):
-        image = None
+    @property
+    def path(self) -> Optional[str]:
+        return self._path
+
+    def acquire(self) -> Optional[np.ndarray]:
+        with self._lock:
+            self._refs += 1
+            array = self._array
+            path = self._path
+        if array is None and path is not None:
+            array = _load_image(path)
+        if array is None:
+            self.release()
+        return array
+
+    def release(self):
+        with self._lock:
+            self._refs = max(0, self._refs - 1)
+            if self._refs == 0 and self._evict_pending:
+                self._array = None
+                self._evict_pending = False
+
+    @contextmanager
+    def borrow(self):
+        """with buffer.borrow() as image: ... (image 는 수정하지 않음)"""
+        array = self.acquire()
+        try:
+            yield array
+        finally:
+            if array is not None:
+                self.release()
+
+    def spill(self, path) -> bool:
+        """디스크에 기록. 이미 기록했거나 image 가 없으면 False."""
+        with self._lock:
+            array = self._array
+            if array is None or self._path is not None:
+                return False
+        _save_image(path, array)
+        with self._lock:
+            self._path = path
+        return True
+
+    def evict(self) -> int:
+        """
+        메모리에서 내립니다 (디스크에 기록된 경우만).
+
+        Returns:
+            int: 해제한 (또는 반납 후 해제될) byte 수
+        """
+        with self._lock:
+            if self._array is None or self._path is None:
+                return 0
+            if self._refs > 0:
+                self._evict_pending = True
+            else:
+                self._array = None
+            return self.nbytes
+
+
+def _save_image(path, array):
+    encoded = encode_image(array, SPILL_PROFILE)
+    if encoded is None:
+        raise OSError(f"encode failed. {path}")
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(encoded)
+    os.replace(temp_path, path)
+
+
+def _load_image(path) -> Optional[np.ndarray]:
+    array = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+    if array is None:
+        print(f"[InspectionDataManager.py] - load failed. {path}")
+        return None
+    array.flags.writeable = False
+    return array
+
+
+class InspectionRecord:
+    """cycle 1건의 검사 결과. image 는 ImageBuffer 로만 참조."""
+    __slots__ = ("cycle_id", "timestamp", "body_type", "agv_no",
+                 "qr1_text", "qr1_success", "qr3_text", "qr3_success",
+                 "hole_result", "arm_correction_fitness", "cycle_time", "completed", "images")
+
+    def __init__(self, cycle_id: int, body_type: str = "", agv_no: str = ""):
+        self.cycle_id = cycle_id
+        self.timestamp = time.time()
+        self.body_type = body_type
+        self.agv_no = agv_no
+        self.qr1_text: Optional[str] = None
+        self.qr1_success: Optional[bool] = None
+        self.qr3_text: Optional[str] = None
+        self.qr3_success: Optional[bool] = None
+        self.hole_result: Optional[bool] = None
+        self.arm_correction_fitness: Optional[float] = None
+        self.cycle_time: Optional[float] = None
+        self.completed = False
+        self.images = {}      # position -> ImageBuffer
+
+    def get_data(self, position):
+        """position 별 결과 (기존 get_inspection_data 와 같은 값: QR text / Hole 결과)."""
         if position == 1:
-            image = self.position1_image
-        elif position == 2:
-            image = self.position2_image
-        elif position == 3:
-            image = self.position3_image
+            return self.qr1_text
+        if position == 2:
+            return self.hole_result
+        if position == 3:
+            return self.qr3_text
+        return None
+
+    def memory_bytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self.images.values() if buffer.in_memory)
+
+    def summary(self) -> str:
+        return (f"{datetime.fromtimestamp(self.timestamp):%Y-%m-%d %H:%M:%S} {self.body_type} AGV {self.agv_no} "
+                f"QR1: {self.qr1_success}, HOLE: {self.hole_result}, QR3: {self.qr3_success}")
+
+
+class InspectionDataManager:
+    """
+    Args:
+        memory_budget (int): 메모리에 둘 image 의 최대 byte 수 (진행 중인 cycle 은 항상 메모리에 둠)
+        spill_path (str): 완료된 cycle image 를 기록할 폴더. None 이면 디스크에 기록하지 않음 (기록 개수만 제한)
+        max_records (int): 유지할 cycle 기록 수
+    """
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, spill_path=None, max_records=DEFAULT_MAX_RECORDS):
+        self.memory_budget = memory_budget
+        self.spill_path = spill_path
+        self.max_records = max_records
+
+        self._lock = threading.RLock()
+        self._records = OrderedDict()     # cycle_id -> InspectionRecord (오래된 순)
+        self._next_cycle_id = 1
+        self._current = None
+        self._spill_executor = None
+
+        if self.spill_path is not None:
+            self._get_spill_executor().submit(self._sweep_spill_path)
+
+    # ---------------------------------------------------------------
+    # cycle
+    # ---------------------------------------------------------------
+    def begin_cycle(self, body_type="", agv_no="") -> InspectionRecord:
+        """새 cycle 기록 시작. 진행 중인 cycle 이 있으면 완료 처리."""
+        with self._lock:
+            self.finish_cycle()
+            record = InspectionRecord(self._next_cycle_id, body_type, agv_no)
+            self._next_cycle_id += 1
+            self._records[record.cycle_id] = record
+            self._current = record
+            self._trim_records()
+            return record
+
+    def finish_cycle(self, cycle_time=None, arm_correction_fitness=None):
+        """진행 중인 cycle 을 완료 처리하고 image 를 디스크로 내보냄."""
+        with self._lock:
+            record, self._current = self._current, None
+            if record is None:
+                return
+            if cycle_time is not None:
+                record.cycle_time = cycle_time
+            if arm_correction_fitness is not None:
+                record.arm_correction_fitness = arm_correction_fitness
+            record.completed = True
 
-        return image
+        if self.spill_path is not None and record.images:
+            self._submit_spill(record)
+        else:
+            self._enforce_budget()
+
+    def _ensure_current(self) -> InspectionRecord:
+        # begin_cycle 없이 결과가 들어온 경우 (수동 검사 등)
+        if self._current is None:
+            self.begin_cycle()
+        return self._current
+
+    # ---------------------------------------------------------------
+    # 결과 기록
+    # ---------------------------------------------------------------
+    def set_qr_result(self, position, image: np.ndarray, text: str, success: bool):
+        with self._lock:
+            record = self._ensure_current()
+            if position == 1:
+                record.qr1_text, record.qr1_success = text, success
+            else:
+                record.qr3_text, record.qr3_success = text, success
+            self._set_image(record, position, image)
+
+    def set_hole_result(self, image: np.ndarray, result: bool):
+        with self._lock:
+            record = self._ensure_current()
+            record.hole_result = result
+            self._set_image(record, 2, image)
+
+    def _set_image(self, record, position, image):
+        if image is not None:
+            record.images[position] = image if isinstance(image, ImageBuffer) else ImageBuffer(image)
+        self._enforce_budget()
+
+    # ---------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------
+    @property
+    def current_record(self) -> Optional[InspectionRecord]:
+        """진행 중인 cycle. 없으면 마지막 cycle."""
+        with self._lock:
+            if self._current is not None:
+                return self._current
+            return next(reversed(self._records.values()), None)
+
+    def record_count(self) -> int:
+        return len(self._records)
+
+    def page(self, offset=0, limit=20) -> list:
+        """최근 기록부터 offset 번째부터 limit 개 (image 는 포함하지 않음)."""
+        with self._lock:
+            records = list(reversed(self._records.values()))
+        return records[offset:offset + limit]
+
+    def get_record(self, cycle_id) -> Optional[InspectionRecord]:
+        return self._records.get(cycle_id)
+
+    def get_image_buffer(self, position, record: InspectionRecord = None) -> Optional[ImageBuffer]:
+        record = record or self.current_record
+        return None if record is None else record.images.get(position)
+
+    @contextmanager
+    def borrow_image(self, position, record: InspectionRecord = None):
+        """with manager.borrow_image(1) as image: ... (image 가 없으면 None)"""
+        buffer = self.get_image_buffer(position, record)
+        if buffer is None:
+            yield None
+            return
+        with buffer.borrow() as image:
+            yield image
+
+    def get_inspection_image(self, position):
+        """진행 중 (또는 마지막) cycle 의 읽기 전용 image. 디스크로 내려간 경우 파일에서 읽음."""
+        with self.borrow_image(position) as image:
+            return image
 
     def get_inspection_data(self, position):
-        data = None
-        if position == 1:
-            data = self.position1_data
-        elif position == 2:
-            data = self.position2_data
-        elif position == 3:
-            data = self.position3_data
+        record = self.current_record
+        return None if record is None else record.get_data(position)
+
+    def memory_usage(self) -> int:
+        with self._lock:
+            return sum(record.memory_bytes() for record in self._records.values())
+
+    # ---------------------------------------------------------------
+    # 메모리 / 디스크
+    # ---------------------------------------------------------------
+    def _get_spill_executor(self) -> ThreadPoolExecutor:
+        if self._spill_executor is None:
+            self._spill_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="InspectionSpill")
+        return self._spill_executor
+
+    def _submit_spill(self, record):
+        self._get_spill_executor().submit(self._spill_record, record)
+
+    def _sweep_spill_path(self):
+        """이전 실행의 spill 파일 (SPILL_PREFIX) 과 빈 날짜 폴더 삭제. 이번 실행의 기록보다 먼저 실행됨 (spill thread 1개)."""
+        if not os.path.isdir(self.spill_path):
+            return
+        removed = 0
+        for root, directories, files in os.walk(self.spill_path, topdown=False):
+            for name in files:
+                if name.startswith(SPILL_PREFIX):
+                    try:
+                        os.remove(os.path.join(root, name))
+                        removed += 1
+                    except OSError:
+                        pass
+            if root != self.spill_path:
+                try:
+                    os.rmdir(root)
+                except OSError:
+                    pass    # 비어 있지 않음
+        if removed:
+            print(f"[InspectionDataManager.py] - removed {removed} spill files of previous run")
+
+    def _spill_record(self, record):
+        directory = os.path.join(self.spill_path, datetime.fromtimestamp(record.timestamp).strftime("%Y%m%d"))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for position, buffer in list(record.images.items()):
+                name = f"{SPILL_PREFIX}{record.cycle_id:06d}_{record.timestamp:.0f}_p{position}{SPILL_PROFILE.ext}"
+                buffer.spill(os.path.join(directory, name))
+        except OSError as e:
+            print(f"[InspectionDataManager.py] - spill failed. {e}")
+
+        # 기록하는 동안 max_records 에서 밀려난 경우
+        if record.cycle_id not in self._records:
+            self._remove_files(record)
+        self._enforce_budget()
+
+    def _enforce_budget(self):
+        """budget 을 넘으면 디스크에 기록된 오래된 cycle 부터 메모리에서 내림."""
+        with self._lock:
+            usage = sum(record.memory_bytes() for record in self._records.values())
+            for record in self._records.values():
+                if usage <= self.memory_budget:
+                    break
+                if record is self._current:
+                    continue
+                for buffer in record.images.values():
+                    usage -= buffer.evict()
+
+            # 디스크에 기록하지 않는 경우: 완료된 오래된 cycle 의 image 를 버림
+            if usage > self.memory_budget and self.spill_path is None:
+                for record in self._records.values():
+                    if usage <= self.memory_budget:
+                        break
+                    if record is self._current:
+                        continue
+                    usage -= record.memory_bytes()
+                    record.images = {}
+
+    def _trim_records(self):
+        while len(self._records) > self.max_records:
+            _, record = self._records.popitem(last=False)
+            self._remove_files(record)
+
+    @staticmethod
+    def _remove_files(record):
+        for buffer in record.images.values():
+            if buffer.path is not None:
+                try:
+                    os.remove(buffer.path)
+                except OSError:
+                    pass
+
+    def flush(self, timeout=None):
+        """진행 중인 spill 이 끝날 때까지 대기."""
+        if self._spill_executor is None:
+            return
+        self._spill_executor.submit(lambda: None).result(timeout)
 
-        return data
+    def close(self):
+        self.finish_cycle()
+        if self._spill_executor is not None:
+            self._spill_executor.shutdown(wait=True)
+            self._spill_executor = None
@@ -91,10 +91,18 @@ class SpotDataManager:
         self.update_data()
         return self.spot_data.get("inspection_settings").get("hole_inspection").get("arm_correction_data").get("path")
 
+    def get_arm_pre_position_settings(self):
+        self.update_data()
+        return self.spot_data.get("inspection_settings", {}).get("arm_pre_position", {})
+
     def get_depth_settings(self):
         self.update_data()
         return self.spot_data.get("depth_settings", {})
 
+    def get_image_encoding_settings(self):
+        self.update_data()
+        return self.spot_data.get("image_settings", {}).get("encoding", {})
+
     # Setters
     def set_spot_setting(self, key, value):
         self.spot_data["spot_settings"][key] = value
@@ -140,6 +148,14 @@ class SpotDataManager:
         self.spot_data["depth_settings"] = settings
         self.save_data()
 
+    def set_image_encoding_settings(self, settings):
+        self.spot_data.setdefault("image_settings", {})["encoding"] = settings
+        self.save_data()
+
+    def set_arm_pre_position_settings(self, settings):
+        self.spot_data["inspection_settings"]["arm_pre_position"] = settings
+        self.save_data()
+
     def set_template_region(self, region):
         self.spot_data["inspection_settings"]["hole_inspection"]["region"] = region
         self.save_data()
@@ -0,0 +1,288 @@
+import math
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+# Cycle 별 takt time 기록 저장소 (SQLite, append-only)
+# cycle thread 에서는 append() 로 queue 에 넣기만 하고,
+# writer thread 가 모아서 한 transaction 으로 기록한다.
+#
+# cycle      : cycle 1건 (차종, AGV, 전체 시간, 검사 결과 ..)
+# cycle_step : cycle 의 단계별 소요 시간 (HOMING, POS1, nav, arm ..)
+
+WRITE_BATCH_SIZE = 32
+WRITE_FLUSH_INTERVAL = 1.0  # seconds
+PERCENTILES = (50, 95, 99)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cycle (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp   REAL NOT NULL,
+    day         TEXT NOT NULL,
+    body_type   TEXT,
+    agv_no      TEXT,
+    cycle_time  REAL,
+    qr1_success INTEGER,
+    qr3_success INTEGER,
+    hole_result INTEGER,
+    arm_correction_fitness REAL,
+    retries     INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS cycle_step (
+    cycle_id    INTEGER NOT NULL REFERENCES cycle(id),
+    step        TEXT NOT NULL,
+    duration    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cycle_day ON cycle(day);
+CREATE INDEX IF NOT EXISTS idx_cycle_step_step ON cycle_step(step);
+"""
+
+
+@dataclass
+class CycleRecord:
+    body_type: str = ""
+    agv_no: str = ""
+    cycle_time: float = 0.0
+    step_durations: dict = field(default_factory=dict)
+    qr1_success: Optional[bool] = None
+    qr3_success: Optional[bool] = None
+    hole_result: Optional[bool] = None
+    arm_correction_fitness: Optional[float] = None
+    retries: int = 0
+    timestamp: float = field(default_factory=time.time)
+
+
+def percentile(sorted_values, percent):
+    """nearest-rank percentile. sorted_values 는 오름차순 정렬된 list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(percent / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _to_int(value):
+    return None if value is None else int(bool(value))
+
+
+class TaktTimeStore:
+    """
+    Args:
+        db_path (str): SQLite 파일 경로
+        batch_size (int): 한번에 기록할 최대 cycle 수
+        flush_interval (float): queue 에 남은 기록을 내보내는 최대 대기 시간 (초)
+    """
+    def __init__(self, db_path, batch_size=WRITE_BATCH_SIZE, flush_interval=WRITE_FLUSH_INTERVAL):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._schema_ready = False
+
+    # ---------------------------------------------------------------
+    # 기록
+    # ---------------------------------------------------------------
+    def append(self, record: CycleRecord):
+        """cycle 기록 추가. 즉시 반환하고 기록은 writer thread 에서 처리."""
+        self._ensure_writer()
+        self._queue.put(record)
+
+    def flush(self, timeout=None):
+        """지금까지 append 된 기록이 저장될 때까지 대기."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._queue.put(None)
+        self._thread.join(self.flush_interval * 5)
+        self._thread = None
+
+    def _ensure_writer(self):
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run_writer, name="TaktTimeStoreWriter", daemon=True)
+            self._thread.start()
+
+    def _connect(self):
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = sqlite3.connect(self.db_path, timeout=5.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        if not self._schema_ready:
+            connection.executescript(_SCHEMA)
+            self._schema_ready = True
+        return connection
+
+    def _run_writer(self):
+        connection = None
+        while True:
+            batch = []
+            waiters = []
+            stop = False
+
+            item = self._queue.get()
+            deadline = time.time() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+
+                if stop or waiters or len(batch) >= self.batch_size:
+                    break
+
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    if connection is None:
+                        connection = self._connect()
+                    self._write_batch(connection, batch)
+                except (sqlite3.Error, OSError) as e:
+                    print(f"[TaktTimeStore.py] - write failed. {e}")
+
+            for waiter in waiters:
+                waiter.set()
+
+            if stop or self._stop_event.is_set():
+                break
+
+        if connection is not None:
+            connection.close()
+
+    @staticmethod
+    def _write_batch(connection, batch):
+        with connection:
+            for record in batch:
+                cursor = connection.execute(
+                    "INSERT INTO cycle (timestamp, day, body_type, agv_no, cycle_time, qr1_success, qr3_success, "
+                    "hole_result, arm_correction_fitness, retries) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (record.timestamp, datetime.fromtimestamp(record.timestamp).strftime("%Y-%m-%d"),
+                     record.body_type, record.agv_no, record.cycle_time,
+                     _to_int(record.qr1_success), _to_int(record.qr3_success), _to_int(record.hole_result),
+                     record.arm_correction_fitness, record.retries))
+                cycle_id = cursor.lastrowid
+                connection.executemany("INSERT INTO cycle_step (cycle_id, step, duration) VALUES (?, ?, ?)",
+                                       [(cycle_id, step, duration) for step, duration in record.step_durations.items()])
+
+    # ---------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------
+    def _query(self, sql, params=()):
+        if not os.path.exists(self.db_path):
+            return []
+        connection = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            return connection.execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            print(f"[TaktTimeStore.py] - query failed. {e}")
+            return []
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _where(since=None, until=None, body_type=None):
+        conditions = []
+        params = []
+        if since is not None:
+            conditions.append("c.day >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("c.day <= ?")
+            params.append(until)
+        if body_type:
+            conditions.append("c.body_type = ?")
+            params.append(body_type)
+        where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+        return where, params
+
+    def step_percentiles(self, group_by="step", step=None, since=None, until=None, body_type=None) -> list:
+        """
+        단계별 p50/p95/p99 (초).
+
+        Args:
+            group_by (str): "step" | "body_type" | "day". step 외의 값이면 (group, step) 별로 계산.
+            step (str): 특정 단계만 조회. "cycle_time" 이면 전체 cycle 시간.
+            since, until (str): "YYYY-MM-DD" 범위
+            body_type (str): 차종 필터
+
+        Returns:
+            list[dict]: {"group", "step", "count", "p50", "p95", "p99"}
+        """
+        if group_by not in ("step", "body_type", "day"):
+            raise ValueError(f"unsupported group_by: {group_by}")
+
+        where, params = self._where(since, until, body_type)
+        group_column = "''" if group_by == "step" else f"c.{group_by}"
+
+        if step == "cycle_time":
+            sql = f"SELECT {group_column}, 'cycle_time', c.cycle_time FROM cycle c{where}"
+        else:
+            sql = f"SELECT {group_column}, s.step, s.duration FROM cycle_step s JOIN cycle c ON c.id = s.cycle_id{where}"
+            if step is not None:
+                sql += (" AND" if where else " WHERE") + " s.step = ?"
+                params.append(step)
+
+        groups = {}
+        for group, step_name, duration in self._query(sql, params):
+            if duration is None:
+                continue
+            groups.setdefault((group, step_name), []).append(duration)
+
+        result = []
+        for (group, step_name), durations in sorted(groups.items()):
+            durations.sort()
+            row = {"group": group, "step": step_name, "count": len(durations)}
+            for percent in PERCENTILES:
+                row[f"p{percent}"] = percentile(durations, percent)
+            result.append(row)
+        return result
+
+    def daily_trend(self, step="cycle_time", days=30, body_type=None) -> list:
+        """최근 days 일 동안 step 의 일별 p50/p95/p99."""
+        since = datetime.fromtimestamp(time.time() - days * 86400).strftime("%Y-%m-%d")
+        return self.step_percentiles(group_by="day", step=step, since=since, body_type=body_type)
+
+    def get_steps(self) -> list:
+        return [row[0] for row in self._query("SELECT DISTINCT step FROM cycle_step ORDER BY step")]
+
+    def get_body_types(self) -> list:
+        return [row[0] for row in self._query("SELECT DISTINCT body_type FROM cycle ORDER BY body_type")]
+
+    def get_result_rates(self, since=None, until=None, body_type=None) -> dict:
+        """QR 성공률, Hole OK 비율, 평균 fitness, 재시도 합계."""
+        where, params = self._where(since, until, body_type)
+        rows = self._query(f"SELECT COUNT(*), AVG(c.qr1_success), AVG(c.qr3_success), AVG(c.hole_result), "
+                           f"AVG(c.arm_correction_fitness), SUM(c.retries) FROM cycle c{where}", params)
+        if not rows:
+            return {}
+        count, qr1, qr3, hole, fitness, retries = rows[0]
+        return {"count": count, "qr1_success_rate": qr1, "qr3_success_rate": qr3,
+                "hole_ok_rate": hole, "arm_correction_fitness": fitness, "retries": retries or 0}
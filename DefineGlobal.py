@@ -66,6 +66,9 @@ MODE_VIP = False
 
 ADMIN_PASSWORD = "3214"
 IMAGE_SAVE_PATH = "D:/BIW/DATA/IMAGE"
+TRACE_SAVE_PATH = "D:/BIW/DATA/TRACE"
+TAKT_TIME_DB_PATH = "D:/BIW/DATA/TAKT/takt_time.db"
+INSPECTION_SPILL_PATH = "D:/BIW/DATA/INSPECTION"
 CONFIG_PATH = "D:/BIW/CONFIG"
 
 SPOT_DATA_PATH = f"D:/BIW/CONFIG/{SELECTED_BODY_TYPE.name}/{SPOT_POSITION.name}"
@@ -73,10 +76,20 @@ SPOT_NAVIGATION_MAP = f"{SPOT_DATA_PATH}/navigation_map_{SELECTED_BODY_TYPE.name
 SPOT_DATA_FILE_NAME = f"spot_data_config_{SELECTED_BODY_TYPE.name}_{SPOT_POSITION.name}.json"
 SPOT_MASTER_DATA_PATH = f"D:/BIW/SPOT_CONTROL/master_data/master/arm_correction/{SPOT_POSITION.name}"
 
+# NE / ME navigation map 상주 방식
+# "single": 차종의 map 만 로봇에 올림 (같은 map 이면 업로드 생략)
+# "merged": NE / ME map 을 합쳐 한 번만 올리고, 차종 전환은 waypoint 이름 namespace 변경으로 처리
+SPOT_MAP_RESIDENCY_MODE = "single"
+SPOT_MERGED_NAVIGATION_MAP = f"{CONFIG_PATH}/MERGED/{SPOT_POSITION.name}/navigation_map_MERGED_{SPOT_POSITION.name}"
+
 # SERVER_URL = "opc.tcp://DESKTOP-B9OTIT0:4990/FactoryTalkLinxGateway1"
 # SERVER_URL = "opc.tcp://localhost:4840"
 # SERVER_URL = "opc.tcp://SPOT-PC-1-RH:4990/FactoryTalkLinx"
 SERVER_URL = "opc.tcp://192.168.1.83:4990/FactoryTalkLinx"  #
+
+# Remote 상태 server (모니터링 station 이 접속)
+REMOTE_SERVER_IP = "0.0.0.0"
+REMOTE_SERVER_PORT = 8500
 SERVER_NAME = "[MF]"
 
 
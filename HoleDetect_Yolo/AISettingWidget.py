@@ -120,7 +120,7 @@ class AISettingWidget(QWidget):
 
     def select_model_path(self):
         file_dialog = QFileDialog(self)
-        file_dialog.setNameFilter("Model files (*.pt)")
+        file_dialog.setNameFilter("Model files (*.pt *.onnx)")
         if file_dialog.exec():
             model_path = file_dialog.selectedFiles()[0]
             self.model_path_line_edit.setText(model_path)
@@ -1,11 +1,12 @@
+import time
+
 import cv2
-import torch
 from PySide6.QtCore import QThread, QObject, Signal
-from PIL import Image
-from torchvision import transforms
 import numpy as np
 
-device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+from HoleDetect_Yolo.YoloOnnxDetector import YoloOnnxDetector
+from HoleDetect_Yolo.YoloTorchDetector import is_model_cached, load_torch_model, model_device
+
 
 class ModelLoaderThread(QThread):
     completed = Signal(object)
@@ -18,10 +19,17 @@ class ModelLoaderThread(QThread):
     def run(self):
         try:
             print("run model load")
-            device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-            model = torch.hub.load('./yolov5', 'custom', path=self.model_path, source='local').to(device)
+            start_time = time.time()
+            if self.model_path.endswith(".onnx"):
+                model = YoloOnnxDetector(self.model_path)
+                model.warm_up()
+            else:
+                cached = is_model_cached(self.model_path)
+                model = load_torch_model(self.model_path)
+                if cached:
+                    print("model already loaded. reuse cached weights.")
             self.completed.emit(model)
-            print("model load complete.")
+            print(f"model load complete. ({time.time() - start_time:.2f}s)")
         except Exception as e:
             self.failed.emit(str(e))
 
@@ -54,7 +62,10 @@ class ModelManager(QObject):
         self.model_path = new_path
         self.load_model()
 
-def preprocess_image(image_path):
+def preprocess_image(image_path, device):
+    from PIL import Image
+    from torchvision import transforms
+
     image = Image.open(image_path)
     transform = transforms.Compose([
         transforms.Resize((640, 640)),
@@ -63,10 +74,41 @@ def preprocess_image(image_path):
     return transform(image).unsqueeze(0).to(device), image.size
 
 
+def infer_frame(image, detector: YoloOnnxDetector, region=None):
+    """
+    메모리의 BGR image 에서 score 가 가장 높은 검출을 그려서 반환.
+    region (x, y, w, h) 이 주어지면 해당 영역만 원본 해상도 타일로 검출.
+    """
+    try:
+        result = detector.detect(image) if region is None else detector.detect_region(image, region)
+        best_result = result.best()
+    except Exception as e:
+        print(f"YoloManager.py - infer_frame: {e}")
+        return None, str(e)
+
+    if best_result is None:
+        return None, "No detections."
+
+    x1, y1, x2, y2, score, class_id = best_result
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    image = image.copy()
+    cv2.rectangle(image, (x1, y1), (x2, y2), (0, 255, 0), 2)
+    label_text = f'Class: {class_id}, Score: {score:.2f}'
+    cv2.putText(image, label_text, (x1, y1 - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+    return image, label_text
+
+
 def infer_image(image_path, model):
-    image_tensor, original_size = preprocess_image(image_path)
+    if isinstance(model, YoloOnnxDetector):
+        return infer_frame(cv2.imread(image_path), model)
+
+    import torch
+
+    image_tensor, original_size = preprocess_image(image_path, model_device(model))
     try:
-        results = model(image_tensor)
+        # torch.hub AutoShape 가 해주던 inference mode 를 직접 적용 (grad 기록 X)
+        with torch.inference_mode():
+            results = model(image_tensor)
     except Exception as e:
         print(f"YoloManager.py - infer_image: {e}")
         return None, str(e)
@@ -0,0 +1,322 @@
+import os
+import threading
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+import onnxruntime as ort
+
+# YOLOv5 ONNX hole detector (CPU 추론용)
+# - session 은 생성 시 한 번만 로드 (graph 최적화 + intra/inter-op thread 설정)
+# - 메모리의 BGR frame 을 받아 letterbox 전처리 -> 재사용하는 입력 buffer 에 기록
+# - 후처리(confidence filter, xywh->xyxy, NMS, 좌표 복원)는 NumPy 벡터 연산
+# - 여러 crop 을 한 번에 추론 (batch). batch 축이 고정된 model 이면 1장씩 실행
+# - detect_region: 검사 영역(+margin)만 잘라 원본 해상도로 input_size 타일(겹침 포함)로 나눠 batch 추론,
+#   원본 좌표로 복원 후 타일 사이 중복을 NMS 로 제거 (4K 전체를 640 으로 줄이면 작은 hole 이 사라짐)
+#
+# ONNX export (batch 사용 시 --dynamic):
+#     python yolov5/export.py --weights best.pt --include onnx --dynamic
+
+INPUT_SIZE = 640
+CONF_THRESHOLD = 0.25
+IOU_THRESHOLD = 0.45
+MAX_DETECTIONS = 300
+MAX_BATCH = 8
+LETTERBOX_COLOR = 114
+_MAX_WH = 7680  # class 별 NMS 를 위한 box offset
+REGION_MARGIN = 64
+TILE_OVERLAP = 128
+
+
+@dataclass
+class DetectionResult:
+    """
+    원본 frame 좌표 기준 검출 결과.
+
+    boxes: (N, 4) float32 [x1, y1, x2, y2], scores: (N,) float32, class_ids: (N,) int32
+    """
+    boxes: np.ndarray
+    scores: np.ndarray
+    class_ids: np.ndarray
+
+    def __len__(self):
+        return len(self.scores)
+
+    @classmethod
+    def empty(cls):
+        return cls(np.zeros((0, 4), np.float32), np.zeros(0, np.float32), np.zeros(0, np.int32))
+
+    def best(self):
+        """score 가 가장 높은 검출 (x1, y1, x2, y2, score, class_id). 없으면 None."""
+        if not len(self):
+            return None
+        index = int(np.argmax(self.scores))
+        x1, y1, x2, y2 = self.boxes[index].tolist()
+        return x1, y1, x2, y2, float(self.scores[index]), int(self.class_ids[index])
+
+
+def letterbox_params(shape, new_size, scale_up=True):
+    """(ratio, (pad_x, pad_y), (resized_w, resized_h)). 비율 유지, 가운데 정렬. scale_up=False 이면 확대하지 않음."""
+    height, width = shape[:2]
+    ratio = min(new_size / height, new_size / width)
+    if not scale_up:
+        ratio = min(ratio, 1.0)
+    resized_w, resized_h = int(round(width * ratio)), int(round(height * ratio))
+    pad_x, pad_y = (new_size - resized_w) // 2, (new_size - resized_h) // 2
+    return ratio, (pad_x, pad_y), (resized_w, resized_h)
+
+
+def letterbox_into(image, canvas, scale_up=True):
+    """
+    image 를 canvas (new_size, new_size, 3) 에 letterbox 로 기록합니다. canvas 는 재사용.
+
+    Returns:
+        (ratio, (pad_x, pad_y))
+    """
+    new_size = canvas.shape[0]
+    ratio, (pad_x, pad_y), (resized_w, resized_h) = letterbox_params(image.shape, new_size, scale_up)
+
+    canvas.fill(LETTERBOX_COLOR)
+    target = canvas[pad_y:pad_y + resized_h, pad_x:pad_x + resized_w]
+    if (resized_w, resized_h) == (image.shape[1], image.shape[0]):
+        target[...] = image
+    else:
+        cv2.resize(image, (resized_w, resized_h), dst=target, interpolation=cv2.INTER_LINEAR)
+    return ratio, (pad_x, pad_y)
+
+
+def box_iou_one_to_many(box, boxes):
+    x1 = np.maximum(box[0], boxes[:, 0])
+    y1 = np.maximum(box[1], boxes[:, 1])
+    x2 = np.minimum(box[2], boxes[:, 2])
+    y2 = np.minimum(box[3], boxes[:, 3])
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area = (box[2] - box[0]) * (box[3] - box[1])
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    return intersection / np.maximum(area + areas - intersection, 1e-9)
+
+
+def nms(boxes, scores, iou_threshold=IOU_THRESHOLD, max_detections=MAX_DETECTIONS):
+    """
+    greedy NMS. 반복마다 남은 box 전체와의 IoU 를 한 번에 계산합니다.
+
+    Returns:
+        np.ndarray: 남긴 box 의 index (score 내림차순)
+    """
+    order = np.argsort(-scores, kind="stable")
+    keep = []
+    while order.size and len(keep) < max_detections:
+        index = order[0]
+        keep.append(index)
+        if order.size == 1:
+            break
+        iou = box_iou_one_to_many(boxes[index], boxes[order[1:]])
+        order = order[1:][iou <= iou_threshold]
+    return np.asarray(keep, dtype=np.int64)
+
+
+def tile_starts(length, tile_size, overlap):
+    """한 축의 타일 시작 위치. 마지막 타일은 끝에 맞춤."""
+    if length <= tile_size:
+        return [0]
+    step = max(1, tile_size - overlap)
+    starts = list(range(0, length - tile_size, step))
+    starts.append(length - tile_size)
+    return starts
+
+
+def expand_region(region, margin, shape):
+    """(x, y, w, h) 에 margin 을 더하고 frame 안으로 자른 (x1, y1, x2, y2)."""
+    x, y, w, h = region
+    height, width = shape[:2]
+    return max(0, x - margin), max(0, y - margin), min(width, x + w + margin), min(height, y + h + margin)
+
+
+def xywh_to_xyxy(xywh):
+    xyxy = np.empty_like(xywh)
+    half_w = xywh[:, 2] / 2
+    half_h = xywh[:, 3] / 2
+    xyxy[:, 0] = xywh[:, 0] - half_w
+    xyxy[:, 1] = xywh[:, 1] - half_h
+    xyxy[:, 2] = xywh[:, 0] + half_w
+    xyxy[:, 3] = xywh[:, 1] + half_h
+    return xyxy
+
+
+def postprocess(prediction, conf_threshold=CONF_THRESHOLD, iou_threshold=IOU_THRESHOLD,
+                max_detections=MAX_DETECTIONS, agnostic=False):
+    """
+    YOLOv5 출력 1장 (N, 5 + nc) [cx, cy, w, h, obj, cls...] -> (boxes xyxy, scores, class_ids). 입력(letterbox) 좌표.
+    """
+    prediction = prediction[prediction[:, 4] > conf_threshold]
+    if not len(prediction):
+        return DetectionResult.empty()
+
+    class_scores = prediction[:, 5:] * prediction[:, 4:5]
+    if class_scores.shape[1] == 1:
+        class_ids = np.zeros(len(prediction), np.int32)
+        scores = class_scores[:, 0]
+    else:
+        class_ids = class_scores.argmax(axis=1).astype(np.int32)
+        scores = class_scores[np.arange(len(class_scores)), class_ids]
+
+    mask = scores > conf_threshold
+    if not mask.any():
+        return DetectionResult.empty()
+    boxes = xywh_to_xyxy(prediction[mask, :4])
+    scores = scores[mask].astype(np.float32)
+    class_ids = class_ids[mask]
+
+    offsets = 0 if agnostic else class_ids[:, None].astype(np.float32) * _MAX_WH
+    keep = nms(boxes + offsets, scores, iou_threshold, max_detections)
+    return DetectionResult(boxes[keep].astype(np.float32), scores[keep], class_ids[keep])
+
+
+class YoloOnnxDetector:
+    """
+    Args:
+        model_path (str): YOLOv5 ONNX export 경로
+        input_size (int): model 입력 크기 (정사각형)
+        conf_threshold (float): confidence 임계값
+        iou_threshold (float): NMS IoU 임계값
+        intra_op_threads (int): 연산 내부 병렬 thread 수. None 이면 물리 core 수
+        inter_op_threads (int): 연산 간 병렬 thread 수 (YOLO 는 순차 graph 라 1 이 유리)
+        max_batch (int): detect_batch 한 번에 실행할 최대 frame 수
+        providers (list): onnxruntime execution provider. None 이면 CPU
+    """
+    def __init__(self, model_path, input_size=INPUT_SIZE, conf_threshold=CONF_THRESHOLD,
+                 iou_threshold=IOU_THRESHOLD, intra_op_threads=None, inter_op_threads=1,
+                 max_batch=MAX_BATCH, providers=None):
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(model_path)
+
+        self.model_path = model_path
+        self.input_size = input_size
+        self.conf_threshold = conf_threshold
+        self.iou_threshold = iou_threshold
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.intra_op_num_threads = intra_op_threads or max(1, (os.cpu_count() or 2) // 2)
+        options.inter_op_num_threads = inter_op_threads
+        options.enable_mem_pattern = True
+        self.session = ort.InferenceSession(model_path, sess_options=options,
+                                            providers=providers or ["CPUExecutionProvider"])
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.output_name = self.session.get_outputs()[0].name
+        # batch 축이 숫자로 고정되어 있으면 (export 시 --dynamic 미사용) 1장씩 실행
+        self.dynamic_batch = not isinstance(model_input.shape[0], int)
+        self.max_batch = max_batch if self.dynamic_batch else 1
+
+        self._input_buffer = np.empty((self.max_batch, 3, input_size, input_size), np.float32)
+        self._canvas = np.empty((input_size, input_size, 3), np.uint8)
+        self._lock = threading.Lock()
+
+    def warm_up(self, runs=2):
+        """첫 추론의 graph 초기화 / 메모리 할당 비용을 미리 치릅니다."""
+        frame = np.full((self.input_size, self.input_size, 3), LETTERBOX_COLOR, np.uint8)
+        for _ in range(runs):
+            self.detect(frame)
+
+    def _preprocess_into(self, index, frame, scale_up=True):
+        """BGR frame -> letterbox -> RGB CHW float32 [0, 1] 로 입력 buffer[index] 에 기록."""
+        ratio, pad = letterbox_into(frame, self._canvas, scale_up)
+        np.multiply(self._canvas[..., ::-1].transpose(2, 0, 1), 1.0 / 255.0,
+                    out=self._input_buffer[index], casting="unsafe")
+        return ratio, pad
+
+    def _restore(self, result: DetectionResult, ratio, pad, shape):
+        if not len(result):
+            return result
+        boxes = result.boxes
+        boxes[:, [0, 2]] -= pad[0]
+        boxes[:, [1, 3]] -= pad[1]
+        boxes /= ratio
+        boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, shape[1])
+        boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, shape[0])
+        return result
+
+    def detect(self, frame) -> DetectionResult:
+        """BGR frame (H, W, 3) 1장 검출."""
+        return self.detect_batch([frame])[0]
+
+    def detect_batch(self, frames, scale_up=True) -> list:
+        """
+        여러 BGR frame (crop) 을 max_batch 단위로 묶어서 검출.
+
+        Args:
+            scale_up (bool): False 이면 input_size 보다 작은 frame 을 확대하지 않고 padding 만 추가
+
+        Returns:
+            list[DetectionResult]: frames 와 같은 순서
+        """
+        results = []
+        with self._lock:
+            for start in range(0, len(frames), self.max_batch):
+                chunk = frames[start:start + self.max_batch]
+                letterboxes = [self._preprocess_into(index, frame, scale_up) for index, frame in enumerate(chunk)]
+
+                outputs = self.session.run([self.output_name],
+                                           {self.input_name: self._input_buffer[:len(chunk)]})[0]
+
+                for prediction, (ratio, pad), frame in zip(outputs, letterboxes, chunk):
+                    result = postprocess(prediction, self.conf_threshold, self.iou_threshold)
+                    results.append(self._restore(result, ratio, pad, frame.shape))
+        return results
+
+    def detect_region(self, frame, region, margin=REGION_MARGIN, overlap=TILE_OVERLAP) -> DetectionResult:
+        """
+        검사 영역만 원본 해상도로 검출.
+
+        region(+margin) 을 잘라 input_size 타일(overlap 만큼 겹침)로 나누고 한 batch 로 추론한 뒤
+        frame 좌표로 옮겨 타일 사이 중복 검출을 NMS 로 제거합니다.
+
+        Args:
+            frame: BGR frame (H, W, 3)
+            region (tuple): (x, y, w, h)
+            margin (int): region 바깥으로 더 포함할 pixel
+            overlap (int): 이웃 타일이 겹치는 pixel (검출 대상 크기보다 크게)
+
+        Returns:
+            DetectionResult: frame 좌표 기준
+        """
+        x1, y1, x2, y2 = expand_region(region, margin, frame.shape)
+        if x2 <= x1 or y2 <= y1:
+            return DetectionResult.empty()
+
+        tiles, origins = [], []
+        for tile_y in tile_starts(y2 - y1, self.input_size, overlap):
+            for tile_x in tile_starts(x2 - x1, self.input_size, overlap):
+                origin_x, origin_y = x1 + tile_x, y1 + tile_y
+                tiles.append(frame[origin_y:min(y2, origin_y + self.input_size),
+                                   origin_x:min(x2, origin_x + self.input_size)])
+                origins.append((origin_x, origin_y))
+
+        tile_results = self.detect_batch(tiles, scale_up=False)
+        if len(tile_results) == 1:
+            result = tile_results[0]
+            result.boxes += np.asarray(origins[0] * 2, np.float32)
+            return result
+
+        boxes = np.concatenate([result.boxes + np.asarray(origin * 2, np.float32)
+                                for result, origin in zip(tile_results, origins)])
+        if not len(boxes):
+            return DetectionResult.empty()
+        scores = np.concatenate([result.scores for result in tile_results])
+        class_ids = np.concatenate([result.class_ids for result in tile_results])
+
+        # 타일 사이 중복 제거
+        keep = nms(boxes + class_ids[:, None].astype(np.float32) * _MAX_WH, scores, self.iou_threshold)
+        return DetectionResult(boxes[keep], scores[keep], class_ids[keep])
+
+
+def draw_detections(image, result: DetectionResult, color=(0, 255, 0)):
+    for (x1, y1, x2, y2), score, class_id in zip(result.boxes.astype(int).tolist(),
+                                                 result.scores.tolist(), result.class_ids.tolist()):
+        cv2.rectangle(image, (x1, y1), (x2, y2), color, 2)
+        cv2.putText(image, f'Class: {class_id}, Score: {score:.2f}', (x1, y1 - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
+    return image
@@ -0,0 +1,110 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# YOLOv5 (.pt) model 로딩
+# 기존: torch.hub.load('./yolov5', 'custom', source='local')
+#   - model 을 바꿀 때마다 hubconf 를 다시 읽고 import / sys.path 처리를 반복
+#   - cwd 기준 경로라 yolov5 사본이 여러 개 (yolov5/, HoleDetect_Yolo/yolov5/, HoleDetect_Yolo/utils)
+# 변경: project root 의 yolov5/ 하나만 사용. hubconf 를 거치지 않고 DetectMultiBackend 로 바로 생성하고,
+#       (절대 경로, mtime, device) 를 key 로 load 한 model 을 cache. 같은 weight 로 다시 바꾸면 load 없이 재사용.
+# torch 는 이 module 의 함수를 처음 호출할 때 import (프로그램 시작 시간에 포함되지 않음).
+
+YOLOV5_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "yolov5")
+MODEL_CACHE_SIZE = 2        # 메모리에 유지할 model 개수 (AISettingWidget 에서 두 model 을 번갈아 비교하는 경우)
+WARM_UP_SIZE = 640
+
+_model_cache = OrderedDict()    # (path, mtime, device) -> model
+_model_cache_lock = threading.Lock()
+
+
+def _add_yolov5_path():
+    """yolov5 code 는 models / utils 를 top-level package 로 import 합니다."""
+    if YOLOV5_ROOT not in sys.path:
+        sys.path.insert(0, YOLOV5_ROOT)
+
+
+def default_device():
+    import torch
+    return torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+
+
+def model_device(model):
+    return next(model.parameters()).device
+
+
+def model_cache_key(model_path, device):
+    path = os.path.abspath(model_path)
+    return path, os.path.getmtime(path), str(device)
+
+
+def is_model_cached(model_path, device=None) -> bool:
+    try:
+        key = model_cache_key(model_path, device if device is not None else default_device())
+    except OSError:
+        return False
+    with _model_cache_lock:
+        return key in _model_cache
+
+
+def warm_up_model(model, image_size=WARM_UP_SIZE):
+    """첫 추론의 초기화 비용 (cudnn 설정, memory 할당) 을 load 시점에 미리 처리."""
+    import torch
+    parameter = next(model.parameters())
+    with torch.inference_mode():
+        model(torch.zeros((1, 3, image_size, image_size), device=parameter.device, dtype=parameter.dtype))
+
+
+def load_torch_model(model_path, device=None, warm_up=True):
+    """
+    YOLOv5 weight 를 load 합니다. 같은 파일(mtime 포함) / device 는 cache 된 model 을 반환.
+
+    Args:
+        model_path (str): .pt 파일
+        device: torch.device 또는 "cpu" / "cuda". None 이면 cuda 가 있으면 cuda.
+        warm_up (bool): 새로 load 한 경우 dummy 입력으로 한 번 추론
+
+    Returns:
+        DetectMultiBackend: model(tensor) 출력은 torch.hub 'custom' model 에 tensor 를 넣은 경우와 같음.
+    """
+    import torch
+    device = torch.device(device) if device is not None else default_device()
+    key = model_cache_key(model_path, device)
+
+    # load 중에도 lock 유지: 같은 weight 를 두 thread 가 동시에 load 해서 memory 를 두 배로 쓰지 않도록
+    with _model_cache_lock:
+        model = _model_cache.get(key)
+        if model is not None:
+            _model_cache.move_to_end(key)
+            return model
+
+        _add_yolov5_path()
+        from models.common import DetectMultiBackend
+
+        start_time = time.time()
+        model = DetectMultiBackend(key[0], device=device, fuse=True)
+        model.eval()
+        if warm_up:
+            warm_up_model(model)
+        print(f"YoloTorchDetector.py - Loaded {os.path.basename(key[0])} on {device}. "
+              f"({time.time() - start_time:.2f}s)")
+
+        # 같은 파일의 이전 버전(mtime 이 다름) 과 오래된 model 은 제거
+        stale_keys = [cached_key for cached_key in _model_cache if cached_key[0] == key[0]]
+        for cached_key in stale_keys:
+            del _model_cache[cached_key]
+        _model_cache[key] = model
+        evicted = len(stale_keys) + max(0, len(_model_cache) - MODEL_CACHE_SIZE)
+        while len(_model_cache) > MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+
+    if evicted and device.type == 'cuda':
+        torch.cuda.empty_cache()
+    return model
+
+
+def clear_model_cache():
+    with _model_cache_lock:
+        _model_cache.clear()
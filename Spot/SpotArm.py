@@ -7,6 +7,8 @@ from bosdyn.client.frame_helpers import GRAV_ALIGNED_BODY_FRAME_NAME, ODOM_FRAME
 from bosdyn.client.robot_command import RobotCommandBuilder, block_until_arm_arrives
 from bosdyn.util import seconds_to_duration
 
+from biw_utils.profiler import trace
+
 class SpotArm:
     """
     Spot 로봇의 팔을 제어하는 클래스입니다.
@@ -68,6 +70,7 @@ class SpotArm:
         """
         self.JOINT_TIME_SEC = value
 
+    @trace(category="arm")
     def stow(self):
         """
         팔을 접힌 상태로 변환하는 커맨드를 실행합니다.
@@ -172,6 +175,7 @@ class SpotArm:
                                                                  params=self.joint_params.values(),
                                                                  time_secs=self.JOINT_TIME_SEC)
 
+    @trace(category="arm")
     def joint_move_manual(self, params):
         """
         지정된 관절 파라미터를 사용하여 관절을 이동시키는 커맨드를 실행합니다.
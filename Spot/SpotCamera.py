@@ -2,7 +2,11 @@ import cv2
 from bosdyn.api import image_pb2, gripper_camera_param_pb2
 from bosdyn.client.image import build_image_request
 import numpy as np
-from scipy import ndimage
+
+from biw_utils.lazy_import import lazy_import
+from biw_utils.profiler import trace
+
+ndimage = lazy_import("scipy.ndimage")
 
 
 class SpotCamera:
@@ -22,6 +26,7 @@ class SpotCamera:
         self.image_client = robot.image_client
         self.gripper_client = robot.gripper_camera_param_client
 
+    @trace(category="capture")
     def take_image(self):
         """
         이미지를 촬영하는 메소드입니다.
@@ -1,12 +1,23 @@
+import time
+
 from bosdyn.api import gripper_camera_param_pb2
 from google.protobuf import wrappers_pb2
 
+from biw_utils.profiler import trace
+
+CAMERA_READY_POLL = 0.05        # seconds
+FOCUS_TOLERANCE = 0.01
+
 
 class SpotCameraParameter:
     def __init__(self):
         self.gripper_camera_param_client = None
         self.request = gripper_camera_param_pb2.GripperCameraGetParamRequest()
 
+        # 마지막으로 요청한 focus / LED 설정 (wait_until_camera_ready 에서 비교)
+        self.requested_focus = None
+        self.requested_led_mode = None
+
     def initialize(self, robot):
         self.gripper_camera_param_client = robot.gripper_camera_param_client
 
@@ -69,6 +80,7 @@ class SpotCameraParameter:
 
         return s_resolution
 
+    @trace(category="camera")
     def set_resolution(self, s_resolution, b_flag=True):
         """
         :param s_resolution:
@@ -187,10 +199,12 @@ class SpotCameraParameter:
 
         return b_focus_auto, f_focus_absolute
 
+    @trace(category="camera")
     def set_focus(self, b_focus_auto, f_focus_absolute, b_flag=True):
         gb_focus_auto     = wrappers_pb2.BoolValue(value=b_focus_auto)
         gf_focus_absolute = wrappers_pb2.FloatValue(value=f_focus_absolute)
         if b_flag:
+            self.requested_focus = (b_focus_auto, f_focus_absolute)
             if b_focus_auto:
                 params = gripper_camera_param_pb2.GripperCameraParams(focus_auto=gb_focus_auto)
             else:
@@ -284,6 +298,7 @@ class SpotCameraParameter:
         params = self.get_gripper_params()
         return params.led_mode
 
+    @trace(category="camera")
     def set_led_mode(self, s_led_mode, b_flag=True):
         gn_led_mode = None
         if s_led_mode == 'OFF':
@@ -296,6 +311,7 @@ class SpotCameraParameter:
             gn_led_mode = gripper_camera_param_pb2.GripperCameraParams.LED_MODE_BOTH
 
         if b_flag:
+            self.requested_led_mode = gn_led_mode
             params = gripper_camera_param_pb2.GripperCameraParams(led_mode=gn_led_mode)
             request = gripper_camera_param_pb2.GripperCameraParamRequest(params=params)
 
@@ -308,6 +324,7 @@ class SpotCameraParameter:
         params = self.get_gripper_params()
         return params.led_mode
 
+    @trace(category="camera")
     def set_led_torch_brightness(self, f_torch_brightness, b_flag=True):
         if self.get_gripper_params().led_mode:
             return None
@@ -320,3 +337,39 @@ class SpotCameraParameter:
             return response
         else:
             return gf_led_torch_brightness
+
+    def is_camera_ready(self, params, previous_params=None) -> bool:
+        """
+        요청한 focus / LED 설정이 적용되었고, 직전 조회 결과와 focus 값이 같으면 ready.
+        """
+        if self.requested_led_mode is not None and params.led_mode != self.requested_led_mode:
+            return False
+
+        if self.requested_focus is not None:
+            b_focus_auto, f_focus_absolute = self.requested_focus
+            if params.focus_auto.value != b_focus_auto:
+                return False
+            if not b_focus_auto and abs(params.focus_absolute.value - f_focus_absolute) > FOCUS_TOLERANCE:
+                return False
+
+        if previous_params is None:
+            return False
+        return abs(params.focus_absolute.value - previous_params.focus_absolute.value) <= FOCUS_TOLERANCE
+
+    @trace(category="camera")
+    def wait_until_camera_ready(self, timeout=1.5):
+        """
+        촬영 전 focus 안정 여부 확인. 준비되면 바로 반환.
+
+        Returns:
+            (bool, float): (ready 여부, 소요 시간)
+        """
+        start_time = time.time()
+        previous_params = None
+        while time.time() - start_time < timeout:
+            params = self.get_gripper_params()
+            if self.is_camera_ready(params, previous_params):
+                return True, time.time() - start_time
+            previous_params = params
+            time.sleep(CAMERA_READY_POLL)
+        return False, time.time() - start_time
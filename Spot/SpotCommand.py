@@ -1,10 +1,37 @@
+import logging
 import time
+from dataclasses import dataclass
+from typing import Optional
 
 from bosdyn.api import arm_command_pb2, synchronized_command_pb2, robot_command_pb2, geometry_pb2
 from bosdyn.client import ResponseError, RpcError, LeaseUseError
+from bosdyn.client.async_tasks import AsyncPeriodicQuery
 from bosdyn.client.lease import Error as LeaseBaseError
 from bosdyn.client.robot_command import RobotCommandBuilder
 
+from biw_utils.profiler import trace
+
+LOGGER = logging.getLogger()
+
+ARM_JOINT_NAMES = ("arm0.sh0", "arm0.sh1", "arm0.el0", "arm0.el1", "arm0.wr0", "arm0.wr1")
+
+# Arm 도착 판정 (joint state feedback)
+ARM_STATE_PERIOD       = 0.02   # seconds, 도착 대기 중 robot state 요청 주기
+ARM_JOINT_TOLERANCE    = 0.02   # rad, 목표 joint 와의 최대 오차
+ARM_VELOCITY_TOLERANCE = 0.05   # rad/s, 최대 joint 속도
+ARM_SETTLE_DWELL       = 0.1    # seconds, 위 조건을 연속으로 만족해야 하는 시간
+ARM_SETTLE_MARGIN      = 1.0    # seconds, 이동 시간 + dwell 이후 추가로 기다리는 여유 (feedback 지연, 마지막 감속)
+ARM_SETTLE_RETRY       = 1      # timeout 후 다시 기다리는 횟수. 그래도 도착하지 않으면 ArmNotSettledError
+
+
+def arm_settle_timeout(move_time_sec) -> float:
+    """joint 이동 시간 (time_secs) 으로 보낸 arm 명령의 도착 대기 시간."""
+    return move_time_sec + ARM_SETTLE_DWELL + ARM_SETTLE_MARGIN
+
+
+class ArmNotSettledError(Exception):
+    """arm 이 목표 자세에 도착하지 않음. 이 상태로 촬영하지 않도록 단계를 실패 처리."""
+
 
 def try_grpc(desc, thunk):
     """
@@ -79,6 +106,112 @@ def make_robot_command(arm_joint_traj, gripper_open_flag=False):
     return RobotCommandBuilder.build_synchro_command(arm_sync_robot_cmd)
 
 
+class AsyncRobotState(AsyncPeriodicQuery):
+    """Grab robot state."""
+
+    def __init__(self, robot_state_client, period_sec=0.2):
+        super(AsyncRobotState, self).__init__("robot_state", robot_state_client, LOGGER,
+                                              period_sec=period_sec)
+
+    def _start_query(self):
+        return self._client.get_robot_state_async()
+
+
+@dataclass
+class ArmSettleResult:
+    arrived: bool
+    settle_time: float                      # 대기 시작부터 도착 판정까지 (초)
+    joint_error: Optional[float] = None     # 마지막 최대 joint 오차 (rad)
+    joint_velocity: Optional[float] = None  # 마지막 최대 joint 속도 (rad/s)
+
+    def summary(self) -> str:
+        state = "settled" if self.arrived else "timeout"
+        error = "-" if self.joint_error is None else f"{self.joint_error:.4f}rad"
+        velocity = "-" if self.joint_velocity is None else f"{self.joint_velocity:.4f}rad/s"
+        return f"arm {state}: {self.settle_time:.3f}s (error: {error}, velocity: {velocity})"
+
+
+class ArmArrivalDetector:
+    """
+    joint state feedback 로 arm 도착을 판정합니다.
+    목표 joint 와의 오차, joint 속도가 모두 tolerance 이하인 상태가 dwell 동안 유지되면 도착.
+
+    Args:
+        robot_state_client: RobotStateClient
+        joint_tolerance (float): rad
+        velocity_tolerance (float): rad/s
+        dwell (float): seconds
+        period (float): robot state 요청 주기 (초)
+    """
+    def __init__(self, robot_state_client, joint_tolerance=ARM_JOINT_TOLERANCE,
+                 velocity_tolerance=ARM_VELOCITY_TOLERANCE, dwell=ARM_SETTLE_DWELL, period=ARM_STATE_PERIOD):
+        self.joint_tolerance = joint_tolerance
+        self.velocity_tolerance = velocity_tolerance
+        self.dwell = dwell
+        self.period = period
+        self._state_task = AsyncRobotState(robot_state_client, period_sec=period)
+
+    @staticmethod
+    def get_arm_joint_states(robot_state):
+        """
+        Returns:
+            dict: {joint name: (position, velocity)}
+        """
+        joint_states = {}
+        for joint_state in robot_state.kinematic_state.joint_states:
+            if joint_state.name in ARM_JOINT_NAMES:
+                joint_states[joint_state.name] = (joint_state.position.value, joint_state.velocity.value)
+        return joint_states
+
+    def measure(self, robot_state, target=None):
+        """
+        Returns:
+            (float, float): (최대 joint 오차, 최대 joint 속도). target 이 None 이면 오차는 0.
+            arm joint state 가 없으면 (None, None)
+        """
+        joint_states = self.get_arm_joint_states(robot_state)
+        if len(joint_states) < len(ARM_JOINT_NAMES):
+            return None, None
+
+        joint_velocity = max(abs(joint_states[name][1]) for name in ARM_JOINT_NAMES)
+        if target is None:
+            return 0.0, joint_velocity
+        joint_error = max(abs(joint_states[name][0] - value) for name, value in zip(ARM_JOINT_NAMES, target))
+        return joint_error, joint_velocity
+
+    def wait(self, target=None, timeout=5.0) -> ArmSettleResult:
+        """
+        arm 이 target 자세에 도착해 멈출 때까지 대기합니다.
+
+        Args:
+            target (list): [sh0, sh1, el0, el1, wr0, wr1]. None 이면 정지 여부만 판정.
+            timeout (float): 최대 대기 시간 (초)
+        """
+        start_time = time.time()
+        end_time = start_time + timeout
+        settled_since = None
+        last_state = None
+        joint_error, joint_velocity = None, None
+
+        while time.time() < end_time:
+            self._state_task.update()
+            robot_state = self._state_task.proto
+            if robot_state is not None and robot_state is not last_state:
+                last_state = robot_state
+                joint_error, joint_velocity = self.measure(robot_state, target)
+                if joint_error is not None and joint_error <= self.joint_tolerance \
+                        and joint_velocity <= self.velocity_tolerance:
+                    if settled_since is None:
+                        settled_since = time.time()
+                    if time.time() - settled_since >= self.dwell:
+                        return ArmSettleResult(True, time.time() - start_time, joint_error, joint_velocity)
+                else:
+                    settled_since = None
+            time.sleep(self.period / 2)
+
+        return ArmSettleResult(False, time.time() - start_time, joint_error, joint_velocity)
+
+
 class RobotCommandExecutor:
     """
     Spot 로봇의 커맨드 실행을 담당하는 클래스입니다.
@@ -92,6 +225,7 @@ class RobotCommandExecutor:
         """
         self._robot = None
         self.robot_command_client = None
+        self.arm_arrival_detector = None
         self.VELOCITY_CMD_DURATION = 0.6  # seconds
 
     def initialize(self, robot):
@@ -103,6 +237,7 @@ class RobotCommandExecutor:
         """
         self._robot = robot.robot
         self.robot_command_client  = robot.robot_command_client
+        self.arm_arrival_detector  = ArmArrivalDetector(robot.robot_state_client)
 
     def start_robot_command(self, desc, command_proto, end_time_secs=None):
         """
@@ -169,6 +304,7 @@ class RobotCommandExecutor:
         cmd_id = self.start_robot_command(desc=desc, command_proto=command)
         return cmd_id
 
+    @trace(category="arm")
     def wait_until_arm_arrives(self, cmd_id, timeout=5):
         """
         로봇 팔이 목표 위치에 도착할 때까지 대기하는 메소드입니다.
@@ -205,6 +341,42 @@ class RobotCommandExecutor:
 
             time.sleep(0.1)
 
+    @trace(category="arm")
+    def wait_until_arm_settles(self, target=None, timeout=5) -> ArmSettleResult:
+        """
+        joint state feedback 로 arm 도착을 판정하고, 도착하면 바로 반환합니다.
+
+        Args:
+            target (list): 목표 joint [sh0, sh1, el0, el1, wr0, wr1]. None 이면 정지 여부만 판정.
+            timeout (float): 최대 대기 시간 (초)
+
+        Returns:
+            ArmSettleResult: 도착 여부와 실제 소요 시간
+        """
+        return self.arm_arrival_detector.wait(target, timeout)
+
+    @trace(category="arm")
+    def wait_until_arm_settled(self, target, move_time_sec, retries=ARM_SETTLE_RETRY) -> ArmSettleResult:
+        """
+        time_secs=move_time_sec 로 보낸 arm 명령이 도착할 때까지 대기합니다.
+        arm_settle_timeout() 안에 도착하지 않으면 retries 번 더 기다리고, 그래도 도착하지 않으면 raise.
+
+        Args:
+            target (list): 목표 joint [sh0, sh1, el0, el1, wr0, wr1]. None 이면 정지 여부만 판정.
+            move_time_sec (float): arm 명령의 이동 시간 (SpotArm.JOINT_TIME_SEC)
+
+        Raises:
+            ArmNotSettledError: 마지막 대기까지 도착하지 않음
+        """
+        start_time = time.time()
+        timeout = arm_settle_timeout(move_time_sec)
+        for _ in range(retries + 1):
+            result = self.arm_arrival_detector.wait(target, timeout)
+            result.settle_time = time.time() - start_time
+            if result.arrived:
+                return result
+        raise ArmNotSettledError(result.summary())
+
     def wait_command(self, cmd_id, timeout=5):
         while True:
             feedback_resp = self.robot_command_client.robot_command_feedback(cmd_id)
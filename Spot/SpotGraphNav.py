@@ -1,3 +1,4 @@
+import math
 import os
 import time
 from datetime import datetime
@@ -14,6 +15,13 @@ from bosdyn.client.math_helpers import Quat, SE3Pose
 from bosdyn.client.recording import GraphNavRecordingServiceClient, NotRecordingError
 
 from Spot import graph_nav_util
+from Spot.SpotMapSync import SpotMapSync
+from Spot.SpotNavPolling import AdaptivePollSchedule, NavigationPoller
+from Spot.SpotRoutePlanner import RouteLeg, SpotRoutePlanner
+from biw_utils.profiler import trace
+
+
+WAYPOINT_ARRIVAL_DISTANCE = 0.5  # m, 경유 waypoint 통과 판정 거리
 
 
 class SpotGraphNav:
@@ -38,9 +46,15 @@ class SpotGraphNav:
         self._current_waypoint_snapshots = dict()  # maps id to waypoint snapshot
         self._current_edge_snapshots = dict()  # maps id to edge snapshot
         self._current_annotation_name_to_wp_id = dict()
+        self.route_planner = SpotRoutePlanner()  # shortest path / route cache over the current graph
+        self.last_legs = []
+        self.map_sync = SpotMapSync()
+        self.nav_poller = NavigationPoller(AdaptivePollSchedule())
+        self.last_poll_stats = None
 
     def initialize(self, robot):
         self._graph_nav_client = robot.graph_nav_client
+        self.map_sync.graph_nav_client = robot.graph_nav_client
         self.list_graph_waypoint_and_edge_ids()
 
     def get_localization_state(self, *args):
@@ -81,6 +95,31 @@ class SpotGraphNav:
                 return False
         return True
 
+    def relocalize_near(self, waypoint):
+        """
+        로봇이 waypoint 근처에 있다고 보고 가장 가까운 fiducial 로 다시 localization.
+        (merged map 에서 차종 전환 시 해당 차종 graph 로 localization 을 옮길 때 사용)
+        """
+        waypoint_id = self.route_planner.resolve(waypoint)
+        if not waypoint_id:
+            return False
+
+        localization = nav_pb2.Localization()
+        localization.waypoint_id = waypoint_id
+        localization.waypoint_tform_body.rotation.w = 1.0
+        try:
+            _, odom_tform_body = self.get_localization_state()
+            self._graph_nav_client.set_localization(
+                initial_guess_localization=localization,
+                max_distance=1.0,
+                max_yaw=math.radians(30),
+                fiducial_init=graph_nav_pb2.SetLocalizationRequest.FIDUCIAL_INIT_NEAREST_AT_TARGET,
+                ko_tform_body=odom_tform_body.to_proto())
+        except Exception as e:
+            print(f"[{datetime.now()}] SpotGraphNav.py - Failed to relocalize near {waypoint}. {e}")
+            return False
+        return True
+
     def list_graph_waypoint_and_edge_ids(self, *args):
         """List the waypoint ids and edge ids of the graph currently on the robot."""
 
@@ -96,49 +135,33 @@ class SpotGraphNav:
         # Update and print waypoints and edges
         self._current_annotation_name_to_wp_id, self._current_edges, waypoints_list, edges_list = \
             graph_nav_util.update_waypoints_and_edges(graph, localization_id, do_print=True)
+        self.route_planner.load_graph(graph, self._current_annotation_name_to_wp_id)
 
         return waypoints_list, edges_list
 
-    def upload_graph_and_snapshots(self, upload_filepath):
-        """Upload the graph and snapshots to the robot."""
-        print("Loading the graph from disk into local storage...")
-        with open(upload_filepath + "/graph", "rb") as graph_file:
-            # Load the graph from disk.
-            data = graph_file.read()
-            self._current_graph = map_pb2.Graph()
-            self._current_graph.ParseFromString(data)
-            print("Loaded graph has {} waypoints and {} edges".format(
-                len(self._current_graph.waypoints), len(self._current_graph.edges)))
-        for waypoint in self._current_graph.waypoints:
-            # Load the waypoint snapshots from disk.
-            with open(upload_filepath + "/waypoint_snapshots/{}".format(waypoint.snapshot_id),
-                      "rb") as snapshot_file:
-                waypoint_snapshot = map_pb2.WaypointSnapshot()
-                waypoint_snapshot.ParseFromString(snapshot_file.read())
-                self._current_waypoint_snapshots[waypoint_snapshot.id] = waypoint_snapshot
-        for edge in self._current_graph.edges:
-            if len(edge.snapshot_id) == 0:
-                continue
-            # Load the edge snapshots from disk.
-            with open(upload_filepath + "/edge_snapshots/{}".format(edge.snapshot_id),
-                      "rb") as snapshot_file:
-                edge_snapshot = map_pb2.EdgeSnapshot()
-                edge_snapshot.ParseFromString(snapshot_file.read())
-                self._current_edge_snapshots[edge_snapshot.id] = edge_snapshot
-        # Upload the graph to the robot.
-        print("Uploading the graph and snapshots to the robot...")
-        true_if_empty = not len(self._current_graph.anchoring.anchors)
-        response = self._graph_nav_client.upload_graph(graph=self._current_graph,
-                                                       generate_new_anchoring=true_if_empty)
-        # Upload the snapshots to the robot.
-        for snapshot_id in response.unknown_waypoint_snapshot_ids:
-            waypoint_snapshot = self._current_waypoint_snapshots[snapshot_id]
-            self._graph_nav_client.upload_waypoint_snapshot(waypoint_snapshot)
-            print("Uploaded {}".format(waypoint_snapshot.id))
-        for snapshot_id in response.unknown_edge_snapshot_ids:
-            edge_snapshot = self._current_edge_snapshots[snapshot_id]
-            self._graph_nav_client.upload_edge_snapshot(edge_snapshot)
-            print("Uploaded {}".format(edge_snapshot.id))
+    def upload_graph_and_snapshots(self, upload_filepath, force=False):
+        """
+        Upload the graph and snapshots to the robot.
+        로봇에 같은 graph 가 있으면 clear 를 건너뛰고 (다르면 clear 후 업로드), 로봇에 없는 snapshot 만 업로드합니다.
+
+        Args:
+            upload_filepath (str): map 폴더
+            force (bool): True 이면 clear 후 전체 업로드
+
+        Returns:
+            MapSyncResult
+        """
+        print("Syncing the graph and snapshots to the robot...")
+        local_map = self.map_sync.load_local_map(upload_filepath)
+        self._current_graph = local_map.graph
+        if self.route_planner.graph is not local_map.graph:
+            name_to_id = graph_nav_util.update_waypoints_and_edges(local_map.graph, None, do_print=False)[0]
+            self.route_planner.load_graph(local_map.graph, name_to_id)
+        print("Loaded graph has {} waypoints and {} edges".format(
+            len(local_map.graph.waypoints), len(local_map.graph.edges)))
+
+        result = self.map_sync.sync(upload_filepath, force=force)
+        print(result.summary())
 
         # The upload is complete! Check that the robot is localized to the graph,
         # and if it is not, prompt the user to localize the robot before attempting
@@ -149,17 +172,25 @@ class SpotGraphNav:
             print("\n")
             print("Upload complete! The robot is currently not localized to the map; please localize",
                   "the robot using commands (2) or (3) before attempting a navigation command.")
+        return result
+
+    @trace(category="nav")
+    def navigate_to(self, *args, on_approach=None, approach_distance=None):
+        """
+        Navigate to a specific waypoint.
 
-    def navigate_to(self, *args):
-        """Navigate to a specific waypoint."""
+        Args:
+            on_approach (callable): 목적지까지 남은 거리가 approach_distance 이하가 되면
+                on_approach(remaining_distance) 호출. True 를 반환할 때까지 매 feedback 마다 다시 호출.
+            approach_distance (float): on_approach 를 호출할 남은 거리 (m)
+        """
         # Take the first argument as the destination waypoint.
         if len(args) < 1:
             # If no waypoint id is given as input, then return without requesting navigation.
             print("No waypoint provided as a destination for navigate to.")
             return
 
-        destination_waypoint = graph_nav_util.find_unique_waypoint_id(
-            args[0], self._current_graph, self._current_annotation_name_to_wp_id)
+        destination_waypoint = self.route_planner.resolve(args[0])
         if not destination_waypoint:
             # Failed to find the appropriate unique waypoint id for the navigation command.
             return
@@ -167,40 +198,190 @@ class SpotGraphNav:
         #     print("Failed to power on the robot, and cannot complete navigate to request.")
         #     return
 
-        nav_to_cmd_id = None
-        # Navigate to the destination waypoint.
-        is_finished = False
-        while not is_finished:
-            # Issue the navigation command about twice a second such that it is easy to terminate the
-            # navigation command (with estop or killing the program).
-            try:
-                nav_to_cmd_id = self._graph_nav_client.navigate_to(destination_waypoint, 1.0,
-                                                                   command_id=nav_to_cmd_id)
-            except ResponseError as e:
-                print(f"[{datetime.now()}] SpotGraphNav.py - Robot Lost?")
-                print(e)
-                self._ensure_robot_is_localized()
-                print("Error while navigating {}".format(e))
-                # raise e
-                return False
-            except RobotNotLocalizedToRouteError as e:
-                print("Require to Localize the SPOT.")
-                print(e)
-                self._ensure_robot_is_localized()
-                return False
-            except RobotLostError as e:
-                print(f"[{datetime.now()}] SpotGraphNav.py - Robot Lost.")
-                print(e)
-                self._ensure_robot_is_localized()
-                return False
+        leg = self._start_leg(args[0], destination_waypoint)
 
-            time.sleep(.5)  # Sleep for half a second to allow for command execution.
-            # Poll the robot for feedback to determine if the navigation command is complete. Then sit
-            # the robot down once it is finished.
-            is_finished = self._check_success(nav_to_cmd_id)
+        def issue_command(command_duration, command_id):
+            return self._graph_nav_client.navigate_to(destination_waypoint, command_duration, command_id=command_id)
+
+        def poll(command_id):
+            nonlocal on_approach
+            # Poll the robot for feedback to determine if the navigation command is complete.
+            is_finished = self._check_success(command_id)
+            if is_finished:
+                return True, 0.0
+
+            remaining_distance = self.get_remaining_distance(destination_waypoint, self.status)
+            if on_approach is not None and remaining_distance is not None and remaining_distance <= approach_distance:
+                if on_approach(remaining_distance):
+                    on_approach = None
+            return False, remaining_distance
 
+        # 남은 거리에 따라 polling 주기 조절. 명령은 reissue_interval 마다 재전송
+        # (estop / 프로그램 종료 시 command_duration 이후 정지).
+        try:
+            self.last_poll_stats = self.nav_poller.run(issue_command, poll, initial_distance=leg.distance or None)
+        except ResponseError as e:
+            print(f"[{datetime.now()}] SpotGraphNav.py - Robot Lost?")
+            print(e)
+            self._ensure_robot_is_localized()
+            print("Error while navigating {}".format(e))
+            # raise e
+            return False
+        except RobotNotLocalizedToRouteError as e:
+            print("Require to Localize the SPOT.")
+            print(e)
+            self._ensure_robot_is_localized()
+            return False
+        except RobotLostError as e:
+            print(f"[{datetime.now()}] SpotGraphNav.py - Robot Lost.")
+            print(e)
+            self._ensure_robot_is_localized()
+            return False
+
+        self._finish_legs([leg])
         return True
 
+    @trace(category="nav")
+    def navigate_stops(self, stops, on_approach=None, approach_distance=None):
+        """
+        여러 정지점을 하나의 route 로 이어서 이동. 중간 정지점에서는 멈추지 않고 마지막 정지점에서만 정지.
+
+        Args:
+            stops (list): 경유/도착 waypoint (이름 또는 id). 마지막이 목적지.
+            on_approach, approach_distance: navigate_to 와 동일 (최종 목적지 기준)
+
+        Returns:
+            (bool, list[RouteLeg]): (목적지 도착 여부, 구간별 거리/시간)
+        """
+        localization_id = self._graph_nav_client.get_localization_state().localization.waypoint_id
+        if not localization_id:
+            print("Require to Localize the SPOT.")
+            return False, []
+
+        legs = self.route_planner.plan(stops, start=localization_id)
+        if legs is None:
+            return False, []
+        if not legs:
+            # 이미 목적지에 있음
+            return True, []
+        legs[0].start = graph_nav_util.id_to_short_code(localization_id)
+
+        waypoint_ids, edge_ids = self.route_planner.join_legs(legs)
+        is_reached = self.navigate_waypoint_route(waypoint_ids, edge_ids, legs, on_approach, approach_distance)
+        return is_reached, legs
+
+    def navigate_waypoint_route(self, waypoint_ids, edge_ids, legs=None, on_approach=None, approach_distance=None):
+        """
+        waypoint / edge id 로 만든 route 를 따라 이동.
+        legs 가 주어지면 각 구간의 도착 waypoint 를 지날 때 구간 시간을 기록.
+
+        Returns:
+            bool: 목적지 도착 여부
+        """
+        legs = legs or []
+        route = self._graph_nav_client.build_route(waypoint_ids, edge_ids)
+        destination_waypoint = waypoint_ids[-1]
+
+        leg_index = 0
+        if legs:
+            legs[0].started = time.time()
+
+        def issue_command(command_duration, command_id):
+            return self._graph_nav_client.navigate_route(route, cmd_duration=command_duration, command_id=command_id)
+
+        def poll(command_id):
+            nonlocal leg_index, on_approach
+            is_finished = self._check_success(command_id)
+            if is_finished:
+                return True, 0.0
+
+            localization = self._graph_nav_client.get_localization_state().localization
+            while leg_index < len(legs) - 1 and self._is_at_waypoint(localization, legs[leg_index].waypoint_ids[-1]):
+                legs[leg_index].arrived = time.time()
+                leg_index += 1
+                legs[leg_index].started = legs[leg_index - 1].arrived
+
+            remaining_distance = self.get_remaining_distance(destination_waypoint, self.status, localization)
+            if on_approach is not None and remaining_distance is not None and remaining_distance <= approach_distance:
+                if on_approach(remaining_distance):
+                    on_approach = None
+            return False, remaining_distance
+
+        try:
+            self.last_poll_stats = self.nav_poller.run(issue_command, poll,
+                                                       initial_distance=sum(leg.distance for leg in legs) or None)
+        except (ResponseError, RobotNotLocalizedToRouteError, RobotLostError) as e:
+            print(f"[{datetime.now()}] SpotGraphNav.py - navigate route failed.")
+            print(e)
+            self._ensure_robot_is_localized()
+            return False
+
+        self._finish_legs(legs)
+        return self.status.status == graph_nav_pb2.NavigationFeedbackResponse.STATUS_REACHED_GOAL
+
+    def _start_leg(self, goal, goal_id):
+        """navigate_to 구간 기록. 현재 위치에서 목적지까지 graph 상 최단 거리를 계산."""
+        start_id = self._graph_nav_client.get_localization_state().localization.waypoint_id
+        leg = RouteLeg(graph_nav_util.id_to_short_code(start_id) if start_id else "-", goal)
+        if start_id:
+            path = self.route_planner.shortest_path(start_id, goal_id)
+            if path is not None:
+                leg.waypoint_ids, leg.edge_ids, leg.distance = list(path[0]), list(path[1]), path[2]
+        leg.started = time.time()
+        return leg
+
+    def _finish_legs(self, legs):
+        now = time.time()
+        for leg in legs:
+            if leg.started is None:
+                leg.started = now
+            if leg.arrived is None:
+                leg.arrived = now
+            print(f"[{datetime.now()}] SpotGraphNav.py - Leg {leg.summary()}")
+        if self.last_poll_stats is not None:
+            print(f"[{datetime.now()}] SpotGraphNav.py - Navigation {self.last_poll_stats.summary()}")
+        self.last_legs = legs
+
+    @staticmethod
+    def _is_at_waypoint(localization, waypoint_id):
+        if localization.waypoint_id != waypoint_id:
+            return False
+        body_position = localization.waypoint_tform_body.position
+        return math.hypot(body_position.x, body_position.y) <= WAYPOINT_ARRIVAL_DISTANCE
+
+    def get_remaining_distance(self, destination_waypoint, feedback=None, localization=None):
+        """
+        목적지 waypoint 까지 남은 이동 거리 (m). 위치를 알 수 없으면 None.
+
+        현재 localization waypoint 에서 body 까지의 offset 과
+        navigation feedback 의 remaining_route edge 길이 합으로 계산.
+        """
+        if localization is None:
+            localization = self._graph_nav_client.get_localization_state().localization
+        if not localization.waypoint_id:
+            return None
+
+        body_position = localization.waypoint_tform_body.position
+        body_offset = math.hypot(body_position.x, body_position.y)
+        if localization.waypoint_id == destination_waypoint:
+            return body_offset
+
+        if feedback is None or not feedback.remaining_route.edge_id:
+            return None
+
+        edge_ids = feedback.remaining_route.edge_id
+        edge_lengths = [self.route_planner.get_edge_length(edge_id.from_waypoint, edge_id.to_waypoint)
+                        for edge_id in edge_ids]
+        if None in edge_lengths:
+            return None
+
+        remaining_distance = sum(edge_lengths)
+        if localization.waypoint_id == edge_ids[0].from_waypoint:
+            remaining_distance -= body_offset
+        elif localization.waypoint_id == edge_ids[0].to_waypoint:
+            remaining_distance += body_offset - edge_lengths[0]
+        return max(0.0, remaining_distance)
+
     def navigate_to_async(self, *args):
         """Async version of navigate_to()."""
         # Take the first argument as the destination waypoint.
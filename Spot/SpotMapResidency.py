@@ -0,0 +1,181 @@
+import json
+import os
+import shutil
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from bosdyn.api.graph_nav import map_pb2
+
+# 차종(NE / ME) navigation map 상주 관리
+# 기존: 매 cycle 차종 확인 시 clear_map + map 전체 업로드 (차종이 같아도)
+# 변경:
+#   single : 로봇에 올라간 map 의 graph hash 를 기억하고, 같은 map 이면 업로드하지 않음
+#   merged : NE / ME map 을 하나의 graph 로 합쳐 한 번만 업로드. waypoint 이름은 "NE/..", "ME/.." 로 구분하고
+#            차종 전환은 이름 namespace 변경 + 해당 차종 home waypoint 로 재 localization 만 수행
+# map 전환에 걸린 시간은 근무조(shift) 별로 집계.
+
+MAP_RESIDENCY_SINGLE = "single"
+MAP_RESIDENCY_MERGED = "merged"
+MERGED_MANIFEST_NAME = "merged_manifest.json"
+SHIFT_START_HOURS = (6, 18)     # 주간 06:00 ~ 18:00, 야간 18:00 ~ 06:00
+MAP_CHANGE_HISTORY = 1000
+
+
+def shift_key(timestamp, start_hours=SHIFT_START_HOURS) -> str:
+    """timestamp 가 속한 근무조. ex) "2024-05-01 DAY", 새벽 시간은 전날 "NIGHT"."""
+    moment = datetime.fromtimestamp(timestamp)
+    day_start, night_start = start_hours
+    if moment.hour < day_start:
+        return f"{(moment - timedelta(days=1)).strftime('%Y-%m-%d')} NIGHT"
+    if moment.hour < night_start:
+        return f"{moment.strftime('%Y-%m-%d')} DAY"
+    return f"{moment.strftime('%Y-%m-%d')} NIGHT"
+
+
+@dataclass
+class MapChange:
+    timestamp: float
+    from_key: str
+    to_key: str
+    elapsed_time: float
+    uploaded: bool
+
+    @property
+    def shift(self) -> str:
+        return shift_key(self.timestamp)
+
+    def summary(self) -> str:
+        action = "uploaded" if self.uploaded else "already resident"
+        return f"Map {self.from_key} -> {self.to_key}: {action} ({self.elapsed_time:.2f}s)"
+
+
+def merge_graphs(graphs: dict) -> map_pb2.Graph:
+    """
+    여러 graph 를 하나로 합칩니다. waypoint annotation 이름 앞에 "{key}/" 를 붙입니다.
+    각 map 의 anchoring 은 seed frame 이 달라 합칠 수 없으므로 제거 (업로드 시 새로 생성).
+    """
+    merged = map_pb2.Graph()
+    for key, graph in graphs.items():
+        for waypoint in graph.waypoints:
+            merged_waypoint = merged.waypoints.add()
+            merged_waypoint.CopyFrom(waypoint)
+            merged_waypoint.annotations.name = f"{key}/{waypoint.annotations.name}"
+        merged.edges.extend(graph.edges)
+    return merged
+
+
+def build_merged_map(map_sync, sources: dict, merged_path) -> str:
+    """
+    sources {key: map 폴더} 를 merged_path 에 합쳐서 씁니다. 원본 graph 가 그대로면 다시 쓰지 않습니다.
+
+    Returns:
+        str: merged_path
+    """
+    local_maps = {key: map_sync.load_local_map(path) for key, path in sources.items()}
+    source_hashes = {key: local_map.graph_hash for key, local_map in local_maps.items()}
+
+    manifest_path = os.path.join(merged_path, MERGED_MANIFEST_NAME)
+    if os.path.exists(manifest_path) and os.path.exists(os.path.join(merged_path, "graph")):
+        with open(manifest_path) as f:
+            if json.load(f) == source_hashes:
+                return merged_path
+
+    for directory in ("waypoint_snapshots", "edge_snapshots"):
+        os.makedirs(os.path.join(merged_path, directory), exist_ok=True)
+
+    for local_map in local_maps.values():
+        for snapshot_id, digest in local_map.waypoint_snapshot_hashes.items():
+            _copy_if_changed(map_sync, local_map.waypoint_snapshot_path(snapshot_id),
+                             os.path.join(merged_path, "waypoint_snapshots", snapshot_id), digest)
+        for snapshot_id, digest in local_map.edge_snapshot_hashes.items():
+            _copy_if_changed(map_sync, local_map.edge_snapshot_path(snapshot_id),
+                             os.path.join(merged_path, "edge_snapshots", snapshot_id), digest)
+
+    merged = merge_graphs({key: local_map.graph for key, local_map in local_maps.items()})
+    with open(os.path.join(merged_path, "graph"), "wb") as f:
+        f.write(merged.SerializeToString())
+    with open(manifest_path, "w") as f:
+        json.dump(source_hashes, f, indent=4)
+    return merged_path
+
+
+def _copy_if_changed(map_sync, source, destination, digest):
+    """destination 의 sha256 이 source (digest) 와 다를 때만 복사."""
+    if os.path.exists(destination) and map_sync.hash_file(destination) == digest:
+        return
+    # copy2 는 source 의 mtime 을 그대로 써서 (mtime, size) hash cache 가 이전 내용을 가리킬 수 있음
+    shutil.copyfile(source, destination)
+
+
+class MapResidencyManager:
+    """
+    Args:
+        nav_manager (SpotGraphNav): map 업로드 / 이름 namespace / 재 localization
+        mode (str): MAP_RESIDENCY_SINGLE | MAP_RESIDENCY_MERGED
+        merged_path (str): merged 모드에서 합친 map 을 쓸 폴더
+    """
+    def __init__(self, nav_manager, mode=MAP_RESIDENCY_SINGLE, merged_path=None):
+        self.nav_manager = nav_manager
+        self.mode = mode
+        self.merged_path = merged_path
+
+        self.resident_key = None    # 현재 사용 중인 map (차종)
+        self.resident_hash = None   # 로봇에 올라간 graph 의 hash
+        self.changes = deque(maxlen=MAP_CHANGE_HISTORY)
+
+    def invalidate(self):
+        """로봇의 map 이 바뀌었을 수 있을 때 (재연결, clear, 수동 업로드) 호출. 다음 activate 에서 다시 확인."""
+        self.resident_key = None
+        self.resident_hash = None
+
+    def activate(self, key, map_path, sources=None, home_waypoint=None) -> MapChange:
+        """
+        key(차종) 의 map 을 사용할 수 있게 합니다.
+
+        Args:
+            key (str): 차종 이름 (ex. "NE")
+            map_path (str): single 모드에서 업로드할 map 폴더
+            sources (dict): merged 모드에서 합칠 {차종: map 폴더}
+            home_waypoint (str): merged 모드에서 차종이 바뀌면 이 waypoint 근처로 재 localization
+
+        Returns:
+            MapChange
+        """
+        start_time = time.time()
+        from_key = self.resident_key
+        merged = self.mode == MAP_RESIDENCY_MERGED and sources and key in sources
+
+        target_path = build_merged_map(self.nav_manager.map_sync, sources, self.merged_path) if merged else map_path
+        local_map = self.nav_manager.map_sync.load_local_map(target_path)
+
+        uploaded = local_map.graph_hash != self.resident_hash
+        if uploaded:
+            self.nav_manager.upload_graph_and_snapshots(target_path)
+            self.resident_hash = local_map.graph_hash
+
+        self.nav_manager.route_planner.set_namespace(key if merged else None)
+        if merged and from_key != key and home_waypoint:
+            self.nav_manager.relocalize_near(home_waypoint)
+
+        self.resident_key = key
+        change = MapChange(start_time, str(from_key), key, time.time() - start_time, uploaded)
+        if uploaded or from_key != key:
+            self.changes.append(change)
+        return change
+
+    def shift_report(self) -> dict:
+        """
+        근무조별 map 전환 집계.
+
+        Returns:
+            dict: {shift: {"changes": 전환 횟수, "uploads": 업로드 횟수, "time": 소요 시간 합계(초)}}
+        """
+        report = {}
+        for change in self.changes:
+            row = report.setdefault(change.shift, {"changes": 0, "uploads": 0, "time": 0.0})
+            row["changes"] += 1
+            row["uploads"] += int(change.uploaded)
+            row["time"] += change.elapsed_time
+        return report
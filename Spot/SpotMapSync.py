@@ -0,0 +1,211 @@
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+from bosdyn.api.graph_nav import map_pb2
+
+# GraphNav map 동기화
+# 기존: 연결할 때마다 clear_map() -> graph + 모든 snapshot 업로드 (map 이 크면 수 분 소요)
+# 변경: 로봇의 graph 와 로컬 graph 를 비교해서
+#   - 같으면 clear 를 건너뛰고, 내용이 바뀐 snapshot 만 다시 업로드
+#   - 다르면 clear 후 graph 업로드 (clear 없이 올리면 GraphNav 가 기존 graph 에 합쳐버림)
+#   - 어느 경우든 graph 는 다시 보내서 (snapshot 없이 가벼움) 로봇이 모르는 snapshot(unknown_*_snapshot_ids)을 받아 병렬 업로드
+# snapshot 파일은 sha256 으로 hash 해서 (mtime, size 가 같으면 재사용) 같은 id 의 내용 변경을 감지한다.
+
+MAX_UPLOAD_WORKERS = 4
+
+
+def graph_structure(graph):
+    """waypoint / edge 와 snapshot id 구성. 로봇 graph 와 로컬 graph 비교용."""
+    waypoints = frozenset((waypoint.id, waypoint.snapshot_id) for waypoint in graph.waypoints)
+    edges = frozenset((edge.id.from_waypoint, edge.id.to_waypoint, edge.snapshot_id) for edge in graph.edges)
+    return waypoints, edges
+
+
+@dataclass
+class LocalMap:
+    path: str
+    graph: map_pb2.Graph = field(repr=False)
+    graph_hash: str
+    graph_mtime: float
+    waypoint_snapshot_hashes: dict = field(default_factory=dict, repr=False)   # snapshot id -> sha256
+    edge_snapshot_hashes: dict = field(default_factory=dict, repr=False)       # snapshot id -> sha256
+
+    def waypoint_snapshot_path(self, snapshot_id):
+        return os.path.join(self.path, "waypoint_snapshots", snapshot_id)
+
+    def edge_snapshot_path(self, snapshot_id):
+        return os.path.join(self.path, "edge_snapshots", snapshot_id)
+
+
+@dataclass
+class MapSyncResult:
+    path: str
+    graph_uploaded: bool = False
+    cleared: bool = False
+    uploaded_waypoint_snapshots: int = 0
+    uploaded_edge_snapshots: int = 0
+    elapsed_time: float = 0.0
+
+    @property
+    def skipped(self) -> bool:
+        return not (self.graph_uploaded or self.cleared
+                    or self.uploaded_waypoint_snapshots or self.uploaded_edge_snapshots)
+
+    def summary(self) -> str:
+        if self.skipped:
+            return f"Map already on robot. ({self.elapsed_time:.2f}s)"
+        return (f"Map synced: graph {'uploaded' if self.graph_uploaded else 'unchanged'}"
+                f"{', cleared' if self.cleared else ''}, "
+                f"waypoint snapshots {self.uploaded_waypoint_snapshots}, "
+                f"edge snapshots {self.uploaded_edge_snapshots} ({self.elapsed_time:.2f}s)")
+
+
+class SpotMapSync:
+    """
+    로컬 navigation map 폴더(graph, waypoint_snapshots, edge_snapshots)를 로봇과 동기화합니다.
+
+    Args:
+        graph_nav_client: GraphNavClient
+        max_workers (int): snapshot 동시 업로드 개수
+    """
+    def __init__(self, graph_nav_client=None, max_workers=MAX_UPLOAD_WORKERS):
+        self.graph_nav_client = graph_nav_client
+        self.max_workers = max_workers
+
+        self._local_maps = dict()       # path -> LocalMap (graph 파일 mtime 이 같으면 재사용)
+        self._file_hashes = dict()      # file path -> (mtime, size, sha256)
+        self._uploaded_hashes = dict()  # snapshot id -> 이번 세션에서 로봇에 올린 sha256
+        self._synced_hash = None        # 마지막으로 업로드를 끝낸 graph 의 sha256
+
+    def hash_file(self, filepath) -> str:
+        """파일 sha256. mtime, size 가 같으면 이전 결과를 재사용."""
+        stat = os.stat(filepath)
+        cached = self._file_hashes.get(filepath)
+        if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            return cached[2]
+
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        self._file_hashes[filepath] = (stat.st_mtime, stat.st_size, digest.hexdigest())
+        return digest.hexdigest()
+
+    def load_local_map(self, path) -> LocalMap:
+        """
+        map 폴더를 읽고 snapshot 을 hash 합니다. 파일이 없으면 FileNotFoundError.
+        """
+        graph_path = os.path.join(path, "graph")
+        graph_mtime = os.path.getmtime(graph_path)
+
+        local_map = self._local_maps.get(path)
+        if local_map is None or local_map.graph_mtime != graph_mtime:
+            with open(graph_path, "rb") as graph_file:
+                data = graph_file.read()
+            graph = map_pb2.Graph()
+            graph.ParseFromString(data)
+            local_map = LocalMap(path, graph, hashlib.sha256(data).hexdigest(), graph_mtime)
+            self._local_maps[path] = local_map
+
+        local_map.waypoint_snapshot_hashes = {
+            waypoint.snapshot_id: self.hash_file(local_map.waypoint_snapshot_path(waypoint.snapshot_id))
+            for waypoint in local_map.graph.waypoints}
+        local_map.edge_snapshot_hashes = {
+            edge.snapshot_id: self.hash_file(local_map.edge_snapshot_path(edge.snapshot_id))
+            for edge in local_map.graph.edges if edge.snapshot_id}
+        return local_map
+
+    def is_graph_on_robot(self, local_map: LocalMap, robot_graph) -> bool:
+        if robot_graph is None or not robot_graph.waypoints:
+            return False
+        if graph_structure(robot_graph) != graph_structure(local_map.graph):
+            return False
+        # 이번 세션에서 다른 graph 업로드가 중간에 끊긴 경우는 다시 업로드
+        return self._synced_hash is None or self._synced_hash == local_map.graph_hash
+
+    def _changed_snapshot_ids(self, snapshot_hashes):
+        return {snapshot_id for snapshot_id, digest in snapshot_hashes.items()
+                if snapshot_id in self._uploaded_hashes and self._uploaded_hashes[snapshot_id] != digest}
+
+    def sync(self, path, force=False) -> MapSyncResult:
+        """
+        Args:
+            path (str): map 폴더
+            force (bool): True 이면 기존처럼 clear 후 전체 업로드
+
+        Returns:
+            MapSyncResult
+        """
+        start_time = time.time()
+        local_map = self.load_local_map(path)
+        result = MapSyncResult(path)
+
+        robot_graph = None if force else self.graph_nav_client.download_graph()
+        if not self.is_graph_on_robot(local_map, robot_graph):
+            # 다른 graph 위에 올리면 합쳐지므로 비우고 새로 업로드
+            self.graph_nav_client.clear_graph()
+            self._uploaded_hashes.clear()
+            self._synced_hash = None
+            result.cleared = True
+            result.graph_uploaded = True
+
+        waypoint_snapshot_ids = self._changed_snapshot_ids(local_map.waypoint_snapshot_hashes)
+        edge_snapshot_ids = self._changed_snapshot_ids(local_map.edge_snapshot_hashes)
+
+        # 같은 graph 여도 다시 보내서 로봇에 없는 snapshot 목록을 받음
+        true_if_empty = not len(local_map.graph.anchoring.anchors)
+        response = self.graph_nav_client.upload_graph(graph=local_map.graph, generate_new_anchoring=true_if_empty)
+        waypoint_snapshot_ids.update(response.unknown_waypoint_snapshot_ids)
+        edge_snapshot_ids.update(response.unknown_edge_snapshot_ids)
+
+        self._synced_hash = None
+        self._upload_snapshots(local_map, waypoint_snapshot_ids, edge_snapshot_ids, result)
+        self._synced_hash = local_map.graph_hash
+
+        result.elapsed_time = time.time() - start_time
+        return result
+
+    def _upload_snapshots(self, local_map: LocalMap, waypoint_snapshot_ids, edge_snapshot_ids, result):
+        def upload_waypoint_snapshot(snapshot_id):
+            waypoint_snapshot = map_pb2.WaypointSnapshot()
+            with open(local_map.waypoint_snapshot_path(snapshot_id), "rb") as snapshot_file:
+                waypoint_snapshot.ParseFromString(snapshot_file.read())
+            self.graph_nav_client.upload_waypoint_snapshot(waypoint_snapshot)
+            return local_map.waypoint_snapshot_hashes.get(snapshot_id)
+
+        def upload_edge_snapshot(snapshot_id):
+            edge_snapshot = map_pb2.EdgeSnapshot()
+            with open(local_map.edge_snapshot_path(snapshot_id), "rb") as snapshot_file:
+                edge_snapshot.ParseFromString(snapshot_file.read())
+            self.graph_nav_client.upload_edge_snapshot(edge_snapshot)
+            return local_map.edge_snapshot_hashes.get(snapshot_id)
+
+        if not waypoint_snapshot_ids and not edge_snapshot_ids:
+            return
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="MapSync") as executor:
+            futures = {executor.submit(upload_waypoint_snapshot, snapshot_id): ("waypoint", snapshot_id)
+                       for snapshot_id in waypoint_snapshot_ids}
+            futures.update({executor.submit(upload_edge_snapshot, snapshot_id): ("edge", snapshot_id)
+                            for snapshot_id in edge_snapshot_ids})
+
+            for future in as_completed(futures):
+                kind, snapshot_id = futures[future]
+                try:
+                    self._uploaded_hashes[snapshot_id] = future.result()
+                except Exception as e:
+                    errors.append(e)
+                    print(f"SpotMapSync.py - Failed to upload {kind} snapshot {snapshot_id}. {e}")
+                    continue
+
+                if kind == "waypoint":
+                    result.uploaded_waypoint_snapshots += 1
+                else:
+                    result.uploaded_edge_snapshots += 1
+
+        if errors:
+            raise errors[0]
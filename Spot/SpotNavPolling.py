@@ -0,0 +1,122 @@
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+# GraphNav 이동 명령 polling
+# 기존: 0.5초마다 명령 재전송 + feedback 확인 -> 도착 후 최대 0.5초 늦게 감지 (cycle 당 6회 이상 이동)
+# 변경: navigation feedback 의 남은 경로 길이로 polling 주기를 조절
+#   - 도착 근처(near_distance 이내)에서는 min_interval 로 빠르게 확인
+#   - 이동 중에는 남은 거리에 비례해서 max_interval 까지 느리게 확인
+#   - 명령은 command_duration(end time) 을 길게 주고 reissue_interval 마다만 재전송 (명령 churn 감소)
+# 도착 감지 지연(arrival latency) = 도착을 감지한 poll 과 직전 poll 사이 간격 (최대 지연)
+
+
+@dataclass
+class AdaptivePollSchedule:
+    """
+    Args:
+        min_interval (float): 도착 근처 polling 주기 (초)
+        max_interval (float): 이동 중 최대 polling 주기 (초)
+        near_distance (float): 이 거리 이내이면 min_interval 로 polling (m)
+        expected_speed (float): 주기 계산에 사용하는 이동 속도 (m/s)
+        command_duration (float): navigate 명령 유효 시간 (초). 재전송이 끊기면 이 시간 후 정지.
+        reissue_interval (float): 명령 재전송 주기 (초). command_duration 보다 짧아야 함.
+    """
+    min_interval: float = 0.05
+    max_interval: float = 0.5
+    near_distance: float = 1.0
+    expected_speed: float = 1.0
+    command_duration: float = 3.0
+    reissue_interval: float = 1.0
+
+    @classmethod
+    def fixed(cls, interval=0.5, command_duration=1.0):
+        """기존 동작 (고정 주기, 매 poll 마다 재전송)."""
+        return cls(min_interval=interval, max_interval=interval, command_duration=command_duration,
+                   reissue_interval=0.0)
+
+    def next_interval(self, remaining_distance: Optional[float]) -> float:
+        if remaining_distance is None:
+            return self.max_interval
+        if remaining_distance <= self.near_distance:
+            return self.min_interval
+        # near_distance 에 도달하기까지 걸리는 시간의 절반 이내로 다시 확인
+        interval = (remaining_distance - self.near_distance) / self.expected_speed * 0.5
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def should_reissue(self, last_issued: Optional[float], now: float) -> bool:
+        return last_issued is None or now - last_issued >= self.reissue_interval
+
+
+@dataclass
+class NavigationPollStats:
+    started: float = 0.0
+    finished: float = 0.0
+    polls: int = 0
+    commands: int = 0
+    arrival_latency: Optional[float] = None
+    samples: list = field(default_factory=list, repr=False)  # [(경과 시간, is_finished, 남은 거리)]
+
+    @property
+    def elapsed_time(self) -> float:
+        return self.finished - self.started
+
+    def summary(self) -> str:
+        latency = "-" if self.arrival_latency is None else f"{self.arrival_latency * 1000:.0f}ms"
+        return (f"{self.elapsed_time:.2f}s, polls: {self.polls}, commands: {self.commands}, "
+                f"arrival latency <= {latency}")
+
+
+class NavigationPoller:
+    """
+    navigate 명령 재전송 / feedback 확인 loop.
+
+    Args:
+        schedule (AdaptivePollSchedule): polling 주기
+        clock, sleep: 시간 함수 (replay 시 가상 시계로 교체)
+    """
+    def __init__(self, schedule: AdaptivePollSchedule = None, clock=time.time, sleep=time.sleep):
+        self.schedule = schedule or AdaptivePollSchedule()
+        self.clock = clock
+        self.sleep = sleep
+
+    def run(self, issue_command, poll, initial_distance=None) -> NavigationPollStats:
+        """
+        Args:
+            issue_command (callable): issue_command(command_duration, command_id) -> command_id.
+                예외는 그대로 전달.
+            poll (callable): poll(command_id) -> (is_finished, 남은 거리 또는 None)
+            initial_distance (float): 첫 feedback 전 사용할 남은 거리 (m)
+
+        Returns:
+            NavigationPollStats
+        """
+        stats = NavigationPollStats(started=self.clock())
+        command_id = None
+        last_issued = None
+        last_poll = stats.started
+        remaining_distance = initial_distance
+
+        is_finished = False
+        while not is_finished:
+            now = self.clock()
+            if self.schedule.should_reissue(last_issued, now):
+                command_id = issue_command(self.schedule.command_duration, command_id)
+                last_issued = now
+                stats.commands += 1
+
+            self.sleep(self.schedule.next_interval(remaining_distance))
+
+            poll_time = self.clock()
+            is_finished, distance = poll(command_id)
+            stats.polls += 1
+            if distance is not None:
+                remaining_distance = distance
+            stats.samples.append((poll_time - stats.started, is_finished, distance))
+
+            if is_finished:
+                stats.arrival_latency = poll_time - last_poll
+            last_poll = poll_time
+
+        stats.finished = self.clock()
+        return stats
@@ -3,6 +3,8 @@ import queue
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from dataclasses import dataclass
+from typing import Any
 
 from PySide6.QtCore import QTimer, Qt, QThread
 from bosdyn.api.docking import docking_pb2
@@ -41,11 +43,13 @@ from Spot.SpotEstop import SpotEstop
 from Spot.SpotGraphNav import SpotGraphNav, SpotGraphNavRecording
 from Spot.SpotArm import SpotArm
 from Spot.SpotCamera import SpotCamera
-from Spot.SpotCommand import try_grpc, RobotCommandExecutor
+from Spot.SpotCommand import try_grpc, RobotCommandExecutor, AsyncRobotState
 from Spot.SpotMove import SpotMove
 from Thread.DockingThread import DockingThread
 
 ASYNC_CAPTURE_RATE = 40  # milliseconds, 25 Hz
+ROBOT_STATE_RATE = 5.0          # Hz, robot state 요청 주기
+LOCALIZATION_STATE_RATE = 1.0   # Hz, graph nav localization 요청 주기
 
 
 class Robot:
@@ -107,6 +111,7 @@ class Robot:
         self.robot_fiducial_manager     = MoveWithFiducial()
         self.robot_estop_manager        = SpotEstop()
 
+        self.state_hub         = None
         self._robot_state_task = None
         self.async_tasks       = None
 
@@ -257,8 +262,9 @@ class Robot:
         self.robot_fiducial_manager = self.robot_inspection_manager.move_with_fiducial
         self.robot_estop_manager.initialize(self.estop_client)
 
-        self._robot_state_task = AsyncRobotState(self.robot_state_client)
-        self.async_tasks       = AsyncTasks([self._robot_state_task])
+        self.state_hub         = RobotStateHub(self.robot_state_client, self.graph_nav_client)
+        self._robot_state_task = self.state_hub.robot_state_task
+        self.async_tasks       = AsyncTasks(self.state_hub.tasks)
         self.async_tasks.update()
 
         self.update_task_timer = QTimer()
@@ -274,7 +280,17 @@ class Robot:
     @property
     def robot_state(self):
         """Get latest robot state proto."""
-        return self._robot_state_task.proto
+        return self.state_snapshot.robot_state
+
+    @property
+    def state_snapshot(self) -> "RobotStateSnapshot":
+        """
+        마지막으로 발행된 robot 상태 snapshot.
+        한 번 받아둔 snapshot 의 값은 바뀌지 않으므로, 같은 cycle 안에서는 하나의 snapshot 으로 읽는다.
+        """
+        if self.state_hub is None:
+            return EMPTY_STATE_SNAPSHOT
+        return self.state_hub.snapshot
 
     @property
     def robot_lease_keepalive(self):
@@ -300,13 +316,14 @@ class Robot:
         except Exception as e:
             print(f"SpotRobot.py - update_tasks Raised Error: {e}")
 
-        self.motors_powered = self._power_state() == robot_state_proto.PowerState.STATE_ON
-
         if self._lease_keepalive:
             self.has_robot_control = self._lease_keepalive.is_alive()
         else:
             self.has_robot_control = False
 
+        snapshot = self.state_hub.publish(self.is_connected, self.has_robot_control)
+        self.motors_powered = snapshot.motors_powered
+
     def establish_timesync(self):
         # makes weveral RPC calls to TimeSyncUpdate, continually updaing the clock skew estimate.
         did_establish = self.time_sync_endpoint.establish_timesync(max_samples=10, break_on_success=False)
@@ -436,10 +453,11 @@ class Robot:
         Returns:
             dict: 위치와 회전으로 이루어진 딕셔너리
         """
-        if not self.robot_state:
+        robot_state = self.robot_state
+        if not robot_state:
             return None
 
-        kinematic_state = self.robot_state.kinematic_state
+        kinematic_state = robot_state.kinematic_state
         return kinematic_state.transforms_snapshot.child_to_parent_edge_map[key].parent_tform_child
 
     def get_odom_tform_hand(self):
@@ -449,10 +467,11 @@ class Robot:
         Returns:
             geometry_msgs.msg.Transform: 변환 행렬
         """
-        if not self.robot_state:
+        robot_state = self.robot_state
+        if not robot_state:
             return None
 
-        odom_tform_hand = get_a_tform_b(self.robot_state.kinematic_state.transforms_snapshot,
+        odom_tform_hand = get_a_tform_b(robot_state.kinematic_state.transforms_snapshot,
                                         ODOM_FRAME_NAME, HAND_FRAME_NAME)
 
         return odom_tform_hand
@@ -563,17 +582,17 @@ class Robot:
 
         return result
 
-    def _power_state(self):
+    def _power_state(self, snapshot=None):
         """
         전원 상태를 반환하는 메소드입니다.
 
+        Args:
+            snapshot (RobotStateSnapshot): 읽을 snapshot. None 이면 최신 snapshot.
+
         Returns:
             int: 전원 상태 코드
         """
-        state = self.robot_state
-        if not state:
-            return None
-        return state.power_state.motor_power_state
+        return (snapshot or self.state_snapshot).motor_power_state
 
     def _lease_str(self):
         """
@@ -621,11 +640,11 @@ class Robot:
         state_str = self.robot_estop_manager.get_keep_alive_status()
         return state_str
 
-    def _estop_str(self):
+    def _estop_str(self, snapshot=None):
         estop_state = self._estop_state()
         software_estop_state_str = "-"
         try:
-            software_estop_state = self.robot_state.estop_states[2].state
+            software_estop_state = (snapshot or self.state_snapshot).robot_state.estop_states[2].state
             # 1: ESTOPPED
             # 2: NOT ESTOPPED
             if software_estop_state == 1:
@@ -637,7 +656,7 @@ class Robot:
 
         return estop_state, software_estop_state_str
 
-    def _power_state_str(self):
+    def _power_state_str(self, snapshot=None):
         """
         전원 상태를 문자열로 반환하는 메소드입니다.
 
@@ -647,14 +666,14 @@ class Robot:
         if not self._robot_state_task:
             return ''
 
-        power_state = self._power_state()
+        power_state = self._power_state(snapshot)
         if power_state is None:
             state_str = ""
         else:
             state_str = robot_state_proto.PowerState.MotorPowerState.Name(power_state)
         return '{}'.format(state_str[6:])  # get rid of STATE_ prefix
 
-    def _battery_str(self):
+    def _battery_str(self, snapshot=None):
         """
         배터리 상태를 문자열로 반환하는 메소드입니다.
 
@@ -664,12 +683,13 @@ class Robot:
         if not self._robot_state_task:
             return ''
 
-        if self.robot_state is None:
+        robot_state = (snapshot or self.state_snapshot).robot_state
+        if robot_state is None:
             status    = ""
             bar_val   = 0
             time_left = ""
         else:
-            battery_state = self.robot_state.battery_states[0]
+            battery_state = robot_state.battery_states[0]
             status = battery_state.Status.Name(battery_state.status)
             status = status[7:]  # get rid of STATUS_ prefix
             if battery_state.charge_percentage.value:
@@ -683,8 +703,7 @@ class Robot:
         return status, bar_val, time_left
 
     def spot_is_charging(self):
-        # STATUS_CHARGING: 2
-        return self.robot_state.battery_states[0].status == 2
+        return self.state_snapshot.is_charging
 
     def is_battery_low(self, threshold):
         """
@@ -698,7 +717,7 @@ class Robot:
         return bar_val <= threshold
 
     def get_battery_value(self):
-        return self.robot_state.battery_states[0].charge_percentage.value
+        return self.state_snapshot.battery_percentage
 
     def blocking_stand(self):
         body_control = spot_command_pb2.BodyControlParams(
@@ -777,15 +796,130 @@ class Robot:
 LOGGER = logging.getLogger()
 
 
-class AsyncRobotState(AsyncPeriodicQuery):
-    """Grab robot state."""
+class AsyncLocalizationState(AsyncPeriodicQuery):
+    """Grab graph nav localization state."""
 
-    def __init__(self, robot_state_client):
-        super(AsyncRobotState, self).__init__("robot_state", robot_state_client, LOGGER,
-                                              period_sec=0.2)
+    def __init__(self, graph_nav_client, period_sec=1.0):
+        super(AsyncLocalizationState, self).__init__("localization_state", graph_nav_client, LOGGER,
+                                                     period_sec=period_sec)
 
     def _start_query(self):
-        return self._client.get_robot_state_async()
+        return self._client.get_localization_state_async()
+
+
+@dataclass(frozen=True)
+class RobotStateSnapshot:
+    """
+    robot 상태 snapshot. 생성 후 변경하지 않는다. (proto 도 읽기 전용으로 사용)
+    """
+    timestamp: float = 0.0                  # snapshot 발행 시각
+    robot_state: Any = None                 # RobotState proto
+    robot_state_timestamp: float = 0.0      # robot state 수신 시각
+    localization_state: Any = None          # graph nav LocalizationState proto
+    localization_timestamp: float = 0.0     # localization 수신 시각
+    is_connected: bool = False
+    has_robot_control: bool = False
+
+    @property
+    def age(self) -> float:
+        """robot state 수신 후 지난 시간 (초)."""
+        if not self.robot_state_timestamp:
+            return float("inf")
+        return time.time() - self.robot_state_timestamp
+
+    @property
+    def motor_power_state(self):
+        if self.robot_state is None:
+            return None
+        return self.robot_state.power_state.motor_power_state
+
+    @property
+    def motors_powered(self) -> bool:
+        return self.motor_power_state == robot_state_proto.PowerState.STATE_ON
+
+    @property
+    def battery_percentage(self):
+        if self.robot_state is None or not self.robot_state.battery_states:
+            return None
+        return self.robot_state.battery_states[0].charge_percentage.value
+
+    @property
+    def is_charging(self) -> bool:
+        # STATUS_CHARGING: 2
+        if self.robot_state is None or not self.robot_state.battery_states:
+            return False
+        return self.robot_state.battery_states[0].status == 2
+
+    @property
+    def is_localized(self) -> bool:
+        if self.localization_state is None:
+            return False
+        return bool(self.localization_state.localization.waypoint_id)
+
+
+EMPTY_STATE_SNAPSHOT = RobotStateSnapshot()
+
+
+class RobotStateHub:
+    """
+    robot state / localization 을 비동기로 주기 요청하고, 모든 사용처에 같은 snapshot 을 제공.
+    - update 는 Robot._update_tasks (QTimer) 에서만 호출
+    - 새 응답이 오면 새 RobotStateSnapshot 을 만들어 참조를 교체 (읽는 쪽은 lock 불필요)
+
+    Args:
+        robot_state_client: RobotStateClient
+        graph_nav_client: GraphNavClient. None 이면 localization 은 요청하지 않음.
+        rate_hz (float): robot state 요청 주기
+        localization_rate_hz (float): localization 요청 주기
+    """
+    def __init__(self, robot_state_client, graph_nav_client=None,
+                 rate_hz=ROBOT_STATE_RATE, localization_rate_hz=LOCALIZATION_STATE_RATE):
+        self.robot_state_task = AsyncRobotState(robot_state_client, period_sec=1.0 / rate_hz)
+        self.localization_task = None
+        if graph_nav_client is not None:
+            self.localization_task = AsyncLocalizationState(graph_nav_client, period_sec=1.0 / localization_rate_hz)
+
+        self._snapshot = EMPTY_STATE_SNAPSHOT
+
+    @property
+    def tasks(self) -> list:
+        return [task for task in (self.robot_state_task, self.localization_task) if task is not None]
+
+    @property
+    def snapshot(self) -> RobotStateSnapshot:
+        return self._snapshot
+
+    def set_rate(self, rate_hz, localization_rate_hz=None):
+        self.robot_state_task._period_sec = 1.0 / rate_hz
+        if localization_rate_hz is not None and self.localization_task is not None:
+            self.localization_task._period_sec = 1.0 / localization_rate_hz
+
+    def publish(self, is_connected, has_robot_control) -> RobotStateSnapshot:
+        """
+        async task 의 최신 응답으로 snapshot 을 갱신. 바뀐 값이 없으면 기존 snapshot 을 그대로 반환.
+        """
+        previous = self._snapshot
+        now = time.time()
+
+        robot_state = self.robot_state_task.proto
+        robot_state_timestamp = previous.robot_state_timestamp
+        if robot_state is not previous.robot_state:
+            robot_state_timestamp = now
+
+        localization_state = self.localization_task.proto if self.localization_task is not None else None
+        localization_timestamp = previous.localization_timestamp
+        if localization_state is not previous.localization_state:
+            localization_timestamp = now
+
+        if robot_state is previous.robot_state and localization_state is previous.localization_state \
+                and is_connected == previous.is_connected and has_robot_control == previous.has_robot_control:
+            return previous
+
+        snapshot = RobotStateSnapshot(now, robot_state, robot_state_timestamp,
+                                      localization_state, localization_timestamp,
+                                      is_connected, has_robot_control)
+        self._snapshot = snapshot
+        return snapshot
 
 
 class TimeoutException(Exception):
@@ -0,0 +1,185 @@
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import Optional
+
+from Spot import graph_nav_util
+
+# GraphNav 경로 계획
+# graph 를 한 번 읽어 waypoint 인접 리스트(edge 길이 포함)를 만들고,
+# waypoint 쌍 사이 최단 경로만 cache (_path_cache). 차종별 검사 경로는 cache 하지 않음 (구간마다 정지하므로 이득 없음).
+# 여러 정지점을 하나의 route 로 이어서 navigate_route 로 실행하면 중간 waypoint 에서 멈추지 않는다.
+
+
+@dataclass
+class RouteLeg:
+    """정지점 사이 구간 1개."""
+    start: str                                  # 출발 waypoint (이름 또는 id)
+    goal: str                                   # 도착 waypoint (이름 또는 id)
+    waypoint_ids: list = field(default_factory=list)
+    edge_ids: list = field(default_factory=list, repr=False)   # map_pb2.Edge.Id
+    distance: float = 0.0                       # m
+    started: Optional[float] = None
+    arrived: Optional[float] = None
+
+    @property
+    def elapsed_time(self) -> Optional[float]:
+        if self.started is None or self.arrived is None:
+            return None
+        return self.arrived - self.started
+
+    def summary(self) -> str:
+        elapsed = "-" if self.elapsed_time is None else f"{self.elapsed_time:.2f}s"
+        return f"{self.start} -> {self.goal}: {self.distance:.2f}m, {elapsed}"
+
+
+class SpotRoutePlanner:
+    """
+    graph 의 edge 로 최단 경로를 계산하고 cache 하는 클래스입니다.
+    graph 가 바뀌면 (load_graph) 모든 cache 를 비웁니다.
+    """
+    def __init__(self):
+        self.graph = None
+        self.name_to_id = dict()
+        self.namespace = None           # merged map 에서 waypoint 이름 앞에 붙는 차종 (ex. "NE")
+        self.adjacency = dict()         # waypoint id -> [(neighbor id, length, edge id)]
+        self.edge_lengths = dict()      # (from id, to id) -> length
+
+        self._resolved_ids = dict()     # waypoint 이름/short code -> id
+        self._path_cache = dict()       # (start id, goal id) -> (waypoint ids, edge ids, distance)
+
+    def load_graph(self, graph, name_to_id=None):
+        """graph 로 인접 리스트를 다시 만들고 cache 를 비웁니다."""
+        self.graph = graph
+        self.name_to_id = dict(name_to_id or {})
+        self.adjacency = dict()
+        self.edge_lengths = dict()
+        self._resolved_ids.clear()
+        self._path_cache.clear()
+
+        if graph is None:
+            return
+
+        for waypoint in graph.waypoints:
+            self.adjacency.setdefault(waypoint.id, [])
+
+        for edge in graph.edges:
+            position = edge.from_tform_to.position
+            length = math.sqrt(position.x ** 2 + position.y ** 2 + position.z ** 2)
+            from_id, to_id = edge.id.from_waypoint, edge.id.to_waypoint
+            # edge 는 양방향으로 이동 가능. route 에는 graph 에 저장된 edge id 그대로 사용.
+            self.adjacency.setdefault(from_id, []).append((to_id, length, edge.id))
+            self.adjacency.setdefault(to_id, []).append((from_id, length, edge.id))
+            self.edge_lengths[(from_id, to_id)] = length
+            self.edge_lengths[(to_id, from_id)] = length
+
+    def set_namespace(self, namespace):
+        """이름 검색 시 "{namespace}/{이름}" 을 먼저 찾습니다. (merged map)"""
+        if namespace != self.namespace:
+            self.namespace = namespace
+            self._resolved_ids.clear()
+
+    def get_edge_length(self, from_id, to_id) -> Optional[float]:
+        return self.edge_lengths.get((from_id, to_id))
+
+    def resolve(self, waypoint) -> Optional[str]:
+        """waypoint 이름/short code/id 를 id 로 변환. 결과는 cache."""
+        if waypoint in self._resolved_ids:
+            return self._resolved_ids[waypoint]
+
+        namespaced = f"{self.namespace}/{waypoint}" if self.namespace else None
+        if namespaced in self.name_to_id and self.name_to_id[namespaced] is not None:
+            waypoint_id = self.name_to_id[namespaced]
+        else:
+            waypoint_id = graph_nav_util.find_unique_waypoint_id(waypoint, self.graph, self.name_to_id)
+        if waypoint_id:
+            self._resolved_ids[waypoint] = waypoint_id
+        return waypoint_id
+
+    def shortest_path(self, start, goal):
+        """
+        Dijkstra 최단 경로.
+
+        Returns:
+            (list, list, float): (waypoint ids, edge ids, 거리). 경로가 없으면 None.
+        """
+        start_id = self.resolve(start)
+        goal_id = self.resolve(goal)
+        if not start_id or not goal_id or start_id not in self.adjacency or goal_id not in self.adjacency:
+            return None
+
+        key = (start_id, goal_id)
+        if key in self._path_cache:
+            return self._path_cache[key]
+
+        distances = {start_id: 0.0}
+        previous = {}
+        heap = [(0.0, start_id)]
+        while heap:
+            distance, waypoint_id = heapq.heappop(heap)
+            if waypoint_id == goal_id:
+                break
+            if distance > distances.get(waypoint_id, math.inf):
+                continue
+            for neighbor_id, length, edge_id in self.adjacency[waypoint_id]:
+                new_distance = distance + length
+                if new_distance < distances.get(neighbor_id, math.inf):
+                    distances[neighbor_id] = new_distance
+                    previous[neighbor_id] = (waypoint_id, edge_id)
+                    heapq.heappush(heap, (new_distance, neighbor_id))
+
+        if goal_id not in distances:
+            self._path_cache[key] = None
+            return None
+
+        waypoint_ids = [goal_id]
+        edge_ids = []
+        while waypoint_ids[-1] != start_id:
+            waypoint_id, edge_id = previous[waypoint_ids[-1]]
+            waypoint_ids.append(waypoint_id)
+            edge_ids.append(edge_id)
+        waypoint_ids.reverse()
+        edge_ids.reverse()
+
+        result = (waypoint_ids, edge_ids, distances[goal_id])
+        self._path_cache[key] = result
+        return result
+
+    def plan(self, stops, start=None) -> Optional[list]:
+        """
+        정지점 목록을 구간(RouteLeg) 목록으로 변환.
+
+        Args:
+            stops (list): 정지점 waypoint (이름 또는 id)
+            start (str): 출발 waypoint. None 이면 stops[0] 에서 출발.
+
+        Returns:
+            list[RouteLeg]: 경로를 찾지 못한 구간이 있으면 None
+        """
+        points = list(stops) if start is None else [start] + list(stops)
+        legs = []
+        for leg_start, leg_goal in zip(points[:-1], points[1:]):
+            if self.resolve(leg_start) == self.resolve(leg_goal):
+                continue
+            path = self.shortest_path(leg_start, leg_goal)
+            if path is None:
+                print(f"SpotRoutePlanner.py - No path between {leg_start} and {leg_goal}.")
+                return None
+            waypoint_ids, edge_ids, distance = path
+            legs.append(RouteLeg(leg_start, leg_goal, list(waypoint_ids), list(edge_ids), distance))
+        return legs
+
+    @staticmethod
+    def join_legs(legs):
+        """
+        구간 목록을 하나의 route (waypoint ids, edge ids) 로 연결.
+        """
+        waypoint_ids = []
+        edge_ids = []
+        for leg in legs:
+            if waypoint_ids and waypoint_ids[-1] == leg.waypoint_ids[0]:
+                waypoint_ids.extend(leg.waypoint_ids[1:])
+            else:
+                waypoint_ids.extend(leg.waypoint_ids)
+            edge_ids.extend(leg.edge_ids)
+        return waypoint_ids, edge_ids
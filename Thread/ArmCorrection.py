@@ -1,18 +1,22 @@
+from __future__ import annotations
+
 import json
 import os
 
 import cv2
 import numpy as np
-import open3d as o3d
 
 import DefineGlobal
 from DataManager.config import config_utils
 from biw_utils import spot_functions
 from biw_utils.SpotPointcloud import SpotPointcloud
 from biw_utils.arm_calculate_utils import apply_spot_coordinate_matrix, apply_transformation_to_target
+from biw_utils.lazy_import import lazy_import
 from biw_utils.util_functions import convert_to_target_pose
 from Spot.SpotRobot import Robot
 
+o3d = lazy_import("open3d")
+
 
 class ArmCorrectionData:
     def __init__(self):
@@ -0,0 +1,195 @@
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from Spot.SpotCommand import ArmSettleResult
+from biw_utils.profiler import profiler
+
+# 검사 위치로 이동하는 동안 arm 을 미리 움직이는 motion planner.
+# 기존: navigate_to 완료 -> joint_move -> 도착 대기 -> 촬영
+# 변경: 목적지까지 approach_distance 이내 + body 속도가 envelope 이내이면 이동 중에 arm 명령을 보내고,
+#       도착 후에는 남은 arm 이동만 기다린다.
+#
+# 목표 자세가 envelope(joint 범위)를 벗어나면 목표 대신 ready_pose 로 먼저 이동하고,
+# 정지 후 목표 자세로 이동한다.
+
+ARM_JOINT_NAMES = ("sh0", "sh1", "el0", "el1", "wr0", "wr1")
+
+# 이동 중 arm 자세 (HoleInspectionProcess 가 waypoint 사이 이동 시 사용하는 자세)
+ARM_READY_POSE = [-0.013, -1.7133, 0.5644, -0.0466, 1.0832, 0.0114]
+
+
+@dataclass
+class ArmPrePositionEnvelope:
+    """
+    이동 중 arm 명령 허용 조건.
+
+    Args:
+        enabled (bool): False 이면 기존처럼 도착 후 arm 이동
+        approach_distance (float): 목적지까지 남은 거리가 이 값 이하일 때 arm 명령 (m)
+        max_body_speed (float): body 선속도가 이 값 이하일 때만 arm 명령 (m/s)
+        max_body_yaw_rate (float): body 회전 속도가 이 값 이하일 때만 arm 명령 (rad/s)
+        joint_limits (dict): 이동 중 허용하는 joint 범위 {"sh0": [min, max], ..}. 벗어나면 ready_pose 사용
+        ready_pose (list): 목표 자세가 envelope 밖일 때 미리 이동할 자세
+    """
+    enabled: bool = False
+    approach_distance: float = 1.0
+    max_body_speed: float = 0.3
+    max_body_yaw_rate: float = 0.3
+    joint_limits: dict = field(default_factory=lambda: {"sh0": [-0.35, 0.35]})
+    ready_pose: list = field(default_factory=lambda: list(ARM_READY_POSE))
+
+    @classmethod
+    def from_dict(cls, settings: Optional[dict]):
+        envelope = cls()
+        for key, value in (settings or {}).items():
+            if hasattr(envelope, key):
+                setattr(envelope, key, value)
+        return envelope
+
+    def to_dict(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "approach_distance": self.approach_distance,
+            "max_body_speed": self.max_body_speed,
+            "max_body_yaw_rate": self.max_body_yaw_rate,
+            "joint_limits": self.joint_limits,
+            "ready_pose": self.ready_pose,
+        }
+
+    def contains(self, joint_params) -> bool:
+        for name, value in zip(ARM_JOINT_NAMES, joint_params):
+            limit = self.joint_limits.get(name)
+            if limit is not None and not (limit[0] <= value <= limit[1]):
+                return False
+        return True
+
+
+@dataclass
+class ArmPrePositionResult:
+    name: str
+    waypoint: str = ""
+    joint_params: list = field(default_factory=list)
+    cmd_id: Optional[int] = field(default=None, repr=False)
+    nav_start: float = field(default_factory=time.time)
+    nav_end: Optional[float] = None
+    arm_issued: Optional[float] = None
+    arm_arrived: Optional[float] = None
+    issued_pose: str = ""               # "target" | "ready" | "" (이동 중 명령 없음)
+    trigger_distance: Optional[float] = None
+    settle: Optional[ArmSettleResult] = None
+    legs: list = field(default_factory=list)   # 경유 waypoint 가 있을 때 구간별 거리/시간
+
+    @property
+    def saved_time(self) -> float:
+        """이동과 겹쳐서 cycle time 에서 빠진 arm 이동 시간."""
+        if self.issued_pose != "target" or self.arm_issued is None or self.nav_end is None:
+            return 0.0
+        arm_end = self.arm_arrived if self.arm_arrived is not None else self.nav_end
+        return max(0.0, min(arm_end, self.nav_end) - self.arm_issued)
+
+    def summary(self) -> str:
+        settle_log = f", {self.settle.summary()}" if self.settle is not None else ""
+        if not self.issued_pose:
+            return f"{self.name} arm pre-position: not issued{settle_log}"
+        return (f"{self.name} arm pre-position: {self.issued_pose} pose at {self.trigger_distance:.2f}m, "
+                f"saved: {self.saved_time:.3f}s{settle_log}")
+
+
+class ArmPrePositioner:
+    """
+    waypoint 이동과 arm joint 이동을 겹쳐서 실행.
+
+    Args:
+        spot_robot: SpotRobot
+        envelope (ArmPrePositionEnvelope): 허용 조건
+    """
+    def __init__(self, spot_robot, envelope: ArmPrePositionEnvelope = None):
+        self.spot_robot = spot_robot
+        self.envelope = envelope or ArmPrePositionEnvelope()
+
+    def get_body_velocity(self):
+        """
+        (선속도 m/s, 회전 속도 rad/s). robot state 를 받을 수 없으면 None.
+        """
+        robot_state = self.spot_robot.state_snapshot.robot_state
+        if robot_state is None:
+            return None
+        velocity = robot_state.kinematic_state.velocity_of_body_in_odom
+        return math.hypot(velocity.linear.x, velocity.linear.y), abs(velocity.angular.z)
+
+    def is_body_slow_enough(self) -> bool:
+        body_velocity = self.get_body_velocity()
+        if body_velocity is None:
+            return False
+        linear_speed, yaw_rate = body_velocity
+        return linear_speed <= self.envelope.max_body_speed and yaw_rate <= self.envelope.max_body_yaw_rate
+
+    def move(self, name, waypoint, joint_params) -> ArmPrePositionResult:
+        """
+        waypoint 로 이동하면서 joint_params 자세로 arm 을 이동하고, arm 도착까지 대기.
+
+        Args:
+            name (str): 로그/trace 이름 (ex. "#1")
+            waypoint (str): 목적지 waypoint
+            joint_params (list): [sh0, sh1, el0, el1, wr0, wr1]
+
+        Returns:
+            ArmPrePositionResult
+        """
+        result = self.navigate(name, waypoint, joint_params)
+        self.wait_arm_arrival(result)
+        return result
+
+    def navigate(self, name, waypoint, joint_params, via=None) -> ArmPrePositionResult:
+        """
+        waypoint 로 이동. 조건이 맞으면 이동 중에 arm 명령을 보내고, 도착 후 목표 자세 명령까지 보낸 뒤 반환.
+        도착 후 다른 동작(높이 변경 등)을 먼저 하려면 navigate() -> 동작 -> wait_arm_arrival() 순서로 호출.
+
+        Args:
+            via (list): 경유 waypoint. 주어지면 하나의 route 로 멈추지 않고 통과.
+        """
+        nav_manager = self.spot_robot.robot_graphnav_manager
+        arm_manager = self.spot_robot.robot_arm_manager
+
+        result = ArmPrePositionResult(name, waypoint, list(joint_params))
+
+        def on_approach(remaining_distance):
+            if not self.is_body_slow_enough():
+                return False
+
+            if self.envelope.contains(joint_params):
+                result.issued_pose = "target"
+                result.cmd_id = arm_manager.joint_move_manual(joint_params)
+            else:
+                result.issued_pose = "ready"
+                arm_manager.joint_move_manual(self.envelope.ready_pose)
+            result.arm_issued = time.time()
+            result.trigger_distance = remaining_distance
+            return True
+
+        approach_kwargs = {}
+        if self.envelope.enabled:
+            approach_kwargs = {"on_approach": on_approach, "approach_distance": self.envelope.approach_distance}
+
+        if via:
+            _, result.legs = nav_manager.navigate_stops(list(via) + [waypoint], **approach_kwargs)
+        else:
+            nav_manager.navigate_to(waypoint, **approach_kwargs)
+        result.nav_end = time.time()
+
+        if result.cmd_id is None:
+            result.cmd_id = arm_manager.joint_move_manual(joint_params)
+        return result
+
+    def wait_arm_arrival(self, result: ArmPrePositionResult):
+        """arm 도착 대기. 도착하지 않으면 ArmNotSettledError (촬영하지 않도록 단계 실패)."""
+        command_manager = self.spot_robot.robot_commander
+        result.settle = command_manager.wait_until_arm_settled(result.joint_params,
+                                                               self.spot_robot.robot_arm_manager.joint_time_sec)
+        result.arm_arrived = time.time()
+
+        if result.saved_time > 0:
+            profiler.add_span(f"arm_pre_position{result.name}", "arm", result.arm_issued,
+                              result.arm_issued + result.saved_time, waypoint=result.waypoint)
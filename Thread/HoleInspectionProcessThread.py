@@ -1,4 +1,3 @@
-import threading
 import time
 from copy import deepcopy
 from datetime import datetime
@@ -8,11 +7,13 @@ import cv2
 from PySide6.QtCore import QThread, Signal
 import numpy as np
 
-import DefineGlobal
 from DataManager.config import config_utils
 from Thread.ArmCorrection import ArmCorrectionData, ArmCorrector, arm_corrector_prepare
+from Thread.ArmPrePositioner import ArmPrePositioner, ArmPrePositionEnvelope
+from Thread.InspectionJobExecutor import InspectionJobExecutor
 from main_operator import MainOperator
 from biw_utils import rule_inspection, util_functions
+from biw_utils.profiler import profiler
 
 
 class HoleInspectionProcess(QThread):
@@ -27,7 +28,6 @@ class HoleInspectionProcess(QThread):
         self.position = position
         self.main_operator = main_operator
 
-        self.duration_seconds = 1.5
         self.rule_threshold = 0.7
 
         self.master = ArmCorrectionData()
@@ -36,10 +36,24 @@ class HoleInspectionProcess(QThread):
         self.running = True  # 스레드 실행 여부를 나타내는 플래그
 
         self.hole_inspection_result = False
+        self.arm_correction_fitness = None
+        self.arm_pre_position_result = None
+        self.hole_detector = None
+
+        # 촬영 직후 검사를 시작해 복귀 이동과 병렬로 실행.
+        self.inspection_executor = InspectionJobExecutor(name=f"HoleInspection{position}")
+        self.inspection_job = None
 
     def run(self):
+        with profiler.span(f"HoleInspectionProcess#{self.position}", "process"):
+            self.run_process()
+
+    def run_process(self):
         self.running = True
         self.hole_inspection_result = False
+        self.arm_correction_fitness = None
+        self.arm_pre_position_result = None
+        self.inspection_job = None
 
         # Hole Inspection 일 때는 4k 이미지 취득
         # self.main_window.robot.robot_camera_param_manager.set_resolution("4096x2160")
@@ -49,58 +63,59 @@ class HoleInspectionProcess(QThread):
             self.main_operator.spot_robot.robot_camera_param_manager.set_focus(False, focus_absolute, True)
 
             waypoint1, waypoint2 = self.main_operator.spot_manager.get_hole_waypoint()
-            self.move_to_waypoint(waypoint1)
 
             # joint up
             up_params = [-0.013, -1.7133, 0.5644, -0.0466, 1.0832, 0.0114]
             self.main_operator.spot_joint_move_manual(up_params)
 
-            self.move_to_waypoint(waypoint2)
-
+            # waypoint1 은 멈추지 않고 경유, waypoint2 접근 중 검사 자세로 미리 이동, 높이 변경 후 arm 도착 대기
+            pre_positioner = self.create_arm_pre_positioner()
+            self.arm_pre_position_result = pre_positioner.navigate(f"#{self.position}", waypoint2,
+                                                                   self.get_arm_position_list(), via=[waypoint1])
             self.main_operator.height_change(0.3)
-            self.joint_move(is_wait_until_arm_arrive=True)
+            pre_positioner.wait_arm_arrival(self.arm_pre_position_result)
+            self.main_operator.write_log(self.arm_pre_position_result.summary())
 
             # is_arm_correct = config_utils.is_arm_correction()
             is_arm_correct = True
 
             if is_arm_correct:
-                st_time = time.time()
-                arm_corrector_prepare(self.master, self.arm_corrector)
-                try:
-                    self.arm_corrector.run()
-                except Exception as arm_correction_error:
-                    print(f"Arm Correction Error: {arm_correction_error}")
-
-                end_time = time.time()
-                elapsed_time = end_time - st_time
-                elapsed_log = f"Arm Correction Elapsed Time : {elapsed_time}s"
+                with profiler.span("arm_correction", "arm") as arm_correction_span:
+                    arm_corrector_prepare(self.master, self.arm_corrector)
+                    try:
+                        self.arm_corrector.run()
+                        self.arm_correction_fitness = self.arm_corrector.icp_result.fitness
+                    except Exception as arm_correction_error:
+                        print(f"Arm Correction Error: {arm_correction_error}")
+
+                elapsed_log = f"Arm Correction Elapsed Time : {arm_correction_span.duration}s"
                 self.main_operator.write_log(elapsed_log)
 
             # 3. 촬영
             self.main_operator.spot_robot.robot_camera_param_manager.set_led_mode("TORCH")
             self.main_operator.spot_robot.robot_camera_param_manager.set_led_torch_brightness(f_torch_brightness=1.0)
-            time.sleep(1.0)
+            # arm correction 이동 정지 + focus/torch 적용 확인 후 촬영
+            self.wait_capture_ready()
             print("capture start")
             image = self.capture_rgb()
 
+            # RUN HOLE INSPECTION (복귀 이동과 병렬)
+            self.inspection_job = self.inspection_executor.submit(f"#{self.position} Hole Inspection",
+                                                                  self.run_hole_inspection_job, image)
+
             self.main_operator.spot_robot.robot_camera_param_manager.set_led_mode("OFF")
 
             up_params = [-0.013, -1.7133, 0.5644, -0.0466, 1.0832, 0.0114]
-            cmd_id = self.main_operator.spot_joint_move_manual(up_params)
+            self.main_operator.spot_joint_move_manual(up_params)
             is_wait_until_arm_arrive = True
             if is_wait_until_arm_arrive:
-                self.main_operator.spot_robot.robot_commander.wait_until_arm_arrives(cmd_id, 1.0)
+                self.main_operator.spot_robot.robot_commander.wait_until_arm_settled(up_params, self.get_joint_time_sec())
 
             self.move_to_waypoint(waypoint1)
             self.stow()
+            self.inspection_job.mark_motion_finished()
             self.stop()
 
-            # RUN HOLE INSPECTION
-            rule_inspection_thread = threading.Thread(target=self.run_hole_inspection, args=[image])
-            rule_inspection_thread.start()
-            #
-            # rule_result_image, region_image, hole_inspection_result = self.run_hole_inspection(image)
-
             # Hole Inspection 결과 표시
             # 결과 화면 표시
 
@@ -131,6 +146,8 @@ class HoleInspectionProcess(QThread):
             waypoint1, waypoint2 = self.main_operator.spot_manager.get_hole_waypoint()
             self.move_to_waypoint(waypoint1)
             self.stow()
+            if self.inspection_job is not None:
+                self.inspection_job.mark_motion_finished()
             self.process_error.emit()
 
     def stop(self):
@@ -141,17 +158,37 @@ class HoleInspectionProcess(QThread):
         nav_manager = self.main_operator.spot_robot.robot_graphnav_manager
         return nav_manager.navigate_to(waypoint)
 
-    def joint_move(self, is_wait_until_arm_arrive=True):
+    def get_arm_position_list(self) -> list:
         arm_position = self.main_operator.spot_manager.get_arm_setting(self.position)
+        return [arm_position['sh0'], arm_position['sh1'], arm_position['el0'], arm_position['el1'], arm_position['wr0'], arm_position['wr1']]
+
+    def create_arm_pre_positioner(self) -> ArmPrePositioner:
+        envelope = ArmPrePositionEnvelope.from_dict(self.main_operator.spot_manager.get_arm_pre_position_settings())
+        return ArmPrePositioner(self.main_operator.spot_robot, envelope)
+
+    def joint_move(self, is_wait_until_arm_arrive=True):
         arm_manager = self.main_operator.spot_robot.robot_arm_manager
-        arm_position_list = [arm_position['sh0'], arm_position['sh1'], arm_position['el0'], arm_position['el1'], arm_position['wr0'], arm_position['wr1']]
+        arm_position_list = self.get_arm_position_list()
         cmd_id = arm_manager.joint_move_manual(arm_position_list)
 
         command_manager = self.main_operator.spot_robot.robot_commander
         if is_wait_until_arm_arrive:
-            command_manager.wait_until_arm_arrives(cmd_id, self.duration_seconds)
+            settle_result = command_manager.wait_until_arm_settled(arm_position_list, arm_manager.joint_time_sec)
+            self.main_operator.write_log(f"#{self.position} {settle_result.summary()}")
         # command_manager.wait_command(cmd_id)
 
+    def get_joint_time_sec(self) -> float:
+        return self.main_operator.spot_robot.robot_arm_manager.joint_time_sec
+
+    def wait_capture_ready(self):
+        # arm correction 의 마지막 joint 명령이 멈출 때까지. 멈추지 않으면 ArmNotSettledError (촬영하지 않음)
+        commander = self.main_operator.spot_robot.robot_commander
+        settle_result = commander.wait_until_arm_settled(None, self.get_joint_time_sec())
+        camera_param_manager = self.main_operator.spot_robot.robot_camera_param_manager
+        is_ready, elapsed_time = camera_param_manager.wait_until_camera_ready(timeout=1.0)
+        self.main_operator.write_log(f"#{self.position} {settle_result.summary()}, "
+                                     f"camera {'ready' if is_ready else 'timeout'}: {elapsed_time:.3f}s")
+
     def capture_rgb(self) -> np.ndarray:
         camera_manager = self.main_operator.spot_robot.robot_camera_manager
         image = camera_manager.take_image()
@@ -178,22 +215,83 @@ class HoleInspectionProcess(QThread):
         self.main_operator.height_change(0.3)
         self.joint_move(is_wait_until_arm_arrive=True)
 
+    def run_hole_inspection_job(self, image):
+        try:
+            with profiler.span(f"hole_inspection#{self.position}", "inspection"):
+                return self.run_hole_inspection(image)
+        except Exception as e:
+            print(f"[{datetime.now()}] HoleInspectionProcessThread.py - Inspection Raised. {e}")
+            self.process_error.emit()
+            raise
+
+    def wait_inspection_job(self, timeout=None):
+        """
+        진행중인 검사 작업이 끝날 때까지 대기.
+
+        Returns:
+            InspectionJob | None: 이번 cycle 에 실행한 검사 작업. 없으면 None
+        """
+        job = self.inspection_job
+        if job is None:
+            return None
+
+        try:
+            job.result(timeout)
+        except Exception as e:
+            print(f"[{datetime.now()}] {job.name} failed. {e}")
+        return job
+
     def run_hole_inspection(self, image):
-        # Rule Inspection
         hole_inspection_setting = self.main_operator.spot_manager.get_hole_inspection_setting()
         region = hole_inspection_setting['region']
 
+        # detection_mode: "rule" (template matching, 기본) | "yolo_roi" (검사 영역 타일 YOLO 검출)
+        if hole_inspection_setting.get('detection_mode', "rule") == "yolo_roi":
+            rule_result_image, hole_inspection_result = self.run_yolo_detection(image, hole_inspection_setting)
+        else:
+            rule_result_image, hole_inspection_result = self.run_rule_inspection(image, hole_inspection_setting)
+
+        # # draw bbox
+        # # 1. 1920x1080
+        # pt1 = (778, 320)
+        # pt2 = (1078, 620)
+        #
+        # # 2. 3840x2160
+        # pt1 = (1674, 760)
+        # pt2 = (1974, 1060)
+        x, y, w, h = region
+        pt1 = x, y
+        pt2 = x + w, y + h
+        util_functions.draw_box(rule_result_image, pt1, pt2, color=(0, 255, 0))
+
+        # self.progress.emit(rule_result_image, self.main_window.gview_image)
+
+        region_image = image[y:y + h, x:x + w]
+
+        self.completed.emit(rule_result_image, hole_inspection_result)
+
+        # SAVE IMAGES
+        self.save_result_images(image, rule_result_image, region_image,
+                                ng=self.main_operator.is_hole_ng(hole_inspection_result))
+
+        return rule_result_image, region_image, hole_inspection_result
+
+    def run_rule_inspection(self, image, hole_inspection_setting):
+        # Rule Inspection
+        region = hole_inspection_setting['region']
+
         st_time = time.time()
         roi_file_path = hole_inspection_setting['template_image_path']
         rois_path = [os.path.join(roi_file_path, path) for path in os.listdir(roi_file_path) if
                      path.lower().endswith('png')]
         rois_image = [cv2.imread(file) for file in rois_path]
         # 저장된 ROI들 중에서 가장 높은 점수를 받은 ROI 선택.
-        best_roi, top_left, bottom_right, max_val, best_roi_file_path = rule_inspection.select_best_roi(image,
-                                                                                                        rois_image,
-                                                                                                        region,
-                                                                                                        self.rule_threshold,
-                                                                                                        rois_path)
+        with profiler.span("select_best_roi", "inspection", rois=len(rois_image)):
+            best_roi, top_left, bottom_right, max_val, best_roi_file_path = rule_inspection.select_best_roi(image,
+                                                                                                            rois_image,
+                                                                                                            region,
+                                                                                                            self.rule_threshold,
+                                                                                                            rois_path)
 
         drawed_image = deepcopy(image)
         if best_roi is not None:
@@ -212,54 +310,33 @@ class HoleInspectionProcess(QThread):
             hole_inspection_result = False
             print("False")
 
-        # # draw bbox
-        # # 1. 1920x1080
-        # pt1 = (778, 320)
-        # pt2 = (1078, 620)
-        #
-        # # 2. 3840x2160
-        # pt1 = (1674, 760)
-        # pt2 = (1974, 1060)
-        x, y, w, h = region
-        pt1 = x, y
-        pt2 = x + w, y + h
-        util_functions.draw_box(rule_result_image, pt1, pt2, color=(0, 255, 0))
-
-        # self.progress.emit(rule_result_image, self.main_window.gview_image)
+        return rule_result_image, hole_inspection_result
 
-        region_image = image[y:y + h, x:x + w]
+    def get_hole_detector(self, model_path):
+        """YOLO ONNX detector. 처음 사용할 때 한 번만 load (onnxruntime 은 yolo_roi 모드에서만 필요)."""
+        if self.hole_detector is None or self.hole_detector.model_path != model_path:
+            from HoleDetect_Yolo.YoloOnnxDetector import YoloOnnxDetector
+            self.hole_detector = YoloOnnxDetector(model_path)
+            self.hole_detector.warm_up()
+        return self.hole_detector
 
-        self.completed.emit(rule_result_image, hole_inspection_result)
+    def run_yolo_detection(self, image, hole_inspection_setting):
+        """검사 영역(+margin)을 원본 해상도 타일로 나눠 YOLO 검출. 검출이 있으면 OK."""
+        from HoleDetect_Yolo.YoloOnnxDetector import REGION_MARGIN, draw_detections
 
-        # SAVE IMAGES
-        self.save_result_images(image, rule_result_image, region_image)
-
-        return rule_result_image, region_image, hole_inspection_result
-
-    def save_result_images(self, image, rule_result_image, region_image):
-        # 이미지 저장
-        date = datetime.now().strftime("%Y%m%d")
-        save_path = DefineGlobal.IMAGE_SAVE_PATH
-        path = os.path.join(save_path, date, self.position)
-        rule_result_path = os.path.join(save_path, date, self.position, "Rule")
-        region_path = os.path.join(save_path, date, self.position, "Crop")
-
-        if not os.path.exists(path) or not os.path.exists(rule_result_path) or not os.path.exists(region_path):
-            os.makedirs(path, exist_ok=True)
-            os.makedirs(rule_result_path, exist_ok=True)
-            os.makedirs(region_path, exist_ok=True)
-
-        current_time = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-        # 일단 파일명 현재시간으로 동일하게.
-        origin_image_fname = f"{current_time}.jpg"
-        rule_result_image_fname = f"{current_time}.jpg"
-        region_image_fname = f"{current_time}.jpg"
-
-        origin_image_path = os.path.join(path, origin_image_fname)
-        rule_result_image_path = os.path.join(rule_result_path, rule_result_image_fname)
-        region_image_path = os.path.join(region_path, region_image_fname)
-
-        cv2.imwrite(origin_image_path, image)
-        cv2.imwrite(rule_result_image_path, rule_result_image)
-        cv2.imwrite(region_image_path, region_image)
+        st_time = time.time()
+        detector = self.get_hole_detector(hole_inspection_setting['yolo_model_path'])
+        margin = hole_inspection_setting.get('yolo_region_margin', REGION_MARGIN)
+        with profiler.span("detect_region", "inspection"):
+            result = detector.detect_region(image, hole_inspection_setting['region'], margin)
+
+        print(f"YOLO Hole Detection Elapsed Time : {time.time() - st_time}s \n "
+              f"Detections: {len(result)}, Best: {result.best()}")
+        return draw_detections(deepcopy(image), result), len(result) > 0
+
+    def save_result_images(self, image, rule_result_image, region_image, ng=None):
+        # 이미지 저장 (ImageArchive: <날짜>/<position>/{Rule,Crop} + AGV index)
+        with profiler.span("save_images", "io"):
+            self.main_operator.save_inspection_image(image, self.position, ng=ng)
+            self.main_operator.save_inspection_image(rule_result_image, self.position, "Rule")
+            self.main_operator.save_inspection_image(region_image, self.position, "Crop")
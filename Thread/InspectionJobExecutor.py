@@ -0,0 +1,89 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+# 검사 연산(template matching 등)을 로봇 이동과 병렬로 실행하기 위한 executor.
+# 촬영 직후 submit 하고, 복귀 이동이 끝나면 mark_motion_finished(),
+# ProcessThread 는 완료/NG 신호를 보내기 전에 result() 로 결과를 기다린다.
+
+
+@dataclass
+class InspectionJob:
+    name: str
+    future: Optional[Future] = field(default=None, repr=False)
+    submitted: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    motion_finished: Optional[float] = None
+    joined: Optional[float] = None
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def mark_motion_finished(self):
+        self.motion_finished = time.time()
+
+    def result(self, timeout=None):
+        """
+        검사 결과를 기다립니다. 검사 중 발생한 예외는 그대로 raise.
+        """
+        try:
+            return self.future.result(timeout=timeout)
+        finally:
+            if self.joined is None:
+                self.joined = time.time()
+
+    @property
+    def compute_time(self) -> float:
+        if self.started is None:
+            return 0.0
+        end_time = self.finished if self.finished is not None else time.time()
+        return end_time - self.started
+
+    @property
+    def hidden_time(self) -> float:
+        """로봇 이동과 겹쳐서 cycle time 에 드러나지 않은 연산 시간."""
+        if self.started is None:
+            return 0.0
+        compute_end = self.finished if self.finished is not None else time.time()
+        motion_end = self.motion_finished if self.motion_finished is not None else compute_end
+        return max(0.0, min(compute_end, motion_end) - self.started)
+
+    @property
+    def wait_time(self) -> float:
+        """이동이 끝난 뒤에도 남아있던 연산 시간 (cycle time 에 드러난 부분)."""
+        if self.joined is None or self.finished is None:
+            return 0.0
+        start_wait = self.motion_finished if self.motion_finished is not None else self.submitted
+        return max(0.0, self.finished - start_wait)
+
+    def summary(self) -> str:
+        return (f"{self.name} compute: {self.compute_time:.3f}s, "
+                f"hidden behind motion: {self.hidden_time:.3f}s, "
+                f"waited: {self.wait_time:.3f}s")
+
+
+class InspectionJobExecutor:
+    """
+    검사 작업을 순서대로 실행하는 executor.
+    max_workers=1 이면 submit 순서대로 실행되어 결과 순서가 보장된다.
+    """
+    def __init__(self, max_workers=1, name="InspectionJob"):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+    def submit(self, name, function, *args, **kwargs) -> InspectionJob:
+        job = InspectionJob(name)
+
+        def run_job():
+            job.started = time.time()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                job.finished = time.time()
+
+        job.future = self._executor.submit(run_job)
+        return job
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,145 @@
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Optional
+
+# ProcessThread 의 작업 cycle 상태 머신
+# 기존 run() 은 while 루프에서 sleep 하며 연결/배터리/by-pass/AGV 조건을 매번 다시 확인했음.
+# -> OPC 태그 변화, SPOT 상태, UI 명령을 event 로 queue 에 넣고, 상태별로 처리.
+#
+# IDLE -> WAIT_AGV -> HOMING -> POS1 -> POS2 -> POS3 -> COMPLETE -> WAIT_OUT -> WAIT_AGV ...
+#            |                                                                    |
+#            +-> BYPASS / DOCKING ------------------------------------------------+
+
+STATE_HISTORY_SIZE = 256
+
+
+class PROCESS_STATE(Enum):
+    IDLE = "IDLE"
+    WAIT_AGV = "WAIT_AGV"
+    HOMING = "HOMING"
+    POS1 = "POS1"
+    POS2 = "POS2"
+    POS3 = "POS3"
+    COMPLETE = "COMPLETE"
+    WAIT_OUT = "WAIT_OUT"
+    BYPASS = "BYPASS"
+    DOCKING = "DOCKING"
+
+
+class PROCESS_EVENT(Enum):
+    # UI
+    AUTO_MODE = "AUTO_MODE"             # value: bool (AUTO / MANUAL)
+    BY_PASS = "BY_PASS"                 # value: bool
+    USER_CONFIRM = "USER_CONFIRM"       # NG 확인 완료
+    # OPC
+    OPC_CONNECTION = "OPC_CONNECTION"   # value: bool
+    AGV_POS = "AGV_POS"                 # value: bool (S600_AGV_I_POS_OK)
+    AGV_OUT = "AGV_OUT"                 # value: bool (S600_AGV_I_Workcompl_Feedback)
+    # SPOT
+    SPOT_STATUS = "SPOT_STATUS"         # 상태 갱신 알림. 값은 ProcessThread 에서 직접 읽음.
+    # internal
+    RETRY = "RETRY"
+    STOP = "STOP"
+
+
+@dataclass(frozen=True)
+class ProcessEvent:
+    event: PROCESS_EVENT
+    value: Any = None
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass
+class ProcessStateRecord:
+    state: PROCESS_STATE
+    entered: float
+    exited: Optional[float] = None
+    reason: str = ""
+
+    @property
+    def duration(self) -> float:
+        end_time = self.exited if self.exited is not None else time.time()
+        return end_time - self.entered
+
+
+class ProcessStateMachine:
+    """
+    event queue 와 상태 전이 기록.
+    post() 는 어느 thread 에서나 호출 가능하고, get() / change_state() 는 ProcessThread 에서만 호출.
+    """
+    def __init__(self, initial_state=PROCESS_STATE.IDLE, history_size=STATE_HISTORY_SIZE):
+        self._events = queue.Queue()
+        self._timers = []
+        self._timer_lock = threading.Lock()
+
+        self.state = initial_state
+        self.current = ProcessStateRecord(initial_state, time.time(), reason="init")
+        self.history = deque(maxlen=history_size)
+
+    def post(self, event: PROCESS_EVENT, value=None):
+        self._events.put(ProcessEvent(event, value))
+
+    def post_later(self, delay: float, event: PROCESS_EVENT, value=None):
+        timer = threading.Timer(delay, self._post_timer, args=(event, value))
+        timer.daemon = True
+        with self._timer_lock:
+            self._timers.append(timer)
+        timer.start()
+
+    def _post_timer(self, event, value):
+        with self._timer_lock:
+            self._timers = [timer for timer in self._timers if timer.is_alive() and timer is not threading.current_thread()]
+        self.post(event, value)
+
+    def cancel_timers(self):
+        with self._timer_lock:
+            for timer in self._timers:
+                timer.cancel()
+            self._timers.clear()
+
+    def get(self, timeout=None) -> Optional[ProcessEvent]:
+        try:
+            return self._events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def change_state(self, new_state: PROCESS_STATE, reason="") -> ProcessStateRecord:
+        """
+        상태 변경. 이전 상태의 기록을 닫고 history 에 추가한 뒤 반환.
+        """
+        now = time.time()
+        previous = self.current
+        previous.exited = now
+        self.history.append(previous)
+
+        self.state = new_state
+        self.current = ProcessStateRecord(new_state, now, reason=reason)
+        return previous
+
+    def entered_time(self, state: PROCESS_STATE) -> Optional[float]:
+        """state 에 마지막으로 진입한 시각."""
+        if self.state == state:
+            return self.current.entered
+        for record in reversed(self.history):
+            if record.state == state:
+                return record.entered
+        return None
+
+    def get_cycle_records(self) -> list:
+        """마지막 HOMING 진입 이후의 상태 기록 (현재 상태 포함)."""
+        records = list(self.history) + [self.current]
+        for index in range(len(records) - 1, -1, -1):
+            if records[index].state == PROCESS_STATE.HOMING:
+                return records[index:]
+        return []
+
+    def get_cycle_durations(self) -> dict:
+        """마지막 cycle 의 상태별 소요 시간 (초)."""
+        durations = {}
+        for record in self.get_cycle_records():
+            durations[record.state.name] = durations.get(record.state.name, 0.0) + record.duration
+        return durations
@@ -8,10 +8,16 @@ from bosdyn.client.graph_nav import RobotLostError
 
 import DefineGlobal
 from Thread.HoleInspectionProcessThread import HoleInspectionProcess
+from DataManager.TaktTimeStore import CycleRecord
+from Thread.ProcessStateMachine import ProcessStateMachine, ProcessEvent, PROCESS_STATE, PROCESS_EVENT
 from Thread.QRCodeProcessThread import QRCodeProcess
 from communication.OPC.opc_client import BIWOPCUAClient
 from main_operator import MainOperator
 from biw_utils import util_functions
+from biw_utils.profiler import profiler
+
+PROCESS_RETRY_INTERVAL = 1.0  # seconds
+INSPECTION_JOIN_TIMEOUT = 30.0  # seconds
 
 
 class ProcessThread(QThread):
@@ -19,6 +25,9 @@ class ProcessThread(QThread):
 
     bypass_signal = Signal(bool)
 
+    # previous state, new state, previous state duration (s)
+    state_changed = Signal(str, str, float)
+
     def __init__(self, main_operator: MainOperator, opc_client: BIWOPCUAClient):
         super().__init__()
         self.main_operator = main_operator
@@ -52,173 +61,457 @@ class ProcessThread(QThread):
         self.running = True
 
         self.debug = False
+
+        # State Machine
+        self.state_machine = ProcessStateMachine()
+        self._handlers = {
+            PROCESS_STATE.IDLE: self.handle_idle,
+            PROCESS_STATE.WAIT_AGV: self.handle_wait_agv,
+            PROCESS_STATE.COMPLETE: self.handle_complete,
+            PROCESS_STATE.WAIT_OUT: self.handle_wait_out,
+            PROCESS_STATE.BYPASS: self.handle_by_pass,
+            PROCESS_STATE.DOCKING: self.handle_docking,
+        }
+        self._on_enter = {
+            PROCESS_STATE.WAIT_AGV: self.enter_wait_agv,
+            PROCESS_STATE.HOMING: self.enter_homing,
+            PROCESS_STATE.POS1: self.enter_position1,
+            PROCESS_STATE.POS2: self.enter_position2,
+            PROCESS_STATE.POS3: self.enter_position3,
+            PROCESS_STATE.COMPLETE: self.enter_complete,
+            PROCESS_STATE.WAIT_OUT: self.enter_wait_out,
+            PROCESS_STATE.BYPASS: self.enter_by_pass,
+            PROCESS_STATE.DOCKING: self.enter_docking,
+        }
+        # AUTO 모드 해제 / 연결 끊김 시 IDLE 로 돌아가는 대기 상태.
+        self._waiting_states = (PROCESS_STATE.WAIT_AGV, PROCESS_STATE.WAIT_OUT,
+                                PROCESS_STATE.BYPASS, PROCESS_STATE.DOCKING)
+
+        # 입력 상태 (event 로만 갱신)
+        self.auto_mode = False
+        self.by_pass = False
+        self.opc_connected = False
+        self.spot_ready = False
+        self.battery = 0
+        self.charging = False
+        self.motors_powered = False
         # 1. 정위치신호
-        self.agv_pos_ok = False
-        # 2. 작업완료 신호
-        # 3. 도크 충전시 바이패스
+        self.agv_pos = False
+        # 2. AGV OUT 신호
+        self.agv_out = False
+        self._last_agv_signal = None
+        self._last_agv_out_signal = None
+
+        # 현재 cycle 의 결과 (takt time 기록용). HOMING 진입 시 생성, WAIT_OUT 종료 시 저장.
+        self.cycle_record = None
+
+        # Event 입력 연결
+        self.opc_client.received_agv_signal.connect(self.on_received_agv_signal)
+        self.opc_client.received_agv_out_signal.connect(self.on_received_agv_out_signal)
+        self.main_operator.opc_connection_status_changed.connect(self.on_opc_connection_changed)
+        self.main_operator.event_update_spot_status.connect(self.on_spot_status_updated)
 
     def run(self):
         print("Process Thread Start")
+        self.running = True
+        self.sync_inputs()
+        self.state_machine.post(PROCESS_EVENT.RETRY)
+
         while self.running:
+            event = self.state_machine.get()
+            if event is None:
+                continue
+
+            if event.event == PROCESS_EVENT.STOP:
+                break
+
             try:
-                print("Process Thread Running...")
-                # 0. Program Running 모드 체크
-                if not DefineGlobal.PROCESS_THREAD_IS_RUNNING:
-                    time.sleep(.5)
-                    continue
-
-                # 0. OPC CONNECT 체크
-                if not self.check_opc_connection():
-                    time.sleep(.1)
-                    continue
-
-                # 0. SPOT status check
-                # print(f"[{datetime.now()}] Check Spot Connection.")
-                if not self.check_spot_connection():
-                    # TODO: NOTICE SPOT STATUS TO USER. (etc NEED POWER-ON, NEED LEASE, NEED E-STOP AUTHORITY..)
-                    # TODO: TRY RECONNECT.
-                    if not DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS:
-                        self.try_spot_reset()
-                    time.sleep(.1)
-                    continue
-
-                if self.is_battery_low(DefineGlobal.BATTERY_LOW_THRESHOLD):
-                    # If Spot is not charging, go to dock and set bypass
-                    if not self.main_operator.confirm_spot_is_charging():
-                        self.main_operator.write_log(f"Battery Low. SET BY PASS AND GO TO DOCK.")
-                        self.by_pass_on(is_docking=True)
-
-                # Check only SPOT is charging.
-                if self.is_battery_enough(DefineGlobal.BATTERY_ENOUGH_THRESHOLD):
-                    # If Spot is charged enough, wait the agv signal.
-                    # by_pass off.
-                    if self.main_operator.spot_robot.spot_is_charging() and self.main_operator.spot_robot.motors_powered:
-                        self.by_pass_off()
-                        self.move_spot_home_position()
-                        self.main_operator.write_log(f"Battery is charged about {DefineGlobal.BATTERY_ENOUGH_THRESHOLD}%. OFF BYPASS MODE AND WAIT THE AGV.")
-
-                # 0. CHECK BY-PASS MODE
-                if DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS:
-                    # TODO: 만약, SPOT이 충전중이 아니라면, Docking 하고 나서 by-pass on.
-                    # ENTER THE BY PASS MODE, CHECK
-                    if not self.receive_agv_arrival_signal():
-                        continue
-
-                    self.by_pass_on()
-
-                    time.sleep(.1)
-                    continue
-
-                # 0. Check Auto BY-PASS
-                if not DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS:
-                    # 0. Check Status THREAD IS RUNNING?
-                    if not DefineGlobal.CURRENT_WORK_COMPLETE_STATUS:
-                        # 1. AGV 정위치 도착 신호 수신
-                        # print(f"[{datetime.now()}] Waiting for Position Arrival Signal...")
-                        if not self.receive_agv_arrival_signal():
-                            time.sleep(0.1)
-                            continue
-
-                        # self.wait_for_signal('S600_AGV_O_POS_OK')
-                        # self.wait_for_signal(DefineGlobal)
-
-                    if not DefineGlobal.CURRENT_WORK_COMPLETE_STATUS:
-                        # Delete previous data memory
-                        self.main_operator.inspection_manager.clear()
-
-                        # 2. AGV 진입 OK / 차종 정보 수신 확인
-                        if not self.check_body_type():
-                            print(f"[{datetime.now()}] Unsupported Body Type.")
-
-                            # SEND WORK COMPLETE
-                            self.send_signal(self.WORK_COMP_TAG)
-
-                            # WAIT AGV OUT
-                            agv_out = self.wait_for_agv_out()
-                            # 6. AGV OUT. Work Complete. Clear data
-                            if agv_out:
-                                print(f"[{datetime.now()}] RECEIVE AGV OUT SIGNAL. CLEAR DATA")
-                                self.clear_data()
-
-                            time.sleep(1)
-                            continue
-
-                        # Move SPOT to HOME Position
-                        print(f"[{datetime.now()}] SPOT Move to Home Position.")
-
-                        if self.move_spot_home_position():
-                            print(f"[{datetime.now()}] Complete move to Home Position.")
-                        else:
-                            print(f"[{datetime.now()}] Error Raised. Robot Lost?")
-                            continue
-
-                        print(f"[{datetime.now()}] Send Signal {DefineGlobal.OPC_SPOT_RB1_WRITE_DATA.S600_SPOT_RB1_I_HOME_POSI}.")
-                        print(f"[{datetime.now()}] Send Signal {DefineGlobal.OPC_SPOT_RB2_WRITE_DATA.S600_SPOT_RB2_I_HOME_POSI}.")
-                        self.send_signal(DefineGlobal.OPC_SPOT_RB1_WRITE_DATA.S600_SPOT_RB1_I_HOME_POSI)
-                        self.send_signal(DefineGlobal.OPC_SPOT_RB2_WRITE_DATA.S600_SPOT_RB2_I_HOME_POSI)
-
-                    if not DefineGlobal.CURRENT_WORK_COMPLETE_STATUS:
-                        # 3. SPOT 작업 진행.
-                        print(f"[{datetime.now()}] RUN PROCESS")
-                        self.run_biw_process()
-
-                    if not DefineGlobal.CURRENT_WORK_COMPLETE_STATUS:
-                        # Move SPOT to COMPLETE Position
-                        self.move_spot_complete_position()
-
-                        if DefineGlobal.SPOT_POSITION == DefineGlobal.BIW_POSITION.RH:
-                            tag_name = DefineGlobal.OPC_SPOT_RB1_WRITE_DATA.S600_SPOT_RB1_I_LAST_WORK_COMP
-                        else:
-                            tag_name = DefineGlobal.OPC_SPOT_RB2_WRITE_DATA.S600_SPOT_RB2_I_LAST_WORK_COMP
-
-                        # 4. (If NG occurred, Wait User Command.)
-                        if DefineGlobal.MODE_USER_CONFIRM:
-                            if self.main_operator.hole_ng_occurred:
-                                self.wait_user_command()
-                        else:
-                            # 4-1. AUTO PASS MODE
-                            self.send_signal(tag_name)
-
-                        # 5. Move SPOT to HOME Position
-                        self.move_spot_home_position()
-
-                        # 6. AGV OUT 신호 수신
-                        agv_out = self.wait_for_agv_out()
-
-                        # 7. AGV OUT. Work Complete. Clear data
-                        if agv_out:
-                            print(f"[{datetime.now()}] RECEIVE AGV OUT SIGNAL. CLEAR DATA")
-                            self.clear_data()
-
-                    if DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS:
-                        # 8. Move SPOT to HOME Position directly if by-pass mode.
-                        if DefineGlobal.CURRENT_WORK_STATUS != DefineGlobal.WORK_STATUS.HOME:
-                            print(f"[{datetime.now()}] BY PASS MODE. GO HOME POSITION.")
-                            self.move_spot_home_position()
-
-                        # 9. Wait AGV OUT SIGNAL.
-                        agv_out = self.wait_for_agv_out()
-
-                        # 10. AGV OUT. Work Complete. Clear data
-                        if agv_out:
-                            print(f"[{datetime.now()}] RECEIVE AGV OUT SIGNAL IN BY PASS MODE. CLEAR DATA")
-                            self.clear_data()
-
-                    # 8. Wait
-                    # self.opc_client.write_node_id(DefineGlobal.OPC_AGV_I_TAG.S600_AGV_I_POS_OK, False)
-                    # time.sleep(3)
-
-                time.sleep(.1)
+                self.apply_event(event)
+                self.dispatch_event(event)
 
             except Exception as e:
                 print(f"[{datetime.now()}] ProcessThread.py - Exception Raised. {e}")
+                self.change_state(PROCESS_STATE.IDLE, f"exception: {e}")
+                self.state_machine.post_later(PROCESS_RETRY_INTERVAL, PROCESS_EVENT.RETRY)
+
+        self.state_machine.cancel_timers()
+        print("Process Thread Stop")
 
     def stop(self):
         DefineGlobal.PROCESS_THREAD_IS_RUNNING = False
         self.running = False
+        self.state_machine.post(PROCESS_EVENT.STOP)
         self.quit()
         self.wait()
 
+    # ---------------------------------------------------------------
+    # Event 입력
+    # ---------------------------------------------------------------
+    def post_event(self, event: PROCESS_EVENT, value=None):
+        """어느 thread 에서든 호출 가능."""
+        self.state_machine.post(event, value)
+
+    def post_auto_mode(self):
+        self.post_event(PROCESS_EVENT.AUTO_MODE, DefineGlobal.PROCESS_THREAD_IS_RUNNING)
+
+    def post_by_pass(self):
+        self.post_event(PROCESS_EVENT.BY_PASS, DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS)
+
+    def post_user_confirm(self):
+        self.post_event(PROCESS_EVENT.USER_CONFIRM)
+
+    def on_received_agv_signal(self, agv_signal):
+        # DataReceiveWorker 는 주기적으로 emit 하므로, 값이 바뀐 경우만 event 로 전달.
+        agv_signal = bool(agv_signal)
+        if agv_signal != self._last_agv_signal:
+            self._last_agv_signal = agv_signal
+            self.post_event(PROCESS_EVENT.AGV_POS, agv_signal)
+
+    def on_received_agv_out_signal(self, agv_out):
+        agv_out = bool(agv_out)
+        if agv_out != self._last_agv_out_signal:
+            self._last_agv_out_signal = agv_out
+            self.post_event(PROCESS_EVENT.AGV_OUT, agv_out)
+
+    def on_opc_connection_changed(self, connected):
+        self.post_event(PROCESS_EVENT.OPC_CONNECTION, bool(connected))
+
+    def on_spot_status_updated(self, *args):
+        self.post_event(PROCESS_EVENT.SPOT_STATUS)
+
+    def sync_inputs(self):
+        """thread 시작 시 한번만 현재 값을 읽어 입력 상태를 초기화."""
+        self.auto_mode = DefineGlobal.PROCESS_THREAD_IS_RUNNING
+        self.by_pass = DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS
+        self.opc_connected = self.check_opc_connection()
+        if self.opc_connected:
+            self.agv_pos = bool(self.receive_agv_arrival_signal())
+            self.agv_out = bool(self.opc_client.read_node_id(self.AGV_POS_OUT_TAG))
+        self.update_spot_inputs()
+
+    def update_spot_inputs(self):
+        # 같은 snapshot 에서 읽어 연결/전원/배터리 값이 서로 어긋나지 않도록 함
+        snapshot = self.main_operator.spot_robot.state_snapshot
+        self.spot_ready = self.check_spot_connection(snapshot)
+        if self.spot_ready:
+            self.battery = snapshot.battery_percentage or 0
+            self.charging = snapshot.is_charging
+            self.motors_powered = snapshot.motors_powered
+
+    def apply_event(self, event: ProcessEvent):
+        if event.event == PROCESS_EVENT.AUTO_MODE:
+            self.auto_mode = bool(event.value)
+        elif event.event == PROCESS_EVENT.BY_PASS:
+            self.by_pass = bool(event.value)
+        elif event.event == PROCESS_EVENT.OPC_CONNECTION:
+            self.opc_connected = bool(event.value)
+        elif event.event == PROCESS_EVENT.AGV_POS:
+            self.agv_pos = bool(event.value)
+        elif event.event == PROCESS_EVENT.AGV_OUT:
+            self.agv_out = bool(event.value)
+        elif event.event == PROCESS_EVENT.SPOT_STATUS:
+            self.update_spot_inputs()
+
+    def is_ready(self):
+        return self.auto_mode and self.opc_connected and self.spot_ready
+
+    # ---------------------------------------------------------------
+    # 상태 전이
+    # ---------------------------------------------------------------
+    @property
+    def state(self) -> PROCESS_STATE:
+        return self.state_machine.state
+
+    def change_state(self, new_state: PROCESS_STATE, reason=""):
+        """
+        상태를 변경하고 진입 동작을 실행합니다.
+        진입 동작이 다음 상태를 반환하면 이어서 전이합니다.
+        """
+        while new_state is not None:
+            previous = self.state_machine.change_state(new_state, reason)
+            profiler.add_span(previous.state.name, "state", previous.entered, previous.exited, reason=previous.reason)
+            if previous.state == PROCESS_STATE.WAIT_OUT and self.cycle_record is not None:
+                self.finish_cycle_record()
+            print(f"[{datetime.now()}] STATE {previous.state.name} -> {new_state.name} "
+                  f"({previous.duration:.2f}s) {reason}")
+            self.state_changed.emit(previous.state.name, new_state.name, previous.duration)
+
+            on_enter = self._on_enter.get(new_state)
+            new_state = on_enter() if on_enter is not None else None
+            reason = ""
+
+    def next_ready_state(self) -> PROCESS_STATE:
+        if self.by_pass:
+            return PROCESS_STATE.BYPASS
+        if DefineGlobal.CURRENT_WORK_COMPLETE_STATUS:
+            # 작업 완료 신호를 보낸 상태. AGV OUT 부터 기다림.
+            return PROCESS_STATE.WAIT_OUT
+        return PROCESS_STATE.WAIT_AGV
+
+    def dispatch_event(self, event: ProcessEvent):
+        state = self.state
+
+        # 대기 상태에서 AUTO 모드 해제 / 연결 끊김 시 IDLE.
+        if state in self._waiting_states and not self.is_ready():
+            self.change_state(PROCESS_STATE.IDLE, f"not ready ({event.event.name})")
+            return
+
+        handler = self._handlers.get(state)
+        if handler is not None:
+            handler(event)
+
+    def handle_idle(self, event: ProcessEvent):
+        if self.is_ready():
+            self.change_state(self.next_ready_state(), event.event.name)
+            return
+
+        # SPOT 연결이 끊겨 있으면 reset 시도.
+        if event.event == PROCESS_EVENT.SPOT_STATUS and self.auto_mode and not self.spot_ready:
+            # TODO: NOTICE SPOT STATUS TO USER. (etc NEED POWER-ON, NEED LEASE, NEED E-STOP AUTHORITY..)
+            if not self.by_pass:
+                self.try_spot_reset()
+
+    def handle_wait_agv(self, event: ProcessEvent):
+        if event.event == PROCESS_EVENT.SPOT_STATUS:
+            next_state = self.check_battery_state()
+            if next_state is not None:
+                self.change_state(next_state, "battery")
+            return
+
+        if event.event == PROCESS_EVENT.BY_PASS and self.by_pass:
+            self.change_state(PROCESS_STATE.BYPASS, "user by-pass on")
+            return
+
+        if event.event == PROCESS_EVENT.AGV_POS and self.agv_pos:
+            self.change_state(PROCESS_STATE.HOMING, "agv arrived")
+
+    def handle_complete(self, event: ProcessEvent):
+        finished = event.event == PROCESS_EVENT.USER_CONFIRM
+        finished |= event.event == PROCESS_EVENT.BY_PASS and self.by_pass
+        # AGV 가 빠지면 UI 에서도 사용자 확인 대기를 해제함.
+        finished |= event.event == PROCESS_EVENT.AGV_POS and not self.agv_pos
+        if finished:
+            self.finish_user_command()
+            self.change_state(PROCESS_STATE.WAIT_OUT, event.event.name)
+
+    def handle_wait_out(self, event: ProcessEvent):
+        if event.event == PROCESS_EVENT.AGV_OUT and self.agv_out:
+            print(f"[{datetime.now()}] RECEIVE AGV OUT SIGNAL. CLEAR DATA")
+            self.clear_data()
+            self.change_state(self.next_ready_state(), "agv out")
+
+    def handle_by_pass(self, event: ProcessEvent):
+        if event.event == PROCESS_EVENT.SPOT_STATUS:
+            next_state = self.check_battery_state()
+            if next_state is not None:
+                self.change_state(next_state, "battery")
+            return
+
+        if event.event == PROCESS_EVENT.BY_PASS and not self.by_pass:
+            self.change_state(self.next_ready_state(), "user by-pass off")
+            return
+
+        if event.event == PROCESS_EVENT.AGV_POS and self.agv_pos:
+            self.by_pass_on()
+
+    def handle_docking(self, event: ProcessEvent):
+        if event.event == PROCESS_EVENT.SPOT_STATUS:
+            next_state = self.check_battery_state()
+            if next_state is not None and next_state != PROCESS_STATE.DOCKING:
+                self.change_state(next_state, "battery charged")
+            return
+
+        # 충전 중에도 AGV 는 통과시킴.
+        if event.event == PROCESS_EVENT.AGV_POS and self.agv_pos:
+            self.by_pass_on()
+
+    def check_battery_state(self):
+        """
+        배터리 상태에 따른 다음 상태. 변경이 없으면 None.
+        """
+        if not self.spot_ready:
+            return None
+
+        if self.battery <= DefineGlobal.BATTERY_LOW_THRESHOLD and not self.charging:
+            # If Spot is not charging, go to dock and set bypass
+            if self.state != PROCESS_STATE.DOCKING:
+                self.main_operator.write_log(f"Battery Low. SET BY PASS AND GO TO DOCK.")
+                return PROCESS_STATE.DOCKING
+
+        # If Spot is charged enough, wait the agv signal.
+        if self.battery >= DefineGlobal.BATTERY_ENOUGH_THRESHOLD and self.charging and self.motors_powered:
+            self.by_pass_off()
+            self.move_spot_home_position()
+            self.main_operator.write_log(f"Battery is charged about {DefineGlobal.BATTERY_ENOUGH_THRESHOLD}%. OFF BYPASS MODE AND WAIT THE AGV.")
+            return PROCESS_STATE.WAIT_AGV
+
+        return None
+
+    # ---------------------------------------------------------------
+    # 상태 진입 동작
+    # ---------------------------------------------------------------
+    def enter_wait_agv(self):
+        if self.agv_pos:
+            return PROCESS_STATE.HOMING
+        return None
+
+    def enter_homing(self):
+        if self.cycle_record is None:
+            self.cycle_record = CycleRecord(body_type=str(getattr(self.main_operator.body_type, "name", "")),
+                                            agv_no=str(self.main_operator.agv_no))
+            profiler.begin_cycle(f"{self.cycle_record.body_type} AGV {self.cycle_record.agv_no}")
+            # 이전 cycle 검사 기록은 완료 처리 (image 는 디스크로)
+            self.main_operator.inspection_manager.begin_cycle(self.cycle_record.body_type, self.cycle_record.agv_no)
+        else:
+            # 이전 HOMING 실패 후 재시도.
+            self.cycle_record.retries += 1
+
+        # 2. AGV 진입 OK / 차종 정보 수신 확인
+        if not self.check_body_type():
+            print(f"[{datetime.now()}] Unsupported Body Type.")
+
+            # SEND WORK COMPLETE
+            self.send_signal(self.WORK_COMP_TAG)
+            return PROCESS_STATE.WAIT_OUT
+
+        # Move SPOT to HOME Position
+        print(f"[{datetime.now()}] SPOT Move to Home Position.")
+        if not self.move_spot_home_position():
+            print(f"[{datetime.now()}] Error Raised. Robot Lost?")
+            self.state_machine.post_later(PROCESS_RETRY_INTERVAL, PROCESS_EVENT.RETRY)
+            return PROCESS_STATE.IDLE
+
+        print(f"[{datetime.now()}] Complete move to Home Position.")
+        self.send_signal(DefineGlobal.OPC_SPOT_RB1_WRITE_DATA.S600_SPOT_RB1_I_HOME_POSI)
+        self.send_signal(DefineGlobal.OPC_SPOT_RB2_WRITE_DATA.S600_SPOT_RB2_I_HOME_POSI)
+
+        # Camera Resolution Check.
+        self.main_operator.spot_robot.robot_camera_param_manager.set_resolution(s_resolution="3840x2160")
+        return PROCESS_STATE.POS1
+
+    def enter_position1(self):
+        DefineGlobal.CURRENT_WORK_STATUS = DefineGlobal.WORK_STATUS.POSITION1
+        print(f"[{datetime.now()}] RUN PROCESS 1")
+        if not DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS:
+            self.run_thread(self.process1_thread)
+
+        if DefineGlobal.SELECTED_BODY_TYPE == DefineGlobal.BODY_TYPE.NE:
+            return PROCESS_STATE.POS2
+
+        self.write_process_cycle_time()
+        return PROCESS_STATE.COMPLETE
+
+    def enter_position2(self):
+        DefineGlobal.CURRENT_WORK_STATUS = DefineGlobal.WORK_STATUS.POSITION2
+        print(f"[{datetime.now()}] RUN PROCESS 2")
+        if not DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS:
+            self.run_thread(self.process2_thread)
+        return PROCESS_STATE.POS3
+
+    def enter_position3(self):
+        DefineGlobal.CURRENT_WORK_STATUS = DefineGlobal.WORK_STATUS.POSITION3
+        print(f"[{datetime.now()}] RUN PROCESS 3")
+        if not DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS:
+            self.run_thread(self.process3_thread)
+
+        self.write_process_cycle_time()
+        return PROCESS_STATE.COMPLETE
+
+    def enter_complete(self):
+        # 검사 결과가 나온 뒤에 완료/NG 신호를 보냄.
+        # NG 는 작업 결과로 판단 (hole_ng_occurred 는 GUI slot 에서 나중에 갱신될 수 있음)
+        hole_ng = self.join_inspection_jobs()
+        self.main_operator.hole_ng_occurred = hole_ng
+
+        # Move SPOT to COMPLETE Position
+        self.move_spot_complete_position()
+
+        # 4. (If NG occurred, Wait User Command.)
+        if DefineGlobal.MODE_USER_CONFIRM:
+            if hole_ng:
+                print(f"[{datetime.now()}] WAIT USER COMMAND...")
+                DefineGlobal.WORK_COMPLETE_WAIT_USER_COMMAND = True
+                return None
+        else:
+            # 4-1. AUTO PASS MODE
+            self.send_signal(self.WORK_COMP_TAG)
+
+        return PROCESS_STATE.WAIT_OUT
+
+    def enter_wait_out(self):
+        # 5. Move SPOT to HOME Position
+        if DefineGlobal.CURRENT_WORK_STATUS != DefineGlobal.WORK_STATUS.HOME:
+            self.move_spot_home_position()
+
+        # 6. AGV OUT 신호 수신
+        if self.agv_out:
+            print(f"[{datetime.now()}] RECEIVE AGV OUT SIGNAL. CLEAR DATA")
+            self.clear_data()
+            return self.next_ready_state()
+        return None
+
+    def enter_by_pass(self):
+        if self.agv_pos:
+            self.by_pass_on()
+        return None
+
+    def enter_docking(self):
+        self.by_pass_on(is_docking=True)
+        return None
+
+    def join_inspection_jobs(self) -> bool:
+        """
+        Returns:
+            bool: Hole 검사 NG 여부. 검사 작업이 실패하거나 제한 시간 안에 끝나지 않으면 NG
+        """
+        with profiler.span("join_inspection_jobs", "inspection"):
+            job = self.process2_thread.wait_inspection_job(INSPECTION_JOIN_TIMEOUT)
+        if job is None:
+            return False
+
+        self.process2_thread.inspection_job = None
+        self.main_operator.write_log(job.summary())
+
+        if not job.done():
+            self.main_operator.write_log(f"{job.name} timeout. NG")
+            return True
+        try:
+            _, _, hole_inspection_result = job.result()
+        except Exception:
+            return True
+        return self.main_operator.is_hole_ng(hole_inspection_result)
+
+    def write_process_cycle_time(self):
+        st_time = self.state_machine.entered_time(PROCESS_STATE.POS1)
+        elapsed_time = time.time() - st_time
+
+        print(f"[{datetime.now()}] Progress Elapsed Time : {elapsed_time}s")
+        self.main_operator.write_cycle_time(elapsed_time)
+        if self.cycle_record is not None:
+            self.cycle_record.cycle_time = elapsed_time
+
+    def finish_cycle_record(self):
+        record, self.cycle_record = self.cycle_record, None
+
+        spans = profiler.end_cycle()
+        state_summary = profiler.summarize(spans, category="state")
+        summary_log = ", ".join(f"{name}: {duration:.2f}s" for name, duration in state_summary.items())
+        print(f"[{datetime.now()}] Cycle Profile - {summary_log}")
+
+        # 상태별 시간(대문자) + 세부 단계별 시간(navigate_to, take_image ..)
+        record.step_durations = dict(state_summary)
+        for span in spans:
+            if span.category != "state":
+                record.step_durations[span.name] = record.step_durations.get(span.name, 0.0) + span.duration
+        record.arm_correction_fitness = self.process2_thread.arm_correction_fitness
+
+        self.main_operator.takt_time_store.append(record)
+        self.main_operator.inspection_manager.finish_cycle(record.cycle_time, record.arm_correction_fitness)
+
+    def get_state_durations(self) -> dict:
+        """마지막 cycle 의 상태별 소요 시간 (초). takt-time 분석용."""
+        return self.state_machine.get_cycle_durations()
+
     def set_tag_name(self):
         self.AGV_POS_OK_TAG = DefineGlobal.OPC_AGV_I_TAG.S600_AGV_I_POS_OK
         self.AGV_POS_OUT_TAG = DefineGlobal.OPC_AGV_I_TAG.S600_AGV_I_Workcompl_Feedback
@@ -260,7 +553,7 @@ class ProcessThread(QThread):
     def check_opc_connection(self):
         return self.opc_client.connected
 
-    def check_spot_connection(self):
+    def check_spot_connection(self, snapshot=None):
         # TODO: SPOT STATUS CHECK
         spot_connected = True
         if not self.main_operator.spot_robot.robot:
@@ -269,9 +562,11 @@ class ProcessThread(QThread):
         # Power  ON
         # Lease  ON
         # E-stop ON
+        if snapshot is None:
+            snapshot = self.main_operator.spot_robot.state_snapshot
 
-        spot_connected &= self.main_operator.spot_robot.motors_powered
-        spot_connected &= self.main_operator.spot_robot.has_robot_control
+        spot_connected &= snapshot.motors_powered
+        spot_connected &= snapshot.has_robot_control
 
         return spot_connected
 
@@ -300,6 +595,7 @@ class ProcessThread(QThread):
 
         return False
 
+    @profiler.trace(category="nav")
     def move_spot_home_position(self):
         # home_waypoint = self.main_operator.spot_manager.get_waypoint_home()
 
@@ -384,6 +680,7 @@ class ProcessThread(QThread):
         print(f"[{datetime.now()}] Progress Elapsed Time : {elapsed_time}s")
         self.main_operator.write_cycle_time(elapsed_time)
 
+    @profiler.trace(category="nav")
     def move_spot_complete_position(self):
         complete_waypoint = self.main_operator.spot_manager.get_waypoint_complete()
         nav_manager = self.main_operator.spot_robot.robot_graphnav_manager
@@ -408,28 +705,9 @@ class ProcessThread(QThread):
             # DefineGlobal.CURRENT_WORK_COMPLETE_STATUS = True
             print(f"[{datetime.now()}] MOVE COMPLETE POSITION. SEND SIGNAL: {self.WORK_COMP_TAG}")
 
-    def wait_user_command(self):
-        DefineGlobal.WORK_COMPLETE_WAIT_USER_COMMAND = True
-        while DefineGlobal.WORK_COMPLETE_WAIT_USER_COMMAND:
-            print(f"[{datetime.now()}] WAIT USER COMMAND...")
-            time.sleep(1)
-            if DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS:
-                break
-
+    def finish_user_command(self):
         self.main_operator.hole_ng_occurred = False
         DefineGlobal.WORK_COMPLETE_WAIT_USER_COMMAND = False
-        return True
-
-    def wait_for_agv_out(self):
-        while DefineGlobal.PROCESS_THREAD_IS_RUNNING:
-            if self.opc_client.read_node_id(self.AGV_POS_OUT_TAG):
-                return True
-
-            if DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS:
-                return False
-
-            time.sleep(0.5)
-        return False
 
     def clear_data(self):
         # S600_SPOT_RB1_I_1ST_WORK_COMP
@@ -473,14 +751,12 @@ class ProcessThread(QThread):
         self.main_operator.event_update_hole_inspection_result
 
     def run_thread(self, thread: QThread):
-        st_time = time.time()
-        thread.start()
-        thread.running = True
-        thread.wait()
+        with profiler.span(f"run_thread#{thread.position}", "process") as thread_span:
+            thread.start()
+            thread.running = True
+            thread.wait()
 
-        end_time = time.time()
-        elapsed_time = end_time - st_time
-        elapsed_log = f"#{thread.position} Elapsed Time : {elapsed_time}s"
+        elapsed_log = f"#{thread.position} Elapsed Time : {thread_span.duration}s"
         # self.main_window.write_log(elapsed_log)
         print(elapsed_log)
 
@@ -514,8 +790,10 @@ class ProcessThread(QThread):
         self.main_operator.write_qr_result(message)
         self.main_operator.update_spot_image_with_text(image, qr_context)
 
+        self.set_cycle_result("qr1_success", True)
+
         # Save Inspection Data to InspectionDataManager
-        self.main_operator.inspection_manager.set_position1_data(image, qr_context)
+        self.main_operator.inspection_manager.set_qr_result(1, image, qr_context, True)
 
     def on_progress1_read_fail(self, image, text):
         # 1ST WORK ERROR?
@@ -525,8 +803,10 @@ class ProcessThread(QThread):
         self.main_operator.write_qr_result(message)
         self.main_operator.update_spot_image_with_text(image, text)
 
+        self.set_cycle_result("qr1_success", False)
+
         # Save Inspection Data to InspectionDataManager
-        self.main_operator.inspection_manager.set_position1_data(image, text)
+        self.main_operator.inspection_manager.set_qr_result(1, image, text, False)
 
     def on_progress2_completed(self, roi_image, inspection_result: bool):
         # Send Signal Work 2 Complete.
@@ -547,8 +827,10 @@ class ProcessThread(QThread):
         self.main_operator.update_spot_image(roi_image)
         # self.main_operator.update_spot_image_with_text(roi_image, graphic_view, result)
 
+        self.set_cycle_result("hole_result", inspection_result)
+
         # Save Inspection Data to InspectionDataManager
-        self.main_operator.inspection_manager.set_position2_data(roi_image, inspection_result)
+        self.main_operator.inspection_manager.set_hole_result(roi_image, inspection_result)
 
     def on_progress3_read_success(self, image, qr_image, qr_context):
         self.send_signal(self.WORK_3RD_COMP_TAG)
@@ -558,8 +840,10 @@ class ProcessThread(QThread):
         self.main_operator.update_spot_image_with_text(image, qr_context)
         # TODO: QR IMAGE DISPLAY
 
+        self.set_cycle_result("qr3_success", True)
+
         # Save Inspection Data to InspectionDataManager
-        self.main_operator.inspection_manager.set_position3_data(image, qr_context)
+        self.main_operator.inspection_manager.set_qr_result(3, image, qr_context, True)
 
     def on_progress3_read_fail(self, image, text):
         # 3RD WORK ERROR?
@@ -569,8 +853,15 @@ class ProcessThread(QThread):
         self.main_operator.write_qr_result(message)
         self.main_operator.update_spot_image_with_text(image, text)
 
+        self.set_cycle_result("qr3_success", False)
+
         # Save Inspection Data to InspectionDataManager
-        self.main_operator.inspection_manager.set_position3_data(image, text)
+        self.main_operator.inspection_manager.set_qr_result(3, image, text, False)
+
+    def set_cycle_result(self, name, value):
+        record = self.cycle_record
+        if record is not None:
+            setattr(record, name, value)
 
     def on_progress1_error_occurred(self):
         # Send Signal Work 1 Error.
@@ -584,14 +875,6 @@ class ProcessThread(QThread):
         # Send Signal Work 3 Error.
         self.send_signal(self.WORK_3RD_ERR_TAG)
 
-    def is_battery_low(self, threshold) -> bool:
-        battery_val = self.main_operator.spot_robot.get_battery_value()
-        return battery_val <= threshold
-
-    def is_battery_enough(self, threshold) -> bool:
-        battery_val = self.main_operator.spot_robot.get_battery_value()
-        return battery_val >= threshold
-
     def by_pass_on(self, is_docking=False):
         # TODO: Temporary RB1 RB2 total bypass
         if DefineGlobal.SPOT_POSITION == DefineGlobal.BIW_POSITION.RH:
@@ -619,6 +902,7 @@ class ProcessThread(QThread):
             self.send_signal_off(work_complete_tag_name)
 
         DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS = False
+        self.by_pass = False
         self.bypass_signal.emit(False)
 
         # if DefineGlobal.SPOT_POSITION == DefineGlobal.BIW_POSITION.RH:
@@ -629,7 +913,8 @@ class ProcessThread(QThread):
         #     self.send_signal_off(DefineGlobal.OPC_SPOT_RB2_WRITE_DATA.S600_SPOT_RB2_I_LAST_WORK_COMP)
 
     def send_signal(self, tag_name: str):
-        self.opc_client.write_node_id(tag_name, True)
+        with profiler.span("send_signal", "opc", tag=tag_name):
+            self.opc_client.write_node_id(tag_name, True)
 
         if tag_name == DefineGlobal.OPC_SPOT_RB1_WRITE_DATA.S600_SPOT_RB1_I_LAST_WORK_COMP:
             if not DefineGlobal.WORK_COMPLETE_WAIT_USER_COMMAND:
@@ -640,7 +925,8 @@ class ProcessThread(QThread):
                 DefineGlobal.CURRENT_WORK_COMPLETE_STATUS = True
 
     def send_signal_off(self, tag_name: str):
-        self.opc_client.write_node_id(tag_name, False)
+        with profiler.span("send_signal_off", "opc", tag=tag_name):
+            self.opc_client.write_node_id(tag_name, False)
 
         if tag_name == DefineGlobal.OPC_SPOT_RB1_WRITE_DATA.S600_SPOT_RB1_I_LAST_WORK_COMP:
             DefineGlobal.CURRENT_WORK_COMPLETE_STATUS = False
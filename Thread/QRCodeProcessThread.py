@@ -1,12 +1,11 @@
-import os
 import time
 from datetime import datetime
 
-import cv2
 import numpy as np
 from PySide6.QtCore import QThread, Signal
 
-import DefineGlobal
+from biw_utils.profiler import profiler
+from Thread.ArmPrePositioner import ArmPrePositioner, ArmPrePositionEnvelope
 from Thread.CaptureThread import CaptureProgressThread
 from main_operator import MainOperator
 import spot_functions, qr_functions
@@ -24,16 +23,20 @@ class QRCodeProcess(QThread):
     def __init__(self, main_operator: MainOperator, position: str):
         super().__init__()
         self.position = position
-        self.duration_seconds = 1
         self.main_operator = main_operator
 
         self.running = True  # 스레드 실행 여부를 나타내는 플래그
+        self.arm_pre_position_result = None
         # self.capture_thread = CaptureProgressThread(self.main_operator)
         # self.capture_thread.progress.connect(self.on_progress_running)
         # self.capture_thread.completed.connect(self.on_process_completed)
         # self.capture_thread.timeout.connect(self.on_timeout_occurred)
 
     def run(self):
+        with profiler.span(f"QRCodeProcess#{self.position}", "process"):
+            self.run_process()
+
+    def run_process(self):
         self.running = True
         try:
             # QRCode Reading 일 때는 선택된 해상도의 이미지 취득
@@ -49,8 +52,9 @@ class QRCodeProcess(QThread):
             # config = config_utils.get_config()
             # waypoint = config[self.position]['waypoint']
 
+            # 이동 + arm 자세 (조건이 맞으면 이동 중에 arm 을 미리 움직임)
             waypoint = self.main_operator.spot_manager.get_waypoint(self.position)
-            self.move_to_waypoint(waypoint)
+            self.move_to_waypoint_with_arm(waypoint)
 
             debug_start_always_p1 = True
             # if not debug_start_always_p1:
@@ -68,9 +72,8 @@ class QRCodeProcess(QThread):
             # blocking_stand(command_client, timeout_sec=10,
             #                params=spot_command_pb2.MobilityParams(body_control=body_control))
 
-            # 3. 촬영
-            self.joint_move()
-            time.sleep(1.5)
+            # 3. 촬영 (arm 도착은 move_to_waypoint_with_arm 에서 확인, focus 안정 확인 후 촬영)
+            self.wait_camera_ready()
             image = spot_functions.capture_bgr(self.main_operator.spot_robot.robot_camera_manager)
 
             self.on_progress_running(image)
@@ -91,7 +94,8 @@ class QRCodeProcess(QThread):
     def on_progress_running(self, image):
         # graphic_view = self.body_widget.body_display_widget.image_gview
         self.main_operator.update_spot_image(image)
-        image, message, qr_image = qr_functions.read_datamatrix(image)
+        with profiler.span("read_datamatrix", "decode"):
+            image, message, qr_image = qr_functions.read_datamatrix(image)
 
         if message:
             message = f"QR Code Reading: \n{message}"
@@ -103,24 +107,15 @@ class QRCodeProcess(QThread):
             message = "QR Code Read Fail."
             self.read_fail.emit(image, message)
 
-        # 이미지 저장
-        date = datetime.now().strftime("%Y%m%d")
-
-        save_path = DefineGlobal.IMAGE_SAVE_PATH
-        path = os.path.join(save_path, date, self.position)
-        qr_folder = os.path.join(path, "readed_qrcode")
-        if not os.path.exists(path) or not os.path.exists(qr_folder):
-            os.makedirs(path, exist_ok=True)
-            os.makedirs(qr_folder, exist_ok=True)
-
-        current_time = datetime.now().strftime('%Y%m%d_%H%M%S')
-        image_fname = f"{current_time}.jpg"
-        qrimage_fname = f"{current_time}.png"
-        image_path = os.path.join(path, image_fname)
-        qrimage_path = os.path.join(qr_folder, qrimage_fname)
-        cv2.imwrite(image_path, image)
+        # 이미지 저장 (ImageArchive: 날짜 / position 폴더 + AGV index)
+        with profiler.span("save_images", "io"):
+            self.save_images(image, qr_image)
+
+    def save_images(self, image, qr_image):
+        # QR 을 못 읽으면 (qr_image 없음) NG
+        self.main_operator.save_inspection_image(image, self.position, ng=qr_image is None)
         if qr_image is not None:
-            cv2.imwrite(qrimage_path, qr_image)
+            self.main_operator.save_inspection_image(qr_image, self.position, "readed_qrcode")
 
 
     def on_process_completed(self, image, qr_image, qr_content):
@@ -145,7 +140,7 @@ class QRCodeProcess(QThread):
         qr_content += "POWERTAILGATE: General Tail Gate"
         qr_content += "Sliding Console: General Console"
         qr_content += "Woofer Speaker: General Speaker"
-        self.main_operator.update_spot_image_with_text(image, graphic_view, qr_content)
+        self.main_operator.update_spot_image_with_text(image, qr_content)
         # self.main_operator.update_spot_image(qr_image, qr_gview)
 
         # 결과 텍스트 표시
@@ -159,22 +154,7 @@ class QRCodeProcess(QThread):
         # self.main_window.process_result_widget.show_inspection_result(frame_widget, qr_image, qr_content)
 
         # 이미지 저장
-        date = datetime.now().strftime("%Y%m%d")
-
-        save_path = DefineGlobal.IMAGE_SAVE_PATH
-        path = os.path.join(save_path, date, self.position)
-        qr_folder = os.path.join(path, "readed_qrcode")
-        if not os.path.exists(path) or not os.path.exists(qr_folder):
-            os.makedirs(path, exist_ok=True)
-            os.makedirs(qr_folder, exist_ok=True)
-
-        current_time = datetime.now().strftime('%Y%m%d_%H%M%S')
-        image_fname = f"{current_time}.jpg"
-        qrimage_fname = f"{current_time}.png"
-        image_path = os.path.join(path, image_fname)
-        qrimage_path = os.path.join(qr_folder, qrimage_fname)
-        cv2.imwrite(image_path, image)
-        cv2.imwrite(qrimage_path, qr_image)
+        self.save_images(image, qr_image)
 
     def on_timeout_occurred(self, image):
         # graphic_view = self.main_operator.body_widget.body_display_widget.image_gview
@@ -189,6 +169,20 @@ class QRCodeProcess(QThread):
         nav_manager = self.main_operator.spot_robot.robot_graphnav_manager
         return nav_manager.navigate_to(waypoint)
 
+    def move_to_waypoint_with_arm(self, waypoint: str):
+        arm_position = self.main_operator.spot_manager.get_arm_setting(self.position)
+        arm_position_list = [arm_position['sh0'], arm_position['sh1'], arm_position['el0'], arm_position['el1'], arm_position['wr0'], arm_position['wr1']]
+
+        envelope = ArmPrePositionEnvelope.from_dict(self.main_operator.spot_manager.get_arm_pre_position_settings())
+        pre_positioner = ArmPrePositioner(self.main_operator.spot_robot, envelope)
+        self.arm_pre_position_result = pre_positioner.move(f"#{self.position}", waypoint, arm_position_list)
+        self.main_operator.write_log(self.arm_pre_position_result.summary())
+
+    def wait_camera_ready(self):
+        camera_param_manager = self.main_operator.spot_robot.robot_camera_param_manager
+        is_ready, elapsed_time = camera_param_manager.wait_until_camera_ready(timeout=1.5)
+        self.main_operator.write_log(f"#{self.position} camera {'ready' if is_ready else 'timeout'}: {elapsed_time:.3f}s")
+
     def joint_move(self):
         # sh0, sh1, el0, el1, wr0, wr1 = config_utils.read_arm_position(position)
         arm_position = self.main_operator.spot_manager.get_arm_setting(self.position)
@@ -199,7 +193,8 @@ class QRCodeProcess(QThread):
         cmd_id = arm_manager.joint_move_manual(arm_position_list)
 
         command_manager = self.main_operator.spot_robot.robot_commander
-        command_manager.wait_until_arm_arrives(cmd_id, self.duration_seconds)
+        settle_result = command_manager.wait_until_arm_settled(arm_position_list, arm_manager.joint_time_sec)
+        self.main_operator.write_log(f"#{self.position} {settle_result.summary()}")
 
     def stow(self):
         arm_manager = self.main_operator.spot_robot.robot_arm_manager
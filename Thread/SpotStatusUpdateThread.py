@@ -16,12 +16,14 @@ class SpotStatusUpdateThread(QThread):
     def run(self):
         while self._running:
             try:
+                # robot 으로 새로 요청하지 않고, 한 snapshot 에서 모두 읽음
+                snapshot = self.spot_robot.state_snapshot
                 lease = self.spot_robot.command_dictionary["get_lease"]()
-                power = self.spot_robot.command_dictionary["get_power"]()
-                status, bar_val, time_left = self.spot_robot.command_dictionary["get_battery"]()
-                is_connected = self.spot_robot.is_connected
-                is_localized = self.spot_robot.robot_graphnav_manager.is_localized()
-                estop_status, sw_estop_status = self.spot_robot.command_dictionary["get_estop"]()
+                power = self.spot_robot.command_dictionary["get_power"](snapshot)
+                status, bar_val, time_left = self.spot_robot.command_dictionary["get_battery"](snapshot)
+                is_connected = snapshot.is_connected
+                is_localized = snapshot.is_localized
+                estop_status, sw_estop_status = self.spot_robot.command_dictionary["get_estop"](snapshot)
             except Exception as e:
                 print(e)
                 lease = ""
@@ -0,0 +1,128 @@
+"""
+"AGV X 의 이번 주 image 전부 찾기" benchmark (임시 폴더에 합성 archive 생성).
+
+  scan (legacy)   : 변경 전 방식. 날짜 폴더를 훑어서 파일 이름의 시각을 takt time 기록 (AGV, cycle 시작 / 끝) 과 맞춤
+  index           : ImageArchive.find_vehicle (SQLite index)
+  + thumbnails    : 찾은 image 의 thumbnail decode 까지
+  packed          : compact() 로 지난 날짜를 zip 으로 묶은 뒤 index 조회 + 원본 1장 읽기
+
+실행 (repo root 에서):
+    python -m _test.image_archive.archive_benchmark
+    python -m _test.image_archive.archive_benchmark --days 14 --cycles 60 --width 1920
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from DataManager.ImageArchive import ImageArchive
+
+# cycle 마다 저장하는 image (position, kind). 형식은 종류별 기존 형식 (LEGACY_PRESET)
+CYCLE_IMAGES = (("1", ""), ("1", "readed_qrcode"),
+                ("2", ""), ("2", "Rule"), ("2", "Crop"),
+                ("3", ""), ("3", "readed_qrcode"))
+CYCLE_TIME = 120.0
+
+
+def populate(archive, days, cycles_per_day, agv_count, width):
+    """Returns: list[(agv_no, start, end)] (takt time 기록에 해당)"""
+    height = width * 9 // 16
+    image = np.random.default_rng(0).integers(0, 255, (height, width, 3), dtype=np.uint8)
+    qr_image = image[:200, :200]
+    cycles = []
+    today = datetime.now().replace(hour=6, minute=0, second=0, microsecond=0)
+    for day in range(days):
+        start = (today - timedelta(days=day)).timestamp()
+        for cycle in range(cycles_per_day):
+            agv_no = str(random.randrange(1, agv_count + 1))
+            cycle_start = start + cycle * CYCLE_TIME
+            for index, (position, kind) in enumerate(CYCLE_IMAGES):
+                archive.save(qr_image if kind == "readed_qrcode" else image, position, kind, agv_no=agv_no,
+                             body_type="NE", spec="N3", timestamp=cycle_start + index * 10)
+            cycles.append((agv_no, cycle_start, cycle_start + CYCLE_TIME))
+    return cycles
+
+
+def legacy_scan(root, cycles, agv_no, since):
+    """날짜 폴더 전체를 훑어서 AGV 의 cycle 시간대에 저장된 파일을 찾음."""
+    windows = [(start, end) for cycle_agv, start, end in cycles if cycle_agv == agv_no and end >= since]
+    found = []
+    for day in sorted(os.listdir(root)):
+        if not (len(day) == 8 and day.isdigit()) or day < datetime.fromtimestamp(since).strftime("%Y%m%d"):
+            continue
+        for directory, _, file_names in os.walk(os.path.join(root, day)):
+            for file_name in file_names:
+                moment = datetime.strptime(day + file_name[:6], "%Y%m%d%H%M%S").timestamp()
+                if any(start <= moment < end for start, end in windows):
+                    found.append(os.path.join(directory, file_name))
+    return found
+
+
+def measure(function, runs):
+    elapsed = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function()
+        elapsed.append(time.perf_counter() - start)
+    return statistics.mean(elapsed) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=10)
+    parser.add_argument("--cycles", type=int, default=40, help="하루 cycle 수")
+    parser.add_argument("--agvs", type=int, default=12)
+    parser.add_argument("--width", type=int, default=640, help="합성 image 가로 크기")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as root:
+        archive = ImageArchive(root)
+        start = time.perf_counter()
+        cycles = populate(archive, args.days, args.cycles, args.agvs, args.width)
+        print(f"archive: {args.days} days x {args.cycles} cycles x {len(CYCLE_IMAGES)} images "
+              f"({time.perf_counter() - start:.1f}s)")
+
+        agv_no = cycles[0][0]
+        since = (datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=6)).timestamp()
+
+        rows = []
+        mean, found = measure(lambda: legacy_scan(root, cycles, agv_no, since), args.runs)
+        rows.append(("scan (legacy)", len(found), mean))
+        mean, entries = measure(lambda: archive.find_vehicle(agv_no), args.runs)
+        rows.append(("index", len(entries), mean))
+        mean, _ = measure(lambda: [archive.thumbnail(entry) for entry in archive.find_vehicle(agv_no)], args.runs)
+        rows.append(("index + thumbnails", len(entries), mean))
+
+        start = time.perf_counter()
+        packed = archive.compact()
+        compact_time = time.perf_counter() - start
+
+        def find_and_load():
+            result = archive.find_vehicle(agv_no)
+            archive.load_image(result[0])
+            return result
+
+        mean, entries = measure(find_and_load, args.runs)
+        rows.append(("packed: index + 1 image", len(entries), mean))
+        mean, _ = measure(lambda: [archive.thumbnail(entry) for entry in archive.find_vehicle(agv_no)], args.runs)
+        rows.append(("packed: index + thumbnails", len(entries), mean))
+
+        print(f"AGV {agv_no}, this week")
+        print(f"{'path':<30} {'images':>8} {'mean':>10}  (ms)")
+        for name, count, mean in rows:
+            print(f"{name:<30} {count:>8} {mean:>10.2f}")
+        print(f"compact: {packed} files in {compact_time:.2f}s, "
+              f"retention (7 days): removed {archive.apply_retention(7)} days")
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+검사 image 저장 encoding profile 별 cycle 당 encode 시간 / 크기 benchmark (data/ 의 sample capture 사용).
+
+cycle 마다 저장하는 image (ProcessThread 기준):
+  position 1, 3 : 원본 + readed_qrcode
+  position 2    : 원본 + Rule + Crop
+
+  <preset>             : NG 결과 (원본 크기)
+  <preset> +ok-reduced : original_only_on_ng 설정에서 OK 결과 (원본은 REDUCED_ORIGIN)
+
+실행 (repo root 에서):
+    python -m _test.image_encoding.encoding_benchmark
+    python -m _test.image_encoding.encoding_benchmark --width 3840 --runs 20
+"""
+import argparse
+import os
+import statistics
+import time
+
+import cv2
+
+from DataManager.ImageEncoding import ENCODING_PRESETS, ImageEncodingSettings, encode_image
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+HOLE_REGION = (1674, 760, 300, 300)     # 3840x2160 기준 검사 영역 (HoleInspectionProcessThread 주석)
+
+
+def load(name, width=None):
+    image = cv2.imread(os.path.join(DATA_PATH, name))
+    if image is None:
+        raise FileNotFoundError(name)
+    if width and image.shape[1] != width:
+        height = round(image.shape[0] * width / image.shape[1])
+        image = cv2.resize(image, (width, height), interpolation=cv2.INTER_CUBIC)
+    return image
+
+
+def cycle_images(width):
+    """Returns: list[(kind, image)] 한 cycle 에 저장하는 image"""
+    capture = load("hole_inspection_capture_example.jpg", width)
+    rule = load("hole_inspection_result_example.png", capture.shape[1])
+    qr_capture = load("hand_color.jpg", width)
+    qr_image = load("my_qr_code.png")
+
+    scale = capture.shape[1] / 3840
+    x, y, w, h = (round(value * scale) for value in HOLE_REGION)
+    crop = capture[y:y + h, x:x + w]
+    return [("", qr_capture), ("readed_qrcode", qr_image),
+            ("", capture), ("Rule", rule), ("Crop", crop),
+            ("", qr_capture), ("readed_qrcode", qr_image)]
+
+
+def run_cycle(images, encoding, ng):
+    total = 0
+    for kind, image in images:
+        total += len(encode_image(image, encoding.profile(kind, ng)))
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=3840, help="capture 가로 크기 (sample 을 resize)")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    images = cycle_images(args.width)
+    print(f"capture {images[2][1].shape[1]}x{images[2][1].shape[0]}, {len(images)} images / cycle, "
+          f"OpenCV {cv2.__version__}")
+    print(f"{'profile':<26} {'encode (ms)':>12} {'stdev':>8} {'KB / cycle':>12}")
+
+    for preset in ENCODING_PRESETS:
+        for label, encoding, ng in ((preset, ImageEncodingSettings(preset), True),
+                                    (f"{preset} +ok-reduced", ImageEncodingSettings(preset, True), False)):
+            run_cycle(images, encoding, ng)     # warm up
+            elapsed = []
+            size = 0
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                size = run_cycle(images, encoding, ng)
+                elapsed.append((time.perf_counter() - start) * 1000)
+            print(f"{label:<26} {statistics.mean(elapsed):>12.1f} {statistics.pstdev(elapsed):>8.1f} "
+                  f"{size / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Live preview soak test (GraphicViewWithText).
+
+4K BGR frame 을 일정 주기로 set_image + set_text 해서 (CaptureThread live / update_ui_spot_image_with_text 와 같은 호출)
+GUI thread 시간, scene item 개수, process memory(RSS) 를 주기적으로 출력합니다.
+
+  live   : LiveImageItem (scene / item 재사용, viewport 크기로 축소, refresh 주기로 합침)
+  legacy : 기존 방식 (frame 마다 원본 크기 QPixmap + QGraphicsPixmapItem 추가)
+
+실행 (repo root 에서):
+    python -m _test.live_view.live_view_soak --duration 3600
+    python -m _test.live_view.live_view_soak --duration 600 --legacy
+"""
+import argparse
+import sys
+import time
+
+import cv2
+import numpy as np
+import psutil
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QApplication, QGraphicsPixmapItem
+
+from widget.common.GraphicViewWithText import GraphicViewWithText
+
+
+def make_frames(count, width, height):
+    frames = []
+    for index in range(count):
+        frame = np.full((height, width, 3), 40 + index * 20, dtype=np.uint8)
+        cv2.circle(frame, (width // 2 + index * 50, height // 2), height // 4, (0, 200, 255), 20)
+        cv2.putText(frame, f"frame {index}", (100, height - 100), cv2.FONT_HERSHEY_SIMPLEX, 8, (255, 255, 255), 12)
+        frames.append(frame)
+    return frames
+
+
+def legacy_set_image(view, image):
+    """변경 전 GraphicViewWithText.set_image."""
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width, channels = image.shape
+    qimage = QImage(image.data, width, height, channels * width, QImage.Format_RGB888)
+    view.scene.addItem(QGraphicsPixmapItem(QPixmap.fromImage(qimage.rgbSwapped())))
+    view.fit_in_view()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=3600, help="초")
+    parser.add_argument("--fps", type=float, default=30)
+    parser.add_argument("--report", type=float, default=60, help="출력 주기 (초)")
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--legacy", action="store_true")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    view = GraphicViewWithText()
+    view.resize(1280, 720)
+    view.show()
+
+    frames = make_frames(4, args.width, args.height)
+    process = psutil.Process()
+    start_rss = process.memory_info().rss
+    start_time = time.perf_counter()
+    state = {"index": 0, "submit_time": 0.0, "last_report": start_time}
+
+    def on_frame():
+        frame = frames[state["index"] % len(frames)]
+        state["index"] += 1
+
+        submit_start = time.perf_counter()
+        if args.legacy:
+            legacy_set_image(view, frame)
+        else:
+            view.set_image(frame)
+        view.set_text("INSPECTION INFO", f"frame: {state['index']}")
+        state["submit_time"] += time.perf_counter() - submit_start
+
+        now = time.perf_counter()
+        if now - state["last_report"] >= args.report:
+            state["last_report"] = now
+            report(now)
+        if now - start_time >= args.duration:
+            app.quit()
+
+    def report(now):
+        rss = process.memory_info().rss
+        submit_mean = state["submit_time"] / max(1, state["index"]) * 1000
+        line = (f"[{now - start_time:7.0f}s] rss: {rss / 2**20:8.1f}MB (+{(rss - start_rss) / 2**20:.1f}), "
+                f"scene items: {len(view.scene.items())}, set_image+set_text mean: {submit_mean:.2f}ms")
+        if not args.legacy:
+            line += f", {view.live_image.stats.summary()}"
+        print(line, flush=True)
+
+    timer = QTimer()
+    timer.timeout.connect(on_frame)
+    timer.start(int(1000 / args.fps))
+    app.exec()
+    report(time.perf_counter())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+SpotGraphNav.navigate_to / navigate_stops (navigate_waypoint_route) replay.
+graph_nav_client 를 가상 로봇 (직선 corridor graph, 가상 시계) stub 으로 바꿔서 실제 이동 loop 를 실행합니다.
+
+확인 항목:
+  reached   : 목적지 도착 판정 (반환값)
+  overshoot : 가상 로봇 도착 시각 ~ loop 가 도착을 감지한 시각
+  stalls    : 명령 유효 시간 (command_duration) 이 끝나 로봇이 멈춘 횟수 (재전송 누락)
+  leg delay : 경유 waypoint 통과 (WAYPOINT_ARRIVAL_DISTANCE 이내 진입) ~ 구간 도착 기록
+  approach  : on_approach 호출 시 실제 남은 거리 (approach_distance 이하여야 함)
+
+"broken reissue" schedule 은 재전송 주기가 command_duration 보다 길어서 stall 이 나야 정상 (검출 확인용).
+
+실행 (repo root 에서, bosdyn-client 필요):
+    python -m _test.nav_polling.graph_nav_replay
+"""
+import statistics
+
+from bosdyn.api.graph_nav import graph_nav_pb2, map_pb2
+
+import Spot.SpotGraphNav as graph_nav_module
+from Spot import graph_nav_util
+from Spot.SpotGraphNav import SpotGraphNav, WAYPOINT_ARRIVAL_DISTANCE
+from Spot.SpotNavPolling import AdaptivePollSchedule, NavigationPoller
+
+# corridor: waypoint 이름 -> x (m)
+WAYPOINTS = (("home", 0.0), ("p1", 2.0), ("hole1", 3.2), ("hole2", 4.0), ("p3", 9.0), ("complete", 14.0))
+SIM_STEP = 0.01
+MAX_SIM_TIME = 120.0
+
+
+class VirtualClock:
+    """time 모듈 대신 사용 (time(), sleep())."""
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        if self.now > MAX_SIM_TIME:
+            raise TimeoutError("navigation loop did not finish")
+
+
+def waypoint_id(index):
+    return f"waypoint-{index}-replay"
+
+
+def build_graph():
+    graph = map_pb2.Graph()
+    for index, (name, _) in enumerate(WAYPOINTS):
+        waypoint = graph.waypoints.add()
+        waypoint.id = waypoint_id(index)
+        waypoint.annotations.name = name
+    for index in range(len(WAYPOINTS) - 1):
+        edge = graph.edges.add()
+        edge.id.from_waypoint = waypoint_id(index)
+        edge.id.to_waypoint = waypoint_id(index + 1)
+        edge.from_tform_to.position.x = WAYPOINTS[index + 1][1] - WAYPOINTS[index][1]
+        edge.from_tform_to.rotation.w = 1.0
+    return graph
+
+
+class StubGraphNavClient:
+    """
+    GraphNavClient 중 이동 loop 가 쓰는 함수만 구현한 가상 로봇.
+    명령을 받으면 command_duration 동안 목적지로 이동 (감속 포함), 유효 시간이 지나면 정지.
+    """
+    def __init__(self, clock: VirtualClock, start_index=0, speed=1.0, decel_distance=0.5):
+        self.clock = clock
+        self.speed = speed
+        self.decel_distance = decel_distance
+        self.xs = [x for _, x in WAYPOINTS]
+
+        self.position = self.xs[start_index]
+        self.goal = None
+        self.command_end = 0.0
+        self.command_id = 0
+        self.updated = 0.0
+
+        self.arrival_time = None
+        self.stalls = 0
+        self.commands = 0
+        self.passed = {}            # waypoint index -> WAYPOINT_ARRIVAL_DISTANCE 이내로 들어온 시각
+
+    # 가상 로봇 -------------------------------------------------------
+    def _update(self):
+        while self.updated + SIM_STEP <= self.clock.now:
+            self.updated += SIM_STEP
+            if self.goal is None or self.arrival_time is not None:
+                continue
+            if self.updated > self.command_end:
+                self.stalls += 1
+                self.goal = None
+                continue
+
+            remaining = self.xs[self.goal] - self.position
+            if remaining <= 0.02:
+                self.position = self.xs[self.goal]
+                self.arrival_time = self.updated
+                continue
+            speed = self.speed if remaining > self.decel_distance \
+                else max(0.2, self.speed * remaining / self.decel_distance)
+            self.position += min(remaining, speed * SIM_STEP)
+
+            for index, x in enumerate(self.xs):
+                if index not in self.passed and abs(self.position - x) <= WAYPOINT_ARRIVAL_DISTANCE:
+                    self.passed[index] = self.updated
+
+    def _issue(self, goal_index, cmd_duration, command_id):
+        self._update()
+        if command_id is None or command_id != self.command_id:
+            self.command_id += 1
+        self.goal = goal_index
+        self.command_end = self.clock.now + cmd_duration
+        self.commands += 1
+        return self.command_id
+
+    # GraphNavClient --------------------------------------------------
+    def navigate_to(self, destination_waypoint, cmd_duration, command_id=None):
+        return self._issue(int(destination_waypoint.split("-")[1]), cmd_duration, command_id)
+
+    def build_route(self, waypoint_ids, edge_ids):
+        return list(waypoint_ids)
+
+    def navigate_route(self, route, cmd_duration, command_id=None):
+        return self._issue(int(route[-1].split("-")[1]), cmd_duration, command_id)
+
+    def get_localization_state(self):
+        self._update()
+        nearest = min(range(len(self.xs)), key=lambda index: abs(self.xs[index] - self.position))
+        state = graph_nav_pb2.GetLocalizationStateResponse()
+        state.localization.waypoint_id = waypoint_id(nearest)
+        state.localization.waypoint_tform_body.position.x = self.position - self.xs[nearest]
+        state.localization.waypoint_tform_body.rotation.w = 1.0
+        return state
+
+    def navigation_feedback(self, command_id):
+        self._update()
+        feedback = graph_nav_pb2.NavigationFeedbackResponse()
+        if self.arrival_time is not None:
+            feedback.status = graph_nav_pb2.NavigationFeedbackResponse.STATUS_REACHED_GOAL
+            return feedback
+
+        feedback.status = graph_nav_pb2.NavigationFeedbackResponse.STATUS_FOLLOWING_ROUTE
+        segment = max(index for index, x in enumerate(self.xs) if x <= self.position + 1e-9)
+        for index in range(segment, self.goal if self.goal is not None else segment):
+            edge_id = feedback.remaining_route.edge_id.add()
+            edge_id.from_waypoint = waypoint_id(index)
+            edge_id.to_waypoint = waypoint_id(index + 1)
+        return feedback
+
+    def true_remaining(self):
+        return self.xs[self.goal] - self.position if self.goal is not None else None
+
+
+def create_nav(schedule, clock, start_index=0):
+    # 시간 기록 (RouteLeg, navigate_waypoint_route) 도 같은 가상 시계 사용
+    graph_nav_module.time = clock
+    client = StubGraphNavClient(clock, start_index)
+    graph = build_graph()
+
+    nav = SpotGraphNav()
+    nav._graph_nav_client = client
+    nav._current_graph = graph
+    nav.route_planner.load_graph(graph, graph_nav_util.update_waypoints_and_edges(graph, None, do_print=False)[0])
+    nav.nav_poller = NavigationPoller(schedule, clock=clock.time, sleep=clock.sleep)
+    return nav, client
+
+
+def run_navigate_to(schedule, goal, start_offset):
+    clock = VirtualClock()
+    clock.now = start_offset
+    nav, client = create_nav(schedule, clock)
+    client.updated = clock.now
+    approach = []
+
+    def on_approach(remaining_distance):
+        approach.append(client.true_remaining())
+        return True
+
+    reached = nav.navigate_to(goal, on_approach=on_approach, approach_distance=1.0)
+    return {
+        "reached": bool(reached) and client.arrival_time is not None,
+        "overshoot": clock.now - client.arrival_time if client.arrival_time is not None else None,
+        "stalls": client.stalls,
+        "commands": client.commands,
+        "polls": nav.last_poll_stats.polls,
+        "approach": approach[0] if approach else None,
+    }
+
+
+def run_navigate_stops(schedule, stops, start_offset):
+    clock = VirtualClock()
+    clock.now = start_offset
+    nav, client = create_nav(schedule, clock)
+    client.updated = clock.now
+
+    reached, legs = nav.navigate_stops(stops)
+    names = [name for name, _ in WAYPOINTS]
+    leg_delays = [leg.arrived - client.passed[names.index(leg.goal)] for leg in legs[:-1]
+                  if names.index(leg.goal) in client.passed]
+    return {
+        "reached": bool(reached) and client.arrival_time is not None,
+        "overshoot": clock.now - client.arrival_time if client.arrival_time is not None else None,
+        "stalls": client.stalls,
+        "commands": client.commands,
+        "polls": nav.last_poll_stats.polls,
+        "leg_delay": max(leg_delays) if leg_delays else None,
+        "legs": len(legs),
+    }
+
+
+def mean_ms(values):
+    values = [value for value in values if value is not None]
+    return f"{statistics.mean(values) * 1000:.0f}ms" if values else "-"
+
+
+def main():
+    schedules = {
+        "fixed 0.5s": AdaptivePollSchedule.fixed(),
+        "adaptive": AdaptivePollSchedule(),
+        "broken reissue": AdaptivePollSchedule(command_duration=1.0, reissue_interval=4.0),
+    }
+    offsets = [i * 0.05 for i in range(5)]
+
+    print("navigate_to")
+    print(f"{'goal':<10} {'schedule':<15} {'reached':>8} {'overshoot':>10} {'polls':>6} {'cmds':>5} {'stalls':>7} "
+          f"{'approach':>9}")
+    for goal in ("p1", "hole2", "p3", "complete"):
+        for name, schedule in schedules.items():
+            results = []
+            for offset in offsets:
+                results.append(run_navigate_to(schedule, goal, offset))
+            approach = [result["approach"] for result in results if result["approach"] is not None]
+            print(f"{goal:<10} {name:<15} {sum(r['reached'] for r in results):>5}/{len(results)} "
+                  f"{mean_ms(r['overshoot'] for r in results):>10} "
+                  f"{statistics.mean(r['polls'] for r in results):>6.1f} "
+                  f"{statistics.mean(r['commands'] for r in results):>5.1f} "
+                  f"{sum(r['stalls'] for r in results):>7} "
+                  f"{(f'{max(approach):.2f}m' if approach else '-'):>9}")
+
+    print("\nnavigate_stops (navigate_waypoint_route)")
+    print(f"{'stops':<24} {'schedule':<15} {'reached':>8} {'overshoot':>10} {'leg delay':>10} {'cmds':>5} "
+          f"{'stalls':>7}")
+    for stops in (["hole1", "hole2"], ["p1", "hole2", "p3"], ["p1", "p3", "complete"]):
+        for name, schedule in schedules.items():
+            results = []
+            for offset in offsets:
+                results.append(run_navigate_stops(schedule, stops, offset))
+            print(f"{' -> '.join(stops):<24} {name:<15} {sum(r['reached'] for r in results):>5}/{len(results)} "
+                  f"{mean_ms(r['overshoot'] for r in results):>10} {mean_ms(r['leg_delay'] for r in results):>10} "
+                  f"{statistics.mean(r['commands'] for r in results):>5.1f} {sum(r['stalls'] for r in results):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+NavigationPoller replay (mock GraphNav client + 가상 시계).
+
+기록된 feedback 순서(경과 시간, 도착 여부, 남은 거리)를 재생해서
+고정 0.5초 polling 과 AdaptivePollSchedule 의 도착 감지 지연 / poll 수 / 명령 수를 비교합니다.
+
+실행 (repo root 에서):
+    python -m _test.nav_polling.nav_polling_replay
+    python -m _test.nav_polling.nav_polling_replay recorded_feedback.json ...
+
+기록 파일은 SpotGraphNav 이동 후 아래처럼 저장한 JSON 입니다.
+    json.dump(nav_manager.last_poll_stats.samples, f)
+
+SpotGraphNav.navigate_to / navigate_waypoint_route 자체 (재전송, 도착 / 경유 판정) 는 graph_nav_replay.py 참고.
+"""
+import json
+import statistics
+import sys
+
+from Spot.SpotNavPolling import AdaptivePollSchedule, NavigationPoller
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class ReplayGraphNavClient:
+    """
+    기록된 feedback 을 시간 순서대로 재생하는 mock client.
+    첫 도착 sample 의 시각을 실제 도착 시각으로 보고, 그 사이 남은 거리는 선형 보간.
+    """
+    def __init__(self, samples, clock: VirtualClock):
+        self.samples = [(t, finished, remaining) for t, finished, remaining in samples if remaining is not None
+                        or finished]
+        self.clock = clock
+        self.arrival_time = next(t for t, finished, _ in self.samples if finished)
+        self.commands = []
+
+    def navigate_to(self, command_duration, command_id):
+        self.commands.append((self.clock.now, command_duration))
+        return command_id or 1
+
+    def remaining_distance(self, now):
+        previous = None
+        for t, finished, remaining in self.samples:
+            remaining = 0.0 if finished else remaining
+            if t >= now:
+                if previous is None or t == previous[0]:
+                    return remaining
+                ratio = (now - previous[0]) / (t - previous[0])
+                return previous[1] + (remaining - previous[1]) * ratio
+            previous = (t, remaining)
+        return 0.0
+
+    def poll(self, command_id):
+        now = self.clock.now
+        if now >= self.arrival_time:
+            return True, 0.0
+        return False, self.remaining_distance(now)
+
+
+def synthetic_walk(distance, speed=1.0, decel_distance=0.5, step=0.02):
+    """일정 속도 이동 후 decel_distance 부터 감속하는 feedback 기록."""
+    samples = []
+    t, remaining = 0.0, distance
+    while remaining > 0.02:
+        samples.append((round(t, 3), False, remaining))
+        current_speed = speed if remaining > decel_distance else max(0.2, speed * remaining / decel_distance)
+        remaining -= current_speed * step
+        t += step
+    samples.append((round(t, 3), True, 0.0))
+    return samples
+
+
+def replay(samples, schedule, start_offset=0.0):
+    clock = VirtualClock()
+    clock.now = start_offset
+    client = ReplayGraphNavClient(samples, clock)
+    poller = NavigationPoller(schedule, clock=clock.time, sleep=clock.sleep)
+    stats = poller.run(client.navigate_to, client.poll)
+    overshoot = clock.now - client.arrival_time
+    return stats, overshoot
+
+
+def compare(recordings):
+    schedules = {
+        "fixed 0.5s": AdaptivePollSchedule.fixed(),
+        "adaptive": AdaptivePollSchedule(),
+    }
+    # 도착 시각과 polling 위상이 맞는 경우/어긋난 경우를 모두 보도록 시작 시각을 조금씩 이동
+    offsets = [i * 0.05 for i in range(10)]
+
+    print(f"{'recording':<16} {'schedule':<12} {'overshoot avg':>14} {'max':>8} {'polls':>7} {'commands':>9}")
+    for name, samples in recordings.items():
+        for schedule_name, schedule in schedules.items():
+            overshoots, polls, commands = [], [], []
+            for offset in offsets:
+                shifted = [(t + offset, finished, remaining) for t, finished, remaining in samples]
+                stats, overshoot = replay(shifted, schedule)
+                overshoots.append(overshoot)
+                polls.append(stats.polls)
+                commands.append(stats.commands)
+            print(f"{name:<16} {schedule_name:<12} {statistics.mean(overshoots) * 1000:>12.0f}ms "
+                  f"{max(overshoots) * 1000:>6.0f}ms {statistics.mean(polls):>7.1f} {statistics.mean(commands):>9.1f}")
+
+
+def main():
+    if len(sys.argv) > 1:
+        recordings = {}
+        for path in sys.argv[1:]:
+            with open(path) as f:
+                recordings[path[-16:]] = [tuple(sample) for sample in json.load(f)]
+    else:
+        recordings = {f"walk {distance:.1f}m": synthetic_walk(distance) for distance in (0.8, 2.0, 5.0, 12.0)}
+    compare(recordings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+QR 결과 표시 경로 benchmark (4K frame + 결과 text).
+
+  pil (legacy)       : 변경 전 GraphicView.set_bgr_image_with_text
+                       (numpy -> PIL, 호출마다 ImageFont.truetype, PIL 에 그리기 -> numpy -> QImage -> QPixmap)
+  GraphicView        : set_bgr_image_with_text (LiveImageItem + TextOverlayRenderer.result)
+  GraphicViewWithText: update_ui_spot_image_with_text 와 같은 set_image + set_text (QR / 검사 결과 화면)
+
+같은 text 반복(cache hit) 과 매번 다른 text(cache miss) 를 각각 측정합니다. (ms per frame, GUI thread)
+
+실행 (repo root 에서):
+    python -m _test.overlay.overlay_benchmark
+    python -m _test.overlay.overlay_benchmark --image data/hand_color.jpg --runs 50
+"""
+import argparse
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from widget.common.GraphicView import GraphicView
+from widget.common.GraphicViewWithText import GraphicViewWithText
+from widget.common.TextOverlay import overlay_renderer
+
+QR_TEXT = ("QR CODE INFORMATION\nMODEL: N3\nDOOR: 4DR\nDRIVE: LHD\nREGION: USA\nTRANSMISSION: AT\n"
+           "ROOF: G/ROOF\nMATERIAL: CR\nENGINE: EV\nWHEEL TYPE: 2WD\nBATTERY: LONG RANGE")
+
+
+def legacy_pil_display(image, text):
+    """변경 전 경로 (PIL 은 benchmark 비교용으로만 사용)."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    pil_img = Image.fromarray(image)
+    title_font = ImageFont.truetype('./font/NotoSans-Bold.ttf', 20)
+    text_font = ImageFont.truetype('./font/NotoSans-Medium.ttf', 15)
+    draw = ImageDraw.Draw(pil_img)
+    left, top, right, bottom = draw.multiline_textbbox((0, 0), text, font=text_font)
+    x, y = pil_img.width - (right - left) - 10, pil_img.height - (bottom - top) - 10
+    draw.rectangle([x, y, x + right - left, y + bottom - top], fill='white')
+    for index, line in enumerate(text.split('\n')):
+        draw.text((x, y), line, font=title_font if index == 0 else text_font, fill=(0, 0, 0))
+        y += (20 if index == 0 else 15) + 5
+
+    image_array = np.ascontiguousarray(np.array(pil_img)[:, :, ::-1], dtype=np.uint8)
+    height, width, channels = image_array.shape
+    qimage = QImage(image_array.data, width, height, channels * width, QImage.Format_RGB888)
+    return QPixmap.fromImage(qimage)
+
+
+def measure(function, runs, warm_up=3):
+    for index in range(warm_up):
+        function(index)
+    elapsed = []
+    for index in range(runs):
+        start = time.perf_counter()
+        function(index)
+        elapsed.append(time.perf_counter() - start)
+    elapsed.sort()
+    return statistics.mean(elapsed) * 1000, elapsed[int(len(elapsed) * 0.95) - 1] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--image", help="BGR image (기본: 3840 x 2160 합성 frame)")
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    image = cv2.imread(args.image) if args.image else np.full((2160, 3840, 3), 90, dtype=np.uint8)
+
+    graphic_view = GraphicView()
+    graphic_view.resize(1280, 720)
+    graphic_view.show()
+    text_view = GraphicViewWithText()
+    text_view.resize(1280, 720)
+    text_view.show()
+    app.processEvents()
+
+    def text_for(index, repeat):
+        return QR_TEXT if repeat else f"{QR_TEXT}\nCOUNT: {index}"
+
+    def show_graphic_view(index, repeat):
+        graphic_view.set_bgr_image_with_text(image, text_for(index, repeat))
+        graphic_view.live_image.flush()
+
+    def show_text_view(index, repeat):
+        text_view.set_image(image)
+        text_view.set_text("INSPECTION INFO", text_for(index, repeat))
+        text_view.live_image.flush()
+
+    rows = []
+    for repeat in (True, False):
+        label = "same text" if repeat else "new text"
+        rows.append((f"pil (legacy), {label}", *measure(lambda i: legacy_pil_display(image, text_for(i, repeat)),
+                                                        args.runs)))
+        rows.append((f"GraphicView, {label}", *measure(lambda i: show_graphic_view(i, repeat), args.runs)))
+        rows.append((f"GraphicViewWithText, {label}", *measure(lambda i: show_text_view(i, repeat), args.runs)))
+
+    print(f"{'path':<34} {'mean':>10} {'p95':>10}  (ms per frame)")
+    for name, mean, p95 in rows:
+        print(f"{name:<34} {mean:>10.2f} {p95:>10.2f}")
+    print(f"overlay cache hits: {overlay_renderer.hits}, misses: {overlay_renderer.misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Point cloud viewer frame time benchmark (data/ 의 depth image).
+
+  scatter (legacy)  : 변경 전 방식. GLScatterPlotItem.setData 로 변환된 point / color 를 매 frame 다시 전달
+                      (ICP animation 한 iteration 과 같음)
+  PointCloudItem    : point 는 VBO 에 한 번만 업로드, 매 frame model matrix (회전) 만 변경. LOD (max points) 별 측정
+
+frame 마다 grabFramebuffer 로 그리기가 끝날 때까지 기다립니다. (ms per frame)
+GPU 가 없는 PC 에서는 --software 로 Qt software OpenGL 을 사용.
+
+실행 (repo root 에서):
+    python -m _test.pointcloud_viewer.pointcloud_viewer_benchmark
+    python -m _test.pointcloud_viewer.pointcloud_viewer_benchmark --software --depth data/hand_depth.png --runs 50
+"""
+import argparse
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+import pyqtgraph.opengl as gl
+from PySide6.QtGui import QVector3D
+from PySide6.QtWidgets import QApplication
+
+from biw_utils.pointcloud_functions import transformation_depth_to_pcd
+from widget.common.PointCloudItem import PointCloudItem, depth_colors, use_software_opengl
+
+DEPTH_IMAGES = ("data/20230605_source_depth.png", "data/hand_depth.png")
+# hand depth camera (point_cloud_widget.py 와 같은 값)
+CALIBRATION = (217.19888305664062, 217.19888305664062, 87.27774047851562, 111.68077850341797, 1000)
+MAX_POINTS = (1_000, 10_000, 50_000, 5_000_000)
+
+
+def rotation_z(angle_degree) -> np.ndarray:
+    angle = np.deg2rad(angle_degree)
+    matrix = np.identity(4)
+    matrix[:2, :2] = [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
+    return matrix
+
+
+def measure(function, runs, warm_up=3):
+    for index in range(warm_up):
+        function(index)
+    elapsed = []
+    for index in range(runs):
+        start = time.perf_counter()
+        function(index)
+        elapsed.append(time.perf_counter() - start)
+    elapsed.sort()
+    return statistics.mean(elapsed) * 1000, elapsed[int(len(elapsed) * 0.95) - 1] * 1000
+
+
+def benchmark(view, points, runs):
+    rows = []
+    colors = depth_colors(points)
+
+    # 변경 전: 매 frame 변환된 point 와 float color 배열을 setData
+    float_colors = colors / 255.0
+    scatter = gl.GLScatterPlotItem(pos=points, color=float_colors, size=1)
+    view.addItem(scatter)
+
+    def draw_scatter(index):
+        matrix = rotation_z(index)
+        scatter.setData(pos=points @ matrix[:3, :3].T + matrix[:3, 3], color=float_colors)
+        view.grabFramebuffer()
+
+    rows.append(("scatter (legacy)", len(points), *measure(draw_scatter, runs)))
+    view.removeItem(scatter)
+
+    item = PointCloudItem(points, colors=colors, point_size=1)
+    view.addItem(item)
+    for max_points in MAX_POINTS:
+        item.set_max_points(max_points)
+
+        def draw_item(index):
+            item.set_model_matrix(rotation_z(index))
+            view.grabFramebuffer()
+
+        mean, p95 = measure(draw_item, runs)
+        level = f"voxel {item.voxel_size * 1000:g}mm" if item.voxel_size else "all points"
+        rows.append((f"PointCloudItem ({level})", item.draw_count, mean, p95))
+    view.removeItem(item)
+    return rows, item.upload_count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--depth", action="append", help=f"depth png (기본: {', '.join(DEPTH_IMAGES)})")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--software", action="store_true", help="Qt software OpenGL 사용")
+    args = parser.parse_args()
+
+    if args.software:
+        use_software_opengl()
+    app = QApplication(sys.argv)
+
+    view = gl.GLViewWidget()
+    view.resize(1280, 720)
+    view.opts['distance'] = 2.4
+    view.show()
+    app.processEvents()
+
+    for depth_path in args.depth or DEPTH_IMAGES:
+        depth = cv2.imread(depth_path, cv2.IMREAD_UNCHANGED)
+        if depth is None:
+            print(f"{depth_path}: cannot read")
+            continue
+
+        start = time.perf_counter()
+        points = transformation_depth_to_pcd(CALIBRATION, depth)
+        convert_time = (time.perf_counter() - start) * 1000
+        view.opts['center'] = QVector3D(*map(float, points.mean(axis=0))) if len(points) else QVector3D()
+
+        rows, upload_count = benchmark(view, points, args.runs)
+        print(f"\n{depth_path}: {depth.shape[1]} x {depth.shape[0]}, {len(points)} points "
+              f"(depth -> points {convert_time:.1f}ms)")
+        print(f"{'path':<36} {'points':>8} {'mean':>10} {'p95':>10}  (ms per frame)")
+        for name, count, mean, p95 in rows:
+            print(f"{name:<36} {count:>8} {mean:>10.2f} {p95:>10.2f}")
+        print(f"PointCloudItem uploads: {upload_count}")
+
+
+if __name__ == "__main__":
+    main()
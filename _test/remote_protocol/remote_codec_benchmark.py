@@ -0,0 +1,100 @@
+"""
+Remote 프로토콜 codec fuzz / throughput benchmark.
+
+실행 (repo root 에서):
+    python -m _test.remote_protocol.remote_codec_benchmark
+"""
+import random
+import socket
+import threading
+import time
+
+from communication.Remote.RemoteData import *
+from communication.Remote.RemoteCodec import RemoteFrameDecoder, RemoteFrameEncoder
+
+REQ_TYPES = [req_type.value for req_type in RemoteCommReqType]
+
+
+def make_random_message(rng: random.Random) -> RemoteCommMessageData:
+    message = RemoteCommMessageData(RemoteCommCommandType.Res.value,
+                                    RemoteCommControllerType.controller_left.value, [])
+    for data_type in rng.sample(REQ_TYPES, rng.randint(1, 8)):
+        body = RemoteCommBodyData()
+        body.data_type = data_type
+        body.data = str(rng.randint(0, 10 ** rng.randint(1, 12))).encode()
+        message.body_data.append(body)
+    return message
+
+
+def fuzz(iterations=2000, seed=0):
+    """임의 위치에서 잘린/합쳐진 stream 이 원본 메세지 순서대로 복원되는지 확인."""
+    rng = random.Random(seed)
+    encoder = RemoteFrameEncoder(initial_size=16)
+    decoder = RemoteFrameDecoder()
+
+    messages = [make_random_message(rng) for _ in range(iterations)]
+    stream = bytearray()
+    for message in messages:
+        # frame 사이 쓰레기 데이터.
+        if rng.random() < 0.1:
+            stream += bytes(rng.randint(4, 127) for _ in range(rng.randint(1, 8)))
+        stream += encoder.encode(message)
+
+    decoded = []
+    pos = 0
+    while pos < len(stream):
+        chunk = rng.randint(1, 300)
+        decoded += decoder.feed(stream[pos:pos + chunk])
+        pos += chunk
+
+    assert len(decoded) == len(messages), (len(decoded), len(messages))
+    for expected, actual in zip(messages, decoded):
+        assert expected.type == actual.type
+        assert expected.id == actual.id
+        assert [(b.data_type, b.data) for b in expected.body_data] == \
+               [(b.data_type, b.data) for b in actual.body_data]
+
+    print(f"fuzz ok: {len(messages)} messages, {len(stream)} bytes, dropped {decoder.dropped_bytes} bytes")
+
+
+def throughput(count=50000, seed=1):
+    """socketpair 를 통해 count 개 메세지를 보내고 초당 처리량 측정."""
+    rng = random.Random(seed)
+    encoder = RemoteFrameEncoder()
+    frames = [encoder.encode(make_random_message(rng)) for _ in range(256)]
+
+    sender, receiver = socket.socketpair()
+
+    def send_all():
+        for i in range(count):
+            sender.sendall(frames[i % len(frames)])
+        sender.shutdown(socket.SHUT_WR)
+
+    decoder = RemoteFrameDecoder()
+    received = 0
+    recv_buffer = bytearray(4096)
+    recv_view = memoryview(recv_buffer)
+
+    st_time = time.perf_counter()
+    send_thread = threading.Thread(target=send_all)
+    send_thread.start()
+
+    while True:
+        n = receiver.recv_into(recv_buffer)
+        if n == 0:
+            break
+        received += len(decoder.feed(recv_view[:n]))
+
+    send_thread.join()
+    elapsed_time = time.perf_counter() - st_time
+
+    sender.close()
+    receiver.close()
+
+    assert received == count, (received, count)
+    print(f"throughput: {count} messages in {elapsed_time:.3f}s -> {count / elapsed_time:,.0f} msg/s")
+
+
+if __name__ == "__main__":
+    fuzz()
+    throughput()
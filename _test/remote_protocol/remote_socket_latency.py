@@ -0,0 +1,86 @@
+"""
+RemoteServer / RemoteClient 왕복 지연 측정 (selector 기반 socket).
+
+실행 (repo root 에서):
+    python -m _test.remote_protocol.remote_socket_latency
+"""
+import statistics
+import threading
+import time
+
+from communication.Remote.RemoteData import *
+from communication.Remote.remote_client.RemoteClient import RemoteClient
+from communication.Remote.remote_server.RemoteServer import RemoteServer
+
+
+def make_request():
+    req = RemoteCommMessageData(RemoteCommCommandType.Req.value,
+                                RemoteCommControllerType.controller_left.value, [])
+    body = RemoteCommBodyData()
+    body.data_type = RemoteCommReqType.spot_battery.value
+    req.body_data.append(body)
+    return req
+
+
+def wait_until(condition, timeout=5.0):
+    end_time = time.time() + timeout
+    while not condition():
+        if time.time() > end_time:
+            raise TimeoutError
+        time.sleep(0.001)
+
+
+def round_trip(count=2000, n_clients=20):
+    server = RemoteServer()
+
+    def on_request(req: RemoteCommMessageData):
+        res = RemoteCommMessageData(RemoteCommCommandType.Res.value, req.id, [])
+        for body in req.body_data:
+            res_body = RemoteCommBodyData()
+            res_body.data_type = body.data_type
+            res_body.data = b"100"
+            res.body_data.append(res_body)
+        server.senddata(res)
+
+    server.setcallbackrecvdataprocess(on_request)
+    server.ServerOpen("127.0.0.1", 0)
+    wait_until(lambda: server.info is not None)
+
+    # 여러 controller 가 동시에 붙어있는 상황.
+    idle_clients = []
+    for _ in range(n_clients - 1):
+        client = RemoteClient()
+        client.SetAutoReconnect(False)
+        client.connect(server.info)
+        idle_clients.append(client)
+
+    client = RemoteClient()
+    client.SetAutoReconnect(False)
+    received = threading.Event()
+    client.setcallbackrecvdataprocess(lambda res: received.set())
+    client.connect(server.info)
+    wait_until(lambda: client.is_connect and len(server.connections) == n_clients)
+
+    latencies = []
+    req = make_request()
+    for _ in range(count):
+        received.clear()
+        st_time = time.perf_counter()
+        client.reqdata(req)
+        if not received.wait(1.0):
+            raise TimeoutError("no response")
+        latencies.append((time.perf_counter() - st_time) * 1000)
+
+    latencies.sort()
+    print(f"{n_clients} clients, {count} round trips")
+    print(f"  p50: {statistics.median(latencies):.3f} ms")
+    print(f"  p99: {latencies[int(len(latencies) * 0.99)]:.3f} ms")
+    print(f"  max: {latencies[-1]:.3f} ms")
+
+    for c in idle_clients + [client]:
+        c.close()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    round_trip()
@@ -0,0 +1,99 @@
+"""
+YOLO hole detector CPU 추론 지연 비교.
+
+  torch     : YoloManager.infer_image 와 같은 경로 (파일 -> PIL resize -> tensor -> YOLOv5 model)
+  load      : load_torch_model 처음 load (weight 읽기 + warm-up) / 같은 weight 재 load (cache)
+  onnx      : YoloOnnxDetector.detect (메모리 BGR frame -> letterbox -> ONNX Runtime -> NumPy NMS)
+  onnx batch: YoloOnnxDetector.detect_batch (crop 여러 장을 한 번에)
+  onnx region: YoloOnnxDetector.detect_region (검사 영역만 원본 해상도 타일로, --region 지정 시)
+
+실행 (repo root 에서):
+    python -m _test.yolo_inference.yolo_inference_benchmark --pt model/best.pt --onnx model/best.onnx --image img.png
+"""
+import argparse
+import statistics
+import time
+
+import cv2
+import torch
+
+from HoleDetect_Yolo.YoloOnnxDetector import YoloOnnxDetector
+
+
+def measure(function, runs, warm_up=3):
+    for _ in range(warm_up):
+        function()
+    elapsed = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        elapsed.append(time.perf_counter() - start)
+    elapsed.sort()
+    return statistics.mean(elapsed) * 1000, elapsed[int(len(elapsed) * 0.95) - 1] * 1000
+
+
+def make_crops(image, count, size=320):
+    height, width = image.shape[:2]
+    crops = []
+    for index in range(count):
+        x = (index * size // 2) % max(1, width - size)
+        y = (index * size // 3) % max(1, height - size)
+        crops.append(image[y:y + size, x:x + size])
+    return crops
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pt", help="YOLOv5 weights (.pt)")
+    parser.add_argument("--onnx", help="YOLOv5 ONNX export (--dynamic 이면 batch 측정)")
+    parser.add_argument("--image", required=True)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--crops", type=int, default=8)
+    parser.add_argument("--region", help="x,y,w,h (hole_inspection region)")
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads or torch.get_num_threads())
+    image = cv2.imread(args.image)
+    rows = []
+
+    if args.pt:
+        from HoleDetect_Yolo.YoloManager import preprocess_image
+        from HoleDetect_Yolo.YoloTorchDetector import load_torch_model
+
+        start = time.perf_counter()
+        model = load_torch_model(args.pt, device="cpu")
+        rows.append(("torch load (cold)", (time.perf_counter() - start) * 1000, float("nan")))
+        rows.append(("torch load (cached)", *measure(lambda: load_torch_model(args.pt, device="cpu"), args.runs)))
+
+        def torch_infer():
+            image_tensor, _ = preprocess_image(args.image, "cpu")
+            with torch.inference_mode():
+                model(image_tensor)
+        rows.append(("torch (file)", *measure(torch_infer, args.runs)))
+
+    if args.onnx:
+        detector = YoloOnnxDetector(args.onnx, intra_op_threads=args.threads)
+        detector.warm_up()
+        rows.append(("onnx (frame)", *measure(lambda: detector.detect(image), args.runs)))
+
+        crops = make_crops(image, args.crops)
+        mean, p95 = measure(lambda: [detector.detect(crop) for crop in crops], args.runs)
+        rows.append((f"onnx {args.crops} crops, 1x1", mean / args.crops, p95 / args.crops))
+        if detector.dynamic_batch:
+            mean, p95 = measure(lambda: detector.detect_batch(crops), args.runs)
+            rows.append((f"onnx {args.crops} crops, batch", mean / args.crops, p95 / args.crops))
+
+        if args.region:
+            region = tuple(int(value) for value in args.region.split(","))
+            rows.append(("onnx region tiles", *measure(lambda: detector.detect_region(image, region), args.runs)))
+            print(f"full frame detections: {len(detector.detect(image))}, "
+                  f"region detections: {len(detector.detect_region(image, region))}")
+
+    print(f"{'path':<26} {'mean':>10} {'p95':>10}  (ms per image)")
+    for name, mean, p95 in rows:
+        print(f"{name:<26} {mean:>10.1f} {p95:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
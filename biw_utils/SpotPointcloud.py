@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 import numpy as np
-import open3d as o3d
+from biw_utils.lazy_import import lazy_import
 from biw_utils.outlier_processing import remove_outlier_sor_filter
 
+o3d = lazy_import("open3d")
+
 fx = 217.19888305664062
 fy = 217.19888305664062
 # 90도 로테이션을 했기 때문에, cx, cy의 좌표값을 서로 바꾸어 줌. 기존: (111.-, 87.-)
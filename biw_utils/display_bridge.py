@@ -0,0 +1,110 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import cv2
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+# 작업 thread -> 화면 image 전달
+# 기존: MainOperator.event_update_spot_image(_with_text) 가 4K np.ndarray 를 그대로 Qt signal 로 전달
+#       (queued signal 마다 frame 을 붙잡고 있고, GUI thread 에서 원본 크기로 pixmap 변환)
+# 변경: 작업 thread 에서 화면 크기 thumbnail 을 만들어 최신 값 하나만 보관 (LatestValueSlot).
+#       GUI 에는 payload 없는 frame_ready 만 알리고, GUI 가 가져갈 때까지 들어온 이전 frame 은 버림.
+# 원본 frame 은 InspectionDataManager (검사 기록) 에 보관하고, 화면에는 저장 (이미지 저장 메뉴) 용 참조만 같이 전달.
+
+DEFAULT_THUMBNAIL_SIZE = (1920, 1080)
+
+
+class LatestValueSlot:
+    """thread 간에 최신 값 하나만 전달. 가져가기 전에 새 값이 들어오면 이전 값은 버림."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = None
+        self._has_value = False
+        self.published = 0
+        self.dropped = 0
+
+    def put(self, value) -> bool:
+        """
+        Returns:
+            bool: slot 이 비어 있었으면 True (받는 쪽에 알려야 함)
+        """
+        with self._lock:
+            was_empty = not self._has_value
+            if not was_empty:
+                self.dropped += 1
+            self._value = value
+            self._has_value = True
+            self.published += 1
+            return was_empty
+
+    def take(self):
+        with self._lock:
+            value, self._value = self._value, None
+            self._has_value = False
+            return value
+
+
+def make_thumbnail(image: np.ndarray, max_size) -> np.ndarray:
+    """max_size (w, h) 안에 들어가도록 축소한 복사본. 작업 thread 가 원본을 다시 써도 화면에 영향 없음."""
+    height, width = image.shape[:2]
+    scale = min(max_size[0] / width, max_size[1] / height)
+    if scale >= 1.0:
+        return image.copy()
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+@dataclass
+class DisplayFrame:
+    image: np.ndarray           # thumbnail
+    source_size: tuple          # 원본 (w, h). 화면 좌표는 원본 기준 (text overlay 위치 유지)
+    text: Optional[str] = None
+    published: float = 0.0
+    source: Optional[np.ndarray] = None     # 원본 frame 참조 (복사 없음, 저장할 때만 사용)
+
+
+class DisplayBridge(QObject):
+    """
+    작업 thread 에서 publish, GUI thread 에서 frame_ready 를 받아 take.
+
+    Args:
+        thumbnail_size (tuple): thumbnail 최대 크기 (w, h). GUI 가 set_view_size 로 갱신.
+    """
+    frame_ready = Signal()
+
+    def __init__(self, thumbnail_size=DEFAULT_THUMBNAIL_SIZE):
+        super().__init__()
+        self.thumbnail_size = tuple(thumbnail_size)
+        self.slot = LatestValueSlot()
+        self.thumbnail_time = 0.0
+        self.max_latency = 0.0
+
+    def set_view_size(self, width, height):
+        """표시할 view 의 viewport 크기 (pixel). 다음 frame 부터 이 크기로 축소."""
+        if width > 0 and height > 0:
+            self.thumbnail_size = (int(width), int(height))
+
+    def publish(self, image: np.ndarray, text: Optional[str] = None):
+        start_time = time.time()
+        frame = DisplayFrame(make_thumbnail(image, self.thumbnail_size), (image.shape[1], image.shape[0]), text,
+                             source=image)
+        frame.published = time.time()
+        self.thumbnail_time += frame.published - start_time
+
+        if self.slot.put(frame):
+            self.frame_ready.emit()
+
+    def take(self) -> Optional[DisplayFrame]:
+        frame = self.slot.take()
+        if frame is not None:
+            self.max_latency = max(self.max_latency, time.time() - frame.published)
+        return frame
+
+    def summary(self) -> str:
+        published = max(1, self.slot.published)
+        return (f"display frames: {self.slot.published}, dropped: {self.slot.dropped}, "
+                f"thumbnail mean: {self.thumbnail_time / published * 1000:.1f}ms, "
+                f"max latency: {self.max_latency * 1000:.1f}ms")
@@ -0,0 +1,82 @@
+import builtins
+import sys
+import threading
+import time
+
+# 시작 시 import 시간 측정 (python -X importtime 과 같은 self / cumulative 분해)
+# main.py 에서 다른 import 보다 먼저 start() 하고, 첫 화면이 뜬 뒤 report() 를 출력한다.
+#
+# recorder = ImportTimeRecorder()
+# recorder.start()
+# ...
+# recorder.stop()
+# print(recorder.report())
+
+
+class ImportTimeRecorder:
+    """
+    builtins.__import__ 를 감싸서 main thread 에서 처음 import 되는 module 의 시간을 기록합니다.
+    """
+    def __init__(self):
+        self.records = dict()   # module -> (self 시간, cumulative 시간, depth)
+        self.started = None
+        self.stopped = None
+        self._original_import = None
+        self._stack = []
+        self._main_thread = threading.main_thread()
+
+    def start(self):
+        if self._original_import is not None:
+            return
+        self.started = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self):
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+        self.stopped = time.perf_counter()
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original_import = self._original_import or builtins.__import__
+        if level != 0 or name in sys.modules or threading.current_thread() is not self._main_thread:
+            return original_import(name, globals, locals, fromlist, level)
+
+        start_time = time.perf_counter()
+        self._stack.append(0.0)
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - start_time
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += cumulative
+            if name not in self.records:
+                self.records[name] = (cumulative - nested, cumulative, len(self._stack))
+
+    def top_level(self) -> dict:
+        """최상위 package 별 cumulative 합계 (초)."""
+        packages = {}
+        for name, (_, cumulative, depth) in self.records.items():
+            if depth == 0:
+                package = name.split(".")[0]
+                packages[package] = packages.get(package, 0.0) + cumulative
+        return packages
+
+    def report(self, top=20) -> str:
+        total = (self.stopped or time.perf_counter()) - (self.started or time.perf_counter())
+        lines = [f"Import time: {len(self.records)} modules, {total:.2f}s until first window",
+                 f"{'self [ms]':>10} | {'cumulative':>10} | module"]
+        ranked = sorted(self.records.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        for name, (self_time, cumulative, depth) in ranked:
+            lines.append(f"{self_time * 1000:>10.1f} | {cumulative * 1000:>10.1f} | {'  ' * depth}{name}")
+
+        lines.append("top-level packages:")
+        for package, cumulative in sorted(self.top_level().items(), key=lambda item: item[1], reverse=True)[:top]:
+            lines.append(f"{cumulative * 1000:>10.1f} ms  {package}")
+        return "\n".join(lines)
+
+
+import_time_recorder = ImportTimeRecorder()
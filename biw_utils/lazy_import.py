@@ -0,0 +1,77 @@
+import importlib
+import threading
+import time
+import types
+
+# 무거운 module (open3d, scipy, torch ..) 을 처음 사용할 때 import
+# GUI 첫 화면이 뜨기 전에 import 하지 않도록 module level 에서는 proxy 만 만든다.
+#
+# o3d = lazy_import("open3d")
+# o3d.geometry.PointCloud()   # 이 시점에 import
+#
+# 화면이 뜬 뒤 warm_up_in_background() 로 미리 import 해두면 처음 사용할 때도 기다리지 않는다.
+
+# 화면 표시 후 background 로 미리 import 할 module (앞에서부터 순서대로)
+WARM_UP_MODULES = (
+    "scipy.ndimage",
+    "scipy.stats",
+    "open3d",
+    "pyqtgraph",
+    "torch",
+    "torchvision",
+)
+
+
+class LazyModule(types.ModuleType):
+    """속성에 처음 접근할 때 실제 module 을 import 하는 proxy."""
+    def __init__(self, name):
+        super().__init__(name)
+        self._lazy_lock = threading.Lock()
+        self._lazy_module = None
+
+    def _load(self):
+        module = self._lazy_module
+        if module is None:
+            with self._lazy_lock:
+                if self._lazy_module is None:
+                    self._lazy_module = importlib.import_module(self.__name__)
+                module = self._lazy_module
+        return module
+
+    def __getattr__(self, item):
+        if item.startswith("_lazy_"):
+            raise AttributeError(item)
+        return getattr(self._load(), item)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name) -> LazyModule:
+    return LazyModule(name)
+
+
+def warm_up_in_background(names=WARM_UP_MODULES, on_finished=None) -> threading.Thread:
+    """
+    names 의 module 을 background thread 에서 순서대로 import 합니다.
+    설치되지 않은 module 은 건너뜁니다.
+
+    Args:
+        on_finished (callable): on_finished({module: 소요 시간(초) 또는 None}) - background thread 에서 호출
+    """
+    def run():
+        elapsed_times = {}
+        for name in names:
+            start_time = time.perf_counter()
+            try:
+                importlib.import_module(name)
+                elapsed_times[name] = time.perf_counter() - start_time
+            except Exception as e:
+                print(f"[lazy_import.py] - warm up {name} skipped. {e}")
+                elapsed_times[name] = None
+        if on_finished is not None:
+            on_finished(elapsed_times)
+
+    thread = threading.Thread(target=run, name="ModuleWarmUp", daemon=True)
+    thread.start()
+    return thread
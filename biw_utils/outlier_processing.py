@@ -1,5 +1,8 @@
 import numpy as np
-from scipy.stats import zscore
+
+from biw_utils.lazy_import import lazy_import
+
+stats = lazy_import("scipy.stats")
 
 
 # Outlier Remove (IQR)
@@ -88,7 +91,7 @@ def remove_outlier_sor_filter(pcd, nb_neighbors=20, std_ratio=2.0):
 
 def depth_accumulate(depth_list, threshold):
     # Z-점수 계산
-    z_scores = zscore(depth_list, axis=None)
+    z_scores = stats.zscore(depth_list, axis=None)
 
     # Z-점수가 특정 임계값을 초과하는 값 제외
     # threshold = 3  # 임계값 설정 (예시)
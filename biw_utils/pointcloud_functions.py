@@ -1,36 +1,26 @@
+from __future__ import annotations
+
 import cv2
 import numpy as np
-import open3d as o3d
+
+from biw_utils.lazy_import import lazy_import
+
+o3d = lazy_import("open3d")
 
 
 def transformation_depth_to_pcd(calibration: tuple, depth: np.ndarray):
     fx, fy, cx, cy, depth_scale = calibration
-    # depth 이미지의 크기를 구합니다.
-    height, width = depth.shape[:2]
-
-    # 카메라 파라미터를 이용하여 포인트 클라우드를 생성합니다.
-    # 포인트 클라우드는 (h*w, 3) 크기의 NumPy 배열입니다.
-    pointcloud = np.zeros((height * width, 3), dtype=np.float32)
-
-    index = 0
-    for v in range(height):
-        for u in range(width):
-            # 이미지 상의 (u, v) 좌표의 깊이 값을 가져옵니다.
-            depth_value = depth[v, u]
-
-            # 깊이 값이 0인 경우는 포인트 클라우드에 추가하지 않습니다.
-            if depth_value == 0:
-                continue
-
-            # 이미지 상의 (u, v) 좌표의 3차원 좌표 값을 계산합니다.
-            Z = depth_value / depth_scale
-            X = (u - cx) * Z / fx
-            Y = (v - cy) * Z / fy
-            pointcloud[index, :] = [X, Y, Z]
-            index += 1
-
-    # 포인트 클라우드가 저장된 NumPy 배열과 포인트 개수를 반환합니다.
-    return pointcloud[:index, :]
+
+    # 깊이 값이 0 이 아닌 픽셀 (행 우선 순서)
+    v, u = np.nonzero(depth)
+
+    # 이미지 상의 (u, v) 좌표의 3차원 좌표 값을 계산합니다.
+    Z = depth[v, u] / depth_scale
+    X = (u - cx) * Z / fx
+    Y = (v - cy) * Z / fy
+
+    # (N, 3) 포인트 클라우드
+    return np.stack((X, Y, Z), axis=1).astype(np.float32)
 
 
 def transformation_pcd_to_depth(calibration: tuple, pointcloud, height=224, width=171):
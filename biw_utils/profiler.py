@@ -0,0 +1,206 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# Cycle time 분석용 span profiler
+# 작업 단계(이동, arm, 촬영, 디코딩, OPC 신호 ..)의 시작/종료 시각을 기록.
+# - 최근 span 은 메모리 ring buffer 에 보관
+# - cycle 이 끝나면 해당 cycle 의 span 을 Chrome trace JSON 으로 저장 (chrome://tracing, Perfetto)
+#
+# with profiler.span("navigate_to", "nav", waypoint=waypoint):
+#     ...
+#
+# @trace("take_image", "capture")
+# def take_image(self): ...
+
+SPAN_BUFFER_SIZE = 4096
+TRACE_MAX_FILES = 200
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start: float                  # time.time()
+    end: float = 0.0
+    thread_id: int = 0
+    thread_name: str = ""
+    depth: int = 0
+    cycle_id: int = 0
+    args: dict = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def to_trace_event(self, pid: int) -> dict:
+        return {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": int(self.start * 1e6),
+            "dur": int(self.duration * 1e6),
+            "pid": pid,
+            "tid": self.thread_id,
+            "args": {key: str(value) for key, value in self.args.items()},
+        }
+
+
+class SpanProfiler:
+    """
+    thread-safe span 기록기.
+
+    Args:
+        buffer_size (int): 메모리에 보관할 최근 span 개수
+        trace_path (str): cycle trace 저장 폴더. None 이면 저장하지 않음.
+        max_files (int): 보관할 trace 파일 개수. 넘으면 오래된 파일부터 삭제.
+    """
+    def __init__(self, buffer_size=SPAN_BUFFER_SIZE, trace_path=None, max_files=TRACE_MAX_FILES):
+        self.enabled = True
+        self.trace_path = trace_path
+        self.max_files = max_files
+
+        self.spans = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self.cycle_id = 0
+        self.cycle_name = ""
+        self.cycle_start = None
+
+    def _depth(self):
+        return getattr(self._local, "depth", 0)
+
+    @contextmanager
+    def span(self, name, category="", **args):
+        """
+        with 블록 구간을 span 으로 기록. 블록 종료 후 record.duration 으로 소요 시간 확인 가능.
+        """
+        current_thread = threading.current_thread()
+        depth = self._depth()
+        record = Span(name, category, time.time(),
+                      thread_id=current_thread.ident, thread_name=current_thread.name,
+                      depth=depth, cycle_id=self.cycle_id, args=args)
+        self._local.depth = depth + 1
+        try:
+            yield record
+        except Exception as e:
+            record.args["error"] = e
+            raise
+        finally:
+            self._local.depth = depth
+            record.end = time.time()
+            if self.enabled:
+                with self._lock:
+                    self.spans.append(record)
+
+    def trace(self, name=None, category=""):
+        """함수 호출 전체를 span 으로 기록하는 decorator."""
+        def decorator(function):
+            span_name = name or function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name, category):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def add_span(self, name, category, start, end, **args):
+        """이미 측정된 구간을 span 으로 추가. (ex. 상태 머신의 상태 구간)"""
+        if not self.enabled:
+            return
+        current_thread = threading.current_thread()
+        record = Span(name, category, start, end,
+                      thread_id=current_thread.ident, thread_name=current_thread.name,
+                      cycle_id=self.cycle_id, args=args)
+        with self._lock:
+            self.spans.append(record)
+
+    def begin_cycle(self, name=""):
+        with self._lock:
+            self.cycle_id += 1
+            self.cycle_name = name
+            self.cycle_start = time.time()
+        return self.cycle_id
+
+    def end_cycle(self):
+        """
+        현재 cycle 을 종료하고 trace 파일로 저장합니다.
+
+        Returns:
+            list[Span]: 해당 cycle 의 span 목록
+        """
+        with self._lock:
+            cycle_id = self.cycle_id
+            cycle_name = self.cycle_name
+            self.cycle_start = None
+            spans = [span for span in self.spans if span.cycle_id == cycle_id]
+
+        if self.trace_path:
+            try:
+                self.save_trace(spans, cycle_id, cycle_name)
+            except OSError as e:
+                print(f"[profiler.py] - save trace failed. {e}")
+
+        return spans
+
+    def get_spans(self, cycle_id=None) -> list:
+        with self._lock:
+            if cycle_id is None:
+                return list(self.spans)
+            return [span for span in self.spans if span.cycle_id == cycle_id]
+
+    def summarize(self, spans, category=None) -> dict:
+        """이름별 합계 시간 (초)."""
+        summary = {}
+        for span in spans:
+            if category is not None and span.category != category:
+                continue
+            summary[span.name] = summary.get(span.name, 0.0) + span.duration
+        return summary
+
+    def save_trace(self, spans, cycle_id, cycle_name=""):
+        os.makedirs(self.trace_path, exist_ok=True)
+
+        pid = os.getpid()
+        events = []
+        thread_names = {}
+        for span in spans:
+            events.append(span.to_trace_event(pid))
+            thread_names[span.thread_id] = span.thread_name
+
+        for thread_id, thread_name in thread_names.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                           "args": {"name": thread_name}})
+
+        current_time = datetime.now().strftime('%Y%m%d_%H%M%S')
+        file_name = f"cycle_{current_time}_{cycle_id:06d}.json"
+        file_path = os.path.join(self.trace_path, file_name)
+        with open(file_path, "w") as f:
+            json.dump({"traceEvents": events,
+                       "displayTimeUnit": "ms",
+                       "otherData": {"cycle_id": cycle_id, "cycle_name": cycle_name}}, f)
+
+        self._rotate()
+        return file_path
+
+    def _rotate(self):
+        files = sorted(name for name in os.listdir(self.trace_path)
+                       if name.startswith("cycle_") and name.endswith(".json"))
+        for name in files[:max(0, len(files) - self.max_files)]:
+            try:
+                os.remove(os.path.join(self.trace_path, name))
+            except OSError:
+                pass
+
+
+profiler = SpanProfiler()
+span = profiler.span
+trace = profiler.trace
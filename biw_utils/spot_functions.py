@@ -7,14 +7,16 @@ from bosdyn.client import robot_command
 from bosdyn.api import image_pb2
 
 import numpy as np
-from scipy import ndimage
 
 from biw_utils.SpotPointcloud import SpotPointcloud
 from biw_utils import outlier_processing
+from biw_utils.lazy_import import lazy_import
 
 from Spot.SpotCamera import SpotCamera
 from Spot.SpotRobot import Robot
 
+ndimage = lazy_import("scipy.ndimage")
+
 
 def save_arm_joint_state(robot: Robot, file_path: str):
     joint_params = robot.get_current_joint_state()
@@ -125,12 +125,8 @@ def select_roi(origin_image: np.ndarray) -> tuple:
 
 
 def set_graphic_view_image(image, view):
-    qpixmap = convert_image_to_pixmap(image)
-    pixmap_item = QGraphicsPixmapItem(qpixmap)
-    scene = QGraphicsScene()
-    scene.addItem(pixmap_item)
-    view.setScenePixmap(scene, pixmap_item)
-    view.fitInView(pixmap_item, Qt.KeepAspectRatio)
+    # GraphicView 의 scene / pixmap item 을 재사용 (표시 후 fit to view)
+    view.set_image(image)
 
 
 def convert_image_to_pixmap(image_input):
@@ -5,7 +5,6 @@ from PySide6.QtCore import Qt
 from functools import partial
 
 import DefineGlobal
-from HoleDetect_Yolo.AISettingWidget import AISettingWidget
 from main_operator import MainOperator
 from biw_utils.decorators import arm_control_exception_decorator, exception_decorator
 from widget.Setting.CommunicationCheckWidget import OPCWidget
@@ -16,7 +15,7 @@ from widget.Setting.NavigationSettingWidget import NavigationSettingWidget
 from widget.Setting.ProgramSettingWidget import ProgramSettingWidget
 from widget.QRCode.QRCodeInspectionWidget import QRCodeInspectionWidget
 from widget.Setting.SpotControlWidget import SpotControlWidget
-from widget.icp_pointcloud_widget import ICPPointCloudVisualizer
+from widget.common.LazyPage import LazyPage
 
 
 class BodyWidget(QStackedWidget):
@@ -535,8 +534,14 @@ class BodyAdminWidget(QWidget):
         self.btn_ai_setting_page_NE = QPushButton("AI Setting Page")
         self.btn_ai_setting_page_ME = QPushButton("AI Setting Page")
 
-        self.buttons_NE = [self.btn1_NE, self.btn2_NE, self.btn3_NE, self.btn4_NE, self.btn5_NE, self.btn6_NE, self.btn7_NE, self.btn_ai_setting_page_NE]
-        self.buttons_ME = [self.btn1_ME, self.btn4_ME, self.btn5_ME, self.btn6_ME, self.btn7_ME, self.btn_ai_setting_page_ME]
+        self.btn_takt_time_NE = QPushButton("Takt Time")
+        self.btn_takt_time_ME = QPushButton("Takt Time")
+
+        self.btn_history_NE = QPushButton("Inspection History")
+        self.btn_history_ME = QPushButton("Inspection History")
+
+        self.buttons_NE = [self.btn1_NE, self.btn2_NE, self.btn3_NE, self.btn4_NE, self.btn5_NE, self.btn6_NE, self.btn7_NE, self.btn_ai_setting_page_NE, self.btn_takt_time_NE, self.btn_history_NE]
+        self.buttons_ME = [self.btn1_ME, self.btn4_ME, self.btn5_ME, self.btn6_ME, self.btn7_ME, self.btn_ai_setting_page_ME, self.btn_takt_time_ME, self.btn_history_ME]
 
         for index, button in enumerate(self.buttons_NE):
             button.clicked.connect(partial(self.change_NE_Page, index))
@@ -548,6 +553,8 @@ class BodyAdminWidget(QWidget):
         self.btn6_ME.clicked.connect(partial(self.change_ME_Page, 3, 5))
         self.btn7_ME.clicked.connect(partial(self.change_ME_Page, 4, 6))
         self.btn7_ME.clicked.connect(partial(self.change_ME_Page, 5, 7))
+        self.btn_takt_time_ME.clicked.connect(partial(self.change_ME_Page, 6, 8))
+        self.btn_history_ME.clicked.connect(partial(self.change_ME_Page, 7, 9))
 
         layout_NE.addWidget(self.btn1_NE)
         layout_NE.addWidget(self.btn2_NE)
@@ -557,6 +564,8 @@ class BodyAdminWidget(QWidget):
         layout_NE.addWidget(self.btn6_NE)
         layout_NE.addWidget(self.btn7_NE)
         layout_NE.addWidget(self.btn_ai_setting_page_NE)
+        layout_NE.addWidget(self.btn_takt_time_NE)
+        layout_NE.addWidget(self.btn_history_NE)
 
         layout_ME.addWidget(self.btn1_ME)
         layout_ME.addWidget(self.btn4_ME)
@@ -564,6 +573,8 @@ class BodyAdminWidget(QWidget):
         layout_ME.addWidget(self.btn6_ME)
         layout_ME.addWidget(self.btn7_ME)
         layout_ME.addWidget(self.btn_ai_setting_page_ME)
+        layout_ME.addWidget(self.btn_takt_time_ME)
+        layout_ME.addWidget(self.btn_history_ME)
 
         self.widget_setting_NE.setLayout(layout_NE)
         self.widget_setting_ME.setLayout(layout_ME)
@@ -588,7 +599,10 @@ class BodyAdminWidget(QWidget):
         self.page5 = ProgramSettingWidget(self.main_operator)
         self.page6 = NavigationSettingWidget(self.main_operator)
         self.page7 = OPCWidget(self.main_operator)
-        self.page_ai_setting = AISettingWidget()
+        # torch / pyqtgraph 를 쓰는 page 는 처음 열 때 생성
+        self.page_ai_setting = LazyPage(self.create_ai_setting_page)
+        self.page_takt_time = LazyPage(self.create_takt_time_page)
+        self.page_history = LazyPage(self.create_history_page)
 
         self.stacked_widget.addWidget(self.page1)
         self.stacked_widget.addWidget(self.page2)
@@ -598,9 +612,24 @@ class BodyAdminWidget(QWidget):
         self.stacked_widget.addWidget(self.page6)
         self.stacked_widget.addWidget(self.page7)
         self.stacked_widget.addWidget(self.page_ai_setting)
+        self.stacked_widget.addWidget(self.page_takt_time)
+        self.stacked_widget.addWidget(self.page_history)
         self.stacked_widget.setObjectName("body_admin")
         self.right_layout.addWidget(self.stacked_widget)
 
+    @staticmethod
+    def create_ai_setting_page():
+        from HoleDetect_Yolo.AISettingWidget import AISettingWidget
+        return AISettingWidget()
+
+    def create_takt_time_page(self):
+        from widget.Setting.TaktTimeWidget import TaktTimeWidget
+        return TaktTimeWidget(self.main_operator)
+
+    def create_history_page(self):
+        from widget.Setting.InspectionHistoryWidget import InspectionHistoryWidget
+        return InspectionHistoryWidget(self.main_operator)
+
     def change_NE_Page(self, index):
         self.stacked_widget.setCurrentIndex(index)
         self.update_NE_ButtonStyles(index)
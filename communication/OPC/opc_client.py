@@ -12,6 +12,7 @@ class BIWOPCUAClient(QObject):
     data_changed = Signal(str, ua.Variant)
     received_spec_data = Signal(str)
     received_agv_signal = Signal(bool)
+    received_agv_out_signal = Signal(bool)
     received_agv_no = Signal(str)
 
     def __init__(self, server_url):
@@ -30,6 +31,7 @@ class BIWOPCUAClient(QObject):
 
         self.thread_receive_data = DataReceiveWorker(self.read_node_id)
         self.thread_receive_data.received_agv_signal.connect(self.received_agv_signal)
+        self.thread_receive_data.received_agv_out_signal.connect(self.received_agv_out_signal)
         self.thread_receive_data.received_spec_data.connect(self.received_spec_data)
         self.thread_receive_data.received_agv_no.connect(self.received_agv_no)
 
@@ -308,6 +310,7 @@ class SubHandler:
 class DataReceiveWorker(QThread):
     received_spec_data  = Signal(str)
     received_agv_signal = Signal(bool)
+    received_agv_out_signal = Signal(bool)
     received_agv_no = Signal(str)
 
     def __init__(self, function):
@@ -323,10 +326,12 @@ class DataReceiveWorker(QThread):
 
             spec_data = self.read_node_id_function(DefineGlobal.OPC_SPOT_AGV_BT_Data.S600_SPOT_AGV_BT_Data_SPEC)
             agv_signal = self.read_node_id_function(DefineGlobal.OPC_AGV_I_TAG.S600_AGV_I_POS_OK)
+            agv_out_signal = self.read_node_id_function(DefineGlobal.OPC_AGV_I_TAG.S600_AGV_I_Workcompl_Feedback)
             agv_no = self.read_node_id_function(DefineGlobal.OPC_AGV_I_TAG.AGV_Position_72180_AGV_NO)
 
             self.received_spec_data.emit(spec_data)
             self.received_agv_signal.emit(agv_signal)
+            self.received_agv_out_signal.emit(bool(agv_out_signal))
             self.received_agv_no.emit(str(agv_no))
             time.sleep(.1)
 
@@ -0,0 +1,205 @@
+import threading
+
+from communication.Remote.RemoteData import *
+
+# Remote 프로토콜 frame encoder/decoder
+# 기존 recvdata 는 recv(4096) 한번에 메세지 1개가 온전히 들어온다고 가정하고
+# bytes 를 이어 붙여가며 파싱했음.
+# -> 재사용 bytearray 버퍼에 누적하고, 분할/병합되어 들어온 frame 을 모두 처리.
+#
+# frame 형식은 기존과 동일 (상대 controller 와 호환 유지)
+# SOH + type(3) + id + STX + data_type [US data] GS ... + ETX
+
+_SOH = SOH[0]
+_STX = STX[0]
+_ETX = ETX[0]
+_GS = GS[0]
+_US = US[0]
+
+COMMAND_TYPE_LENGTH = 3
+DEFAULT_BUFFER_SIZE = 4096
+MAX_FRAME_SIZE = 64 * 1024
+
+
+class RemoteFrameDecoder:
+    """
+    socket 에서 받은 byte stream 을 RemoteCommMessageData 로 변환하는 streaming decoder.
+
+    - 부분 수신(partial) : 다음 feed() 까지 버퍼에 보관.
+    - 병합 수신(coalesced): 버퍼 안의 모든 완전한 frame 을 순서대로 반환.
+    - SOH 이전의 쓰레기 데이터나 MAX_FRAME_SIZE 를 넘는 frame 은 버린다.
+    """
+    def __init__(self, max_frame_size=MAX_FRAME_SIZE):
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray()
+        self.dropped_bytes = 0
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def reset(self):
+        self._buffer.clear()
+
+    def feed(self, data) -> list:
+        """
+        수신 데이터를 버퍼에 추가하고 완성된 frame 목록을 반환합니다.
+
+        Args:
+            data (bytes | bytearray | memoryview): socket.recv() 결과
+
+        Returns:
+            list[RemoteCommMessageData]: 완성된 메세지 (없으면 빈 list)
+        """
+        buffer = self._buffer
+        buffer += data
+
+        messages = []
+        consumed = 0
+        size = len(buffer)
+
+        while consumed < size:
+            start = buffer.find(SOH, consumed)
+            if start == -1:
+                # frame 시작이 없으면 전부 버림.
+                self.dropped_bytes += size - consumed
+                consumed = size
+                break
+
+            self.dropped_bytes += start - consumed
+            end = buffer.find(ETX, start + 1)
+            if end == -1:
+                if size - start > self.max_frame_size:
+                    # ETX 가 오지 않는 비정상 frame.
+                    self.dropped_bytes += size - start
+                    consumed = size
+                else:
+                    consumed = start
+                break
+
+            # frame 중간에 새 SOH 가 있으면 이전 frame 은 깨진 것으로 보고 재동기화.
+            restart = buffer.rfind(SOH, start + 1, end)
+            if restart != -1:
+                self.dropped_bytes += restart - start
+                start = restart
+
+            message = self._parse_frame(buffer, start, end)
+            if message is not None:
+                messages.append(message)
+            consumed = end + 1
+
+        if consumed:
+            del buffer[:consumed]
+
+        return messages
+
+    @staticmethod
+    def _parse_frame(buffer: bytearray, start: int, end: int):
+        """
+        buffer[start] == SOH, buffer[end] == ETX 인 frame 하나를 파싱.
+        중간 slice 를 만들지 않고 index 로만 탐색하며, 최종 필드만 bytes 로 복사.
+        """
+        header_end = start + 1 + COMMAND_TYPE_LENGTH
+        stx_index = buffer.find(STX, header_end, end)
+        if stx_index == -1:
+            return None
+
+        view = memoryview(buffer)
+        try:
+            message = RemoteCommMessageData(bytes(view[start + 1:header_end]),
+                                            bytes(view[header_end:stx_index]),
+                                            [])
+
+            body_start = stx_index + 1
+            gs_index = buffer.find(GS, body_start, end)
+            while gs_index != -1:
+                body = RemoteCommBodyData()
+                us_index = buffer.find(US, body_start, gs_index)
+                if us_index != -1:
+                    body.data_type = bytes(view[body_start:us_index])
+                    body.data = bytes(view[us_index + 1:gs_index])
+                else:
+                    body.data_type = bytes(view[body_start:gs_index])
+                    body.data = b''
+
+                message.body_data.append(body)
+                body_start = gs_index + 1
+                gs_index = buffer.find(GS, body_start, end)
+        finally:
+            # 버퍼 resize 가 가능하도록 export 해제.
+            view.release()
+
+        return message
+
+
+class RemoteFrameEncoder:
+    """
+    RemoteCommMessageData 를 frame bytes 로 변환하는 encoder.
+    frame 길이를 먼저 계산해서 재사용 버퍼 하나에 memoryview 로 채워 넣는다.
+    """
+    def __init__(self, initial_size=DEFAULT_BUFFER_SIZE):
+        self._buffer = bytearray(initial_size)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def frame_length(message: RemoteCommMessageData, with_data: bool) -> int:
+        length = 1 + len(message.type) + len(message.id) + 1 + 1
+        for body in message.body_data:
+            length += len(body.data_type) + 1
+            if with_data:
+                length += 1 + len(body.data)
+        return length
+
+    def encode(self, message: RemoteCommMessageData, with_data=None) -> bytes:
+        """
+        Args:
+            message (RemoteCommMessageData): 전송할 메세지
+            with_data (bool): US + data 포함 여부. None 이면 응답(RES)일 때만 포함.
+
+        Returns:
+            bytes: 전송할 frame. body 가 없으면 b''
+        """
+        if len(message.body_data) == 0:
+            return b''
+
+        if with_data is None:
+            with_data = bytes(message.type) == RemoteCommCommandType.Res.value
+
+        length = self.frame_length(message, with_data)
+        with self._lock:
+            return self._encode_into_buffer(message, with_data, length)
+
+    def _encode_into_buffer(self, message: RemoteCommMessageData, with_data: bool, length: int) -> bytes:
+        if len(self._buffer) < length:
+            self._buffer = bytearray(max(length, len(self._buffer) * 2))
+
+        view = memoryview(self._buffer)
+        try:
+            pos = 0
+            view[pos] = _SOH
+            pos += 1
+            pos = self._put(view, pos, message.type)
+            pos = self._put(view, pos, message.id)
+            view[pos] = _STX
+            pos += 1
+
+            for body in message.body_data:
+                pos = self._put(view, pos, body.data_type)
+                if with_data:
+                    view[pos] = _US
+                    pos += 1
+                    pos = self._put(view, pos, body.data)
+                view[pos] = _GS
+                pos += 1
+
+            view[pos] = _ETX
+            pos += 1
+
+            return bytes(view[:pos])
+        finally:
+            view.release()
+
+    @staticmethod
+    def _put(view: memoryview, pos: int, data: bytes) -> int:
+        next_pos = pos + len(data)
+        view[pos:next_pos] = data
+        return next_pos
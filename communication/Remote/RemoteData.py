@@ -87,6 +87,9 @@ class RemoteCommReqType(Enum):
     position2_inspection_result = b'pos2_result'
     position3_inspection_result = b'pos3_result'
 
+    # 상태 snapshot version (REQ: 마지막으로 받은 version, RES: 현재 version)
+    status_version = b'status_ver'
+
 @dataclass
 class RemoteCommBodyData:
     data_type: RemoteCommReqType = RemoteCommReqType.spot_connected.value
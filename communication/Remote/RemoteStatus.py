@@ -0,0 +1,221 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
+
+from communication.Remote.RemoteData import *
+
+# Remote 상태 조회용 server 측 snapshot
+# 요청이 올 때마다 live 상태를 조회하지 않고, 주기적으로 만든 불변 snapshot 에서 응답.
+# 요청에 status_version(US 뒤에 마지막으로 받은 version) 이 포함되면 그 이후 변경된 항목만 응답한다.
+#
+# REQ: SOH + 'REQ' + id + STX + 'status_ver' US '12' GS 'spot_conn' GS 'plc_agv_no' GS ... + ETX
+# RES: SOH + 'RES' + id + STX + 'status_ver' US '15' GS 'plc_agv_no' US '3' GS ... + ETX
+
+STATUS_REFRESH_PERIOD = 0.5  # seconds
+
+SPOT_STATUS_FIELDS = (
+    RemoteCommReqType.spot_connected,
+    RemoteCommReqType.spot_serial_no,
+    RemoteCommReqType.spot_power,
+    RemoteCommReqType.spot_battery,
+    RemoteCommReqType.spot_position,
+)
+
+MES_STATUS_FIELDS = (
+    RemoteCommReqType.mes_connected,
+    RemoteCommReqType.mes_flag,
+    RemoteCommReqType.mes_device_id,
+    RemoteCommReqType.mes_data_type,
+    RemoteCommReqType.mes_spool_point,
+    RemoteCommReqType.mes_prod_date,
+    RemoteCommReqType.mes_station_code,
+    RemoteCommReqType.mes_seq,
+    RemoteCommReqType.mes_body_no,
+    RemoteCommReqType.mes_vic_no,
+    RemoteCommReqType.mes_fsc,
+)
+
+PLC_STATUS_FIELDS = (
+    RemoteCommReqType.plc_connected,
+    RemoteCommReqType.plc_agv_no,
+    RemoteCommReqType.plc_agv_mov_no,
+    RemoteCommReqType.plc_vic_no,
+    RemoteCommReqType.plc_interlock,
+)
+
+INSPECTION_STATUS_FIELDS = (
+    RemoteCommReqType.position1_inspection_result_ready,
+    RemoteCommReqType.position2_inspection_result_ready,
+    RemoteCommReqType.position3_inspection_result_ready,
+    RemoteCommReqType.position1_inspection_result,
+    RemoteCommReqType.position2_inspection_result,
+    RemoteCommReqType.position3_inspection_result,
+)
+
+ALL_STATUS_FIELDS = PLC_STATUS_FIELDS + MES_STATUS_FIELDS + SPOT_STATUS_FIELDS + INSPECTION_STATUS_FIELDS
+
+
+def to_status_bytes(value) -> bytes:
+    if value is None:
+        return b''
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, bool):
+        return RemoteCommResVal.spot_connected.value if value else RemoteCommResVal.spot_disconnected.value
+    return str(value).encode()
+
+
+@dataclass(frozen=True)
+class RemoteStatusSnapshot:
+    """
+    특정 시점의 전체 상태.
+    values        : data_type(bytes) -> value(bytes)
+    field_version : data_type(bytes) -> 해당 값이 마지막으로 바뀐 version
+    """
+    version: int = 0
+    timestamp: float = 0.0
+    values: Mapping[bytes, bytes] = field(default_factory=lambda: MappingProxyType({}))
+    field_version: Mapping[bytes, int] = field(default_factory=lambda: MappingProxyType({}))
+
+    def changed_since(self, data_types, since_version: int) -> list:
+        return [data_type for data_type in data_types
+                if data_type in self.values and self.field_version.get(data_type, 0) > since_version]
+
+
+class RemoteStatusPublisher:
+    """
+    provider() 를 주기적으로 호출해 snapshot 을 갱신하고, 요청 메세지에 대한 응답을 만든다.
+    snapshot 은 통째로 교체되므로 읽는 쪽은 lock 없이 self.snapshot 을 참조하면 된다.
+
+    Args:
+        provider: {RemoteCommReqType: value} 를 반환하는 함수. 값은 bool/int/str/bytes.
+        controller_id (bytes): 응답 메세지 id
+        period (float): 갱신 주기 (초)
+    """
+    def __init__(self, provider: Callable[[], dict], controller_id: bytes = b'', period=STATUS_REFRESH_PERIOD):
+        self.provider = provider
+        self.controller_id = controller_id
+        self.period = period
+
+        self.snapshot = RemoteStatusSnapshot()
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self.refresh()
+        self._thread = threading.Thread(target=self._run, name="RemoteStatusPublisher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(self.period * 2)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop_event.wait(self.period):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"[RemoteStatus.py] - refresh raised. {e}")
+
+    def refresh(self) -> RemoteStatusSnapshot:
+        """provider 값으로 새 snapshot 생성. 변경된 값이 없으면 version 유지."""
+        new_values = {}
+        for req_type, value in self.provider().items():
+            data_type = req_type.value if isinstance(req_type, RemoteCommReqType) else req_type
+            new_values[data_type] = to_status_bytes(value)
+
+        previous = self.snapshot
+        changed = [data_type for data_type, value in new_values.items() if previous.values.get(data_type) != value]
+        if not changed:
+            return previous
+
+        version = previous.version + 1
+        field_version = dict(previous.field_version)
+        for data_type in changed:
+            field_version[data_type] = version
+
+        self.snapshot = RemoteStatusSnapshot(version=version,
+                                             timestamp=time.time(),
+                                             values=MappingProxyType(new_values),
+                                             field_version=MappingProxyType(field_version))
+        return self.snapshot
+
+    def make_response(self, request: RemoteCommMessageData) -> RemoteCommMessageData:
+        """
+        요청에 포함된 data_type 들에 대한 응답을 현재 snapshot 에서 생성.
+        status_version 이 포함되어 있으면 그 이후 변경된 항목만 담는다.
+        """
+        snapshot = self.snapshot
+
+        since_version = -1
+        requested = []
+        for body in request.body_data:
+            if body.data_type == RemoteCommReqType.status_version.value:
+                try:
+                    since_version = int(body.data)
+                except ValueError:
+                    since_version = -1
+            else:
+                requested.append(body.data_type)
+
+        # 요청 항목이 없으면 전체.
+        if not requested:
+            requested = list(snapshot.values.keys())
+
+        if since_version >= 0:
+            requested = snapshot.changed_since(requested, since_version)
+
+        response = RemoteCommMessageData(RemoteCommCommandType.Res.value, self.controller_id or request.id, [])
+        response.body_data.append(RemoteCommBodyData(RemoteCommReqType.status_version.value,
+                                                     str(snapshot.version).encode()))
+        for data_type in requested:
+            response.body_data.append(RemoteCommBodyData(data_type, snapshot.values.get(data_type, b'')))
+
+        return response
+
+
+class RemoteStatusCache:
+    """
+    client 측 상태 cache. 응답의 status_version 을 기억해 다음 요청에 실어 보낸다.
+    """
+    def __init__(self):
+        self.version = -1
+        self.values = {}
+        self.updated_time = None
+
+    def make_request(self, controller_id: bytes, fields=ALL_STATUS_FIELDS, only_changed=True) -> RemoteCommMessageData:
+        request = RemoteCommMessageData(RemoteCommCommandType.Req.value, controller_id, [])
+        # 한번도 받지 않은 항목이 있으면 전체 값을 다시 받아야 하므로 version 을 보내지 않는다.
+        has_all_fields = all(req_type.value in self.values for req_type in fields)
+        if only_changed and self.version >= 0 and has_all_fields:
+            request.body_data.append(RemoteCommBodyData(RemoteCommReqType.status_version.value,
+                                                        str(self.version).encode()))
+        for req_type in fields:
+            request.body_data.append(RemoteCommBodyData(req_type.value, b''))
+        return request
+
+    def update(self, response: RemoteCommMessageData) -> bool:
+        """status 응답이면 cache 를 갱신하고 True 반환."""
+        if not response.body_data or response.body_data[0].data_type != RemoteCommReqType.status_version.value:
+            return False
+
+        try:
+            self.version = int(response.body_data[0].data)
+        except ValueError:
+            return False
+
+        for body in response.body_data[1:]:
+            self.values[body.data_type] = body.data
+        self.updated_time = time.time()
+        return True
+
+    def get(self, req_type: RemoteCommReqType, default=b''):
+        return self.values.get(req_type.value, default)
@@ -1,65 +1,30 @@
-from communication.socket.client.SocketClient import *
+from communication.socket.client.SelectorClient import SelectorSocketClient
 from communication.Remote.RemoteData import *
+from communication.Remote.RemoteCodec import RemoteFrameDecoder, RemoteFrameEncoder
+from communication.Remote.RemoteStatus import *
 
 
-class RemoteClient(SocketClient):
+class RemoteClient(SelectorSocketClient):
     def __init__(self):
         super().__init__()
         self.Setrecvcallback(self.recvdata)
-        self.remain_data = b''
+        self.decoder = RemoteFrameDecoder()
+        self.encoder = RemoteFrameEncoder()
         self.cbRecvDataProcess = None
 
         self.remoteRecvData = None
+        self.status_cache = RemoteStatusCache()
 
     def recvdata(self, data: bytes):
         """
         data(bytes) ->  RemoteCommMessageData
         """
-        self.remain_data += data
-
-        # test
-        # print("client recv res_data",self.remain_data)
-
-        start_index = self.remain_data.find(SOH)
-        end_index = -1
-
-        if start_index != -1:
-            end_index = self.remain_data.find(ETX, start_index)
-
-        # 온전한 정보가 다들어 왔을 경우
-        if start_index != -1 and end_index != -1:
-            req_data = self.remain_data[start_index:end_index + 1]
-            self.remain_data = self.remain_data[end_index + 1:-1]
-
-            recv_data = RemoteCommMessageData(RemoteCommCommandType.Req.value, b'', [])
-
-            if req_data[0] is SOH[0]:
-                index = req_data.find(STX)
-
-                if index != -1:
-                    recv_data.type = req_data[1:4]
-                    recv_data.id = req_data[4:index]
-
-                    start_index = index + 1
-                    index = req_data.find(GS, start_index)
-
-                    while index != -1:
-                        body = RemoteCommBodyData()
-                        data_index = req_data[start_index:index].find(US)
-
-                        if data_index != -1:
-                            body.data_type = req_data[start_index:start_index+data_index]
-                            body.data = req_data[start_index+data_index+1:index]
-                        else:
-                            body.data_type = req_data[start_index:index]
-
-                        start_index = index + 1
-                        recv_data.body_data.append(body)
-                        index = req_data.find(GS, start_index)
+        # 분할/병합 수신된 frame 을 모두 처리.
+        for recv_data in self.decoder.feed(data):
+            self.status_cache.update(recv_data)
 
             # 파싱한 데이터를 토대로 데이터 취득 시작.
             # do processing callback 등록
-            # print("client remain:", self.remain_data)
             if self.cbRecvDataProcess is not None:
                 self.cbRecvDataProcess(recv_data)
 
@@ -70,277 +35,48 @@ class RemoteClient(SocketClient):
         # joon_20240313 gma.... djEjgrp gkfRk...
         # parsing and set...
         if len(data.body_data)>0:
-            byte_data = SOH+data.type + data.id+STX
-
-            for b in data.body_data:
-                body: RemoteCommBodyData = b
-                byte_data += body.data_type + GS
-
-            byte_data += ETX
-
-            self.senddata(byte_data)
+            with_data = any(len(body.data) > 0 for body in data.body_data)
+            self.senddata(self.encoder.encode(data, with_data=with_data))
         else:
             print("wrong data_type...")
 
-    def ReqPlcRemoteStatus(self):
+    def ReqStatus(self, fields=ALL_STATUS_FIELDS, only_changed=True):
         """
-        make req data for plc_status.
+        요청 항목들을 하나의 메세지로 묶어서 전송.
+        only_changed 이면 마지막으로 받은 status_version 이후 변경된 값만 응답받는다.
         """
         if self.is_connect:
-            req = RemoteCommMessageData(RemoteCommCommandType.Req.value, b'', [])
-            req.type = RemoteCommCommandType.Req.value
-            req.id = RemoteCommControllerType.controller_left.value
-
-            # plc connect check.
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.plc_connected.value
-            req.body_data.append(body)
-
-            # plc agv_no
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.plc_agv_no.value
-            req.body_data.append(body)
-
-            # plc agv_mov_no
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.plc_agv_mov_no.value
-            req.body_data.append(body)
-
-            # plc vic_no
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.plc_vic_no.value
-            req.body_data.append(body)
-
-            # plc interlock
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.plc_interlock.value
-            req.body_data.append(body)
-
+            req = self.status_cache.make_request(RemoteCommControllerType.controller_left.value,
+                                                 fields, only_changed)
             self.reqdata(req)
         else:
-            print(f"{self.ReqPlcRemoteStatus.__name__}() error! not connected...")
+            print(f"{self.ReqStatus.__name__}() error! not connected...")
+
+    def ReqPlcRemoteStatus(self):
+        """
+        make req data for plc_status.
+        """
+        self.ReqStatus(PLC_STATUS_FIELDS)
 
     def ReqMesRemoteStatus(self):
         """
         make req data for mes_status.
         """
-        if self.is_connect:
-            req = RemoteCommMessageData(RemoteCommCommandType.Req.value, b'', [])
-            req.type = RemoteCommCommandType.Req.value
-            req.id = RemoteCommControllerType.controller_left.value
-
-            # mes check.
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_connected.value
-            req.body_data.append(body)
-
-            # mes flag
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_flag.value
-            req.body_data.append(body)
-
-            # mes device_id
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_device_id.value
-            req.body_data.append(body)
-
-            # mes type
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_data_type.value
-            req.body_data.append(body)
-
-            # mes spool point
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_spool_point.value
-            req.body_data.append(body)
-
-            # mes prod date
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_prod_date.value
-            req.body_data.append(body)
-
-            # mes station code
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_station_code.value
-            req.body_data.append(body)
-
-            # mes seq
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_seq.value
-            req.body_data.append(body)
-
-            # mes body no
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_body_no.value
-            req.body_data.append(body)
-
-            # mes vic no
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_vic_no.value
-            req.body_data.append(body)
-
-            # mes fsc
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_fsc.value
-            req.body_data.append(body)
-        else:
-            print(f"{self.ReqMesRemoteStatus.__name__}() error! not connected...")
+        self.ReqStatus(MES_STATUS_FIELDS)
 
     def ReqSpotRemoteStatus(self):
         """
         make req data for spot_status.
         """
-        if self.is_connect:
-            req = RemoteCommMessageData(RemoteCommCommandType.Req.value, b'', [])
-            req.type = RemoteCommCommandType.Req.value
-            req.id = RemoteCommControllerType.controller_left.value
-
-            # spot check.
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.spot_connected.value
-            req.body_data.append(body)
-
-            # spot serial
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.spot_serial_no.value
-            req.body_data.append(body)
-
-            # spot power
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.spot_power.value
-            req.body_data.append(body)
-
-            # spot battery
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.spot_battery.value
-            req.body_data.append(body)
-
-            # spot position
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.spot_position.value
-            req.body_data.append(body)
-        else:
-            print(f"{self.ReqSpotRemoteStatus.__name__}() error! not connected...")
-
+        self.ReqStatus(SPOT_STATUS_FIELDS)
 
     def ReqRemoteStatus(self):
         """
         make req data for all device_status.
         send to remote server..
         """
-        if self.is_connect:
-            req = RemoteCommMessageData(RemoteCommCommandType.Req.value, b'', [])
-            req.type = RemoteCommCommandType.Req.value
-            req.id = RemoteCommControllerType.controller_left.value
-
-            # plc check.
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.plc_connected.value
-            req.body_data.append(body)
-
-            # plc agv_no
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.plc_agv_no.value
-            req.body_data.append(body)
-
-            # plc agv_mov_no
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.plc_agv_mov_no.value
-            req.body_data.append(body)
-
-            # plc vic_no
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.plc_vic_no.value
-            req.body_data.append(body)
-
-            # plc interlock
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.plc_interlock.value
-            req.body_data.append(body)
-
-            ############################################################
-
-            # mes check.
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_connected.value
-            req.body_data.append(body)
-
-            # mes flag
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_flag.value
-            req.body_data.append(body)
-
-            # mes device_id
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_device_id.value
-            req.body_data.append(body)
-
-            # mes type
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_data_type.value
-            req.body_data.append(body)
-
-            # mes spool point
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_spool_point.value
-            req.body_data.append(body)
-
-            # mes prod date
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_prod_date.value
-            req.body_data.append(body)
-
-            # mes station code
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_station_code.value
-            req.body_data.append(body)
-
-            # mes seq
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_seq.value
-            req.body_data.append(body)
-
-            # mes body no
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_body_no.value
-            req.body_data.append(body)
-
-            # mes vic no
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_vic_no.value
-            req.body_data.append(body)
-
-            # mes fsc
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.mes_fsc.value
-            req.body_data.append(body)
-
-            #####################################################
-
-            # spot check.
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.spot_connected.value
-            req.body_data.append(body)
-
-            # spot serial
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.spot_serial_no.value
-            req.body_data.append(body)
-
-            # spot power
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.spot_power.value
-            req.body_data.append(body)
-
-            # spot battery
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.spot_battery.value
-            req.body_data.append(body)
-
-            # spot position
-            body = RemoteCommBodyData()
-            body.data_type = RemoteCommReqType.spot_position.value
-            req.body_data.append(body)
-
-            self.reqdata(req)
+        self.ReqStatus(ALL_STATUS_FIELDS)
 
+    def GetRemoteStatus(self, req_type: RemoteCommReqType, default=b''):
+        """마지막으로 수신한 상태 값."""
+        return self.status_cache.get(req_type, default)
@@ -1,79 +1,62 @@
-from communication.socket.server.SocketServer import *
+from communication.socket.server.SelectorServer import SelectorSocketServer
 from communication.Remote.RemoteData import *
+from communication.Remote.RemoteCodec import RemoteFrameDecoder, RemoteFrameEncoder
+from communication.Remote.RemoteStatus import RemoteStatusPublisher
 # from communication.remote_server.ThreadServer import *
 # from communication.socket.SocketServer import *
 # from communication.remote_client.RemoteData import *
 
-class RemoteServer(SocketServer):
+class RemoteServer(SelectorSocketServer):
     def __init__(self):
         super().__init__()
         self.Setrecvcallback(self.recvdata)
-        self.remain_data = b''
+        # client 별로 수신 stream 이 다르므로 decoder 를 분리.
+        self.decoders = {}
+        self.encoder = RemoteFrameEncoder()
         self.cbRecvDataProcess = None
 
+        # 상태 요청은 snapshot 에서 바로 응답.
+        self.status_publisher = None
+
+    def set_status_publisher(self, publisher: RemoteStatusPublisher):
+        self.status_publisher = publisher
+
     def senddata(self, data: RemoteCommMessageData):
         """
         RemoteCommMessageData -> data(bytes)
         """
-        byte_data = b''
-
         if len(data.body_data) > 0:
-            byte_data = SOH+data.type + data.id+STX
-
-            for b in data.body_data:
-                body: RemoteCommBodyData = b
-                byte_data += body.data_type + US + body.data + GS
-
-            byte_data += ETX
-
+            byte_data = self.encoder.encode(data, with_data=True)
             super().sendmessage_(byte_data)
 
-    def recvdata(self, data: bytes):
+    def recvdata(self, data: bytes, address=None):
         """
         data(bytes) ->  RemoteCommMessageData
         """
-        self.remain_data += data
-
-        start_index = self.remain_data.find(SOH)
-        end_index = -1
-
-        if start_index != -1:
-            end_index = self.remain_data.find(ETX,start_index)
-
-        # 온전한 정보가 다들어 왔을 경우
-        if start_index != -1 and end_index != -1:
-            req_data = self.remain_data[start_index:end_index+1]
-            self.remain_data = self.remain_data[end_index+1:-1]
-
-            recv_data = RemoteCommMessageData(RemoteCommCommandType.Req.value, b'', [])
-
-            if req_data[0] is SOH[0]:
-                index = req_data.find(STX)
-
-                if index != -1:
-                    recv_data.type = req_data[1:4]
-                    recv_data.id = req_data[4:index]
-
-                    start_index = index+1
-                    index = req_data.find(GS, start_index)
-
-                    while index != -1:
-                        body = RemoteCommBodyData()
-                        body.data_type = req_data[start_index:index]
-                        body.data = b''
-                        start_index = index+1
-                        recv_data.body_data.append(body)
-                        index = req_data.find(GS, start_index)
+        decoder = self.decoders.get(address)
+        if decoder is None:
+            decoder = RemoteFrameDecoder()
+            self.decoders[address] = decoder
+
+        # 분할/병합 수신된 frame 을 모두 처리.
+        for recv_data in decoder.feed(data):
+            if self.status_publisher is not None and recv_data.type == RemoteCommCommandType.Req.value:
+                response = self.status_publisher.make_response(recv_data)
+                self.sendmessage_to(address, self.encoder.encode(response, with_data=True))
+                continue
 
             # 파싱한 데이터를 토대로 데이터 취득 시작.
             # do processing callback 등록
-            # print("server remain:", self.remain_data)
             if self.cbRecvDataProcess is not None:
                 self.cbRecvDataProcess(recv_data)
 
     def setcallbackrecvdataprocess(self,callback_func):
         self.cbRecvDataProcess = callback_func
 
+    def _close_connection(self, connection, error=''):
+        self.decoders.pop(connection.address, None)
+        super()._close_connection(connection, error)
+
 """
 class RemoteServer:
     def __init__(self):
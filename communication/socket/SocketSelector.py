@@ -0,0 +1,186 @@
+import heapq
+import itertools
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+
+# selector(epoll/select) 기반 socket 이벤트 루프
+# 기존 ThreadSocket*Comm 은 연결마다 QThread 를 만들고 sleep(0.1) 간격으로 send/recv 를 polling 했음.
+# -> 하나의 thread 에서 여러 연결을 처리하고, 송신은 deque 에 넣은 뒤 wakeup socket 으로 즉시 깨운다.
+
+RECV_BUFFER_SIZE = 4096
+
+
+class SocketConnection:
+    """
+    연결 하나의 송신 queue 를 관리.
+    queue() 는 다른 thread 에서 호출 가능하고, flush() 는 이벤트 루프 thread 에서만 호출.
+    """
+    def __init__(self, sock: socket.socket, address):
+        self.sock = sock
+        self.address = address
+        self.outbound = deque()
+        self._send_view = None
+
+    def queue(self, data: bytes):
+        if len(data) > 0:
+            self.outbound.append(bytes(data))
+
+    def has_pending(self) -> bool:
+        return self._send_view is not None or len(self.outbound) > 0
+
+    def flush(self) -> bool:
+        """
+        가능한 만큼 송신.
+
+        Returns:
+            bool: 모두 송신했으면 True, socket buffer 가 가득 차서 남았으면 False
+        """
+        while True:
+            if self._send_view is None:
+                if not self.outbound:
+                    return True
+                self._send_view = memoryview(self.outbound.popleft())
+
+            try:
+                sent = self.sock.send(self._send_view)
+            except (BlockingIOError, InterruptedError):
+                return False
+
+            if sent < len(self._send_view):
+                self._send_view = self._send_view[sent:]
+            else:
+                self._send_view = None
+
+    def close(self):
+        self.outbound.clear()
+        self._send_view = None
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class SocketSelectorLoop:
+    """
+    selectors 기반 단일 thread 이벤트 루프.
+    등록된 fileobj 의 data 에 handler(sock, mask) 를 넣어 두면 이벤트 발생 시 호출한다.
+    """
+    def __init__(self, name="SocketSelectorLoop"):
+        self.name = name
+        self.selector = None
+        self.is_run = False
+
+        self._thread = None
+        self._wakeup_recv = None
+        self._wakeup_send = None
+        self._pending = deque()
+        self._timers = []
+        self._timer_counter = itertools.count()
+
+    def start(self):
+        if self.is_run:
+            return
+
+        self.selector = selectors.DefaultSelector()
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
+        self.selector.register(self._wakeup_recv, selectors.EVENT_READ, self._on_wakeup)
+
+        self.is_run = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        if not self.is_run:
+            return
+
+        self.is_run = False
+        self.wakeup()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def is_loop_thread(self) -> bool:
+        return self._thread is threading.current_thread()
+
+    def call_soon(self, func, *args):
+        """func 을 이벤트 루프 thread 에서 실행하도록 예약. 어느 thread 에서든 호출 가능."""
+        self._pending.append((func, args))
+        self.wakeup()
+
+    def call_later(self, delay, func, *args):
+        """delay 초 후 이벤트 루프 thread 에서 func 실행. 루프 thread 에서만 호출."""
+        heapq.heappush(self._timers, (time.monotonic() + delay, next(self._timer_counter), func, args))
+
+    def wakeup(self):
+        if self._wakeup_send is None:
+            return
+        try:
+            self._wakeup_send.send(b'\0')
+        except (BlockingIOError, OSError):
+            # 이미 깨어날 데이터가 쌓여 있거나 루프가 종료됨.
+            pass
+
+    def _on_wakeup(self, sock, mask):
+        try:
+            while sock.recv(RECV_BUFFER_SIZE):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    def _next_timeout(self):
+        if self._pending:
+            return 0
+        if not self._timers:
+            return None
+        return max(0.0, self._timers[0][0] - time.monotonic())
+
+    def _run_timers(self):
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, func, args = heapq.heappop(self._timers)
+            func(*args)
+
+    def _run(self):
+        while self.is_run:
+            try:
+                events = self.selector.select(self._next_timeout())
+                for key, mask in events:
+                    key.data(key.fileobj, mask)
+
+                while self._pending:
+                    func, args = self._pending.popleft()
+                    func(*args)
+
+                self._run_timers()
+            except Exception as e:
+                print(f"[{self.name}] event loop exception. {e}")
+
+        self.on_loop_stop()
+
+        self.selector.close()
+        self._wakeup_send.close()
+        self._wakeup_recv.close()
+        self._wakeup_send = None
+        self._wakeup_recv = None
+        self._pending.clear()
+        self._timers.clear()
+
+    def on_loop_stop(self):
+        """루프 종료 직전 루프 thread 에서 호출. 하위 클래스에서 socket 정리."""
+        pass
+
+    def update_interest(self, connection: SocketConnection, handler):
+        """송신 대기 데이터가 있으면 write-readiness 도 감시."""
+        events = selectors.EVENT_READ
+        if connection.has_pending():
+            events |= selectors.EVENT_WRITE
+        try:
+            self.selector.modify(connection.sock, events, handler)
+        except (KeyError, ValueError, OSError):
+            pass
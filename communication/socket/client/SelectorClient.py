@@ -0,0 +1,179 @@
+import errno
+import selectors
+import socket
+
+from communication.socket.SocketSelector import SocketSelectorLoop, SocketConnection, RECV_BUFFER_SIZE
+
+# non-blocking connect 진행중 error code (windows: WSAEWOULDBLOCK)
+_CONNECT_IN_PROGRESS = (0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, 10035)
+
+
+class SelectorSocketClient(SocketSelectorLoop):
+    """
+    SocketClient 와 같은 인터페이스를 가지는 selector 기반 client.
+    connect / send / recv / 재접속을 이벤트 루프 thread 하나에서 처리한다.
+    """
+    def __init__(self):
+        super().__init__("SelectorSocketClient")
+
+        self.sock = None
+        self.server_address = None
+        self.is_connect = False
+        self.connection = None
+
+        # recv callback func.
+        self.cbRecvdata = None
+
+        self.auto_reconnect = True
+        self.reconnect_interval = 1.0
+        self._connecting = False
+
+    def connect(self, server_address):
+        if self.is_connect:
+            print("aleady connected...")
+            return
+
+        if self._connecting:
+            print("please wait connecting...")
+            return
+
+        self.server_address = server_address
+        self._connecting = True
+        self.start()
+        self.call_soon(self._start_connect)
+
+    # callback func 등록시, connect 이전에 등록 필요.
+    def Setrecvcallback(self, recv_callback):
+        self.cbRecvdata = recv_callback
+
+    def SetAutoReconnect(self, reconnect: bool):
+        self.auto_reconnect = reconnect
+
+    def reconnect(self):
+        self.call_soon(self._reconnect)
+
+    def commclose(self, str=""):
+        if self.is_loop_thread():
+            self._close(str)
+        else:
+            self.call_soon(self._close, str)
+
+    def close(self):
+        """자동 재접속 없이 연결 및 이벤트 루프 종료."""
+        self.auto_reconnect = False
+        self.stop()
+
+    def senddata(self, data: bytes):
+        """
+        data: type byte string. byte[]
+        """
+        if self.connection is not None:
+            self.connection.queue(data)
+            self.call_soon(self._flush)
+
+    def is_connecting(self):
+        return self.is_connect
+
+    def on_loop_stop(self):
+        self._release_socket()
+        self._connecting = False
+
+    def _start_connect(self):
+        self._release_socket()
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        error_code = sock.connect_ex(self.server_address)
+
+        self.sock = sock
+        if error_code not in _CONNECT_IN_PROGRESS:
+            self._on_connect_fail(error_code)
+            return
+
+        self.selector.register(sock, selectors.EVENT_WRITE, self._on_connect)
+
+    def _on_connect(self, sock, mask):
+        error_code = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if error_code != 0:
+            self._on_connect_fail(error_code)
+            return
+
+        self.connection = SocketConnection(sock, self.server_address)
+        self.is_connect = True
+        self._connecting = False
+        print(f"socket connect:[{self.is_connect}]")
+
+        self.update_interest(self.connection, self._on_event)
+
+    def _on_connect_fail(self, error_code):
+        print(f"{errno.errorcode.get(error_code, error_code)}")
+        print(f"connect error!ip:[{self.server_address[0]}],port[{self.server_address[1]}]")
+        self._release_socket()
+
+        if self.auto_reconnect:
+            self.call_later(self.reconnect_interval, self._start_connect)
+        else:
+            self._connecting = False
+
+    def _on_event(self, sock, mask):
+        if mask & selectors.EVENT_READ:
+            try:
+                data = sock.recv(RECV_BUFFER_SIZE)
+            except (BlockingIOError, InterruptedError):
+                data = None
+            except OSError as e:
+                self._close(str(e))
+                return
+
+            if data is not None:
+                if len(data) == 0:
+                    self._close("서버연결종료.")
+                    return
+
+                if self.cbRecvdata is not None:
+                    self.cbRecvdata(data)
+
+        if mask & selectors.EVENT_WRITE:
+            self._flush()
+
+    def _flush(self):
+        if self.connection is None:
+            return
+        try:
+            self.connection.flush()
+        except OSError as e:
+            self._close(str(e))
+            return
+        self.update_interest(self.connection, self._on_event)
+
+    def _close(self, message=""):
+        self._release_socket()
+
+        # log...
+        print(message)
+
+        # re connect.
+        if self.auto_reconnect and self.is_run:
+            self._connecting = True
+            self.call_later(self.reconnect_interval, self._start_connect)
+
+    def _reconnect(self):
+        self._release_socket()
+        self._connecting = True
+        self._start_connect()
+
+    def _release_socket(self):
+        if self.sock is not None:
+            try:
+                self.selector.unregister(self.sock)
+            except (KeyError, ValueError):
+                pass
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+
+        self.sock = None
+        self.connection = None
+        self.is_connect = False
@@ -0,0 +1,151 @@
+import selectors
+import socket
+
+from communication.socket.SocketSelector import SocketSelectorLoop, SocketConnection, RECV_BUFFER_SIZE
+
+
+class SelectorSocketServer(SocketSelectorLoop):
+    """
+    SocketServer 와 같은 인터페이스를 가지는 selector 기반 server.
+    모든 client 연결을 이벤트 루프 thread 하나에서 처리한다.
+    """
+    def __init__(self):
+        super().__init__("SelectorSocketServer")
+
+        self.info = None
+        self.serverSocket = None
+        self.connections = {}
+
+        self.cbRecvdata = None
+
+    def is_runnig(self):
+        return self.is_run
+
+    def is_running(self):
+        return self.is_run
+
+    def is_connecting(self):
+        return len(self.connections) > 0
+
+    def ServerOpen(self, ip, port):
+        if self.is_run:
+            print("server aleady run..")
+            return
+
+        address = (ip, port)
+        try:
+            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server_socket.bind(address)
+            server_socket.listen()
+            server_socket.setblocking(False)
+        except OSError as e:
+            print(e)
+            print(f"server open error!ip:[{ip}],port[{port}]")
+            return
+
+        self.info = server_socket.getsockname()
+        self.serverSocket = server_socket
+
+        self.start()
+        self.call_soon(self.selector.register, server_socket, selectors.EVENT_READ, self._on_accept)
+
+    def server_close(self):
+        self.stop()
+
+    # callback func 등록시, accept 이전에 등록 필요.
+    # callback(data: bytes, address: tuple)
+    def Setrecvcallback(self, recv_callback):
+        self.cbRecvdata = recv_callback
+
+    def sendmessage_(self, data: bytes):
+        """연결된 모든 client 에 송신."""
+        if not self.is_run:
+            return
+        self.call_soon(self._queue_message, None, bytes(data))
+
+    def sendmessage_to(self, address, data: bytes):
+        """address 의 client 에만 송신."""
+        if not self.is_run:
+            return
+        self.call_soon(self._queue_message, address, bytes(data))
+
+    def on_loop_stop(self):
+        for connection in list(self.connections.values()):
+            self._close_connection(connection)
+
+        if self.serverSocket is not None:
+            try:
+                self.selector.unregister(self.serverSocket)
+            except (KeyError, ValueError):
+                pass
+            self.serverSocket.close()
+            self.serverSocket = None
+
+    def _on_accept(self, server_socket, mask):
+        while True:
+            try:
+                client_socket, address = server_socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                print(e)
+                return
+
+            client_socket.setblocking(False)
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            connection = SocketConnection(client_socket, address)
+            self.connections[client_socket] = connection
+            self.selector.register(client_socket, selectors.EVENT_READ, self._on_client_event)
+
+    def _on_client_event(self, client_socket, mask):
+        connection = self.connections.get(client_socket)
+        if connection is None:
+            return
+
+        if mask & selectors.EVENT_READ:
+            try:
+                data = client_socket.recv(RECV_BUFFER_SIZE)
+            except (BlockingIOError, InterruptedError):
+                data = None
+            except OSError as e:
+                self._close_connection(connection, str(e))
+                return
+
+            if data is not None:
+                if len(data) == 0:
+                    self._close_connection(connection)
+                    return
+
+                if self.cbRecvdata is not None:
+                    self.cbRecvdata(data, connection.address)
+
+        if mask & selectors.EVENT_WRITE:
+            self._flush(connection)
+
+    def _flush(self, connection: SocketConnection):
+        try:
+            connection.flush()
+        except OSError as e:
+            self._close_connection(connection, str(e))
+            return
+        self.update_interest(connection, self._on_client_event)
+
+    def _queue_message(self, address, data: bytes):
+        for connection in list(self.connections.values()):
+            if address is None or connection.address == address:
+                connection.queue(data)
+                self._flush(connection)
+
+    def _close_connection(self, connection: SocketConnection, error=''):
+        if self.connections.pop(connection.sock, None) is None:
+            return
+
+        try:
+            self.selector.unregister(connection.sock)
+        except (KeyError, ValueError):
+            pass
+        connection.close()
+
+        ip, port = connection.address[0], connection.address[1]
+        print(f"connect client close...ip:{ip},port{port} {error}")
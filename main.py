@@ -1,9 +1,31 @@
 import sys
+
+# 첫 화면이 뜰 때까지의 import 시간 측정 (다른 import 보다 먼저)
+from biw_utils.import_profiler import import_time_recorder
+import_time_recorder.start()
+
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
+from biw_utils.lazy_import import warm_up_in_background
 from main_window import MainWindow
 
+
+def print_warm_up_result(elapsed_times):
+    result = ", ".join(f"{name}: {'-' if elapsed is None else f'{elapsed:.2f}s'}"
+                       for name, elapsed in elapsed_times.items())
+    print(f"[main.py] - warm up complete. {result}")
+
+
+def on_first_window_shown():
+    import_time_recorder.stop()
+    print(import_time_recorder.report())
+    # 화면이 뜬 뒤 무거운 module 을 background 로 미리 import
+    warm_up_in_background(on_finished=print_warm_up_result)
+
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
+    QTimer.singleShot(0, on_first_window_shown)
     sys.exit(app.exec())
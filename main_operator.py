@@ -10,7 +10,6 @@ from bosdyn.client import UnableToConnectToRobotError, ResponseError
 from bosdyn.client.graph_nav import RobotImpairedError
 from opcua import Client, ua
 
-from PIL import Image
 
 from PySide6 import QtCore
 from PySide6.QtCore import QThread, Signal, QObject
@@ -26,12 +25,20 @@ from Thread.SpotImageViewThread import SpotImageViewThread
 from Thread.SpotStatusUpdateThread import SpotStatusUpdateThread
 from Thread.WorkStatusUpdateThread import WorkStatusUpdateThread
 from communication.OPC.opc_client import BIWOPCUAClient
+from communication.Remote.RemoteData import RemoteCommReqType, RemoteCommControllerType
+from communication.Remote.RemoteStatus import RemoteStatusPublisher, MES_STATUS_FIELDS
 from biw_utils import util_functions
 from biw_utils.decorators import exception_decorator, spot_connection_check
+from biw_utils.display_bridge import DisplayBridge
+from biw_utils.profiler import profiler
 from biw_utils.util_functions import *
 import biw_utils.spot_functions as spot_functions
+from DataManager.ImageArchive import ImageArchive
+from DataManager.ImageEncoding import ImageEncodingSettings
 from DataManager.InspectionDataManager import InspectionDataManager
+from DataManager.TaktTimeStore import TaktTimeStore
 from DataManager.SpotDataManager import SpotDataManager
+from Spot.SpotMapResidency import MapResidencyManager, MAP_RESIDENCY_MERGED
 from Spot.SpotRobot import Robot
 from widget.common.GraphicView import GraphicView
 from widget.common.GraphicViewWithText import GraphicViewWithText
@@ -64,8 +71,6 @@ class MainOperator(QObject):
 
     # NavigationSettingWidget
     event_qr_setting_waypoints = Signal(list)
-    event_update_spot_image = Signal(np.ndarray)
-    event_update_spot_image_with_text = Signal(np.ndarray, str)
     event_update_hole_inspection_result = Signal(bool)
 
     # SEND WORK COMPLETE
@@ -74,6 +79,7 @@ class MainOperator(QObject):
     # 차종 정보 데이터
     spec_data = None
     agv_no = None
+    agv_pos_ok = False
     body_type = None
     hole_spec_type = None
     hole_ng_occurred = False
@@ -81,11 +87,22 @@ class MainOperator(QObject):
     def __init__(self):
         super().__init__()
 
+        # Cycle Time Profiler
+        profiler.trace_path = DefineGlobal.TRACE_SAVE_PATH
+        self.takt_time_store = TaktTimeStore(DefineGlobal.TAKT_TIME_DB_PATH)
+
         self.spot_robot = Robot()
+        self.map_residency = MapResidencyManager(self.spot_robot.robot_graphnav_manager,
+                                                 DefineGlobal.SPOT_MAP_RESIDENCY_MODE,
+                                                 DefineGlobal.SPOT_MERGED_NAVIGATION_MAP)
         self.spot_manager = SpotDataManager()
-        self.inspection_manager = InspectionDataManager()
+        self.inspection_manager = InspectionDataManager(spill_path=DefineGlobal.INSPECTION_SPILL_PATH)
+        self.image_archive = ImageArchive(DefineGlobal.IMAGE_SAVE_PATH)
         self.load_initial_data()
 
+        # 작업 thread -> 화면 image (thumbnail, 최신 frame 만)
+        self.display_bridge = DisplayBridge()
+
         # OPC
         self.opc_client = BIWOPCUAClient(DefineGlobal.SERVER_URL)
         self.opc_client.data_changed.connect(self.handle_data_changed)
@@ -123,6 +140,11 @@ class MainOperator(QObject):
         # Demo Thread
         self.demo_thread = DemoThread(self)
 
+        # Remote Status (모니터링 station 응답용 snapshot)
+        self.remote_server = None
+        self.remote_status_publisher = RemoteStatusPublisher(self.get_remote_status_values,
+                                                             RemoteCommControllerType.controller_left.value)
+
     def get_spot_manager(self):
         return self.spot_manager
 
@@ -171,10 +193,9 @@ class MainOperator(QObject):
         return spot_connected
 
     def upload_navigation_map_to_spot(self):
-        nav_manager = self.spot_robot.robot_graphnav_manager
-
-        self.spot_robot.robot_recording_manager.clear_map()
-        nav_manager.upload_graph_and_snapshots(DefineGlobal.SPOT_NAVIGATION_MAP)
+        # 재연결 시 로봇의 map 을 다시 확인 (같은 map 이 있으면 clear / 업로드를 건너뜀)
+        self.map_residency.invalidate()
+        self.activate_body_type_map()
 
         self.try_localize()
 
@@ -215,6 +236,7 @@ class MainOperator(QObject):
         control_params = self.spot_manager.get_control_params()
         inspection_settings = self.spot_manager.get_inspection_settings()
         depth_settings = self.spot_manager.get_depth_settings()
+        self.image_encoding = ImageEncodingSettings.from_dict(self.spot_manager.get_image_encoding_settings())
 
     def spot_capture_bgr(self):
         camera_manager = self.spot_robot.robot_camera_manager
@@ -275,13 +297,11 @@ class MainOperator(QObject):
             msg_box.information(None, "알림", message, QMessageBox.Ok)
 
     def update_spot_image(self, image):
-        self.event_update_spot_image.emit(image)
+        # 화면에는 thumbnail 만 전달 (원본은 inspection_manager 에 저장)
+        self.display_bridge.publish(image)
 
     def update_spot_image_with_text(self, image, text: str):
-        self.event_update_spot_image_with_text.emit(image, text)
-        # pil_img = Image.fromarray(image)
-        # pil_resized_img = pil_img.resize((922, 747), Image.LANCZOS)
-        # gview.set_bgr_image_with_text(pil_resized_img, text)
+        self.display_bridge.publish(image, text)
 
     def update_hole_inspection_result(self, hole_inspection_result: bool):
         self.event_update_hole_inspection_result.emit(hole_inspection_result)
@@ -362,6 +382,25 @@ class MainOperator(QObject):
         # label = self.main_window.body_widget.body_display_widget.lbl_tack_time_value
         # label.setText(str(elapsed_time))
 
+    def set_image_encoding(self, encoding: ImageEncodingSettings):
+        self.image_encoding = encoding
+        self.spot_manager.set_image_encoding_settings(encoding.to_dict())
+
+    def is_hole_ng(self, hole_inspection_result: bool) -> bool:
+        # 검사 결과 (hole 있음) 가 spec (HOLE / NO HOLE) 과 다르면 NG
+        b_hole_spec = self.hole_spec_type == DefineGlobal.HOLE_TYPE.HOLE.name
+        return hole_inspection_result != b_hole_spec
+
+    def save_inspection_image(self, image, position, kind="", ng=None):
+        """
+        검사 image 저장 (현재 차량의 AGV / 차종 / spec 으로 index). 작업 thread 에서 호출.
+        encoding 은 설정 (image_encoding) 의 종류별 profile, ng 가 False 이고 original_only_on_ng 이면 원본은 축소본.
+        """
+        return self.image_archive.save(image, position, kind, agv_no=self.agv_no and str(self.agv_no),
+                                       body_type=getattr(self.body_type, "name", None),
+                                       spec=self.spec_data and str(self.spec_data),
+                                       profile=self.image_encoding.profile(kind, ng))
+
     def write_log(self, log_message):
         # print(log_message)
 
@@ -431,6 +470,9 @@ class MainOperator(QObject):
         self.opc_client.opc_connect()
         self.opc_connection_status_changed.emit(self.opc_client.connected)
 
+        # PLC 연동을 시작할 때 모니터링 station 용 상태 server 도 시작 (이미 실행 중이면 무시)
+        self.start_remote_server(DefineGlobal.REMOTE_SERVER_IP, DefineGlobal.REMOTE_SERVER_PORT)
+
     def opc_disconnect(self):
         self.opc_client.disconnect()
         self.opc_connection_status_changed.emit(self.opc_client.connected)
@@ -464,6 +506,7 @@ class MainOperator(QObject):
         self.opc_received_spec_data.emit(data, self.body_type.name, self.hole_spec_type)
 
     def handle_received_agv_signal(self, agv_signal):
+        self.agv_pos_ok = bool(agv_signal)
         self.opc_received_agv_signal.emit(agv_signal)
 
     def handle_received_agv_no(self, agv_no):
@@ -568,20 +611,17 @@ class MainOperator(QObject):
 
         return write_result
 
-    def upload_map_into_spot(self, navigation_map_filepath):
-        try:
-            self.spot_robot.robot_recording_manager.clear_map()
-            self.write_log("Complete Clear Map. Uploading new map...")
-        except Exception as e:
-            self.write_log(f"Clear Map Error Raised: {e}")
-            return
-
+    def upload_map_into_spot(self, navigation_map_filepath, force=False):
+        self.map_residency.invalidate()
         try:
-            self.spot_robot.robot_graphnav_manager.upload_graph_and_snapshots(navigation_map_filepath)
+            sync_result = self.spot_robot.robot_graphnav_manager.upload_graph_and_snapshots(navigation_map_filepath,
+                                                                                           force=force)
             self.spot_robot.robot_graphnav_manager.get_localization_state()
-            self.write_log("Complete Upload the new map.")
+            self.write_log(sync_result.summary())
         except FileNotFoundError as e:
             self.write_log(f"{e} - {navigation_map_filepath}")
+        except Exception as e:
+            self.write_log(f"Upload Map Error Raised: {e}")
 
     def change_body_type_setting(self, body_type: DefineGlobal.BODY_TYPE):
         # Update Navigation Map
@@ -591,12 +631,42 @@ class MainOperator(QObject):
 
         DefineGlobal.SPOT_DATA_PATH = f"D:/BIW/CONFIG/{DefineGlobal.SELECTED_BODY_TYPE.name}/{DefineGlobal.SPOT_POSITION.name}"
         DefineGlobal.SPOT_DATA_FILE_NAME = f"spot_data_config_{DefineGlobal.SELECTED_BODY_TYPE.name}_{DefineGlobal.SPOT_POSITION.name}.json"
-        DefineGlobal.SPOT_NAVIGATION_MAP = f"{DefineGlobal.SPOT_DATA_PATH}/navigation_map_{DefineGlobal.SELECTED_BODY_TYPE.name}_{DefineGlobal.SPOT_POSITION.name}"
+        DefineGlobal.SPOT_NAVIGATION_MAP = self.get_navigation_map_path(DefineGlobal.SELECTED_BODY_TYPE)
+        self.spot_manager.update_data()
 
-        self.upload_map_into_spot(DefineGlobal.SPOT_NAVIGATION_MAP)
+        # 로봇에 이미 같은 map 이 있으면 업로드하지 않음
+        self.activate_body_type_map()
 
-        self.write_log(f"Change Body Type. {before_selected_body_type} -> {DefineGlobal.SELECTED_BODY_TYPE}")
-        self.spot_manager.update_data()
+        if before_selected_body_type != DefineGlobal.SELECTED_BODY_TYPE:
+            self.write_log(f"Change Body Type. {before_selected_body_type} -> {DefineGlobal.SELECTED_BODY_TYPE}")
+
+    @staticmethod
+    def get_navigation_map_path(body_type: DefineGlobal.BODY_TYPE):
+        return (f"{DefineGlobal.CONFIG_PATH}/{body_type.name}/{DefineGlobal.SPOT_POSITION.name}"
+                f"/navigation_map_{body_type.name}_{DefineGlobal.SPOT_POSITION.name}")
+
+    def activate_body_type_map(self):
+        body_type = DefineGlobal.SELECTED_BODY_TYPE
+        sources = None
+        if self.map_residency.mode == MAP_RESIDENCY_MERGED:
+            sources = {each.name: self.get_navigation_map_path(each)
+                       for each in (DefineGlobal.BODY_TYPE.NE, DefineGlobal.BODY_TYPE.ME)}
+
+        try:
+            map_change = self.map_residency.activate(body_type.name, DefineGlobal.SPOT_NAVIGATION_MAP, sources,
+                                                     home_waypoint=self.spot_manager.get_waypoint_home())
+        except FileNotFoundError as e:
+            self.write_log(f"{e} - {DefineGlobal.SPOT_NAVIGATION_MAP}")
+            return
+        except Exception as e:
+            self.write_log(f"Map Change Error Raised: {e}")
+            return
+
+        if map_change.uploaded or map_change.from_key != map_change.to_key:
+            shift_summary = self.map_residency.shift_report().get(map_change.shift, {})
+            self.write_log(f"{map_change.summary()} | {map_change.shift}: "
+                           f"{shift_summary.get('changes', 0)} changes, {shift_summary.get('uploads', 0)} uploads, "
+                           f"{shift_summary.get('time', 0.0):.1f}s")
 
     def run_spot_connect(self):
         connect_thread = Thread(target=self.spot_robot.connect)
@@ -624,6 +694,71 @@ class MainOperator(QObject):
     def run_send_signal_off(self, tag_name):
         self.opc_client.write_node_id(tag_name, False)
 
+    def get_remote_status_values(self):
+        """
+        Remote 상태 snapshot 용 값. 이미 cache 된 값만 읽고 robot/OPC 로 새로 요청하지 않는다.
+        """
+        spot_robot = self.spot_robot
+        spot_connected = spot_robot.robot is not None and spot_robot.is_connected
+        serial_no = spot_robot.robot_id.serial_number if spot_robot.robot_id is not None else ""
+        power = ""
+        battery = ""
+        snapshot = spot_robot.state_snapshot
+        if spot_connected and snapshot.robot_state is not None:
+            power = spot_robot._power_state_str(snapshot)
+            battery = int(snapshot.battery_percentage or 0)
+
+        values = {
+            RemoteCommReqType.spot_connected: spot_connected,
+            RemoteCommReqType.spot_serial_no: serial_no,
+            RemoteCommReqType.spot_power: power,
+            RemoteCommReqType.spot_battery: battery,
+            RemoteCommReqType.spot_position: DefineGlobal.CURRENT_WORK_STATUS.name,
+
+            RemoteCommReqType.plc_connected: self.opc_client.connected,
+            RemoteCommReqType.plc_agv_no: self.agv_no,
+            # 작업 위치에 도착 (POS_OK) 한 AGV 번호
+            RemoteCommReqType.plc_agv_mov_no: self.agv_no if self.agv_pos_ok else None,
+            RemoteCommReqType.plc_vic_no: self.spec_data,
+            # AGV 가 도착했고 작업 완료 신호 전: AGV 출발 금지
+            RemoteCommReqType.plc_interlock: self.agv_pos_ok and not DefineGlobal.CURRENT_WORK_COMPLETE_STATUS,
+        }
+
+        # MES 는 아직 연동되지 않음. 항목은 빈 값으로 응답.
+        values.update({req_type: None for req_type in MES_STATUS_FIELDS})
+        values[RemoteCommReqType.mes_connected] = False
+
+        ready_types = [RemoteCommReqType.position1_inspection_result_ready,
+                       RemoteCommReqType.position2_inspection_result_ready,
+                       RemoteCommReqType.position3_inspection_result_ready]
+        result_types = [RemoteCommReqType.position1_inspection_result,
+                        RemoteCommReqType.position2_inspection_result,
+                        RemoteCommReqType.position3_inspection_result]
+        for position, (ready_type, result_type) in enumerate(zip(ready_types, result_types), start=1):
+            data = self.inspection_manager.get_inspection_data(position)
+            values[ready_type] = data is not None
+            values[result_type] = data
+
+        return values
+
+    def start_remote_server(self, ip, port):
+        from communication.Remote.remote_server.RemoteServer import RemoteServer
+
+        if self.remote_server is None:
+            self.remote_server = RemoteServer()
+            self.remote_server.set_status_publisher(self.remote_status_publisher)
+
+        self.remote_status_publisher.start()
+        self.remote_server.ServerOpen(ip, port)
+
+    def stop_remote_server(self):
+        if self.remote_server is not None:
+            self.remote_server.server_close()
+            # 닫힌 event loop 는 다시 시작하지 않으므로 다음 start 에서 새로 생성
+            self.remote_server = None
+        self.remote_status_publisher.stop()
+
+
 class SpotReconnectThread(QThread):
     hostname = DefineGlobal.SPOT_HOSTNAME
     username = DefineGlobal.SPOT_USERNAME
@@ -114,8 +114,7 @@ class MainWindow(QMainWindow):
         self.main_operator.opc_connection_status_changed.connect(self.update_opc_connection_status)
 
         self.main_operator.event_qr_setting_waypoints.connect(self.update_ui_qr_setting_waypoints)
-        self.main_operator.event_update_spot_image.connect(self.update_ui_spot_image)
-        self.main_operator.event_update_spot_image_with_text.connect(self.update_ui_spot_image_with_text)
+        self.main_operator.display_bridge.frame_ready.connect(self.update_ui_spot_image_from_bridge)
         self.main_operator.event_update_hole_inspection_result.connect(self.update_ui_hole_inspection_result)
 
         # Body Events
@@ -142,6 +141,8 @@ class MainWindow(QMainWindow):
 
         # ProcessThread Events
         self.main_operator.process_manager.bypass_signal.connect(self.update_ui_bypass_button)
+        self.footer_widget.btn_toggle_system_mode.clicked.connect(self.main_operator.process_manager.post_auto_mode)
+        self.header_widget.btn_toggle_confirm_mode.clicked.connect(self.post_process_user_confirm_mode)
 
     def update_spot_status(self, lease, power, bar_status, bar_val, time_left, connected, localized, estop_status, sw_estop_status):
         self.footer_widget.spot_status_widget.set_lease_status(lease)
@@ -162,6 +163,7 @@ class MainWindow(QMainWindow):
             self.spot_disconnect_dialog_shown = True
             DefineGlobal.PROCESS_THREAD_IS_RUNNING = False
             self.footer_widget.ui_update_system_manual()
+            self.main_operator.process_manager.post_auto_mode()
 
             disconnected_message = ("SPOT is disconnected because of network status.\n"
                                     "Try to reconnect...\n"
@@ -263,17 +265,31 @@ class MainWindow(QMainWindow):
         gview.set_image(image)
         gview.set_text("INSPECTION INFO", text)
 
+    def update_ui_spot_image_from_bridge(self):
+        # 작업 thread 가 만든 thumbnail 중 최신 frame 만 표시
+        bridge = self.main_operator.display_bridge
+        frame = bridge.take()
+        if frame is None:
+            return
+
+        gview = self.body_widget.body_display_widget.image_gview
+        viewport = gview.viewport()
+        if viewport.isVisible():
+            ratio = viewport.devicePixelRatioF()
+            bridge.set_view_size(viewport.width() * ratio, viewport.height() * ratio)
+
+        gview.set_image(frame.image, frame.source_size, full_frame=frame.source)
+        if frame.text is not None:
+            gview.set_text("INSPECTION INFO", frame.text)
+
     def update_ui_hole_inspection_result(self, hole_inspection_result: bool):
         label = self.body_widget.body_display_widget.lbl_hole_inspection_value
         label.setText(str(hole_inspection_result))
 
-        if self.main_operator.hole_spec_type == DefineGlobal.HOLE_TYPE.HOLE.name:
-            b_hole_spec = True
-        else:
-            b_hole_spec = False
+        b_hole_spec = self.main_operator.hole_spec_type == DefineGlobal.HOLE_TYPE.HOLE.name
 
         # If different, ng occurred.
-        self.main_operator.hole_ng_occurred = hole_inspection_result != b_hole_spec
+        self.main_operator.hole_ng_occurred = self.main_operator.is_hole_ng(hole_inspection_result)
 
         # b_hole_spec = True
         # self.main_operator.hole_ng_occurred = True
@@ -322,6 +338,7 @@ class MainWindow(QMainWindow):
     def update_ui_by_pass_status(self):
         by_pass_status = self.main_operator.get_by_pass_status()
         DefineGlobal.PROCESS_THREAD_MANUAL_BY_PASS = by_pass_status
+        self.main_operator.process_manager.post_by_pass()
 
         if by_pass_status:
             self.footer_widget.ui_update_bypass_on()
@@ -377,6 +394,7 @@ class MainWindow(QMainWindow):
                 show_message(text="Send Fail.")
 
             DefineGlobal.WORK_COMPLETE_WAIT_USER_COMMAND = False
+            self.main_operator.process_manager.post_user_confirm()
 
     def run_send_agv_real_ng_signal(self):
         text = f"SEND NG SIGNAL?\nAGV NO: {self.main_operator.agv_no}"
@@ -390,6 +408,7 @@ class MainWindow(QMainWindow):
                 show_message(text="FAIL.")
 
             DefineGlobal.WORK_COMPLETE_WAIT_USER_COMMAND = False
+            self.main_operator.process_manager.post_user_confirm()
 
     def run_event_position_home(self):
         waypoint = self.main_operator.spot_manager.get_waypoint_home()
@@ -419,44 +438,47 @@ class MainWindow(QMainWindow):
             move_thread.start()
 
     def run_event_position1(self):
-        image = self.main_operator.inspection_manager.get_inspection_image(1)
-        data  = self.main_operator.inspection_manager.get_inspection_data(1)
+        inspection_manager = self.main_operator.inspection_manager
+        data = inspection_manager.get_inspection_data(1)
 
-        if image is None:
-            show_message("No Image")
-            return
+        with inspection_manager.borrow_image(1) as image:
+            if image is None:
+                show_message("No Image")
+                return
 
-        if data is None:
-            data = "No Data"
+            if data is None:
+                data = "No Data"
 
-        self.update_ui_spot_image_with_text(image, data)
+            self.update_ui_spot_image_with_text(image, data)
 
     def run_event_position2(self):
-        image = self.main_operator.inspection_manager.get_inspection_image(2)
-        data  = self.main_operator.inspection_manager.get_inspection_data(2)
+        inspection_manager = self.main_operator.inspection_manager
+        data = inspection_manager.get_inspection_data(2)
 
-        if image is None:
-            show_message("No Image")
-            return
+        with inspection_manager.borrow_image(2) as image:
+            if image is None:
+                show_message("No Image")
+                return
 
-        if data is None:
-            data = "No Data"
+            if data is None:
+                data = "No Data"
 
-        self.update_ui_spot_image(image)
-        self.update_ui_hole_inspection_result(data)
+            self.update_ui_spot_image(image)
+            self.update_ui_hole_inspection_result(data)
 
     def run_event_position3(self):
-        image = self.main_operator.inspection_manager.get_inspection_image(3)
-        data  = self.main_operator.inspection_manager.get_inspection_data(3)
+        inspection_manager = self.main_operator.inspection_manager
+        data = inspection_manager.get_inspection_data(3)
 
-        if image is None:
-            show_message("No Image")
-            return
+        with inspection_manager.borrow_image(3) as image:
+            if image is None:
+                show_message("No Image")
+                return
 
-        if data is None:
-            data = "No Data"
+            if data is None:
+                data = "No Data"
 
-        self.update_ui_spot_image_with_text(image, data)
+            self.update_ui_spot_image_with_text(image, data)
 
     # VIP MODE
     def toggle_vip_mode(self):
@@ -572,6 +594,7 @@ class MainWindow(QMainWindow):
             """
 
         write_result = self.main_operator.send_by_pass_mode()
+        self.main_operator.process_manager.post_by_pass()
         if write_result:
             if DefineGlobal.SPOT_POSITION == DefineGlobal.BIW_POSITION.RH:
                 tag_name = DefineGlobal.OPC_SPOT_RB1_WRITE_DATA.S600_SPOT_RB1_I_BYPASS_ON
@@ -620,6 +643,11 @@ class MainWindow(QMainWindow):
             util_functions.show_message(text=message)
 
     # PROCESS THREAD EVENTS
+    def post_process_user_confirm_mode(self):
+        # AUTO PASS 모드로 바뀌면 NG 확인 대기 해제.
+        if not DefineGlobal.MODE_USER_CONFIRM:
+            self.main_operator.process_manager.post_user_confirm()
+
     def update_ui_bypass_button(self, bypass_signal):
         if bypass_signal:
             self.footer_widget.ui_update_bypass_on()
@@ -681,6 +709,12 @@ class MainWindow(QMainWindow):
                 self.main_operator.status_thread.stop()
                 self.main_operator.status_thread.wait()
 
+            # 남은 takt time 기록 저장
+            self.main_operator.takt_time_store.close()
+            self.main_operator.inspection_manager.close()
+            self.main_operator.image_archive.close()
+            self.main_operator.stop_remote_server()
+
             if self.main_operator.process_manager.isRunning():
                 self.main_operator.process_manager.stop()
 
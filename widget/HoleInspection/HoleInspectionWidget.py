@@ -452,10 +452,7 @@ class HoleInspectionWidget(QWidget):
                 # pt1 = (self.region[0], self.region[1])
                 # pt2 = (self.region[0] + self.region[2], self.region[1] + self.region[3])
 
-                image_pixmap = QPixmap(selected_files)
-                scene = QGraphicsScene()
-                scene.addItem(QGraphicsPixmapItem(image_pixmap))
-                self.view.setScenePixmap(scene, QGraphicsPixmapItem(image_pixmap))
+                self.view.set_image(QPixmap(selected_files))
 
                 # utils.draw_box(image, pt1, pt2, color=(0, 255, 0))
                 # utils.set_graphic_view_image(image, self.view)
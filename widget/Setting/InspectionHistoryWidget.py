@@ -0,0 +1,132 @@
+from datetime import datetime
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, \
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+
+from DataManager.InspectionDataManager import POSITIONS
+from main_operator import MainOperator
+from widget.common.GraphicView import GraphicView
+
+PAGE_SIZE = 20
+
+
+def result_text(value):
+    return "-" if value is None else ("OK" if value else "NG")
+
+
+class InspectionHistoryWidget(QWidget):
+    """
+    InspectionDataManager 의 cycle 기록 조회.
+    표에는 한 page 의 기록 (결과 필드) 만 두고, image 는 선택한 기록 / position 하나만 저장소에서 읽어서 표시.
+    """
+    def __init__(self, main_operator: MainOperator):
+        super().__init__()
+        self.main_operator = main_operator
+        self.inspection_manager = self.main_operator.inspection_manager
+        self.page_index = 0
+        self.records = []
+
+        self.initUI()
+
+    def initUI(self):
+        self.main_layout = QVBoxLayout()
+
+        self.lbl_title = QLabel("Inspection History")
+        self.lbl_title.setAlignment(Qt.AlignCenter)
+        self.lbl_title.setObjectName("title")
+        self.main_layout.addWidget(self.lbl_title)
+
+        # page 이동
+        hlayout_page = QHBoxLayout()
+        self.btn_prev = QPushButton("< Prev")
+        self.btn_next = QPushButton("Next >")
+        self.btn_refresh = QPushButton("Refresh")
+        self.lbl_page = QLabel("-")
+        self.lbl_page.setAlignment(Qt.AlignCenter)
+        self.btn_prev.clicked.connect(lambda: self.move_page(-1))
+        self.btn_next.clicked.connect(lambda: self.move_page(1))
+        self.btn_refresh.clicked.connect(self.refresh)
+
+        hlayout_page.addWidget(self.btn_prev)
+        hlayout_page.addWidget(self.lbl_page)
+        hlayout_page.addWidget(self.btn_next)
+        hlayout_page.addWidget(self.btn_refresh)
+        self.main_layout.addLayout(hlayout_page)
+
+        self.table_records = QTableWidget(0, 7)
+        self.table_records.setHorizontalHeaderLabels(["Time", "Body Type", "AGV", "QR #1", "Hole", "QR #3",
+                                                      "Cycle (s)"])
+        self.table_records.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_records.verticalHeader().setVisible(False)
+        self.table_records.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_records.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table_records.itemSelectionChanged.connect(self.update_preview)
+        self.main_layout.addWidget(self.table_records, 2)
+
+        # 선택한 기록의 image
+        hlayout_position = QHBoxLayout()
+        self.cbx_position = QComboBox()
+        self.cbx_position.addItems([f"Position #{position}" for position in POSITIONS])
+        self.cbx_position.currentIndexChanged.connect(self.update_preview)
+        self.lbl_result = QLabel("-")
+        hlayout_position.addWidget(self.cbx_position)
+        hlayout_position.addWidget(self.lbl_result, 1)
+        self.main_layout.addLayout(hlayout_position)
+
+        self.image_view = GraphicView()
+        self.main_layout.addWidget(self.image_view, 3)
+
+        self.setLayout(self.main_layout)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def page_count(self):
+        return max(1, -(-self.inspection_manager.record_count() // PAGE_SIZE))
+
+    def move_page(self, step):
+        self.page_index = min(max(0, self.page_index + step), self.page_count() - 1)
+        self.refresh()
+
+    def refresh(self):
+        self.page_index = min(self.page_index, self.page_count() - 1)
+        self.records = self.inspection_manager.page(self.page_index * PAGE_SIZE, PAGE_SIZE)
+        self.lbl_page.setText(f"{self.page_index + 1} / {self.page_count()}")
+        self.btn_prev.setEnabled(self.page_index > 0)
+        self.btn_next.setEnabled(self.page_index < self.page_count() - 1)
+
+        self.table_records.setRowCount(len(self.records))
+        for index, record in enumerate(self.records):
+            values = [datetime.fromtimestamp(record.timestamp).strftime("%Y-%m-%d %H:%M:%S"),
+                      record.body_type, record.agv_no,
+                      result_text(record.qr1_success), result_text(record.hole_result),
+                      result_text(record.qr3_success),
+                      "-" if record.cycle_time is None else f"{record.cycle_time:.1f}"]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                self.table_records.setItem(index, column, item)
+
+        if self.records:
+            self.table_records.selectRow(0)
+        else:
+            self.image_view.live_image.clear()
+            self.lbl_result.setText("-")
+
+    def update_preview(self):
+        row = self.table_records.currentRow()
+        if not 0 <= row < len(self.records):
+            return
+
+        record = self.records[row]
+        position = POSITIONS[self.cbx_position.currentIndex()]
+        data = record.get_data(position)
+        self.lbl_result.setText("-" if data is None else str(data).replace("\n", " "))
+
+        with self.inspection_manager.borrow_image(position, record) as image:
+            if image is None:
+                self.image_view.live_image.clear()
+                return
+            self.image_view.set_image(image)
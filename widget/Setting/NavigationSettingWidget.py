@@ -315,6 +315,7 @@ class NavigationSettingWidget(QWidget):
         """
         upload_filepath = QFileDialog.getExistingDirectory(None, 'Select Directory')
         if upload_filepath:
+            self.main_operator.map_residency.invalidate()
             self.graph_nav_manager.upload_graph_and_snapshots(upload_filepath)
             self.get_list_graph()
 
@@ -341,6 +342,7 @@ class NavigationSettingWidget(QWidget):
         """
         로봇에 저장된 map을 초기화합니다.
         """
+        self.main_operator.map_residency.invalidate()
         self.recording_manager.clear_map()
 
     @spot_connection_check
@@ -1,13 +1,13 @@
-import os
-import shutil
+import threading
 from datetime import datetime, timedelta
 
 import psutil
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QFormLayout, QSpinBox, QFileDialog, \
-    QPushButton, QSlider, QCheckBox, QProgressBar
+    QPushButton, QSlider, QCheckBox, QProgressBar, QComboBox
 from PySide6.QtCore import Qt, QTimer
 
 import DefineGlobal
+from DataManager.ImageEncoding import ENCODING_PRESETS, ImageEncodingSettings
 from main_operator import MainOperator
 from biw_utils import util_functions
 from widget.Setting.SpotCameraParameterWidget import SpotCameraParameterWidget
@@ -299,6 +299,22 @@ class ProgramSettingWidget(QWidget):
         compression_layout.addWidget(self.compression_slider)
         # layout.addLayout(compression_layout)
 
+        # Encoding profile (저장 종류별 품질 / 축소 / 형식 preset)
+        encoding = self.main_operator.image_encoding
+        encoding_layout = QHBoxLayout()
+        self.encoding_label = QLabel('Encoding Profile:')
+        self.cbx_encoding_preset = QComboBox()
+        self.cbx_encoding_preset.addItems(list(ENCODING_PRESETS))
+        self.cbx_encoding_preset.setCurrentText(encoding.preset)
+        self.cbx_encoding_preset.currentTextChanged.connect(self.update_image_encoding)
+        self.original_only_on_ng_checkbox = QCheckBox("Full-size original only for NG")
+        self.original_only_on_ng_checkbox.setChecked(encoding.original_only_on_ng)
+        self.original_only_on_ng_checkbox.toggled.connect(self.update_image_encoding)
+        encoding_layout.addWidget(self.encoding_label)
+        encoding_layout.addWidget(self.cbx_encoding_preset)
+        encoding_layout.addWidget(self.original_only_on_ng_checkbox)
+        layout.addLayout(encoding_layout)
+
         # Automatic cleanup configuration
         cleanup_layout = QHBoxLayout()
         self.cleanup_checkbox = QCheckBox("Enable Automatic Cleanup")
@@ -333,6 +349,13 @@ class ProgramSettingWidget(QWidget):
     def updateCompressionLabel(self, value):
         self.compression_label.setText(f'Compression Setting ({value}):')
 
+    def update_image_encoding(self):
+        # 종류별 overrides 는 설정 파일에서만 편집하므로 그대로 유지
+        encoding = ImageEncodingSettings(preset=self.cbx_encoding_preset.currentText(),
+                                         original_only_on_ng=self.original_only_on_ng_checkbox.isChecked(),
+                                         overrides=self.main_operator.image_encoding.overrides)
+        self.main_operator.set_image_encoding(encoding)
+
     def toggleCleanupSettings(self, checked):
         self.cleanup_time_spinbox.setEnabled(checked)
 
@@ -370,22 +393,17 @@ class ProgramSettingWidget(QWidget):
         # self.midnight_timer.start(10000)
 
     def cleanup_old_images(self):
-        cutoff_date = datetime.now() - timedelta(days=self.cleanup_time_spinbox.value())
+        # 다음 날 자정에 다시 실행
+        self.init_midnight_timer()
+
+        # 지난 날짜 폴더는 날짜별 zip 으로 묶고, 보관 기간이 지난 날짜는 삭제 (index 포함). 시간이 걸리므로 별도 thread.
+        retention_days = self.cleanup_time_spinbox.value()
+        threading.Thread(target=self.run_image_archive_maintenance, args=(retention_days,),
+                         name="ImageArchiveMaintenance", daemon=True).start()
+
+    def run_image_archive_maintenance(self, retention_days):
         try:
-            for folder_name in os.listdir(DefineGlobal.IMAGE_SAVE_PATH):
-                try:
-                    folder_date = datetime.strptime(folder_name, '%Y%m%d')
-                    folder_path = os.path.join(DefineGlobal.IMAGE_SAVE_PATH, folder_name)
-                    if folder_date < cutoff_date:
-                        shutil.rmtree(folder_path)
-                        log_message = f"Deleted Old Images Folder: {folder_path}"
-                        self.main_operator.write_log(log_message)
-                except ValueError:
-                    log_message = f"Skipping non-date folder: {folder_name}"
-                    self.main_operator.write_log(log_message)
-                except Exception as e:
-                    log_message = f"Cleanup Data Exception: {e}"
-                    self.main_operator.write_log(log_message)
-        except FileNotFoundError as e:
-            log_message = f"Error Exception: {e}"
-            self.main_operator.write_log(log_message)
+            log_message = self.main_operator.image_archive.maintenance(retention_days)
+        except Exception as e:
+            log_message = f"Cleanup Data Exception: {e}"
+        self.main_operator.write_log(log_message)
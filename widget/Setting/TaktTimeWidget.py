@@ -0,0 +1,147 @@
+import pyqtgraph as pg
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, QSpinBox, \
+    QTableWidget, QTableWidgetItem, QHeaderView
+
+from main_operator import MainOperator
+
+ALL_BODY_TYPES = "ALL"
+
+
+class TaktTimeWidget(QWidget):
+    """
+    TaktTimeStore 의 단계별 p50/p95/p99 표와 일별 추이 그래프.
+    """
+    def __init__(self, main_operator: MainOperator):
+        super().__init__()
+        self.main_operator = main_operator
+        self.takt_time_store = self.main_operator.takt_time_store
+
+        self.initUI()
+
+    def initUI(self):
+        self.main_layout = QVBoxLayout()
+
+        self.lbl_title = QLabel("Takt Time")
+        self.lbl_title.setAlignment(Qt.AlignCenter)
+        self.lbl_title.setObjectName("title")
+        self.main_layout.addWidget(self.lbl_title)
+
+        # 조회 조건
+        hlayout_filter = QHBoxLayout()
+        self.cbx_body_type = QComboBox()
+        self.cbx_step = QComboBox()
+        self.sbx_days = QSpinBox()
+        self.sbx_days.setRange(1, 365)
+        self.sbx_days.setValue(30)
+        self.sbx_days.setSuffix(" days")
+        self.btn_refresh = QPushButton("Refresh")
+        self.btn_refresh.clicked.connect(self.refresh)
+
+        hlayout_filter.addWidget(QLabel("Body Type"))
+        hlayout_filter.addWidget(self.cbx_body_type)
+        hlayout_filter.addWidget(QLabel("Step"))
+        hlayout_filter.addWidget(self.cbx_step)
+        hlayout_filter.addWidget(self.sbx_days)
+        hlayout_filter.addWidget(self.btn_refresh)
+        self.main_layout.addLayout(hlayout_filter)
+
+        # 일별 추이
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setBackground("w")
+        self.plot_widget.showGrid(x=True, y=True)
+        self.plot_widget.setLabel("left", "seconds")
+        self.plot_widget.addLegend()
+        self.main_layout.addWidget(self.plot_widget, 3)
+
+        # 단계별 percentile
+        self.table_steps = QTableWidget(0, 5)
+        self.table_steps.setHorizontalHeaderLabels(["Step", "Count", "p50 (s)", "p95 (s)", "p99 (s)"])
+        self.table_steps.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_steps.verticalHeader().setVisible(False)
+        self.main_layout.addWidget(self.table_steps, 2)
+
+        self.lbl_result_rates = QLabel("-")
+        self.main_layout.addWidget(self.lbl_result_rates)
+
+        self.setLayout(self.main_layout)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def selected_body_type(self):
+        body_type = self.cbx_body_type.currentText()
+        return None if body_type in ("", ALL_BODY_TYPES) else body_type
+
+    def update_filters(self):
+        body_type = self.cbx_body_type.currentText()
+        step = self.cbx_step.currentText()
+
+        self.cbx_body_type.blockSignals(True)
+        self.cbx_body_type.clear()
+        self.cbx_body_type.addItems([ALL_BODY_TYPES] + self.takt_time_store.get_body_types())
+        if body_type:
+            self.cbx_body_type.setCurrentText(body_type)
+        self.cbx_body_type.blockSignals(False)
+
+        self.cbx_step.blockSignals(True)
+        self.cbx_step.clear()
+        self.cbx_step.addItems(["cycle_time"] + self.takt_time_store.get_steps())
+        if step:
+            self.cbx_step.setCurrentText(step)
+        self.cbx_step.blockSignals(False)
+
+    def refresh(self):
+        self.update_filters()
+        body_type = self.selected_body_type()
+        step = self.cbx_step.currentText() or "cycle_time"
+        days = self.sbx_days.value()
+
+        self.update_trend_plot(step, days, body_type)
+        self.update_step_table(body_type)
+        self.update_result_rates(body_type)
+
+    def update_trend_plot(self, step, days, body_type):
+        self.plot_widget.clear()
+        trend = self.takt_time_store.daily_trend(step, days, body_type)
+        if not trend:
+            return
+
+        x = list(range(len(trend)))
+        colors = {"p50": "b", "p95": "m", "p99": "r"}
+        for key, color in colors.items():
+            self.plot_widget.plot(x, [row[key] for row in trend], pen=pg.mkPen(color, width=2),
+                                  symbol="o", symbolSize=5, symbolBrush=color, name=key)
+
+        ticks = [(index, row["group"][5:]) for index, row in enumerate(trend)]
+        self.plot_widget.getAxis("bottom").setTicks([ticks])
+        self.plot_widget.setTitle(step)
+
+    def update_step_table(self, body_type):
+        rows = self.takt_time_store.step_percentiles(body_type=body_type)
+        rows = self.takt_time_store.step_percentiles(step="cycle_time", body_type=body_type) + rows
+
+        self.table_steps.setRowCount(len(rows))
+        for index, row in enumerate(rows):
+            values = [row["step"], str(row["count"]),
+                      f"{row['p50']:.2f}", f"{row['p95']:.2f}", f"{row['p99']:.2f}"]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                self.table_steps.setItem(index, column, item)
+
+    def update_result_rates(self, body_type):
+        rates = self.takt_time_store.get_result_rates(body_type=body_type)
+        if not rates or not rates["count"]:
+            self.lbl_result_rates.setText("-")
+            return
+
+        def to_percent(value):
+            return "-" if value is None else f"{value * 100:.1f}%"
+
+        fitness = rates["arm_correction_fitness"]
+        self.lbl_result_rates.setText(
+            f"Cycles: {rates['count']}  |  QR#1: {to_percent(rates['qr1_success_rate'])}  "
+            f"|  QR#3: {to_percent(rates['qr3_success_rate'])}  |  Hole OK: {to_percent(rates['hole_ok_rate'])}  "
+            f"|  Arm Fitness: {'-' if fitness is None else f'{fitness:.3f}'}  |  Retries: {rates['retries']}")
@@ -2,16 +2,17 @@ import os
 import sys
 import numpy as np
 import cv2
-from PySide6.QtWidgets import QApplication, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QGraphicsRectItem, \
-    QGraphicsSimpleTextItem, QMenu, QMessageBox
-from PySide6.QtGui import QPixmap, QImage, QFont, QColor, QBrush, QWheelEvent, QContextMenuEvent, QPainter, QAction, \
-    QShortcut, QKeySequence
+from PySide6.QtWidgets import QApplication, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QMenu, QMessageBox
+from PySide6.QtGui import QPixmap, QImage, QWheelEvent, QContextMenuEvent, QPainter, QAction, QShortcut, QKeySequence
 from PySide6.QtCore import Qt
 
 import PySide6.QtCore
 
 from datetime import datetime
 
+from widget.common.LiveImageItem import LiveImageItem
+from widget.common.TextOverlay import overlay_renderer
+
 
 class GraphicViewWithText(QGraphicsView):
     def __init__(self):
@@ -31,10 +32,17 @@ class GraphicViewWithText(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setDragMode(QGraphicsView.ScrollHandDrag)  # 드래그 모드 설정
 
-        # 기본 텍스트 항목들
-        self.title_item = None
-        self.label_items = []
-        self.value_items = []
+        # 이미지 항목 (scene 에 하나만 두고 pixmap 만 교체)
+        self.live_image = LiveImageItem(self, on_shown=self.fit_in_view)
+        self.image_item = self.live_image.item
+        self.image_item.setZValue(-1)
+        self.scene.addItem(self.image_item)
+
+        # 텍스트 overlay (TextOverlayRenderer 가 그린 pixmap, 같은 내용은 cache 재사용)
+        self.overlay_item = QGraphicsPixmapItem()
+        self.overlay_item.setPos(10, 10)
+        self.overlay_item.hide()
+        self.scene.addItem(self.overlay_item)
 
         # 저장 단축키
         save_shortcut = QShortcut(QKeySequence("Ctrl+S"), self)
@@ -56,112 +64,31 @@ class GraphicViewWithText(QGraphicsView):
         else:
             raise ValueError("Unsupported image type")
 
-    def set_image(self, image_input):
-        """이미지를 설정하고 QGraphicsPixmapItem으로 추가"""
-        pixmap = self.convert_image_to_pixmap(image_input)
-        # scaled_pixmap = pixmap.scaled(960, 840, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    def set_image(self, image_input, source_size=None, full_frame=None):
+        """
+        이미지를 교체. 이전 이미지에 표시하던 텍스트는 제거 (텍스트가 필요하면 set_text 를 이어서 호출)
+        source_size (w, h): image_input 이 thumbnail 일 때 원래 frame 크기. text 위치 / 크기는 원래 크기 기준.
+        full_frame (np.ndarray): image_input 이 thumbnail 일 때 원래 frame. 이미지 저장은 이 frame 으로.
+        """
+        self.clear_text()
+        self.live_image.set_image(image_input, source_size, full_frame)
 
-        # 이미지 아이템 생성 및 추가
-        self.image_item = QGraphicsPixmapItem(pixmap)
-        self.scene.addItem(self.image_item)
-        self.fit_in_view()
+    def clear_text(self):
+        """기존 텍스트 overlay 제거"""
+        self.overlay_item.hide()
+        self.overlay_item.setPixmap(QPixmap())
+
+    def show_overlay(self, pixmap):
+        self.overlay_item.setPixmap(pixmap)
+        self.overlay_item.show()
 
     def set_text_list(self, title, labels, values):
         """텍스트 데이터를 설정하고 씬에 추가"""
-        # 기존 텍스트 항목 제거
-        if self.title_item:
-            self.scene.removeItem(self.title_item)
-        for item in self.label_items:
-            self.scene.removeItem(item)
-        for item in self.value_items:
-            self.scene.removeItem(item)
-
-        self.label_items.clear()
-        self.value_items.clear()
-
-        # 텍스트 폭 설정
-        text_width = 680
-        text_height = 680
-
-        # 배경 사각형 생성 및 추가
-        background_rect = QGraphicsRectItem(10, 10, text_width + 20, text_height + 20)
-        background_rect.setBrush(QBrush(QColor(0, 100, 0, 128)))  # 약간 초록색 느낌의 반투명 배경
-        background_rect.setPen(Qt.NoPen)
-        self.scene.addItem(background_rect)
-
-        # 가장 긴 label의 길이를 구함
-        max_label_length = max(len(label) for label in labels)
-
-        # 타이틀 추가
-        self.title_item = QGraphicsSimpleTextItem(title)
-        self.title_item.setBrush(QBrush(QColor("cyan")))
-        self.title_item.setFont(QFont('Consolas', 28, QFont.Bold))
-        self.title_item.setPos(20, 20)
-        self.scene.addItem(self.title_item)
-
-        # 각 항목 추가
-        y_offset = 80
-        label_color = QColor("black")
-        value_color = QColor("white")
-        for label, value in zip(labels, values):
-            label_item_text = label.center(max_label_length) + " :"
-            label_item = QGraphicsSimpleTextItem(label_item_text)
-            label_item.setBrush(QBrush(label_color))
-            label_item.setFont(QFont('Consolas', 24))
-            label_item.setPos(40, y_offset)
-            self.scene.addItem(label_item)
-            self.label_items.append(label_item)
-
-            value_item = QGraphicsSimpleTextItem(value)
-            value_item.setBrush(QBrush(value_color))
-            value_item.setFont(QFont('Consolas', 24))
-            value_item.setPos(400, y_offset)
-            self.scene.addItem(value_item)
-            self.value_items.append(value_item)
-
-            y_offset += 40
+        self.show_overlay(overlay_renderer.table(title, labels, values))
 
     def set_text(self, title, text):
         """텍스트 데이터를 설정하고 씬에 추가"""
-        # 기존 텍스트 항목 제거
-        if self.title_item:
-            self.scene.removeItem(self.title_item)
-        for item in self.label_items:
-            self.scene.removeItem(item)
-        for item in self.value_items:
-            self.scene.removeItem(item)
-
-        self.label_items.clear()
-        self.value_items.clear()
-
-        # 텍스트 폭 설정
-        text_width  = 300 * 4
-        text_height = 150 * 4
-
-        # 배경 사각형 생성 및 추가
-        background_rect = QGraphicsRectItem(10, 10, text_width + 20, text_height + 20)
-        background_rect.setBrush(QBrush(QColor(0, 100, 0, 128)))  # 약간 초록색 느낌의 반투명 배경
-        background_rect.setPen(Qt.PenStyle.NoPen)
-        self.scene.addItem(background_rect)
-
-        # 타이틀 추가
-        title_font = QFont('Consolas', 14*3, QFont.Weight.Bold)
-        self.title_item = QGraphicsSimpleTextItem(title)
-        self.title_item.setBrush(QBrush(QColor("cyan")))
-        self.title_item.setFont(title_font)
-        self.title_item.setPos(20, 20)
-        self.scene.addItem(self.title_item)
-
-        y_offset = 60 * 4
-
-        label_item_font = QFont('Consolas', 12*3)
-
-        label_item = QGraphicsSimpleTextItem(text)
-        label_item.setBrush(QBrush(QColor("black")))
-        label_item.setFont(label_item_font)
-        label_item.setPos(20, y_offset)
-        self.scene.addItem(label_item)
-        self.label_items.append(label_item)
+        self.show_overlay(overlay_renderer.info(title, text))
 
     def wheelEvent(self, event: QWheelEvent):
         """마우스 휠 이벤트 처리 (확대/축소)"""
@@ -174,6 +101,11 @@ class GraphicViewWithText(QGraphicsView):
             zoom_factor = zoom_out_factor
 
         self.scale(zoom_factor, zoom_factor)
+        self.live_image.refresh_resolution()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.live_image.refresh_resolution()
 
     def contextMenuEvent(self, event: QContextMenuEvent):
         """우클릭 메뉴 이벤트 처리"""
@@ -243,7 +175,7 @@ class GraphicViewWithText(QGraphicsView):
         save_folder = "D:/PROJECT/2024/BIW/20240829/IMAGE"
         file_name = f"{curreunt_time}.png"
         file_path = os.path.join(save_folder, file_name)
-        qimage = self.image_item.pixmap().toImage()
+        qimage = self.live_image.full_resolution_qimage()
         if qimage.save(file_path):
             # 저장 성공 메시지
             QMessageBox.information(self, "저장 완료", "이미지가 성공적으로 저장되었습니다.")
@@ -0,0 +1,35 @@
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QApplication
+
+
+class LazyPage(QWidget):
+    """
+    QStackedWidget 에 넣는 빈 page. 처음 화면에 보일 때 factory() 로 실제 page 를 만듭니다.
+    무거운 module (torch, pyqtgraph ..) 을 쓰는 page 를 프로그램 시작 시 만들지 않기 위해 사용.
+    """
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.page = None
+
+        self.main_layout = QVBoxLayout()
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self.main_layout)
+
+    def load(self):
+        if self.page is not None:
+            return self.page
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.page = self.factory()
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        self.main_layout.addWidget(self.page)
+        self.page.show()
+        return self.page
+
+    def showEvent(self, event):
+        self.load()
+        super().showEvent(event)
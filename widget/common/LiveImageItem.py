@@ -0,0 +1,214 @@
+import time
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+from PySide6.QtCore import QObject, QTimer, Qt
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtWidgets import QGraphicsPixmapItem
+
+# 실시간 image 표시용 pixmap item
+# 기존: frame 마다 QGraphicsScene / QPixmap / QGraphicsPixmapItem 을 새로 생성 (GraphicViewWithText 는 item 을 계속 추가만 함)
+#       4K frame 을 원본 크기 그대로 GUI thread 에서 QPixmap 으로 변환
+# 변경:
+#   - scene / item 은 하나만 유지하고 pixmap 만 교체
+#   - frame 을 view 에 표시되는 크기로 먼저 줄인 뒤 변환 (축소 buffer 와 이를 감싼 QImage 재사용).
+#     item 은 원본 크기로 scale 해서 scene 좌표 (text overlay, fit in view) 는 기존과 같음
+#   - 화면 refresh 주기보다 빨리 들어오는 frame 은 마지막 것만 표시
+#   - 확대 / resize 로 더 큰 해상도가 필요하면 마지막 frame 을 다시 변환
+# 이미지 저장은 축소된 pixmap 이 아닌 원본 frame 으로 (full_resolution_qimage).
+# thumbnail 을 받은 경우 (DisplayBridge) 에는 같이 받은 원래 frame (full_frame) 으로 저장.
+
+DEFAULT_REFRESH_RATE = 60.0
+
+
+def numpy_to_qimage(frame: np.ndarray) -> QImage:
+    """BGR / BGRA / gray frame 을 감싸는 QImage (복사 없음, frame 이 살아있는 동안만 유효)."""
+    height, width = frame.shape[:2]
+    if frame.ndim == 2:
+        image_format = QImage.Format.Format_Grayscale8
+    elif frame.shape[2] == 4:
+        image_format = QImage.Format.Format_ARGB32     # little endian BGRA
+    else:
+        image_format = QImage.Format.Format_BGR888
+    return QImage(frame.data, width, height, frame.strides[0], image_format)
+
+
+def image_size(image_input):
+    """(width, height)"""
+    if isinstance(image_input, np.ndarray):
+        return image_input.shape[1], image_input.shape[0]
+    return image_input.width(), image_input.height()
+
+
+@dataclass
+class LiveImageStats:
+    submitted: int = 0
+    shown: int = 0
+    dropped: int = 0            # 표시 전에 다음 frame 으로 교체된 frame
+    ui_time: float = 0.0        # GUI thread 에서 변환 + pixmap 교체에 쓴 시간 합계 (초)
+    max_ui_time: float = 0.0
+
+    def add_ui_time(self, elapsed):
+        self.shown += 1
+        self.ui_time += elapsed
+        self.max_ui_time = max(self.max_ui_time, elapsed)
+
+    def summary(self) -> str:
+        mean = self.ui_time / self.shown * 1000 if self.shown else 0.0
+        return (f"frames: {self.submitted}, shown: {self.shown}, dropped: {self.dropped}, "
+                f"ui time mean: {mean:.2f}ms, max: {self.max_ui_time * 1000:.2f}ms")
+
+
+class LiveImageItem(QObject):
+    """
+    view 하나에 붙어서 frame 을 표시하는 pixmap item.
+
+    Args:
+        view (QGraphicsView): 표시할 view. item 은 호출하는 쪽에서 scene 에 추가.
+        auto_fit (bool): True 이면 frame 마다 fit in view 한다고 보고 viewport 크기에 맞춰 축소
+        on_shown (callable): frame 을 표시한 후 호출 (ex. fit_in_view)
+    """
+    def __init__(self, view, auto_fit=True, on_shown=None):
+        super().__init__(view)
+        self.view = view
+        self.auto_fit = auto_fit
+        self.on_shown = on_shown
+
+        self.item = QGraphicsPixmapItem()
+        self.item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        self.source = None          # 마지막으로 표시한 원본 frame
+        self.source_size = None     # scene 에서 차지할 크기 (w, h). thumbnail 이면 원래 frame 크기
+        self.full_frame = None      # source 가 thumbnail 일 때 원래 frame (저장용)
+        self.stats = LiveImageStats()
+
+        self._pending = None
+        self._last_shown = 0.0
+        self._buffer = None         # 축소 frame buffer (크기가 같으면 재사용)
+        self._buffer_image = None   # _buffer 를 감싼 QImage
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    def frame_interval(self) -> float:
+        screen = self.view.screen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0
+        return 1.0 / (refresh_rate if refresh_rate > 0 else DEFAULT_REFRESH_RATE)
+
+    def set_image(self, image_input, source_size=None, full_frame=None):
+        """
+        frame 을 표시합니다. 직전 표시 후 refresh 주기가 지나지 않았으면 남은 시간 뒤에 마지막 frame 만 표시.
+
+        Args:
+            image_input: np.ndarray (BGR / BGRA / gray), QImage, QPixmap
+            source_size (tuple): image_input 이 축소본(thumbnail)일 때 원래 frame 크기 (w, h).
+                scene 좌표는 원래 크기 기준으로 유지.
+            full_frame (np.ndarray): image_input 이 축소본일 때 원래 frame. 이미지 저장에 사용 (복사 없음).
+        """
+        if not isinstance(image_input, (np.ndarray, QImage, QPixmap)):
+            raise ValueError("Unsupported image type")
+
+        self.stats.submitted += 1
+        if self._pending is not None:
+            self.stats.dropped += 1
+        self._pending = (image_input, source_size or image_size(image_input), full_frame)
+
+        wait = self._last_shown + self.frame_interval() - time.perf_counter()
+        if wait <= 0:
+            self._timer.stop()
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start(max(1, int(wait * 1000)))
+
+    def flush(self):
+        if self._pending is None:
+            return
+        (image, self.source_size, self.full_frame), self._pending = self._pending, None
+
+        start_time = time.perf_counter()
+        self.source = image
+        self._show(image, self.display_scale(use_view_transform=not self.auto_fit))
+        self._last_shown = time.perf_counter()
+        self.stats.add_ui_time(self._last_shown - start_time)
+
+        if self.on_shown is not None:
+            self.on_shown()
+
+    def refresh_resolution(self):
+        """확대 / resize 후 현재 pixmap 해상도가 부족하면 마지막 frame 을 다시 변환."""
+        if not isinstance(self.source, np.ndarray) or self._pending is not None:
+            return
+        width = self.source.shape[1]
+        scale = self.display_scale(use_view_transform=True)
+        if self.item.pixmap().width() < int(width * scale) - 1:
+            self._show(self.source, scale)
+
+    def display_scale(self, use_view_transform=False) -> float:
+        """원본 frame 대비 필요한 해상도 비율 (0 ~ 1)."""
+        if not isinstance(self.source, np.ndarray):
+            return 1.0
+        viewport = self.view.viewport()
+        if not viewport.isVisible():
+            return 1.0
+
+        height, width = self.source.shape[:2]
+        fit_scale = min(viewport.width() / width, viewport.height() / height)
+        # view transform 은 scene (source_size) 기준
+        view_scale = self.view.transform().m11() * self.source_size[0] / width
+        scale = max(fit_scale, view_scale) if use_view_transform else fit_scale
+        return min(1.0, scale * viewport.devicePixelRatioF())
+
+    def _show(self, image, scale):
+        if isinstance(image, QPixmap):
+            pixmap = image
+        elif isinstance(image, QImage):
+            pixmap = QPixmap.fromImage(image)
+        else:
+            frame = self._resize(image, scale)
+            # QImage 는 frame memory 를 참조만 하므로 fromImage (복사) 가 끝날 때까지 frame 을 유지
+            pixmap = QPixmap.fromImage(self._buffer_image if frame is self._buffer else numpy_to_qimage(frame))
+
+        self.item.setPixmap(pixmap)
+        self.item.setScale(self.source_size[0] / pixmap.width() if pixmap.width() else 1.0)
+
+    def _resize(self, image, scale) -> np.ndarray:
+        """표시할 크기의 uint8 frame. 축소하는 경우 buffer 를 재사용."""
+        if scale >= 1.0:
+            return np.ascontiguousarray(image, dtype=np.uint8)
+
+        height, width = image.shape[:2]
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        shape = (size[1], size[0]) + image.shape[2:]
+        if self._buffer is None or self._buffer.shape != shape or self._buffer.dtype != image.dtype:
+            self._buffer = np.empty(shape, dtype=image.dtype)
+            self._buffer_image = None
+        cv2.resize(image, size, dst=self._buffer, interpolation=cv2.INTER_AREA)
+
+        if self._buffer.dtype != np.uint8:
+            return np.ascontiguousarray(self._buffer, dtype=np.uint8)
+        if self._buffer_image is None:
+            self._buffer_image = numpy_to_qimage(self._buffer)
+        return self._buffer
+
+    def full_resolution_qimage(self) -> QImage:
+        """저장용 원본 해상도 image. 원래 frame 없이 thumbnail 만 받았으면 thumbnail 해상도."""
+        if isinstance(self.full_frame, np.ndarray):
+            frame = np.ascontiguousarray(self.full_frame, dtype=np.uint8)
+            return numpy_to_qimage(frame).copy()
+        if isinstance(self.source, np.ndarray):
+            frame = np.ascontiguousarray(self.source, dtype=np.uint8)
+            return numpy_to_qimage(frame).copy()
+        if isinstance(self.source, QPixmap):
+            return self.source.toImage()
+        if isinstance(self.source, QImage):
+            return self.source
+        return self.item.pixmap().toImage()
+
+    def clear(self):
+        self._timer.stop()
+        self._pending = None
+        self.source = None
+        self.source_size = None
+        self.full_frame = None
+        self.item.setPixmap(QPixmap())
@@ -0,0 +1,221 @@
+import numpy as np
+from OpenGL import GL
+from PySide6.QtCore import QCoreApplication, Qt
+from PySide6.QtGui import QMatrix4x4, QOpenGLContext
+from pyqtgraph.opengl.GLGraphicsItem import GLGraphicsItem
+
+# Point cloud 표시용 GL item
+# 기존: GLScatterPlotItem.setData 로 매 update 마다 전체 point / color 배열을 넘기고 (paint 마다 client array 전송),
+#       ICP animation 은 변환된 point 를 매 iteration 다시 업로드
+# 변경:
+#   - point / color 는 set_points 때 한 번만 VBO 에 업로드
+#   - 강체 변환(ICP 등)은 point 를 바꾸지 않고 model matrix (setTransform) 로 적용
+#   - voxel 간소화 LOD: 굵은 voxel 대표점부터 앞쪽에 오도록 정렬해서 올리므로
+#     LOD 변경은 glDrawArrays 개수만 바꿈 (재업로드 없음)
+#   - fixed function pipeline (OpenGL 1.5 / 2.1) 만 사용 -> software OpenGL (Mesa llvmpipe, opengl32sw) 에서도 동작
+#   - VBO 는 view 에서 제거 (removeItem) 되거나 GL context 가 없어질 때 glDeleteBuffers 로 해제.
+#     정렬된 point / color 배열은 유지해서 다시 붙거나 context 가 새로 만들어지면 다음 paint 에서 다시 업로드
+#     (호출하는 쪽에서 set_points 를 다시 부를 필요 없음)
+
+DEFAULT_VOXEL_SIZES = (0.04, 0.02, 0.01, 0.005)     # m, 굵은 순서
+DEFAULT_MAX_POINTS = 200_000
+
+
+def use_software_opengl():
+    """QApplication 생성 전에 호출. GPU 가 없는 (headless) PC 에서 Qt 의 software OpenGL 사용."""
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_UseSoftwareOpenGL)
+
+
+def voxel_decimate(points: np.ndarray, voxel_size: float) -> np.ndarray:
+    """
+    voxel 마다 대표점 하나의 index (처음 나온 point).
+
+    Returns:
+        np.ndarray: 정렬된 point index
+    """
+    if len(points) == 0:
+        return np.empty(0, dtype=np.int64)
+    voxels = np.floor(points / voxel_size).astype(np.int64)
+    voxels -= voxels.min(axis=0)
+    dims = voxels.max(axis=0) + 1
+    keys = np.ravel_multi_index(tuple(voxels.T), tuple(int(dim) for dim in dims))
+    _, first_index = np.unique(keys, return_index=True)
+    return np.sort(first_index)
+
+
+def lod_order(points: np.ndarray, voxel_sizes=DEFAULT_VOXEL_SIZES):
+    """
+    굵은 voxel 대표점이 앞에 오도록 한 point 순서와 LOD 별 앞쪽 point 개수.
+
+    Returns:
+        (np.ndarray, list): (point index 순서, [(voxel_size, count), .., (0.0, 전체 개수)])
+    """
+    selected = np.zeros(len(points), dtype=bool)
+    order = []
+    levels = []
+    count = 0
+    for voxel_size in voxel_sizes:
+        index = voxel_decimate(points, voxel_size)
+        index = index[~selected[index]]
+        selected[index] = True
+        order.append(index)
+        count += len(index)
+        levels.append((voxel_size, count))
+    order.append(np.flatnonzero(~selected))
+    levels.append((0.0, len(points)))
+    return np.concatenate(order), levels
+
+
+def depth_colors(points: np.ndarray) -> np.ndarray:
+    """z (거리) 에 따라 파란색 -> 빨간색 RGBA (uint8)."""
+    colors = np.zeros((len(points), 4), dtype=np.uint8)
+    if len(points) == 0:
+        return colors
+    z_values = points[:, 2]
+    z_min, z_max = z_values.min(), z_values.max()
+    normalized_z = (z_values - z_min) / (z_max - z_min) if z_max > z_min else np.zeros_like(z_values)
+    colors[:, 0] = normalized_z * 255            # R
+    colors[:, 2] = (1 - normalized_z) * 255      # B
+    colors[:, 3] = 255                           # Alpha
+    return colors
+
+
+class PointCloudItem(GLGraphicsItem):
+    """
+    Args:
+        points (np.ndarray): (N, 3)
+        colors (np.ndarray): (N, 4) RGBA. uint8 (0 ~ 255) 또는 float (0 ~ 1). None 이면 color 로 단색.
+        color (tuple): 단색 RGBA (0 ~ 1)
+        point_size (float): pixel
+        max_points (int): 표시할 최대 point 수. 이 개수 안에서 가장 촘촘한 LOD 를 선택.
+        voxel_sizes (tuple): LOD voxel 크기 (굵은 순서)
+        gl_options (str): 'opaque' | 'translucent' | 'additive'
+
+    정렬된 point / color 배열을 계속 들고 있으므로 removeItem 후 다시 addItem 하거나
+    GL context 가 새로 만들어져도 (widget reparent, tab / dock 이동) set_points 없이 다시 표시됨.
+    """
+    def __init__(self, points=None, colors=None, color=(1.0, 1.0, 1.0, 1.0), point_size=1.0,
+                 max_points=DEFAULT_MAX_POINTS, voxel_sizes=DEFAULT_VOXEL_SIZES, gl_options='opaque'):
+        super().__init__()
+        self.setGLOptions(gl_options)
+        self.color = color
+        self.point_size = point_size
+        self.max_points = max_points
+        self.voxel_sizes = tuple(voxel_sizes)
+
+        self.levels = [(0.0, 0)]
+        self.center = np.zeros(3)
+        self._positions = None      # LOD 순서로 정렬된 float32 (N, 3). VBO 를 다시 만들 때 사용
+        self._colors = None
+        self._needs_upload = False  # 다음 paint 에서 VBO 로 업로드
+        self._vbo = None            # [position buffer, color buffer]
+        self._gl_view = None        # VBO 를 만든 context 의 view (해제할 때 makeCurrent)
+        self._uploaded_colors = False
+        self.upload_count = 0
+
+        if points is not None:
+            self.set_points(points, colors)
+
+    def set_points(self, points: np.ndarray, colors: np.ndarray = None):
+        """point 를 교체합니다. 다음 paint 에서 한 번만 업로드."""
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
+        order, self.levels = lod_order(points, self.voxel_sizes)
+        self._positions = np.ascontiguousarray(points[order])
+        self.center = points.mean(axis=0) if len(points) else np.zeros(3)
+
+        self._colors = None
+        if colors is not None:
+            colors = np.asarray(colors)
+            if colors.dtype != np.uint8:
+                colors = np.clip(colors * 255, 0, 255).astype(np.uint8)
+            self._colors = np.ascontiguousarray(colors[order])
+        self._needs_upload = True
+        self.update()
+
+    def set_max_points(self, max_points: int):
+        """LOD 변경. 업로드 없이 그리는 개수만 바뀜."""
+        self.max_points = max_points
+        self.update()
+
+    def set_model_matrix(self, matrix: np.ndarray):
+        """4x4 강체 변환 (ex. ICP transformation). point 는 다시 올리지 않음."""
+        self.setTransform(QMatrix4x4(*np.asarray(matrix, dtype=np.float64).ravel()))
+        self.update()
+
+    @property
+    def point_count(self) -> int:
+        return self.levels[-1][1]
+
+    @property
+    def draw_count(self) -> int:
+        """max_points 이하인 LOD 중 가장 촘촘한 level 의 point 수 (가장 굵은 level 은 항상 표시)."""
+        counts = [count for _, count in self.levels]
+        fitting = [count for count in counts if count <= self.max_points]
+        return max(fitting) if fitting else counts[0]
+
+    @property
+    def voxel_size(self) -> float:
+        """현재 표시 중인 LOD 의 voxel 크기 (0 이면 전체 point)."""
+        return dict((count, size) for size, count in self.levels)[self.draw_count]
+
+    def _setView(self, view):
+        # view 에서 빠지면 (GLViewWidget.removeItem) 그 view 의 context 에서 만든 VBO 해제
+        if view is not self.view():
+            self.release_buffers()
+        super()._setView(view)
+
+    def release_buffers(self):
+        """VBO 해제. point 배열은 유지하므로 다시 paint 되면 (다시 addItem / 새 context) 자동으로 다시 업로드."""
+        if self._vbo is None:
+            return
+        vbo, self._vbo = self._vbo, None
+        self._needs_upload = self._positions is not None
+        view, self._gl_view = self._gl_view, None
+        context = view.context() if view is not None else None
+        if context is None:
+            return
+        context.aboutToBeDestroyed.disconnect(self.release_buffers)
+        view.makeCurrent()
+        GL.glDeleteBuffers(2, vbo)
+        view.doneCurrent()
+
+    def _upload(self):
+        if self._vbo is None:
+            self._vbo = GL.glGenBuffers(2)
+            # paint 중이므로 현재 context 가 이 item 의 view context
+            self._gl_view = self.view()
+            QOpenGLContext.currentContext().aboutToBeDestroyed.connect(self.release_buffers)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo[0])
+        GL.glBufferData(GL.GL_ARRAY_BUFFER, self._positions.nbytes, self._positions, GL.GL_STATIC_DRAW)
+        self._uploaded_colors = self._colors is not None
+        if self._uploaded_colors:
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo[1])
+            GL.glBufferData(GL.GL_ARRAY_BUFFER, self._colors.nbytes, self._colors, GL.GL_STATIC_DRAW)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
+        self._needs_upload = False
+        self.upload_count += 1
+
+    def paint(self):
+        if self._needs_upload:
+            self._upload()
+        if self._vbo is None or self.point_count == 0:
+            return
+
+        self.setupGLState()
+        GL.glPointSize(self.point_size)
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        try:
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo[0])
+            GL.glVertexPointer(3, GL.GL_FLOAT, 0, None)
+            if self._uploaded_colors:
+                GL.glEnableClientState(GL.GL_COLOR_ARRAY)
+                GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._vbo[1])
+                GL.glColorPointer(4, GL.GL_UNSIGNED_BYTE, 0, None)
+            else:
+                GL.glColor4f(*self.color)
+            GL.glDrawArrays(GL.GL_POINTS, 0, self.draw_count)
+        finally:
+            GL.glDisableClientState(GL.GL_COLOR_ARRAY)
+            GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
@@ -0,0 +1,150 @@
+import os
+from collections import OrderedDict
+from functools import lru_cache
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QFontDatabase, QFontMetrics, QPainter, QPixmap
+
+# 결과 표시용 text overlay
+# 기존: add_text_to_pil_image 가 호출마다 ImageFont.truetype 으로 font 파일을 읽고
+#       numpy -> PIL -> numpy -> QImage 로 frame 에 직접 그림 (4K frame 복사 여러 번)
+#       GraphicViewWithText.set_text 도 호출마다 QFont / QGraphicsRectItem / QGraphicsSimpleTextItem 을 새로 생성
+# 변경: font 는 한 번만 load, 같은 내용의 overlay 는 QPixmap 으로 한 번만 그려서 재사용 (LRU).
+#       overlay 는 image 위의 별도 QGraphicsPixmapItem 으로 표시하고 frame 은 건드리지 않음.
+
+FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "font")
+OVERLAY_CACHE_SIZE = 8      # overlay pixmap 1장 ~3MB (1220 x 620)
+
+INFO_BOX_SIZE = (1200 + 20, 600 + 20)
+TABLE_BOX_SIZE = (680 + 20, 680 + 20)
+OVERLAY_BACKGROUND = QColor(0, 100, 0, 128)     # 약간 초록색 느낌의 반투명 배경
+
+
+@lru_cache(maxsize=None)
+def font_family(file_name, fallback="Consolas") -> str:
+    """font 폴더의 ttf 를 application font 로 한 번만 등록하고 family 이름을 반환."""
+    font_id = QFontDatabase.addApplicationFont(os.path.join(FONT_DIR, file_name))
+    families = QFontDatabase.applicationFontFamilies(font_id) if font_id >= 0 else []
+    return families[0] if families else fallback
+
+
+@lru_cache(maxsize=None)
+def get_font(family, size, bold=False, pixel_size=False) -> QFont:
+    font = QFont(family)
+    if pixel_size:
+        font.setPixelSize(size)
+    else:
+        font.setPointSize(size)
+    if bold:
+        font.setWeight(QFont.Weight.Bold)
+    return font
+
+
+class TextOverlayRenderer:
+    """
+    overlay pixmap 을 그리고 cache 합니다. QApplication 생성 후 사용.
+    """
+    def __init__(self, cache_size=OVERLAY_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _cached(self, key, draw):
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return pixmap
+
+        self.misses += 1
+        pixmap = draw()
+        self._cache[key] = pixmap
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return pixmap
+
+    def info(self, title, text) -> QPixmap:
+        """GraphicViewWithText.set_text 화면 (scene (10, 10) 에 표시)."""
+        return self._cached(("info", title, text), lambda: self._draw_info(title, text))
+
+    def table(self, title, labels, values) -> QPixmap:
+        """GraphicViewWithText.set_text_list 화면 (scene (10, 10) 에 표시)."""
+        key = ("table", title, tuple(labels), tuple(values))
+        return self._cached(key, lambda: self._draw_table(title, labels, values))
+
+    def result(self, text) -> QPixmap:
+        """GraphicView.set_bgr_image_with_text 화면. 첫 줄은 title, 나머지는 "key: value"."""
+        return self._cached(("result", text), lambda: self._draw_result(text))
+
+    @staticmethod
+    def _begin(width, height, background):
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.fillRect(0, 0, width, height, background)
+        return pixmap, painter
+
+    @staticmethod
+    def _draw_text(painter, x, y, text, font, color):
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(QRectF(x, y, painter.device().width() - x, painter.device().height() - y),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, text)
+
+    def _draw_info(self, title, text):
+        pixmap, painter = self._begin(*INFO_BOX_SIZE, OVERLAY_BACKGROUND)
+        self._draw_text(painter, 10, 10, title, get_font("Consolas", 14 * 3, bold=True), QColor("cyan"))
+        self._draw_text(painter, 10, 230, text, get_font("Consolas", 12 * 3), QColor("black"))
+        painter.end()
+        return pixmap
+
+    def _draw_table(self, title, labels, values):
+        pixmap, painter = self._begin(*TABLE_BOX_SIZE, OVERLAY_BACKGROUND)
+        self._draw_text(painter, 10, 10, title, get_font("Consolas", 28, bold=True), QColor("cyan"))
+
+        # 가장 긴 label 길이에 맞춰 가운데 정렬
+        max_label_length = max((len(label) for label in labels), default=0)
+        item_font = get_font("Consolas", 24)
+        y_offset = 70
+        for label, value in zip(labels, values):
+            self._draw_text(painter, 30, y_offset, label.center(max_label_length) + " :", item_font, QColor("black"))
+            self._draw_text(painter, 390, y_offset, value, item_font, QColor("white"))
+            y_offset += 40
+        painter.end()
+        return pixmap
+
+    def _draw_result(self, text):
+        title_font = get_font(font_family("NotoSans-Bold.ttf"), 20, pixel_size=True)
+        text_font = get_font(font_family("NotoSans-Medium.ttf"), 15, pixel_size=True)
+        title_metrics, text_metrics = QFontMetrics(title_font), QFontMetrics(text_font)
+        line_spacing = 5
+
+        lines = [line.strip() for line in text.split('\n')]
+        title, rows = lines[0], [line.split(':', 1) if ':' in line else [line] for line in lines[1:]]
+
+        key_width = max((text_metrics.horizontalAdvance(row[0].strip() + ":") for row in rows if len(row) == 2),
+                        default=0)
+        row_widths = [key_width + 10 + text_metrics.horizontalAdvance(row[1].strip()) if len(row) == 2
+                      else text_metrics.horizontalAdvance(row[0]) for row in rows]
+        width = max([title_metrics.horizontalAdvance(title)] + row_widths) + 2 * line_spacing
+        height = (title_metrics.height() + line_spacing + len(rows) * (text_metrics.height() + line_spacing)
+                  + line_spacing)
+
+        pixmap, painter = self._begin(width, height, QColor("white"))
+        x, y = line_spacing, line_spacing
+        self._draw_text(painter, x, y, title, title_font, QColor(255, 215, 78))     # 금색
+        y += title_metrics.height() + line_spacing
+        for row in rows:
+            if len(row) == 2:
+                self._draw_text(painter, x, y, row[0].strip() + ":", text_font, QColor("black"))
+                self._draw_text(painter, x + key_width + 10, y, row[1].strip(), text_font, QColor(173, 216, 230))
+            else:
+                self._draw_text(painter, x, y, row[0], text_font, QColor("black"))
+            y += text_metrics.height() + line_spacing
+        painter.end()
+        return pixmap
+
+
+overlay_renderer = TextOverlayRenderer()
@@ -5,7 +5,8 @@ from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, Q
 from PySide6.QtCore import QTimer, QThread, Signal
 from PySide6.QtGui import QVector3D
 import pyqtgraph.opengl as gl
-import copy
+
+from widget.common.PointCloudItem import PointCloudItem
 
 
 class CustomGLViewWidget(gl.GLViewWidget):
@@ -50,21 +51,27 @@ class ICPPointCloudVisualizer(QWidget):
         super().__init__()
         self.source = None
         self.target = None
+        self.pointcloud_item_source = None
+        self.pointcloud_item_target = None
         self.initUI()
 
     def init_pointcloud(self, source, target):
         self.source = np.asarray(source.points)
         self.target = np.asarray(target.points)
 
-        # GLScatterPlotItem 생성
-        self.colors_source = np.array([[1.0, 0.0, 0.0, 0.5] for _ in range(self.source.shape[0])])
-        self.colors_target = np.array([[0.0, 1.0, 0.0, 0.5] for _ in range(self.target.shape[0])])
+        # 이전 item 은 view 에서 제거 (VBO 해제)
+        for item in (self.pointcloud_item_source, self.pointcloud_item_target):
+            if item is not None:
+                self.widget.removeItem(item)
 
-        self.scatter_plot_source = gl.GLScatterPlotItem(pos=self.source, color=self.colors_source, size=2)
-        self.scatter_plot_target = gl.GLScatterPlotItem(pos=self.target, color=self.colors_target, size=2)
+        # 단색 (반투명) point. ICP 변환은 model matrix 로만 적용하므로 source 는 다시 올리지 않음
+        self.pointcloud_item_source = PointCloudItem(self.source, color=(1.0, 0.0, 0.0, 0.5), point_size=2,
+                                                     gl_options='translucent')
+        self.pointcloud_item_target = PointCloudItem(self.target, color=(0.0, 1.0, 0.0, 0.5), point_size=2,
+                                                     gl_options='translucent')
 
-        self.widget.addItem(self.scatter_plot_source)
-        self.widget.addItem(self.scatter_plot_target)
+        self.widget.addItem(self.pointcloud_item_source)
+        self.widget.addItem(self.pointcloud_item_target)
         self.set_pointcloud_center()
 
     def initUI(self):
@@ -125,8 +132,9 @@ class ICPPointCloudVisualizer(QWidget):
         self.source = np.asarray(source_pcd.points)
         self.target = np.asarray(target_pcd.points)
 
-        self.scatter_plot_source.setData(pos=self.source, color=self.colors_source)
-        self.scatter_plot_target.setData(pos=self.target, color=self.colors_target)
+        self.pointcloud_item_source.set_points(self.source)
+        self.pointcloud_item_target.set_points(self.target)
+        self.pointcloud_item_source.set_model_matrix(np.identity(4))
 
         self.set_pointcloud_center()
 
@@ -144,15 +152,14 @@ class ICPPointCloudVisualizer(QWidget):
         else:
             self.timer.start(50)
 
-    def update_source_points(self, new_source_points):
-        self.source = new_source_points
-        self.scatter_plot_source.setData(pos=self.source, color=self.colors_source)
-        self.set_pointcloud_center()
+    def update_source_transform(self, transformation):
+        # source point 는 그대로 두고 누적 변환 (4x4) 만 적용
+        self.pointcloud_item_source.set_model_matrix(transformation)
 
     def run_icp_algorithm(self):
         # ICP 알고리즘을 실행하는 스레드 시작
         self.icp_thread = ICPThread(self.source_pcd, self.target_pcd, threshold=0.02, max_iterations=50)
-        self.icp_thread.transformation_signal.connect(self.update_source_points)
+        self.icp_thread.transformation_signal.connect(self.update_source_transform)
         self.icp_thread.start()
 
     def set_point_clouds(self, source_pcd, target_pcd):
@@ -173,16 +180,16 @@ class ICPThread(QThread):
         self.max_iterations = max_iterations
 
     def run(self):
-        source_temp = copy.deepcopy(self.source)
+        # 원본 source 에서 누적 변환을 초기값으로 1 iteration 씩 진행하고, 누적 변환 (4x4) 만 전달
+        # (기존: 변환된 source 에 누적 변환을 다시 적용해서 변환이 중복되고, 매 iteration point 전체를 전달)
         while self.iteration < self.max_iterations:
             reg_p2p = o3d.pipelines.registration.registration_icp(
-                source_temp, self.target, self.threshold, self.transformation,
+                self.source, self.target, self.threshold, self.transformation,
                 o3d.pipelines.registration.TransformationEstimationPointToPoint(),
                 o3d.pipelines.registration.ICPConvergenceCriteria(max_iteration=1)
             )
-            self.transformation = reg_p2p.transformation
-            source_temp.transform(self.transformation)
-            self.transformation_signal.emit(np.asarray(source_temp.points))
+            self.transformation = np.asarray(reg_p2p.transformation)
+            self.transformation_signal.emit(self.transformation.copy())
             self.iteration += 1
 
 
@@ -8,8 +8,8 @@ from PySide6.QtGui import QVector3D, QMatrix4x4
 import pyqtgraph.opengl as gl
 import open3d as o3d
 
-import pointcloud_functions as pointcloud_functions
-import outlier_processing as outlier_processing
+from biw_utils import pointcloud_functions, outlier_processing
+from widget.common.PointCloudItem import PointCloudItem, depth_colors, DEFAULT_MAX_POINTS
 
 
 class CustomGLViewWidget(gl.GLViewWidget):
@@ -64,9 +64,9 @@ class PointCloudVisualizer(QWidget):
         # 초기 3D PointCloud 데이터 생성
         self.pointcloud_data, self.colors = self.generate_pointcloud_data(self.depth_path)
 
-        # GLScatterPlotItem 생성
-        self.scatter_plot = gl.GLScatterPlotItem(pos=self.pointcloud_data, color=self.colors, size=1)
-        self.widget.addItem(self.scatter_plot)
+        # point 는 VBO 에 한 번만 업로드, LOD 는 max points 로 조절
+        self.pointcloud_item = PointCloudItem(self.pointcloud_data, colors=self.colors, point_size=1)
+        self.widget.addItem(self.pointcloud_item)
 
         self.set_pointcloud_center()
 
@@ -83,10 +83,20 @@ class PointCloudVisualizer(QWidget):
         self.update_button = QPushButton('Update PointCloud')
         self.rotate_button = QPushButton('Rotate PointCloud')
 
+        # 표시할 최대 point 수 (LOD)
+        max_points_label = QLabel("max points")
+        self.max_points_input = QSpinBox()
+        self.max_points_input.setRange(1_000, 5_000_000)
+        self.max_points_input.setSingleStep(10_000)
+        self.max_points_input.setValue(DEFAULT_MAX_POINTS)
+        self.max_points_input.valueChanged.connect(self.pointcloud_item.set_max_points)
+
         # 버튼 레이아웃 설정
         button_layout = QHBoxLayout()
         button_layout.addWidget(self.update_button)
         button_layout.addWidget(self.rotate_button)
+        button_layout.addWidget(max_points_label)
+        button_layout.addWidget(self.max_points_input)
 
         # 사용자 입력 레이아웃 설정
         user_input_layout = QVBoxLayout()
@@ -134,20 +144,8 @@ class PointCloudVisualizer(QWidget):
         self.rotate_button.clicked.connect(self.rotate_pointcloud)
 
     def calculate_colors(self, points):
-        # 포인트의 z 값 (거리 값)에 따라 색상을 계산
-        z_values = points[:, 2]
-        z_min, z_max = np.min(z_values), np.max(z_values)
-        colors = np.zeros((points.shape[0], 4))
-
-        # z 값을 0과 1 사이로 정규화
-        normalized_z = (z_values - z_min) / (z_max - z_min)
-
-        # 색상 매핑 (예: 파란색에서 빨간색으로)
-        colors[:, 0] = normalized_z  # R
-        colors[:, 2] = 1 - normalized_z  # B
-        colors[:, 3] = 1.0  # Alpha
-
-        return colors
+        # 포인트의 z 값 (거리 값)에 따라 색상을 계산 (파란색 -> 빨간색, uint8 RGBA)
+        return depth_colors(points)
 
     def generate_pointcloud_data(self, depth_image_path):
         # 깊이 이미지 로드
@@ -155,7 +153,7 @@ class PointCloudVisualizer(QWidget):
 
         # 이미지가 없으면 빈 배열 반환
         if depth_image is None:
-            return np.empty((0, 3))
+            return np.empty((0, 3)), np.empty((0, 4), dtype=np.uint8)
 
         # 깊이 이미지와 RGB 이미지를 준비
         self.spot_pointcloud.prepare(depth_image)
@@ -168,9 +166,8 @@ class PointCloudVisualizer(QWidget):
 
     def set_pointcloud_center(self):
         # 포인트 클라우드의 중심 계산
-        if self.pointcloud_data.size > 0:
-            center = self.pointcloud_data.mean(axis=0)
-            self.widget.setCenter(center)
+        if self.pointcloud_item.point_count > 0:
+            self.widget.setCenter(self.pointcloud_item.center)
 
     def update_pointcloud(self):
         azimuth = self.azimuth_input_label.value()
@@ -184,7 +181,7 @@ class PointCloudVisualizer(QWidget):
 
         # 깊이 데이터 업데이트
         # self.pointcloud_data, self.colors = self.generate_pointcloud_data(self.depth_path)
-        # self.scatter_plot.setData(pos=self.pointcloud_data, color=self.colors)
+        # self.pointcloud_item.set_points(self.pointcloud_data, self.colors)
         # self.set_pointcloud_center()
 
     def update_rotation(self):